@@ -0,0 +1,151 @@
+"""
+Backup compression benchmark: throughput and ratio of every backup codec
+
+Builds a synthetic SQLite database of roughly --size-mb megabytes (contacts
+and applications with realistic, repetitive text), then compresses and
+decompresses it once per codec in utils.backup_manager.CODECS, checking the
+round trip byte for byte.
+
+Usage:
+    python -m benchmarks.bench_backup_codecs
+    python -m benchmarks.bench_backup_codecs --size-mb 50 --codecs gzip-1 parallel-zlib-6 --json results.json
+"""
+import argparse
+import hashlib
+import json
+import random
+import shutil
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from utils.backup_manager import CODECS, get_codec
+
+MB = 1024 * 1024
+
+_WORDS = ("follow up coffee chat referral recruiter interview onsite offer team manager "
+          "engineering product data analytics summer intern role applied waiting rejected "
+          "great conversation about the roadmap send thank you note next week").split()
+
+
+def build_database(path: Path, size_mb: int, seed: int = 7) -> None:
+    """Write a synthetic tracker-like database of about size_mb megabytes to path"""
+    rng = random.Random(seed)
+    conn = sqlite3.connect(str(path))
+    try:
+        conn.execute("PRAGMA journal_mode=OFF")
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.execute("""CREATE TABLE contacts (
+            id INTEGER PRIMARY KEY, name TEXT, job_title TEXT, company TEXT,
+            email TEXT, contact_date TEXT, status TEXT, notes TEXT)""")
+        conn.execute("""CREATE TABLE applications (
+            id INTEGER PRIMARY KEY, role_name TEXT, company TEXT,
+            application_date TEXT, status TEXT, notes TEXT)""")
+        conn.execute("CREATE INDEX ix_contacts_company ON contacts(company)")
+
+        def notes():
+            return " ".join(rng.choice(_WORDS) for _ in range(rng.randint(10, 80)))
+
+        next_id = 0
+        while path.stat().st_size < size_mb * MB:
+            batch = range(next_id, next_id + 5000)
+            conn.executemany(
+                "INSERT INTO contacts VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [(i, f"Contact {i}", f"Engineer {i % 37}", f"Company {rng.randint(0, 2000)}",
+                  f"contact{i}@example.com", f"2025-{i % 12 + 1:02d}-{i % 28 + 1:02d}",
+                  rng.choice(['Reached Out', 'Responded', 'Call Scheduled', 'No Response']),
+                  notes()) for i in batch])
+            conn.executemany(
+                "INSERT INTO applications VALUES (?, ?, ?, ?, ?, ?)",
+                [(i, f"Role {i % 300}", f"Company {rng.randint(0, 2000)}",
+                  f"2025-{i % 12 + 1:02d}-{i % 28 + 1:02d}",
+                  rng.choice(['Applied', 'Interview', 'Offer', 'Rejected']), notes())
+                 for i in batch[::4]])
+            conn.commit()
+            next_id += len(batch)
+    finally:
+        conn.close()
+
+
+def file_digest(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(MB), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def run_codec(name: str, database: Path, scratch: Path, expected_digest: str) -> dict:
+    """Compress and decompress database with one codec"""
+    codec = get_codec(name)
+    raw_size = database.stat().st_size
+    compressed = scratch / f"backup{codec.extension}"
+    restored = scratch / "restored.db"
+
+    start = time.perf_counter()
+    codec.compress_file(database, compressed)
+    compress_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    codec.decompress_file(compressed, restored)
+    decompress_s = time.perf_counter() - start
+
+    result = {
+        'codec': name,
+        'raw_mb': round(raw_size / MB, 2),
+        'compressed_mb': round(compressed.stat().st_size / MB, 2),
+        'ratio': round(raw_size / compressed.stat().st_size, 2),
+        'compress_mb_s': round(raw_size / MB / compress_s, 2),
+        'decompress_mb_s': round(raw_size / MB / decompress_s, 2),
+        'round_trip_ok': file_digest(restored) == expected_digest,
+    }
+    compressed.unlink()
+    restored.unlink()
+    return result
+
+
+def run_benchmark(size_mb: int, codecs) -> list:
+    scratch = Path(tempfile.mkdtemp(prefix='gti_codecs_'))
+    try:
+        database = scratch / "synthetic.db"
+        start = time.perf_counter()
+        build_database(database, size_mb)
+        print(f"Built {database.stat().st_size / MB:.0f} MB database in {time.perf_counter() - start:.1f}s")
+
+        expected_digest = file_digest(database)
+        return [run_codec(name, database, scratch, expected_digest) for name in codecs]
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+
+def print_results(results):
+    columns = ['codec', 'compressed_mb', 'ratio', 'compress_mb_s', 'decompress_mb_s', 'round_trip_ok']
+    print("  ".join(f"{c:>16}" for c in columns))
+    print("-" * 18 * len(columns))
+    for result in sorted(results, key=lambda r: r['compress_mb_s'], reverse=True):
+        print("  ".join(f"{str(result[c]):>16}" for c in columns))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--size-mb', type=int, default=500, help="Size of the synthetic database")
+    parser.add_argument('--codecs', nargs='+', choices=list(CODECS), default=list(CODECS))
+    parser.add_argument('--json', type=Path, help="Write results to this JSON file")
+    args = parser.parse_args(argv)
+
+    results = run_benchmark(args.size_mb, args.codecs)
+    print_results(results)
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+    return 0 if all(r['round_trip_ok'] for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,234 @@
+"""
+Contact table benchmark: per-row widgets vs. model/view
+
+Measures time-to-first-paint and resident memory growth for the legacy
+QTableWidget + setCellWidget table and the ContactTableModel/QTableView
+table, each in a fresh subprocess so RSS numbers don't bleed together.
+
+Usage:
+    python -m benchmarks.bench_contact_table
+    python -m benchmarks.bench_contact_table --sizes 1000 10000 --json results.json
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+DEFAULT_SIZES = [1000, 10000, 100000]
+IMPLEMENTATIONS = ['legacy', 'model']
+
+
+def make_rows(count: int):
+    """Build synthetic ContactRow tuples"""
+    from db.models import NetworkingStatus
+    from ui.contact_table_model import ContactRow
+
+    statuses = list(NetworkingStatus)
+    today = date.today()
+    return [
+        ContactRow(
+            i + 1,
+            f"Contact {i}",
+            f"Engineer {i % 37}",
+            f"Company {i % 500}",
+            f"555-01{i % 100:02d}" if i % 2 else None,
+            f"linkedin.com/in/contact{i}" if i % 3 else None,
+            today - timedelta(days=i % 365),
+            statuses[i % len(statuses)]
+        )
+        for i in range(count)
+    ]
+
+
+def peak_rss_kb() -> int:
+    """Peak resident set size of this process in KB (None if unavailable)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux reports kilobytes
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def build_legacy_table(rows):
+    """Rebuild the table the way NetworkingListView used to: items + cell widgets per row"""
+    from PySide6.QtWidgets import (
+        QTableWidget, QTableWidgetItem, QWidget, QHBoxLayout,
+        QPushButton, QLabel, QComboBox
+    )
+    from PySide6.QtCore import Qt
+    from PySide6.QtGui import QColor
+    from db.models import NetworkingStatus
+    from utils.date_helpers import format_date
+
+    def cell(widget_factory):
+        widget = QWidget()
+        layout = QHBoxLayout(widget)
+        layout.setContentsMargins(4, 4, 4, 4)
+        widget_factory(layout)
+        return widget
+
+    table = QTableWidget()
+    table.setColumnCount(8)
+    table.verticalHeader().setDefaultSectionSize(80)
+    table.setRowCount(len(rows))
+
+    for row_idx, row in enumerate(rows):
+        for column, text in ((0, row.name), (1, row.job_title), (2, row.company),
+                             (5, format_date(row.contact_date))):
+            item = QTableWidgetItem(text)
+            item.setForeground(QColor("#FFFFFF"))
+            if column == 0:
+                item.setData(Qt.UserRole, row.id)
+            table.setItem(row_idx, column, item)
+
+        table.setCellWidget(row_idx, 3, cell(
+            lambda l, r=row: l.addWidget(QPushButton(r.phone) if r.phone else QLabel("-"))
+        ))
+        table.setCellWidget(row_idx, 4, cell(
+            lambda l, r=row: l.addWidget(QPushButton("🔗 Open") if r.linkedin_url else QLabel("-"))
+        ))
+
+        def add_combo(layout, current=row.status):
+            combo = QComboBox()
+            for status in NetworkingStatus:
+                combo.addItem(status.value, status)
+            combo.setCurrentText(current.value)
+            layout.addWidget(combo)
+        table.setCellWidget(row_idx, 6, cell(add_combo))
+
+        def add_actions(layout):
+            layout.addWidget(QPushButton("✏"))
+            layout.addWidget(QPushButton("×"))
+        table.setCellWidget(row_idx, 7, cell(add_actions))
+
+    return table
+
+
+def build_model_table(rows):
+    """Build the model/view table used by NetworkingListView"""
+    from PySide6.QtWidgets import QTableView
+    from ui.contact_table_model import ContactTableModel, ContactItemDelegate
+
+    table = QTableView()
+    model = ContactTableModel(table)
+    table.setModel(model)
+    table.setItemDelegate(ContactItemDelegate(table))
+    table.verticalHeader().setDefaultSectionSize(80)
+    model.set_rows(rows)
+    return table
+
+
+def run_worker(implementation: str, count: int) -> dict:
+    """Measure one implementation/size pair inside the current process"""
+    os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
+
+    from PySide6.QtWidgets import QApplication
+    from PySide6.QtCore import QObject, QEvent
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    rows = make_rows(count)
+    app.processEvents()
+    baseline_kb = peak_rss_kb()
+
+    class PaintProbe(QObject):
+        painted = False
+
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Paint:
+                self.painted = True
+            return False
+
+    start = time.perf_counter()
+    if implementation == 'legacy':
+        table = build_legacy_table(rows)
+    else:
+        table = build_model_table(rows)
+
+    probe = PaintProbe()
+    table.viewport().installEventFilter(probe)
+    table.resize(1400, 800)
+    table.show()
+
+    deadline = time.perf_counter() + 120
+    while not probe.painted and time.perf_counter() < deadline:
+        app.processEvents()
+    if not probe.painted:
+        table.viewport().repaint()
+    first_paint_ms = (time.perf_counter() - start) * 1000
+
+    final_kb = peak_rss_kb()
+    return {
+        'implementation': implementation,
+        'rows': count,
+        'first_paint_ms': round(first_paint_ms, 2),
+        'rss_delta_mb': None if baseline_kb is None else round((final_kb - baseline_kb) / 1024, 2),
+        'peak_rss_mb': None if final_kb is None else round(final_kb / 1024, 2),
+    }
+
+
+def run_benchmark(sizes, implementations) -> list:
+    """Run every implementation/size pair in its own subprocess"""
+    results = []
+    for count in sizes:
+        for implementation in implementations:
+            proc = subprocess.run(
+                [sys.executable, '-m', 'benchmarks.bench_contact_table',
+                 '--worker', implementation, str(count)],
+                cwd=str(PROJECT_ROOT), capture_output=True, text=True
+            )
+            if proc.returncode != 0:
+                results.append({
+                    'implementation': implementation, 'rows': count,
+                    'error': proc.stderr.strip().splitlines()[-1:] or ['failed']
+                })
+                continue
+            results.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+    return results
+
+
+def print_results(results):
+    print(f"{'rows':>8}  {'impl':<8}  {'first paint (ms)':>17}  {'RSS delta (MB)':>15}")
+    print("-" * 56)
+    for r in results:
+        if 'error' in r:
+            print(f"{r['rows']:>8}  {r['implementation']:<8}  error: {r['error'][0]}")
+            continue
+        rss = '-' if r['rss_delta_mb'] is None else f"{r['rss_delta_mb']:.2f}"
+        print(f"{r['rows']:>8}  {r['implementation']:<8}  {r['first_paint_ms']:>17.2f}  {rss:>15}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--impl', choices=IMPLEMENTATIONS, nargs='+', default=IMPLEMENTATIONS)
+    parser.add_argument('--json', type=Path, help="Write results to this JSON file")
+    parser.add_argument('--worker', nargs=2, metavar=('IMPL', 'ROWS'), help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        print(json.dumps(run_worker(args.worker[0], int(args.worker[1]))))
+        return 0
+
+    results = run_benchmark(args.sizes, args.impl)
+    print_results(results)
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
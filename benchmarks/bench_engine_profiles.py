@@ -0,0 +1,162 @@
+"""
+SQLite engine profile benchmark
+
+For every profile in db.engine_profile, builds a scratch database and
+measures single-row insert and update throughput (one commit each, like the
+dialogs), list-page read throughput, and read latency while a writer thread
+keeps committing (dashboards and the notification timer reading during saves).
+
+Usage:
+    python -m benchmarks.bench_engine_profiles
+    python -m benchmarks.bench_engine_profiles --rows 2000 --profiles balanced compatible
+"""
+import argparse
+import json
+import shutil
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+
+def make_engine(db_path: Path, profile):
+    """Engine + schema for one profile, without touching the app's database"""
+    from sqlalchemy import create_engine
+    from db.models import Base
+    from db.engine_profile import apply_engine_profile
+    import db.enhanced_models  # noqa: F401
+
+    engine = create_engine(f'sqlite:///{db_path}')
+    apply_engine_profile(engine, profile)
+    Base.metadata.create_all(engine)
+    return engine
+
+
+def run_profile(profile, rows: int, concurrent_seconds: float) -> dict:
+    """Measure one profile in a fresh database"""
+    from sqlalchemy import select
+    from sqlalchemy.orm import sessionmaker
+    from db.models import NetworkingContact, NetworkingStatus
+
+    scratch = Path(tempfile.mkdtemp(prefix='gti_profile_'))
+    engine = make_engine(scratch / 'bench.db', profile)
+    Session = sessionmaker(bind=engine)
+    statuses = list(NetworkingStatus)
+    today = date.today()
+
+    try:
+        # Inserts: one commit per contact
+        start = time.perf_counter()
+        for i in range(rows):
+            session = Session()
+            session.add(NetworkingContact(
+                name=f"Contact {i}", job_title="Engineer", company=f"Company {i % 50}",
+                contact_date=today - timedelta(days=i % 90), status=statuses[i % 4]
+            ))
+            session.commit()
+            session.close()
+        insert_rate = rows / (time.perf_counter() - start)
+
+        # Updates: one commit per status change
+        start = time.perf_counter()
+        for contact_id in range(1, rows + 1):
+            session = Session()
+            contact = session.get(NetworkingContact, contact_id)
+            contact.status = statuses[(contact_id + 1) % 4]
+            session.commit()
+            session.close()
+        update_rate = rows / (time.perf_counter() - start)
+
+        page = (select(NetworkingContact.id, NetworkingContact.name, NetworkingContact.company)
+                .order_by(NetworkingContact.contact_date.desc()).limit(200))
+
+        # Reads: list pages
+        reads = max(rows // 4, 50)
+        start = time.perf_counter()
+        with engine.connect() as conn:
+            for _ in range(reads):
+                conn.execute(page).all()
+        read_rate = reads / (time.perf_counter() - start)
+
+        # Reads while a writer keeps committing
+        stop = threading.Event()
+
+        def writer():
+            i = 0
+            while not stop.is_set():
+                session = Session()
+                contact = session.get(NetworkingContact, (i % rows) + 1)
+                contact.company = f"Company {i}"
+                session.commit()
+                session.close()
+                i += 1
+
+        latencies = []
+        thread = threading.Thread(target=writer, daemon=True)
+        thread.start()
+        deadline = time.perf_counter() + concurrent_seconds
+        with engine.connect() as conn:
+            while time.perf_counter() < deadline:
+                start = time.perf_counter()
+                conn.execute(page).all()
+                conn.rollback()
+                latencies.append((time.perf_counter() - start) * 1000)
+        stop.set()
+        thread.join()
+
+        latencies.sort()
+        return {
+            'profile': profile.name,
+            'inserts_per_s': round(insert_rate, 1),
+            'updates_per_s': round(update_rate, 1),
+            'reads_per_s': round(read_rate, 1),
+            'read_p50_ms_under_write': round(statistics.median(latencies), 2),
+            'read_p99_ms_under_write': round(latencies[int(len(latencies) * 0.99) - 1], 2),
+            'read_max_ms_under_write': round(latencies[-1], 2),
+        }
+    finally:
+        engine.dispose()
+        shutil.rmtree(scratch, ignore_errors=True)
+
+
+def print_results(results):
+    columns = ['profile', 'inserts_per_s', 'updates_per_s', 'reads_per_s',
+               'read_p50_ms_under_write', 'read_p99_ms_under_write', 'read_max_ms_under_write']
+    headers = ['profile', 'insert/s', 'update/s', 'read/s', 'p50 ms*', 'p99 ms*', 'max ms*']
+    print("  ".join(f"{h:>12}" for h in headers))
+    print("-" * 14 * len(headers))
+    for result in results:
+        print("  ".join(f"{result[c]:>12}" for c in columns))
+    print("* list-page read latency while another connection commits updates")
+
+
+def main(argv=None):
+    from db.engine_profile import ENGINE_PROFILES
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1000)
+    parser.add_argument('--concurrent-seconds', type=float, default=3.0)
+    parser.add_argument('--profiles', nargs='+', choices=list(ENGINE_PROFILES), default=list(ENGINE_PROFILES))
+    parser.add_argument('--json', type=Path, help="Write results to this JSON file")
+    args = parser.parse_args(argv)
+
+    results = [
+        run_profile(ENGINE_PROFILES[name], args.rows, args.concurrent_seconds)
+        for name in args.profiles
+    ]
+    print_results(results)
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+"""
+Full-text search benchmark
+
+Fills a scratch database with synthetic contacts and applications, then
+times ranked global search and the list-view id filter against the
+FTS5 index (and the old LIKE scan for comparison).
+
+Usage:
+    python -m benchmarks.bench_search
+    python -m benchmarks.bench_search --documents 100000 --repeat 50
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+QUERIES = ["goo", "software eng", "kubernetes", "maria", "fintech startup", "zzzz"]
+
+FIRST_NAMES = ["Maria", "James", "Wei", "Aisha", "Lucas", "Priya", "Noah", "Elena"]
+COMPANIES = ["Google", "Stripe", "Shopify", "Datadog", "Airbnb", "Cloudflare", "Revolut"]
+TITLES = ["Software Engineer", "Recruiter", "Product Manager", "Data Scientist"]
+NOTES = [
+    "Met at the career fair, works on Kubernetes tooling",
+    "Alumni from my school, fintech startup background",
+    "Referred by a friend; interested in distributed systems",
+    "",
+]
+
+
+def populate(engine, documents: int):
+    """Bulk insert documents/2 contacts and documents/2 applications"""
+    from sqlalchemy import insert
+    from db.models import NetworkingContact, InternshipApplication, NetworkingStatus, InternshipStatus
+
+    today = date.today()
+    half = documents // 2
+    contacts = [{
+        'name': f"{FIRST_NAMES[i % 8]} {i}",
+        'job_title': TITLES[i % 4],
+        'company': COMPANIES[i % 7],
+        'contact_date': today - timedelta(days=i % 365),
+        'relevant_info': NOTES[i % 4],
+        'status': list(NetworkingStatus)[i % 4],
+    } for i in range(half)]
+    applications = [{
+        'role_name': f"{TITLES[i % 4]} Intern",
+        'company': COMPANIES[(i * 3) % 7],
+        'application_date': today - timedelta(days=i % 365),
+        'notes': NOTES[(i + 1) % 4],
+        'status': list(InternshipStatus)[i % 5],
+    } for i in range(documents - half)]
+
+    with engine.begin() as conn:
+        conn.execute(insert(NetworkingContact), contacts)
+        conn.execute(insert(InternshipApplication), applications)
+
+
+def time_ms(func, repeat: int) -> float:
+    """Median wall time of func() in milliseconds"""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--documents', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args(argv)
+
+    scratch = tempfile.mkdtemp(prefix='gti_bench_')
+    os.environ['XDG_DATA_HOME'] = scratch
+    os.environ['APPDATA'] = scratch
+
+    from db import session as db_session
+    from db.session import init_database, get_engine
+    from db.queries import ContactFilter, fetch_contact_rows
+    from db import search_index
+
+    init_database()
+    engine = get_engine()
+
+    start = time.perf_counter()
+    populate(engine, args.documents)
+    print(f"Inserted {args.documents} documents (triggers on) in "
+          f"{time.perf_counter() - start:.1f}s; db: {db_session.get_database_path()}")
+
+    print(f"\n{'query':<18} {'hits':>6} {'global (ms)':>12} {'list page (ms)':>15} {'LIKE page (ms)':>15}")
+    print("-" * 70)
+    for query in QUERIES:
+        contact_filter = ContactFilter(search_text=query)
+        hits = len(search_index.search(query))
+        global_ms = time_ms(lambda: search_index.search(query), args.repeat)
+        page_ms = time_ms(lambda: fetch_contact_rows(contact_filter, 0, 200), args.repeat)
+
+        search_index._available = False  # force the LIKE fallback
+        try:
+            like_ms = time_ms(lambda: fetch_contact_rows(contact_filter, 0, 200), args.repeat)
+        finally:
+            search_index._available = True
+
+        print(f"{query:<18} {hits:>6} {global_ms:>12.2f} {page_ms:>15.2f} {like_ms:>15.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,196 @@
+"""
+MainWindow startup benchmark: lazy views vs. building every view
+
+Each run is a fresh subprocess against a seeded scratch database. Measures
+the time to import ui.main_window, to construct and show the window, and
+until the views that were built have finished loading, plus peak RSS and
+the number of modules imported.
+
+Usage:
+    python -m benchmarks.bench_startup
+    python -m benchmarks.bench_startup --rows 20000 --runs 5 --json results.json
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+MODES = ['lazy', 'eager']
+
+
+def peak_rss_kb() -> int:
+    """Peak resident set size of this process in KB (None if unavailable)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux reports kilobytes
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def data_dir_env(data_dir: Path) -> dict:
+    """Environment that points get_app_data_dir() at data_dir on every platform"""
+    env = dict(os.environ)
+    env['XDG_DATA_HOME'] = str(data_dir)
+    env['APPDATA'] = str(data_dir)
+    env['HOME'] = str(data_dir)
+    env.setdefault('QT_QPA_PLATFORM', 'offscreen')
+    return env
+
+
+def seed_database(rows: int) -> None:
+    """Fill the (scratch) database with contacts and applications"""
+    from db.session import init_database, get_session
+    from db.models import NetworkingContact, NetworkingStatus, InternshipApplication, InternshipStatus
+
+    init_database()
+    contact_statuses = list(NetworkingStatus)
+    application_statuses = list(InternshipStatus)
+    today = date.today()
+
+    session = get_session()
+    try:
+        session.add_all(
+            NetworkingContact(
+                name=f"Contact {i}", job_title=f"Engineer {i % 37}", company=f"Company {i % 500}",
+                contact_date=today - timedelta(days=i % 365),
+                status=contact_statuses[i % len(contact_statuses)]
+            )
+            for i in range(rows)
+        )
+        session.add_all(
+            InternshipApplication(
+                role_name=f"Role {i}", company=f"Company {i % 500}",
+                application_date=today - timedelta(days=i % 365),
+                status=application_statuses[i % len(application_statuses)]
+            )
+            for i in range(rows // 4)
+        )
+        session.commit()
+    finally:
+        session.close()
+
+
+def run_worker(mode: str) -> dict:
+    """Start the main window once inside the current process"""
+    from PySide6.QtWidgets import QApplication
+
+    _ = QApplication.instance() or QApplication(sys.argv)  # kept alive for the whole run
+    baseline_modules = len(sys.modules)
+
+    start = time.perf_counter()
+    from db.session import init_database
+    init_database()
+    init_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    from ui.main_window import MainWindow
+    from utils.async_loader import AsyncLoader, wait_for_loaders
+    import_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    window = MainWindow()
+    if mode == 'eager':
+        for view_name in window.view_factories:
+            window.get_view(view_name)
+    window.show()
+    window_ms = (time.perf_counter() - start) * 1000
+
+    wait_for_loaders(*window.findChildren(AsyncLoader), timeout_ms=60000)
+    ready_ms = (time.perf_counter() - start) * 1000
+
+    result = {
+        'mode': mode,
+        'init_database_ms': round(init_ms, 2),
+        'import_ms': round(import_ms, 2),
+        'window_ms': round(window_ms, 2),
+        'ready_ms': round(ready_ms, 2),
+        'views_built': len(window.views),
+        'modules_imported': len(sys.modules) - baseline_modules,
+        'peak_rss_mb': None if resource is None else round(peak_rss_kb() / 1024, 2),
+    }
+    window.close()
+    return result
+
+
+def run_benchmark(rows: int, runs: int, modes) -> list:
+    """Seed one scratch database, then start the window runs times per mode"""
+    scratch = Path(tempfile.mkdtemp(prefix='gti_startup_'))
+    env = data_dir_env(scratch)
+    command = [sys.executable, '-m', 'benchmarks.bench_startup']
+    try:
+        subprocess.run(command + ['--seed', str(rows)], cwd=str(PROJECT_ROOT),
+                       env=env, check=True, capture_output=True)
+
+        results = []
+        for mode in modes:
+            samples = []
+            for _ in range(runs):
+                proc = subprocess.run(command + ['--worker', mode], cwd=str(PROJECT_ROOT),
+                                      env=env, capture_output=True, text=True)
+                if proc.returncode != 0:
+                    raise RuntimeError(proc.stderr.strip().splitlines()[-1])
+                samples.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+
+            # Median of every timing, the rest from the first run
+            summary = dict(samples[0])
+            for key in ('init_database_ms', 'import_ms', 'window_ms', 'ready_ms', 'peak_rss_mb'):
+                values = [s[key] for s in samples if s[key] is not None]
+                summary[key] = round(statistics.median(values), 2) if values else None
+            summary['rows'] = rows
+            results.append(summary)
+        return results
+    finally:
+        shutil.rmtree(scratch, ignore_errors=True)
+
+
+def print_results(results):
+    columns = ['mode', 'views_built', 'import_ms', 'window_ms', 'ready_ms', 'modules_imported', 'peak_rss_mb']
+    print("  ".join(f"{c:>16}" for c in columns))
+    print("-" * 18 * len(columns))
+    for result in results:
+        print("  ".join(f"{str(result[c]):>16}" for c in columns))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=5000, help="Contacts in the scratch database")
+    parser.add_argument('--runs', type=int, default=3, help="Cold starts per mode (median reported)")
+    parser.add_argument('--modes', nargs='+', choices=MODES, default=MODES)
+    parser.add_argument('--json', type=Path, help="Write results to this JSON file")
+    parser.add_argument('--seed', type=int, help=argparse.SUPPRESS)
+    parser.add_argument('--worker', choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.seed is not None:
+        seed_database(args.seed)
+        return 0
+    if args.worker:
+        print(json.dumps(run_worker(args.worker)))
+        return 0
+
+    results = run_benchmark(args.rows, args.runs, args.modes)
+    print_results(results)
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,288 @@
+"""
+Benchmark suite: timed user-facing scenarios on a seeded synthetic database
+
+Generates a scratch database with benchmarks.datagen, then times list
+load, search keystrokes, dashboard refresh, statistics dialog data,
+completer suggestions, follow-up check, CSV import/export and backups.
+Results are written as JSON and can be compared with an earlier run to
+spot regressions.
+
+Usage:
+    python -m benchmarks.bench_suite --json results.json
+    python -m benchmarks.bench_suite --contacts 50000 --json new.json --compare results.json
+    python -m benchmarks.bench_suite --scenarios list_load search_keystroke
+"""
+import argparse
+import json
+import platform
+import shutil
+import sqlite3
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from benchmarks.datagen import generate, scaled_counts, use_data_dir
+
+RESULTS_VERSION = 1
+
+# Prefixes typed one key at a time in the search box
+SEARCH_KEYSTROKES = ["m", "ma", "mar", "mari", "maria", "maria g"]
+
+
+class Scenario:
+    """A timed operation with optional untimed setup/teardown around every run"""
+
+    def __init__(self, name: str, description: str, run, setup=None, teardown=None):
+        self.name = name
+        self.description = description
+        self.run = run
+        self.setup = setup
+        self.teardown = teardown
+
+
+def _list_load():
+    from db.queries import ContactFilter, InternshipFilter
+    from ui.networking_list import query_contacts
+    from ui.internship_list import query_internships
+    query_contacts(ContactFilter(), 'table')
+    query_internships(InternshipFilter(), 200)
+
+
+def _search_keystroke():
+    from db.queries import ContactFilter, fetch_contact_rows, count_contacts
+    for text in SEARCH_KEYSTROKES:
+        contact_filter = ContactFilter(search_text=text)
+        count_contacts(contact_filter)
+        fetch_contact_rows(contact_filter, 0, 200)
+
+
+def _dashboard_refresh():
+    from ui.networking_dashboard import load_networking_snapshot
+    from utils.dashboard_snapshot import DashboardSnapshot
+    load_networking_snapshot()
+    DashboardSnapshot.internships()
+
+
+def _stats_open():
+    from ui.networking_stats import collect_networking_statistics
+    from ui.internship_stats import collect_internship_statistics
+    collect_networking_statistics()
+    collect_internship_statistics()
+
+
+def _lookup_suggest():
+    from utils.lookup_index import lookup_index
+    for text in SEARCH_KEYSTROKES:
+        lookup_index.suggest_companies(text[:3], include_applications=True)
+        lookup_index.suggest_contacts(text)
+
+
+def _followup_check():
+    from utils.smart_followup import SmartFollowUpService
+    SmartFollowUpService.get_followup_count()
+    SmartFollowUpService.get_followup_ids()
+
+
+class _ScratchFiles:
+    """Files and row watermarks shared by the import/export/backup scenarios"""
+
+    def __init__(self, directory: Path):
+        self.directory = directory
+        self.export_path = directory / 'export.csv'
+        self.import_path = directory / 'import.csv'
+        self.max_contact_id = 0
+
+    def csv_export(self):
+        from utils.export_engine import export_contacts
+        export_contacts(self.export_path)
+
+    def prepare_import(self):
+        from sqlalchemy import text
+        from db.session import get_engine
+        from utils.export_engine import export_contacts
+        if not self.import_path.exists():
+            export_contacts(self.import_path)
+        with get_engine().connect() as connection:
+            self.max_contact_id = connection.execute(text("SELECT max(id) FROM networking_contacts")).scalar()
+
+    def csv_import(self):
+        from utils.bulk_import import import_contacts_csv
+        import_contacts_csv(self.import_path, duplicates='report')
+
+    def undo_import(self):
+        """Remove the imported rows so every run starts from the same database"""
+        from sqlalchemy import text
+        from db.session import get_engine
+        from db.stats_counters import rebuild_stats_counters
+        from utils.performance import invalidate_tables
+        engine = get_engine()
+        with engine.begin() as connection:
+            connection.execute(text("DELETE FROM networking_contacts WHERE id > :max_id"),
+                               {'max_id': self.max_contact_id})
+        rebuild_stats_counters(engine, ['contact'])
+        invalidate_tables('networking_contacts')
+
+    def backup_manual(self):
+        from db.session import get_backup_manager
+        path = get_backup_manager().create_backup('manual')
+        path.unlink()
+
+    def backup_incremental(self):
+        from db.session import get_backup_manager
+        get_backup_manager().store.backup_database(get_backup_manager().database_path, ['daily'])
+
+
+def build_scenarios(scratch: _ScratchFiles) -> dict:
+    scenarios = [
+        Scenario('list_load', "First page of the contact and internship lists", _list_load),
+        Scenario('search_keystroke', f"Count + first page for {len(SEARCH_KEYSTROKES)} keystrokes",
+                 _search_keystroke),
+        Scenario('dashboard_refresh', "Networking and internship dashboard snapshots", _dashboard_refresh),
+        Scenario('stats_open', "Data behind both statistics dialogs", _stats_open),
+        Scenario('lookup_suggest', f"Company and contact completer suggestions for {len(SEARCH_KEYSTROKES)} keystrokes",
+                 _lookup_suggest),
+        Scenario('followup_check', "Follow-up count and ids", _followup_check),
+        Scenario('csv_export', "Export all contacts to CSV", scratch.csv_export),
+        Scenario('csv_import', "Import all contacts again (with duplicate check)", scratch.csv_import,
+                 setup=scratch.prepare_import, teardown=scratch.undo_import),
+        Scenario('backup_manual', "Compressed manual backup", scratch.backup_manual),
+        Scenario('backup_incremental', "Backup into the chunk store", scratch.backup_incremental),
+    ]
+    return {scenario.name: scenario for scenario in scenarios}
+
+
+def time_scenario(scenario: Scenario, repeat: int) -> dict:
+    from utils.performance import global_cache
+    samples = []
+    for _ in range(repeat):
+        if scenario.setup:
+            scenario.setup()
+        # Time the queries, not hits of the read-through cache
+        global_cache.clear()
+        start = time.perf_counter()
+        scenario.run()
+        samples.append((time.perf_counter() - start) * 1000)
+        if scenario.teardown:
+            scenario.teardown()
+    samples.sort()
+    return {
+        'description': scenario.description,
+        'runs': repeat,
+        'median_ms': round(statistics.median(samples), 2),
+        'min_ms': round(samples[0], 2),
+        'max_ms': round(samples[-1], 2),
+    }
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=str(PROJECT_ROOT),
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(contacts: int, seed: int, repeat: int, names) -> dict:
+    scratch_dir = Path(tempfile.mkdtemp(prefix='gti_suite_'))
+    try:
+        use_data_dir(scratch_dir)
+        from db.session import init_database, get_engine
+
+        init_database()
+        start = time.perf_counter()
+        counts = generate(get_engine(), contacts, seed)
+        print(f"Generated {counts} in {time.perf_counter() - start:.1f}s")
+
+        scenarios = build_scenarios(_ScratchFiles(scratch_dir))
+        results = {}
+        for name in names:
+            results[name] = time_scenario(scenarios[name], repeat)
+            print(f"  {name:<20} {results[name]['median_ms']:>10.2f} ms")
+
+        return {
+            'version': RESULTS_VERSION,
+            'meta': {
+                'created': datetime.now().isoformat(timespec='seconds'),
+                'revision': git_revision(),
+                'python': platform.python_version(),
+                'sqlite': sqlite3.sqlite_version,
+                'platform': sys.platform,
+                'seed': seed,
+                'repeat': repeat,
+                'rows': counts,
+            },
+            'scenarios': results,
+        }
+    finally:
+        shutil.rmtree(scratch_dir, ignore_errors=True)
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list:
+    """
+    Print current vs. baseline medians
+
+    Returns:
+        Names of scenarios slower than the baseline by more than threshold (fraction)
+    """
+    if baseline.get('meta', {}).get('rows') != results['meta']['rows']:
+        print("Note: baseline was generated with different row counts")
+
+    regressions = []
+    print(f"\n{'scenario':<20} {'baseline ms':>12} {'current ms':>12} {'change':>9}")
+    print("-" * 56)
+    for name, current in results['scenarios'].items():
+        before = baseline.get('scenarios', {}).get(name)
+        if before is None:
+            print(f"{name:<20} {'-':>12} {current['median_ms']:>12.2f} {'new':>9}")
+            continue
+        change = (current['median_ms'] - before['median_ms']) / before['median_ms'] if before['median_ms'] else 0.0
+        flag = ''
+        if change > threshold:
+            regressions.append(name)
+            flag = '  REGRESSION'
+        print(f"{name:<20} {before['median_ms']:>12.2f} {current['median_ms']:>12.2f} {change:>+8.0%}{flag}")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--contacts', type=int, default=10000,
+                        help="Contacts to generate; other tables scale with it "
+                             f"(e.g. {scaled_counts(10000)})")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--repeat', type=int, default=5, help="Runs per scenario (median reported)")
+    parser.add_argument('--scenarios', nargs='+', help="Only these scenarios (default: all)")
+    parser.add_argument('--json', type=Path, help="Write results to this JSON file")
+    parser.add_argument('--compare', type=Path, help="Baseline results JSON to compare with")
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help="Slowdown (fraction of the baseline median) reported as a regression")
+    args = parser.parse_args(argv)
+
+    available = list(build_scenarios(_ScratchFiles(Path('.'))))
+    names = args.scenarios or available
+    unknown = [name for name in names if name not in available]
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(unknown)} (choose from {', '.join(available)})")
+
+    results = run_suite(args.contacts, args.seed, args.repeat, names)
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+    if args.compare:
+        regressions = compare(results, json.loads(args.compare.read_text()), args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
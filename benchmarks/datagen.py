@@ -0,0 +1,187 @@
+"""
+Seeded synthetic data for benchmarks
+
+Fills the application database with contacts, applications, interviews,
+tasks and activity log rows. The same seed and sizes always give the same
+rows, so benchmark runs are comparable.
+
+Usage:
+    python -m benchmarks.datagen --contacts 10000 --data-dir /tmp/gti_bench
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+FIRST_NAMES = ["Maria", "James", "Wei", "Aisha", "Lucas", "Priya", "Noah", "Elena",
+               "Carlos", "Fatima", "Liam", "Olivia", "Kenji", "Amara", "Mateo", "Sofia"]
+LAST_NAMES = ["Smith", "Garcia", "Chen", "Patel", "Kim", "Nguyen", "Brown", "Okafor",
+              "Rossi", "Muller", "Silva", "Cohen", "Ivanova", "Tanaka", "Haddad", "Jensen"]
+COMPANIES = ["Google", "Stripe", "Shopify", "Datadog", "Airbnb", "Cloudflare", "Revolut",
+             "Atlassian", "Figma", "Snowflake", "Canva", "Notion", "Spotify", "Klarna"]
+TITLES = ["Software Engineer", "Recruiter", "Product Manager", "Data Scientist",
+          "Engineering Manager", "Designer", "Security Engineer"]
+ROLES = ["Software Engineering Intern", "Data Science Intern", "Product Intern",
+         "Machine Learning Intern", "Backend Intern", "Frontend Intern"]
+NOTE_WORDS = ("met at career fair alumni referral kubernetes fintech startup distributed "
+              "systems follow up coffee chat onsite team roadmap interested hiring").split()
+
+# Rows per Core executemany
+_BATCH_SIZE = 5000
+
+
+def scaled_counts(contacts: int) -> dict:
+    """Row counts of every table for a given number of contacts"""
+    return {
+        'contacts': contacts,
+        'applications': contacts // 2,
+        'interviews': contacts // 4,
+        'tasks': contacts // 2,
+        'activities': contacts * 3,
+    }
+
+
+def _notes(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(NOTE_WORDS) for _ in range(rng.randint(0, words)))
+
+
+def _insert(connection, table, rows) -> None:
+    from sqlalchemy import insert
+    for start in range(0, len(rows), _BATCH_SIZE):
+        connection.execute(insert(table), rows[start:start + _BATCH_SIZE])
+
+
+def generate(engine, contacts: int, seed: int = 42, today: date = None) -> dict:
+    """
+    Insert a seeded synthetic dataset (sizes from scaled_counts)
+
+    Args:
+        engine: Engine of an initialized, empty database
+        contacts: Number of contacts; the other tables scale with it
+        seed: Random seed
+        today: Reference date for relative dates (default: date.today())
+
+    Returns:
+        Rows inserted per table
+    """
+    from db.models import NetworkingContact, NetworkingStatus, InternshipApplication, InternshipStatus
+    from db.enhanced_models import (
+        Interview, InterviewType, InterviewOutcome, Task, TaskPriority, TaskStatus, TaskType,
+        ActivityLog, ActivityType, EntityType
+    )
+    from db.stats_counters import rebuild_stats_counters
+
+    rng = random.Random(seed)
+    today = today or date.today()
+    now = datetime.combine(today, datetime.min.time()) + timedelta(hours=12)
+    counts = scaled_counts(contacts)
+
+    contact_rows = []
+    for i in range(counts['contacts']):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        company = rng.choice(COMPANIES)
+        contact_rows.append({
+            'name': f"{first} {last}",
+            'job_title': rng.choice(TITLES),
+            'company': company,
+            'contact_date': today - timedelta(days=rng.randint(0, 400)),
+            'status': rng.choices(list(NetworkingStatus), weights=[6, 2, 1, 1])[0],
+            'email': f"{first}.{last}{i}@{company.lower()}.com".lower(),
+            'relevant_info': _notes(rng, 25),
+            'created_at': now, 'updated_at': now,
+        })
+
+    application_rows = [{
+        'role_name': rng.choice(ROLES),
+        'company': rng.choice(COMPANIES),
+        'application_date': today - timedelta(days=rng.randint(0, 300)),
+        'status': rng.choices(list(InternshipStatus), weights=[6, 2, 2, 1, 4])[0],
+        'contact_id': rng.randint(1, counts['contacts']) if counts['contacts'] and rng.random() < 0.3 else None,
+        'notes': _notes(rng, 40),
+        'created_at': now, 'updated_at': now,
+    } for _ in range(counts['applications'])]
+
+    interview_rows = [{
+        'application_id': rng.randint(1, counts['applications']),
+        'interview_round': rng.randint(1, 4),
+        'interview_type': rng.choice(list(InterviewType)),
+        'scheduled_date': now + timedelta(days=rng.randint(-60, 30), hours=rng.randint(0, 8)),
+        'duration_minutes': rng.choice([30, 45, 60]),
+        'outcome': rng.choice(list(InterviewOutcome)),
+        'created_at': now,
+    } for _ in range(counts['interviews'] if counts['applications'] else 0)]
+
+    task_rows = [{
+        'title': f"{rng.choice(['Follow up with', 'Prepare for', 'Research'])} {rng.choice(COMPANIES)}",
+        'due_date': today + timedelta(days=rng.randint(-20, 40)),
+        'priority': rng.choice(list(TaskPriority)),
+        'status': rng.choice(list(TaskStatus)),
+        'task_type': rng.choice(list(TaskType)),
+        'related_contact_id': rng.randint(1, counts['contacts']) if counts['contacts'] else None,
+        'created_at': now,
+    } for _ in range(counts['tasks'])]
+
+    activity_rows = []
+    for i in range(counts['activities']):
+        entity_type = rng.choice([EntityType.CONTACT, EntityType.APPLICATION])
+        limit = counts['contacts'] if entity_type is EntityType.CONTACT else counts['applications']
+        activity_rows.append({
+            'timestamp': now - timedelta(minutes=counts['activities'] - i),
+            'activity_type': rng.choice(list(ActivityType)),
+            'entity_type': entity_type,
+            'entity_id': rng.randint(1, max(limit, 1)),
+            'details': {'source': 'datagen'},
+        })
+
+    with engine.begin() as connection:
+        _insert(connection, NetworkingContact.__table__, contact_rows)
+        _insert(connection, InternshipApplication.__table__, application_rows)
+        _insert(connection, Interview.__table__, interview_rows)
+        _insert(connection, Task.__table__, task_rows)
+        _insert(connection, ActivityLog.__table__, activity_rows)
+
+    # Core inserts skip the ORM listeners that maintain the counters
+    rebuild_stats_counters(engine)
+    return {
+        'contacts': len(contact_rows), 'applications': len(application_rows),
+        'interviews': len(interview_rows), 'tasks': len(task_rows), 'activities': len(activity_rows),
+    }
+
+
+def use_data_dir(data_dir: Path) -> None:
+    """Point get_app_data_dir() (and the backup/log directories under HOME) at data_dir"""
+    data_dir.mkdir(parents=True, exist_ok=True)
+    os.environ['XDG_DATA_HOME'] = str(data_dir)
+    os.environ['APPDATA'] = str(data_dir)
+    os.environ['HOME'] = str(data_dir)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--contacts', type=int, default=10000)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--data-dir', type=Path, required=True,
+                        help="Application data directory to create the database in (must be empty)")
+    args = parser.parse_args(argv)
+
+    use_data_dir(args.data_dir)
+    from db.session import init_database, get_engine, get_database_path
+    if get_database_path().exists():
+        parser.error(f"{get_database_path()} already exists")
+    init_database()
+
+    start = time.perf_counter()
+    counts = generate(get_engine(), args.contacts, args.seed)
+    print(f"Generated {counts} in {time.perf_counter() - start:.1f}s: {get_database_path()}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,327 @@
+"""
+Activity log writer and queries
+User actions are buffered and inserted into activity_log in batches; timelines are indexed queries
+"""
+import atexit
+import json
+import logging
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Union
+from sqlalchemy import insert, select
+from db.enhanced_models import ActivityLog, ActivityType, EntityType
+
+logger = logging.getLogger('GTI_Tracker.ActivityLog')
+
+# Flush after this many buffered events...
+FLUSH_EVERY_EVENTS = 50
+# ...or this long after the oldest buffered event
+FLUSH_INTERVAL_MS = 500
+
+# Model class names accepted as entity types (OperationLogger callers pass these)
+_ENTITY_TYPE_ALIASES = {
+    'NetworkingContact': EntityType.CONTACT,
+    'InternshipApplication': EntityType.APPLICATION,
+    'Interview': EntityType.INTERVIEW,
+    'Task': EntityType.TASK,
+    'Document': EntityType.DOCUMENT,
+}
+
+
+def _to_enum(enum_class, value, aliases: Optional[dict] = None):
+    """Enum member from a member, its name ('ADDED_CONTACT') or its value ('Added Contact')"""
+    if isinstance(value, enum_class):
+        return value
+    if aliases and value in aliases:
+        return aliases[value]
+    if value in enum_class.__members__:
+        return enum_class[value]
+    return enum_class(value)
+
+
+def resolve_entity_type(entity_type: Union[EntityType, str]) -> EntityType:
+    """EntityType from a member, name, value or model class name"""
+    return _to_enum(EntityType, entity_type, _ENTITY_TYPE_ALIASES)
+
+
+def _activity_row(timestamp: datetime, activity_type, entity_type, entity_id: Optional[int],
+                  details: Optional[dict] = None, user_note: Optional[str] = None) -> dict:
+    """
+    Validated activity_log row
+
+    Raises:
+        ValueError: unknown activity or entity type, no entity_id, or
+            details that cannot be stored as JSON
+    """
+    if entity_id is None:
+        raise ValueError("entity_id is required")
+    details = details or {}
+    try:
+        json.dumps(details)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"details are not JSON-serializable: {e}") from e
+    return {
+        'timestamp': timestamp,
+        'activity_type': _to_enum(ActivityType, activity_type),
+        'entity_type': resolve_entity_type(entity_type),
+        'entity_id': entity_id,
+        'details': details,
+        'user_note': user_note,
+    }
+
+
+def _insert_rows(rows: list) -> int:
+    """
+    Insert activity rows in one transaction; if that fails, one transaction
+    per row so a bad row only loses itself
+
+    Returns:
+        Number of rows inserted
+    """
+    if not rows:
+        return 0
+
+    from db.session import get_session
+    session = get_session()
+    try:
+        session.execute(insert(ActivityLog), rows)
+        session.commit()
+        return len(rows)
+    except Exception as e:
+        session.rollback()
+        if len(rows) == 1:
+            logger.error(f"Dropped activity {rows[0]['activity_type'].name} "
+                         f"({rows[0]['entity_type'].name} {rows[0]['entity_id']}): {e}")
+            return 0
+        logger.warning(f"Failed to write {len(rows)} activities at once, retrying one by one: {e}")
+    finally:
+        session.close()
+    return sum(_insert_rows([row]) for row in rows)
+
+
+class ActivityLogWriter:
+    """
+    Buffers activity rows and inserts them from a background thread
+
+    record() only appends to an in-memory buffer. The writer thread inserts
+    the buffer in one transaction once it holds flush_every events or the
+    oldest event is flush_interval_ms old, whichever comes first.
+    """
+
+    def __init__(self, flush_every: int = FLUSH_EVERY_EVENTS, flush_interval_ms: int = FLUSH_INTERVAL_MS):
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval_ms / 1000
+        self._buffer = []
+        self._condition = threading.Condition()
+        # Serializes inserts so flush() returns only after earlier rows are committed
+        self._write_lock = threading.Lock()
+        self._thread = None
+
+    def record(self, activity_type, entity_type, entity_id: int,
+               details: Optional[dict] = None, user_note: Optional[str] = None) -> None:
+        """
+        Buffer one activity
+
+        Raises:
+            ValueError: unknown activity or entity type, no entity_id, or
+                details that cannot be stored as JSON
+        """
+        row = _activity_row(datetime.now(), activity_type, entity_type, entity_id, details, user_note)
+        with self._condition:
+            self._buffer.append(row)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='GTI_Tracker.ActivityLog', daemon=True)
+                self._thread.start()
+                # The thread is a daemon: write what is still buffered at exit
+                atexit.register(self.flush)
+            if len(self._buffer) >= self.flush_every:
+                self._condition.notify()
+
+    def pending(self) -> int:
+        """Events buffered and not yet inserted"""
+        with self._condition:
+            return len(self._buffer)
+
+    def _run(self) -> None:
+        while True:
+            with self._condition:
+                while not self._buffer:
+                    self._condition.wait()
+                # Give the batch time to fill up, unless it already has
+                self._condition.wait_for(lambda: len(self._buffer) >= self.flush_every,
+                                         timeout=self.flush_interval)
+            self.flush()
+
+    def flush(self) -> int:
+        """
+        Insert every buffered event now, in one transaction (row by row if that fails)
+
+        Returns:
+            Number of rows inserted
+        """
+        with self._write_lock:
+            with self._condition:
+                rows, self._buffer = self._buffer, []
+            return _insert_rows(rows)
+
+
+# Process-wide writer used by OperationLogger
+activity_writer = ActivityLogWriter()
+
+
+def _as_dict(entry: ActivityLog) -> dict:
+    return {
+        'id': entry.id,
+        'timestamp': entry.timestamp.isoformat(),
+        'action': entry.activity_type.name,
+        'entity_type': entry.entity_type.name,
+        'entity_id': entry.entity_id,
+        'details': entry.details or {},
+        'user_note': entry.user_note,
+    }
+
+
+def get_entity_timeline(entity_type, entity_id: int, limit: int = 100) -> list:
+    """
+    Activities of one entity, newest first (idx_activity_entity)
+
+    Args:
+        entity_type: EntityType, its name/value, or a model class name
+        entity_id: Primary key of the entity
+        limit: Maximum number of entries
+    """
+    from db.session import get_session
+
+    activity_writer.flush()
+    session = get_session()
+    try:
+        entries = session.execute(
+            select(ActivityLog)
+            .where(ActivityLog.entity_type == resolve_entity_type(entity_type),
+                   ActivityLog.entity_id == entity_id)
+            .order_by(ActivityLog.timestamp.desc(), ActivityLog.id.desc())
+            .limit(limit)
+        ).scalars().all()
+        return [_as_dict(entry) for entry in entries]
+    finally:
+        session.close()
+
+
+def get_recent_activities(limit: int = 50, entity_type=None) -> list:
+    """
+    Most recent activities, newest first (idx_activity_timestamp)
+
+    Args:
+        limit: Maximum number of entries
+        entity_type: Only this entity type (optional)
+    """
+    from db.session import get_session
+
+    activity_writer.flush()
+    session = get_session()
+    try:
+        query = select(ActivityLog)
+        if entity_type is not None:
+            query = query.where(ActivityLog.entity_type == resolve_entity_type(entity_type))
+        entries = session.execute(
+            query.order_by(ActivityLog.timestamp.desc(), ActivityLog.id.desc()).limit(limit)
+        ).scalars().all()
+        return [_as_dict(entry) for entry in entries]
+    finally:
+        session.close()
+
+
+def _legacy_activity_files(log_dir: Path) -> list:
+    """user_activity.json (JSON array), then the JSON Lines segments, oldest first"""
+    files = []
+    if (log_dir / 'user_activity.json').exists():
+        files.append(log_dir / 'user_activity.json')
+    segments = []
+    for path in log_dir.glob('user_activity.*.jsonl'):
+        number = path.name[len('user_activity.'):-len('.jsonl')]
+        if number.isdigit():
+            segments.append((int(number), path))
+    files.extend(path for _, path in sorted(segments))
+    if (log_dir / 'user_activity.jsonl').exists():
+        files.append(log_dir / 'user_activity.jsonl')
+    return files
+
+
+def _read_legacy_records(path: Path) -> list:
+    if path.suffix == '.json':
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    records = []
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        for line in f:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                continue  # torn write from a crash
+    return records
+
+
+def import_legacy_activity(log_dir: Optional[Path] = None) -> int:
+    """
+    Move the activity history of earlier versions (user_activity*.json/.jsonl) into activity_log
+
+    Runs once: every file read is renamed to <name>.imported. Earlier versions
+    did not record entity ids; a contact entry is attributed to the contact
+    whose name matches details['name'] when exactly one does, and entries
+    that cannot be attributed are skipped (they stay in the .imported file).
+
+    Args:
+        log_dir: Directory of the old logs (default: ~/.gti_tracker/logs)
+
+    Returns:
+        Number of activities imported
+    """
+    from sqlalchemy import func
+    from db.models import NetworkingContact
+    from db.session import get_session
+
+    log_dir = Path(log_dir) if log_dir is not None else Path.home() / '.gti_tracker' / 'logs'
+    files = _legacy_activity_files(log_dir) if log_dir.is_dir() else []
+    if not files:
+        return 0
+
+    session = get_session()
+    try:
+        contact_ids = {
+            name: contact_id for name, contact_id in session.execute(
+                select(NetworkingContact.name, func.min(NetworkingContact.id))
+                .group_by(NetworkingContact.name)
+                .having(func.count(NetworkingContact.id) == 1)
+            )
+        }
+    finally:
+        session.close()
+
+    rows, skipped = [], 0
+    for path in files:
+        try:
+            records = _read_legacy_records(path)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read {path}: {e}")
+            continue
+        for record in records:
+            try:
+                entity_type = resolve_entity_type(record.get('entity_type'))
+                entity_id = record.get('entity_id')
+                details = record.get('details') or {}
+                if entity_id is None and entity_type is EntityType.CONTACT:
+                    entity_id = contact_ids.get(details.get('name'))
+                rows.append(_activity_row(
+                    datetime.fromisoformat(record['timestamp']), record.get('action'),
+                    entity_type, entity_id, details
+                ))
+            except (AttributeError, KeyError, TypeError, ValueError):
+                skipped += 1
+
+    imported = _insert_rows(rows)
+    for path in files:
+        path.replace(path.with_name(path.name + '.imported'))
+    logger.info(f"Imported {imported} activities from {len(files)} legacy log files"
+                + (f", skipped {skipped} without a known entity" if skipped else ""))
+    return imported
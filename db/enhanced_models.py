@@ -79,6 +79,7 @@ class CompanySize(enum.Enum):
 class ActivityType(enum.Enum):
     """Activity log types"""
     ADDED_CONTACT = "Added Contact"
+    UPDATED_CONTACT = "Updated Contact"
     SENT_MESSAGE = "Sent Message"
     UPDATED_STATUS = "Updated Status"
     SUBMITTED_APPLICATION = "Submitted Application"
@@ -123,8 +124,12 @@ class Task(Base):
     reminder_enabled = Column(Boolean, default=True)
 
     # Relationships
-    related_contact = relationship("NetworkingContact", foreign_keys=[related_contact_id])
-    related_application = relationship("InternshipApplication", foreign_keys=[related_application_id])
+    related_contact = relationship(
+        "NetworkingContact", foreign_keys=[related_contact_id], back_populates="related_tasks"
+    )
+    related_application = relationship(
+        "InternshipApplication", foreign_keys=[related_application_id], back_populates="related_tasks"
+    )
 
     def __repr__(self):
         return f"<Task(id={self.id}, title='{self.title}', status='{self.status.value}')>"
@@ -220,3 +225,15 @@ InternshipApplication.interviews = relationship(
     cascade="all, delete-orphan"
 )
 
+# Tasks outlive the contact/application they point at: deleting one through
+# the ORM nulls the link first (PRAGMA foreign_keys rejects dangling ids)
+NetworkingContact.related_tasks = relationship(
+    "Task",
+    foreign_keys=[Task.related_contact_id],
+    back_populates="related_contact"
+)
+InternshipApplication.related_tasks = relationship(
+    "Task",
+    foreign_keys=[Task.related_application_id],
+    back_populates="related_application"
+)
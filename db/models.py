@@ -5,7 +5,7 @@ Enterprise-grade data models with ACID compliance, audit trails, and soft deleti
 from datetime import datetime, date
 from sqlalchemy import (
     Column, Integer, String, Text, Date, DateTime,
-    ForeignKey, Enum as SQLEnum, Boolean, event
+    ForeignKey, Enum as SQLEnum, Boolean, Index, event
 )
 from sqlalchemy.orm import declarative_base, relationship
 from sqlalchemy.ext.declarative import declared_attr
@@ -137,3 +137,20 @@ class Settings(Base):
     def __repr__(self):
         return f"<Settings(id={self.id}, follow_up_days={self.follow_up_days})>"
 
+
+
+class StatsCounter(Base):
+    """Materialized count, e.g. (contact, status, COLD_MESSAGE) -> 42 (see db.stats_counters)"""
+    __tablename__ = 'stats_counters'
+
+    entity = Column(String(20), primary_key=True)
+    dimension = Column(String(20), primary_key=True)
+    key = Column(String(200), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        Index('idx_stats_counters_top', 'entity', 'dimension', 'count'),
+    )
+
+    def __repr__(self):
+        return f"<StatsCounter({self.entity}.{self.dimension}[{self.key!r}]={self.count})>"
@@ -0,0 +1,251 @@
+"""
+Query layer for the list views
+Search text, status filter and sort key are compiled into one SQL statement
+with LIMIT/OFFSET paging; search text goes through the FTS5 index when present
+"""
+from collections import namedtuple
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional
+from sqlalchemy import select, func, and_, or_, false, true
+from db.models import (
+    NetworkingContact, NetworkingStatus,
+    InternshipApplication, InternshipStatus
+)
+from db.session import get_session
+from db import search_index
+from utils.smart_followup import SmartFollowUpService
+
+
+# Plain, session-independent snapshot of a contact for display
+ContactRow = namedtuple('ContactRow', [
+    'id', 'name', 'job_title', 'company', 'phone',
+    'linkedin_url', 'contact_date', 'status'
+])
+
+# Plain snapshot of an application plus its linked contact (if any)
+InternshipRow = namedtuple('InternshipRow', [
+    'id', 'role_name', 'company', 'application_date', 'status', 'job_link',
+    'contact_id', 'contact_name', 'contact_job_title', 'contact_company'
+])
+
+CONTACT_ROW_COLUMNS = (
+    NetworkingContact.id,
+    NetworkingContact.name,
+    NetworkingContact.job_title,
+    NetworkingContact.company,
+    NetworkingContact.phone,
+    NetworkingContact.linkedin_url,
+    NetworkingContact.contact_date,
+    NetworkingContact.status,
+)
+
+# Sort keys used by the "Sort by" combos. Every order ends on id so paging is stable.
+# date -> idx_networking_date, name/company -> the NOCASE indexes
+CONTACT_SORT_ORDERS = {
+    'date_desc': (NetworkingContact.contact_date.desc(), NetworkingContact.id.desc()),
+    'date_asc': (NetworkingContact.contact_date.asc(), NetworkingContact.id.asc()),
+    'name_asc': (NetworkingContact.name.collate('NOCASE').asc(), NetworkingContact.id.asc()),
+    'name_desc': (NetworkingContact.name.collate('NOCASE').desc(), NetworkingContact.id.desc()),
+    'company_asc': (NetworkingContact.company.collate('NOCASE').asc(), NetworkingContact.id.asc()),
+    'company_desc': (NetworkingContact.company.collate('NOCASE').desc(), NetworkingContact.id.desc()),
+}
+
+INTERNSHIP_SORT_ORDERS = {
+    'date_desc': (InternshipApplication.application_date.desc(), InternshipApplication.id.desc()),
+    'date_asc': (InternshipApplication.application_date.asc(), InternshipApplication.id.asc()),
+    'company_asc': (InternshipApplication.company.collate('NOCASE').asc(), InternshipApplication.id.asc()),
+    'role_asc': (InternshipApplication.role_name.collate('NOCASE').asc(), InternshipApplication.id.asc()),
+}
+
+
+@dataclass(frozen=True)
+class ContactFilter:
+    """Filter and sort state of the contact list"""
+    search_text: str = ''
+    status: Optional[NetworkingStatus] = None
+    sort_key: str = 'date_desc'
+    # Only contacts past their follow-up threshold (SmartFollowUpService)
+    needs_followup: bool = False
+
+
+@dataclass(frozen=True)
+class InternshipFilter:
+    """Filter and sort state of the internship list"""
+    search_text: str = ''
+    status: Optional[InternshipStatus] = None
+    sort_key: str = 'date_desc'
+
+
+def contact_to_row(contact: NetworkingContact) -> ContactRow:
+    """Convert a NetworkingContact into a ContactRow"""
+    return ContactRow(
+        contact.id, contact.name, contact.job_title, contact.company,
+        contact.phone, contact.linkedin_url, contact.contact_date, contact.status
+    )
+
+
+def like_pattern(text: str) -> str:
+    """Build a LIKE substring pattern with wildcards in the input escaped"""
+    escaped = text.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
+    return f"%{escaped}%"
+
+
+def _contact_criteria(contact_filter: ContactFilter) -> list:
+    """WHERE clauses for a contact filter"""
+    criteria = []
+
+    search_text = contact_filter.search_text.strip()
+    if search_text and search_index.is_available():
+        # Prefix search over name, title, company, notes and email
+        matches = search_index.match_ids_query('contact', search_text)
+        criteria.append(NetworkingContact.id.in_(matches) if matches is not None else false())
+    elif search_text:
+        # SQLite LIKE is case-insensitive for ASCII, matching the old lower() scan
+        pattern = like_pattern(search_text)
+        criteria.append(or_(
+            NetworkingContact.name.like(pattern, escape='\\'),
+            NetworkingContact.company.like(pattern, escape='\\'),
+            NetworkingContact.job_title.like(pattern, escape='\\'),
+        ))
+
+    if contact_filter.status is not None:
+        criteria.append(NetworkingContact.status == contact_filter.status)
+
+    if contact_filter.needs_followup:
+        # Same predicate as the follow-up badge and notifications
+        criteria.append(SmartFollowUpService.followup_condition(date.today()))
+
+    return criteria
+
+
+def contact_filter_clauses(contact_filter: ContactFilter) -> tuple:
+    """(WHERE clause, ORDER BY columns) of a contact filter, for queries built elsewhere"""
+    order_by = CONTACT_SORT_ORDERS.get(contact_filter.sort_key, CONTACT_SORT_ORDERS['date_desc'])
+    return and_(true(), *_contact_criteria(contact_filter)), order_by
+
+
+def _internship_criteria(internship_filter: InternshipFilter) -> list:
+    """WHERE clauses for an internship filter"""
+    criteria = []
+
+    search_text = internship_filter.search_text.strip()
+    if search_text and search_index.is_available():
+        # Prefix search over role, company, location and notes
+        matches = search_index.match_ids_query('application', search_text)
+        criteria.append(InternshipApplication.id.in_(matches) if matches is not None else false())
+    elif search_text:
+        pattern = like_pattern(search_text)
+        criteria.append(or_(
+            InternshipApplication.role_name.like(pattern, escape='\\'),
+            InternshipApplication.company.like(pattern, escape='\\'),
+        ))
+
+    if internship_filter.status is not None:
+        criteria.append(InternshipApplication.status == internship_filter.status)
+
+    return criteria
+
+
+def build_contact_query(contact_filter: ContactFilter, offset: int = 0,
+                        limit: Optional[int] = None):
+    """Build the paged SELECT for a contact filter"""
+    order_by = CONTACT_SORT_ORDERS.get(contact_filter.sort_key, CONTACT_SORT_ORDERS['date_desc'])
+    stmt = (
+        select(*CONTACT_ROW_COLUMNS)
+        .where(*_contact_criteria(contact_filter))
+        .order_by(*order_by)
+    )
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    if offset:
+        stmt = stmt.offset(offset)
+    return stmt
+
+
+def build_internship_query(internship_filter: InternshipFilter, offset: int = 0,
+                           limit: Optional[int] = None):
+    """Build the paged SELECT for an internship filter, joined to the linked contact"""
+    order_by = INTERNSHIP_SORT_ORDERS.get(
+        internship_filter.sort_key, INTERNSHIP_SORT_ORDERS['date_desc']
+    )
+    stmt = (
+        select(
+            InternshipApplication.id,
+            InternshipApplication.role_name,
+            InternshipApplication.company,
+            InternshipApplication.application_date,
+            InternshipApplication.status,
+            InternshipApplication.job_link,
+            InternshipApplication.contact_id,
+            NetworkingContact.name,
+            NetworkingContact.job_title,
+            NetworkingContact.company,
+        )
+        .outerjoin(NetworkingContact, InternshipApplication.contact_id == NetworkingContact.id)
+        .where(*_internship_criteria(internship_filter))
+        .order_by(*order_by)
+    )
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    if offset:
+        stmt = stmt.offset(offset)
+    return stmt
+
+
+def count_contacts(contact_filter: ContactFilter) -> int:
+    """Count contacts matching a filter"""
+    session = get_session()
+    try:
+        stmt = select(func.count(NetworkingContact.id)).where(*_contact_criteria(contact_filter))
+        return session.execute(stmt).scalar_one()
+    finally:
+        session.close()
+
+
+def fetch_contact_rows(contact_filter: ContactFilter, offset: int = 0,
+                       limit: Optional[int] = None) -> list:
+    """Fetch one page of ContactRow tuples"""
+    session = get_session()
+    try:
+        result = session.execute(build_contact_query(contact_filter, offset, limit))
+        return [ContactRow(*row) for row in result]
+    finally:
+        session.close()
+
+
+def fetch_contacts(contact_filter: ContactFilter, offset: int = 0,
+                   limit: Optional[int] = None) -> list:
+    """Fetch one page of full NetworkingContact objects (detached)"""
+    session = get_session()
+    try:
+        # Same filter, order and paging as the row query, selecting the entity
+        stmt = build_contact_query(contact_filter, offset, limit).with_only_columns(NetworkingContact)
+        return list(session.execute(stmt).scalars())
+    finally:
+        session.close()
+
+
+def count_internships(internship_filter: InternshipFilter) -> int:
+    """Count applications matching a filter"""
+    session = get_session()
+    try:
+        stmt = (
+            select(func.count(InternshipApplication.id))
+            .where(*_internship_criteria(internship_filter))
+        )
+        return session.execute(stmt).scalar_one()
+    finally:
+        session.close()
+
+
+def fetch_internship_rows(internship_filter: InternshipFilter, offset: int = 0,
+                          limit: Optional[int] = None) -> list:
+    """Fetch one page of InternshipRow tuples"""
+    session = get_session()
+    try:
+        result = session.execute(build_internship_query(internship_filter, offset, limit))
+        return [InternshipRow(*row) for row in result]
+    finally:
+        session.close()
+
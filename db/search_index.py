@@ -0,0 +1,406 @@
+"""
+Full-text search index (SQLite FTS5)
+One search_index table covers contacts, applications and the enhanced tables,
+kept in sync by triggers, with ranked prefix search and highlighted snippets
+"""
+import html
+import logging
+import re
+import unicodedata
+from collections import namedtuple
+from typing import Iterable, Optional
+from sqlalchemy import Integer, text
+
+logger = logging.getLogger('GTI_Tracker.Search')
+
+# Result of a global search; title/subtitle/snippet are HTML with <b> around matches
+SearchHit = namedtuple('SearchHit', [
+    'entity', 'entity_id', 'title', 'subtitle', 'snippet', 'rank'
+])
+
+# The best hits, how many documents matched, and whether only the newest
+# MAX_RANKED_CANDIDATES of them were ranked
+SearchResults = namedtuple('SearchResults', ['hits', 'matched', 'truncated'])
+
+DEFAULT_LIMIT = 50
+
+# Every indexed source table: entity name -> (table, rowid code, title, subtitle, body).
+# Column expressions use {row}, which becomes NEW/OLD in triggers and the table
+# name when rebuilding. The FTS rowid is source id * 8 + code, so each trigger
+# touches exactly one index row and hits decode without reading stored columns.
+INDEXED_ENTITIES = {
+    'contact': (
+        'networking_contacts', 1,
+        "{row}.name",
+        "{row}.job_title || ' @ ' || {row}.company",
+        "coalesce({row}.relevant_info, '') || ' ' || coalesce({row}.email, '')",
+    ),
+    'application': (
+        'internship_applications', 2,
+        "{row}.role_name",
+        "{row}.company || coalesce(' · ' || {row}.location, '')",
+        "coalesce({row}.notes, '')",
+    ),
+    'interview': (
+        'interviews', 3,
+        "'Interview round ' || {row}.interview_round || coalesce(': ' || "
+        "(SELECT role_name || ' @ ' || company FROM internship_applications "
+        "WHERE id = {row}.application_id), '')",
+        "coalesce({row}.interviewer_names, '')",
+        "coalesce({row}.preparation_notes, '') || ' ' || coalesce({row}.questions_asked, '')",
+    ),
+    'document': (
+        'documents', 4,
+        "coalesce({row}.tailored_for_role, {row}.file_path)",
+        "coalesce({row}.tailored_for_company, '')",
+        "coalesce({row}.notes, '')",
+    ),
+    'company': (
+        'company_research', 5,
+        "{row}.company_name",
+        "coalesce({row}.industry, '')",
+        "coalesce({row}.culture_notes, '') || ' ' || coalesce({row}.recent_news, '') || ' ' || "
+        "coalesce({row}.products_services, '') || ' ' || coalesce({row}.key_competitors, '') || ' ' || "
+        "coalesce({row}.interview_process_notes, '')",
+    ),
+    'task': (
+        'tasks', 6,
+        "{row}.title",
+        "''",
+        "coalesce({row}.description, '')",
+    ),
+}
+
+ROWID_STRIDE = 8
+
+ENTITY_BY_CODE = {spec[1]: entity for entity, spec in INDEXED_ENTITIES.items()}
+
+# Matches ranked with bm25 at most; beyond this (one-letter prefixes on large
+# databases) only the newest are ranked and the results are marked truncated
+MAX_RANKED_CANDIDATES = 20000
+
+SNIPPET_WORDS = 12
+
+# title matches outrank subtitle (role/company) matches, which outrank notes
+RANK_FUNCTION = 'bm25(10.0, 5.0, 1.0)'
+
+_TOKEN_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+# None until ensure_search_index() has run; False if SQLite lacks FTS5
+_available = None
+
+
+def is_available() -> bool:
+    """Whether the FTS5 index exists and can be queried"""
+    return bool(_available)
+
+
+def build_match_query(search_text: str) -> Optional[str]:
+    """
+    Turn free text into an FTS5 MATCH expression
+
+    Search-as-you-type: finished words must match whole tokens and the last
+    word is a prefix, so "software eng" matches "Software Engineer". Words are
+    quoted, so FTS operators in the input are taken literally.
+
+    Args:
+        search_text: Text typed by the user
+
+    Returns:
+        MATCH expression, or None if the text has no searchable words
+    """
+    tokens = _TOKEN_PATTERN.findall(search_text or '')
+    if not tokens:
+        return None
+    terms = [f'"{token}"' for token in tokens]
+    terms[-1] += '*'
+    return ' '.join(terms)
+
+
+def _insert_sql(entity: str, row: str) -> str:
+    """INSERT ... SELECT/VALUES for one entity with {row} bound"""
+    table, code, title, subtitle, body = INDEXED_ENTITIES[entity]
+    values = (
+        f"{row}.id * {ROWID_STRIDE} + {code}, "
+        f"{title.format(row=row)}, {subtitle.format(row=row)}, {body.format(row=row)}"
+    )
+    columns = "INSERT INTO search_index(rowid, title, subtitle, body)"
+    if row in ('NEW', 'OLD'):
+        return f"{columns} VALUES ({values})"
+    return f"{columns} SELECT {values} FROM {table}"
+
+
+def _trigger_statements(entity: str) -> list:
+    """CREATE TRIGGER statements keeping one entity's rows in sync"""
+    table, code, *_ = INDEXED_ENTITIES[entity]
+    delete_old = f"DELETE FROM search_index WHERE rowid = OLD.id * {ROWID_STRIDE} + {code}"
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS search_{table}_ai AFTER INSERT ON {table} "
+        f"BEGIN {_insert_sql(entity, 'NEW')}; END",
+        f"CREATE TRIGGER IF NOT EXISTS search_{table}_ad AFTER DELETE ON {table} "
+        f"BEGIN {delete_old}; END",
+        f"CREATE TRIGGER IF NOT EXISTS search_{table}_au AFTER UPDATE ON {table} "
+        f"BEGIN {delete_old}; {_insert_sql(entity, 'NEW')}; END",
+    ]
+
+
+def _interview_refresh_trigger() -> str:
+    """Trigger re-indexing an application's interviews, whose titles include its role and company"""
+    table, code, *_ = INDEXED_ENTITIES['interview']
+    return (
+        "CREATE TRIGGER IF NOT EXISTS search_interviews_application_au "
+        "AFTER UPDATE OF role_name, company ON internship_applications "
+        f"BEGIN DELETE FROM search_index WHERE rowid IN "
+        f"(SELECT id * {ROWID_STRIDE} + {code} FROM {table} WHERE application_id = NEW.id); "
+        f"{_insert_sql('interview', table)} WHERE {table}.application_id = NEW.id; END"
+    )
+
+
+def _reindex_entity(conn, entity: str) -> None:
+    table, code, *_ = INDEXED_ENTITIES[entity]
+    conn.execute(text(f"DELETE FROM search_index WHERE rowid % {ROWID_STRIDE} = {code}"))
+    conn.execute(text(_insert_sql(entity, table)))
+
+
+def _table_exists(conn, name: str) -> bool:
+    return conn.execute(
+        text("SELECT 1 FROM sqlite_master WHERE name = :name"), {'name': name}
+    ).first() is not None
+
+
+def ensure_search_index(engine) -> bool:
+    """
+    Create the FTS5 table and sync triggers if missing, filling the index
+    from existing rows the first time
+
+    Args:
+        engine: SQLAlchemy engine
+
+    Returns:
+        True if full-text search is available
+    """
+    global _available
+
+    with engine.connect() as conn:
+        created = not _table_exists(conn, 'search_index')
+        if created:
+            try:
+                conn.execute(text(
+                    "CREATE VIRTUAL TABLE search_index USING fts5("
+                    "title, subtitle, body, "
+                    "tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3')"
+                ))
+            except Exception as e:
+                # SQLite built without FTS5: list views fall back to LIKE
+                logger.warning(f"Full-text search unavailable: {e}")
+                conn.rollback()
+                _available = False
+                return False
+            conn.execute(text(
+                "INSERT INTO search_index(search_index, rank) VALUES ('rank', :rank)"
+            ), {'rank': RANK_FUNCTION})
+
+        for entity, (table, *_rest) in INDEXED_ENTITIES.items():
+            if not _table_exists(conn, table):
+                continue
+            for statement in _trigger_statements(entity):
+                conn.execute(text(statement))
+        if _table_exists(conn, 'interviews') and not _table_exists(conn, 'search_interviews_application_au'):
+            conn.execute(text(_interview_refresh_trigger()))
+            if not created:
+                # Interview titles may be stale from before this trigger existed
+                _reindex_entity(conn, 'interview')
+        conn.commit()
+
+    _available = True
+    if created:
+        rebuild_search_index(engine)
+    logger.info("Search index created/verified")
+    return True
+
+
+def rebuild_search_index(engine) -> int:
+    """
+    Repopulate the index from the source tables
+
+    Args:
+        engine: SQLAlchemy engine
+
+    Returns:
+        Number of indexed documents
+    """
+    with engine.connect() as conn:
+        conn.execute(text("DELETE FROM search_index"))
+        for entity, (table, *_rest) in INDEXED_ENTITIES.items():
+            if _table_exists(conn, table):
+                conn.execute(text(_insert_sql(entity, table)))
+        conn.execute(text("INSERT INTO search_index(search_index) VALUES ('optimize')"))
+        conn.commit()
+        count = conn.execute(text("SELECT count(*) FROM search_index")).scalar_one()
+
+    logger.info(f"Search index rebuilt with {count} documents")
+    return count
+
+
+def _entity_clause(entities) -> str:
+    """rowid filter restricting matches to the given entities"""
+    codes = ', '.join(str(INDEXED_ENTITIES[entity][1]) for entity in entities)
+    return f" AND rowid % {ROWID_STRIDE} IN ({codes})"
+
+
+def match_ids_query(entity: str, search_text: str):
+    """
+    Id subquery for one entity, for use in `Model.id.in_(...)`
+
+    Args:
+        entity: Key of INDEXED_ENTITIES
+        search_text: Text typed by the user
+
+    Returns:
+        Textual SELECT of matching entity ids, or None if the text has no words
+    """
+    match = build_match_query(search_text)
+    if match is None:
+        return None
+    return text(
+        f"SELECT rowid / {ROWID_STRIDE} AS entity_id FROM search_index "
+        f"WHERE search_index MATCH :match{_entity_clause([entity])}"
+    ).bindparams(match=match).columns(entity_id=Integer)
+
+
+def _fold(value: str) -> str:
+    """
+    Lowercase and strip accents one character at a time, like the unicode61
+    tokenizer, keeping offsets aligned with the original string
+    """
+    return ''.join(
+        (unicodedata.normalize('NFKD', ch)[:1] or ch).lower()[:1] or ch for ch in value
+    )
+
+
+def _match_pattern(search_text: str):
+    """Regex over folded text finding the words a query hits (every word as a prefix)"""
+    tokens = sorted(set(_TOKEN_PATTERN.findall(_fold(search_text))), key=len, reverse=True)
+    return re.compile(r'\b(?:' + '|'.join(re.escape(t) for t in tokens) + r')\w*')
+
+
+def highlight(value: str, pattern) -> str:
+    """HTML-escape value and wrap every matched word in <b></b>"""
+    value = value or ''
+    parts = []
+    last = 0
+    for found in pattern.finditer(_fold(value)):
+        parts.append(html.escape(value[last:found.start()]))
+        parts.append(f"<b>{html.escape(value[found.start():found.end()])}</b>")
+        last = found.end()
+    parts.append(html.escape(value[last:]))
+    return ''.join(parts)
+
+
+def snippet(value: str, pattern, words: int = SNIPPET_WORDS) -> str:
+    """Highlighted window of about `words` words around the first match"""
+    value = ' '.join((value or '').split())
+    found = pattern.search(_fold(value))
+    if not found:
+        return ''
+
+    spans = [m.span() for m in re.finditer(r'\S+', value)]
+    first = next(i for i, (_start, word_end) in enumerate(spans) if word_end > found.start())
+    lead = min(first, words // 3)
+    start = first - lead
+    end = min(len(spans), start + words)
+    window_text = value[spans[start][0]:spans[end - 1][1]]
+    prefix = '… ' if start > 0 else ''
+    suffix = ' …' if end < len(spans) else ''
+    return f"{prefix}{highlight(window_text, pattern)}{suffix}"
+
+
+def search(search_text: str, entities: Optional[Iterable[str]] = None,
+           limit: int = DEFAULT_LIMIT) -> list:
+    """
+    Ranked prefix search across every indexed table (see search_results)
+
+    Returns:
+        List of SearchHit, best match first
+    """
+    return search_results(search_text, entities, limit).hits
+
+
+def search_results(search_text: str, entities: Optional[Iterable[str]] = None,
+                   limit: int = DEFAULT_LIMIT) -> SearchResults:
+    """
+    Ranked prefix search across every indexed table
+
+    Every match is ranked (bm25, title > subtitle > notes) unless more than
+    MAX_RANKED_CANDIDATES documents match; then only the newest of them are
+    ranked and the result is marked truncated. Highlighting is done on the
+    returned page only.
+
+    Args:
+        search_text: Text typed by the user
+        entities: Restrict to these INDEXED_ENTITIES keys (default: all)
+        limit: Maximum number of hits
+
+    Returns:
+        SearchResults with the hits best match first
+    """
+    from db.session import get_session
+
+    empty = SearchResults([], 0, False)
+    match = build_match_query(search_text)
+    if match is None or not is_available():
+        return empty
+
+    entity_clause = ''
+    if entities is not None:
+        entities = list(entities)
+        if not entities:
+            return empty
+        entity_clause = _entity_clause(entities)
+
+    count_sql = text(f"SELECT count(*) FROM search_index WHERE search_index MATCH :match{entity_clause}")
+    ranked_sql = text(
+        f"SELECT rowid, rank FROM search_index WHERE search_index MATCH :match{entity_clause} "
+        "ORDER BY rank LIMIT :limit"
+    )
+    newest_ranked_sql = text(
+        "SELECT rowid, rank FROM search_index "
+        f"WHERE search_index MATCH :match{entity_clause} AND rowid >= coalesce(("
+        "SELECT min(rowid) FROM (SELECT rowid FROM search_index "
+        f"WHERE search_index MATCH :match{entity_clause} "
+        "ORDER BY rowid DESC LIMIT :candidates)), 0) "
+        "ORDER BY rank LIMIT :limit"
+    )
+
+    session = get_session()
+    try:
+        matched = session.execute(count_sql, {'match': match}).scalar_one()
+        if not matched:
+            return empty
+        truncated = matched > MAX_RANKED_CANDIDATES
+        ranked = session.execute(newest_ranked_sql if truncated else ranked_sql, {
+            'match': match, 'candidates': MAX_RANKED_CANDIDATES, 'limit': limit
+        }).all()
+        rowids = ', '.join(str(int(rowid)) for rowid, _rank in ranked)
+        content = {
+            rowid: (title, subtitle, body)
+            for rowid, title, subtitle, body in session.execute(text(
+                f"SELECT rowid, title, subtitle, body FROM search_index WHERE rowid IN ({rowids})"
+            ))
+        }
+    except Exception as e:
+        logger.error(f"Search failed for {search_text!r}: {e}")
+        return empty
+    finally:
+        session.close()
+
+    pattern = _match_pattern(search_text)
+    hits = []
+    for rowid, rank in ranked:
+        title, subtitle, body = content[rowid]
+        hits.append(SearchHit(
+            ENTITY_BY_CODE[rowid % ROWID_STRIDE], rowid // ROWID_STRIDE,
+            highlight(title, pattern), highlight(subtitle, pattern),
+            snippet(body, pattern), rank
+        ))
+    return SearchResults(hits, matched, truncated)
@@ -6,14 +6,20 @@ import os
 import sys
 import logging
 from pathlib import Path
+from typing import Optional
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
 from db.models import Base, Settings
+from db.engine_profile import get_engine_profile, apply_engine_profile
+from utils.startup_profiler import phase as startup_phase
+import db.enhanced_models  # noqa: F401 - registers Task, Interview, ... on Base
 
 logger = logging.getLogger(__name__)
 
 # Global backup manager instance
 _backup_manager = None
+# Scheduled backups are only taken of a database that existed at startup
+_scheduled_backups_pending = False
 
 
 def get_app_data_dir() -> Path:
@@ -53,17 +59,18 @@ def get_database_path() -> Path:
 # Global engine and session factory
 _engine = None
 _SessionFactory = None
+_engine_profile = None
 
 
-def init_database() -> None:
+def init_database(engine_profile: Optional[str] = None) -> None:
     """
     Initialize the database:
-    - Create engine
+    - Create engine with the given engine profile (see db.engine_profile)
     - Create all tables if they don't exist
     - Insert default settings if needed
-    - Initialize backup manager and perform scheduled backups
+    - Initialize backup manager (scheduled backups run later, see start_scheduled_backups)
     """
-    global _engine, _SessionFactory, _backup_manager
+    global _engine, _SessionFactory, _backup_manager, _engine_profile, _scheduled_backups_pending
 
     db_path = get_database_path()
     db_exists = db_path.exists()
@@ -71,44 +78,79 @@ def init_database() -> None:
     logger.info(f"Database path: {db_path}")
     logger.info(f"Database exists: {db_exists}")
 
-    # Create engine
-    _engine = create_engine(f'sqlite:///{db_path}', echo=False)
-    _SessionFactory = sessionmaker(bind=_engine)
+    # Create engine; PRAGMAs are applied on every pooled connection
+    with startup_phase('engine'):
+        _engine_profile = get_engine_profile(engine_profile)
+        _engine = create_engine(f'sqlite:///{db_path}', echo=False)
+        apply_engine_profile(_engine, _engine_profile)
+        # Per-statement timings for the diagnostics panel, and cache invalidation on commit
+        from utils.performance import install_query_hooks, register_cache_invalidation
+        install_query_hooks(_engine)
+        register_cache_invalidation()
+        # Company/contact completers; after the cache so commits apply in place
+        from utils.lookup_index import register_lookup_index
+        register_lookup_index()
+        _SessionFactory = sessionmaker(bind=_engine)
 
     # Create all tables
-    Base.metadata.create_all(_engine)
+    with startup_phase('create_all'):
+        Base.metadata.create_all(_engine)
     logger.info("Database tables created/verified")
 
     # Run migrations if needed
     if db_exists:
         try:
-            from db.migrations import run_migrations
-            run_migrations()
+            with startup_phase('migrations'):
+                from db.migrations import run_migrations
+                run_migrations()
         except Exception as e:
             logger.warning(f"Migration failed: {e}")
 
     # Create indexes for performance
     try:
-        from utils.performance import QueryOptimizer
-        QueryOptimizer.add_indexes(_engine)
+        with startup_phase('indexes'):
+            from utils.performance import QueryOptimizer
+            QueryOptimizer.add_indexes(_engine)
     except Exception as e:
         logger.warning(f"Failed to create indexes: {e}")
 
-    # Initialize backup manager
+    # Full-text search index (FTS5) and its sync triggers
     try:
-        from utils.backup_manager import BackupManager
-        _backup_manager = BackupManager(db_path)
+        with startup_phase('search_index'):
+            from db.search_index import ensure_search_index
+            ensure_search_index(_engine)
+    except Exception as e:
+        logger.warning(f"Failed to create search index: {e}")
 
-        # Perform scheduled backups if database exists
-        if db_exists:
-            _backup_manager.perform_scheduled_backups()
-            logger.info("Scheduled backups completed")
+    # Materialized dashboard/statistics counters
+    try:
+        with startup_phase('stats_counters'):
+            from db.stats_counters import ensure_stats_counters
+            ensure_stats_counters(_engine)
+    except Exception as e:
+        logger.warning(f"Failed to initialize stats counters: {e}")
+
+    # Activity history of earlier versions (user_activity*.json/.jsonl), imported once
+    try:
+        with startup_phase('legacy_activity'):
+            from db.activity_log import import_legacy_activity
+            import_legacy_activity()
+    except Exception as e:
+        logger.warning(f"Failed to import the old activity log: {e}")
+
+    # Initialize backup manager; the scheduled backups themselves are deferred
+    try:
+        with startup_phase('backup_manager'):
+            from utils.backup_manager import BackupManager
+            _backup_manager = BackupManager(db_path)
+            _scheduled_backups_pending = db_exists
     except Exception as e:
         logger.warning(f"Backup manager initialization failed: {e}")
 
     # If this is a new database, insert default settings
     if not db_exists:
-        _insert_default_settings()
+        with startup_phase('default_settings'):
+            _insert_default_settings()
 
 
 def _insert_default_settings() -> None:
@@ -166,11 +208,39 @@ def get_engine():
     return _engine
 
 
+def get_active_engine_profile():
+    """Get the EngineProfile the engine was created with"""
+    return _engine_profile
+
+
+def checkpoint_database() -> None:
+    """Write WAL contents back into the database file (before copying it)"""
+    if _engine is None:
+        return
+    with _engine.connect() as conn:
+        conn.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")
+
+
 def get_backup_manager():
     """Get the backup manager instance"""
     return _backup_manager
 
 
+def start_scheduled_backups():
+    """
+    Take the due daily/weekly/monthly backups on a background thread
+    (called once the main window is up)
+
+    Returns:
+        The worker thread, or None if there is nothing to back up
+    """
+    global _scheduled_backups_pending
+    if not (_backup_manager and _scheduled_backups_pending):
+        return None
+    _scheduled_backups_pending = False
+    return _backup_manager.perform_scheduled_backups_in_background()
+
+
 def create_manual_backup():
     """Create a manual backup of the database"""
     if _backup_manager:
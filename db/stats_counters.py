@@ -0,0 +1,347 @@
+"""
+Materialized statistics counters
+Per-status, per-day and per-company counts kept current by ORM events,
+so dashboards and statistics read a handful of rows instead of scanning tables
+"""
+import argparse
+import logging
+import sys
+from collections import Counter
+from datetime import date
+from typing import Dict, Iterable, Optional
+from sqlalchemy import event, inspect, text
+from sqlalchemy.orm import Session
+from db.models import NetworkingContact, InternshipApplication
+
+logger = logging.getLogger('GTI_Tracker.StatsCounters')
+
+
+# Counted entities: name -> (model, table, {dimension: column})
+# The 'total' dimension has a single row with key ''.
+COUNTED_ENTITIES = {
+    'contact': (NetworkingContact, 'networking_contacts', {
+        'status': 'status',
+        'day': 'contact_date',
+        'company': 'company',
+    }),
+    'application': (InternshipApplication, 'internship_applications', {
+        'status': 'status',
+        'day': 'application_date',
+        'company': 'company',
+    }),
+}
+
+_ENTITY_BY_MODEL = {spec[0]: entity for entity, spec in COUNTED_ENTITIES.items()}
+
+# session.info key holding the deltas collected during a flush
+_PENDING_KEY = 'stats_counter_deltas'
+# session.info key holding the entities changed by ORM UPDATE/DELETE statements
+_REBUILD_KEY = 'stats_counter_rebuilds'
+
+_UPSERT_SQL = text(
+    "INSERT INTO stats_counters (entity, dimension, key, count) "
+    "VALUES (:entity, :dimension, :key, :delta) "
+    "ON CONFLICT (entity, dimension, key) DO UPDATE SET count = count + excluded.count"
+)
+
+
+def _counter_key(value) -> str:
+    """Stored key for a column value (enum name, ISO date, plain text)"""
+    if value is None:
+        return ''
+    if hasattr(value, 'name') and not isinstance(value, str):
+        return value.name
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
+
+def _counter_keys(entity: str, values: Dict[str, object]) -> list:
+    """(dimension, key) pairs one row contributes to"""
+    dimensions = COUNTED_ENTITIES[entity][2]
+    keys = [('total', '')]
+    keys.extend((dimension, _counter_key(values[column])) for dimension, column in dimensions.items())
+    return keys
+
+
+def _current_values(entity: str, target) -> dict:
+    columns = COUNTED_ENTITIES[entity][2].values()
+    return {column: getattr(target, column) for column in columns}
+
+
+def _previous_values(entity: str, target) -> dict:
+    """Column values as they were before the pending update"""
+    state = inspect(target)
+    values = {}
+    for column in COUNTED_ENTITIES[entity][2].values():
+        history = state.attrs[column].history
+        if history.deleted:
+            values[column] = history.deleted[0]
+        else:
+            values[column] = getattr(target, column)
+    return values
+
+
+def _record(target, entity: str, keys: Iterable, delta: int) -> None:
+    """Add deltas to the owning session; applied once per flush"""
+    session = Session.object_session(target)
+    if session is None:
+        return
+    pending = session.info.setdefault(_PENDING_KEY, Counter())
+    for dimension, key in keys:
+        pending[(entity, dimension, key)] += delta
+
+
+def _after_insert(mapper, connection, target):
+    entity = _ENTITY_BY_MODEL[mapper.class_]
+    _record(target, entity, _counter_keys(entity, _current_values(entity, target)), 1)
+
+
+def _after_delete(mapper, connection, target):
+    entity = _ENTITY_BY_MODEL[mapper.class_]
+    _record(target, entity, _counter_keys(entity, _previous_values(entity, target)), -1)
+
+
+def _after_update(mapper, connection, target):
+    entity = _ENTITY_BY_MODEL[mapper.class_]
+    old_keys = set(_counter_keys(entity, _previous_values(entity, target)))
+    new_keys = set(_counter_keys(entity, _current_values(entity, target)))
+    if old_keys != new_keys:
+        _record(target, entity, old_keys - new_keys, -1)
+        _record(target, entity, new_keys - old_keys, 1)
+
+
+def _after_flush(session, flush_context):
+    """Write the deltas collected during this flush in one executemany"""
+    pending = session.info.pop(_PENDING_KEY, None)
+    if not pending:
+        return
+    rows = [
+        {'entity': entity, 'dimension': dimension, 'key': key, 'delta': delta}
+        for (entity, dimension, key), delta in pending.items() if delta
+    ]
+    if rows:
+        session.connection().execute(_UPSERT_SQL, rows)
+
+
+def _after_bulk_change(orm_execute_state):
+    """
+    session.execute(update/delete(Model)) and query.update()/delete() skip
+    the mapper events: recount the affected entity before the commit
+    """
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    mapper = orm_execute_state.bind_mapper
+    entity = _ENTITY_BY_MODEL.get(mapper.class_) if mapper is not None else None
+    if entity is not None:
+        orm_execute_state.session.info.setdefault(_REBUILD_KEY, set()).add(entity)
+
+
+def _rebuild_bulk_changed(session):
+    # before_commit runs ahead of the final flush, whose deltas then apply on top
+    entities = session.info.pop(_REBUILD_KEY, None)
+    if entities:
+        _rebuild(session.connection(), entities)
+
+
+def _discard_bulk_changed(session, previous_transaction=None):
+    session.info.pop(_REBUILD_KEY, None)
+
+
+def record_bulk_insert(connection, entity: str, rows: Iterable[dict]) -> None:
+    """
+    Count rows inserted with Core (connection.execute(insert(...), rows)), which skips the mapper events
+
+    Args:
+        connection: Connection of the inserting transaction
+        entity: COUNTED_ENTITIES key
+        rows: The inserted column values
+    """
+    deltas = Counter()
+    for row in rows:
+        for dimension, key in _counter_keys(entity, row):
+            deltas[(entity, dimension, key)] += 1
+    if deltas:
+        connection.execute(_UPSERT_SQL, [
+            {'entity': entity, 'dimension': dimension, 'key': key, 'delta': delta}
+            for (entity, dimension, key), delta in deltas.items()
+        ])
+
+
+def _track_old_value(target, value, oldvalue, initiator):
+    """No-op 'set' listener; registering it with active_history loads the old value"""
+    return value
+
+
+def register_listeners() -> None:
+    """Attach the ORM listeners that keep the counters current (idempotent)"""
+    if event.contains(Session, 'after_flush', _after_flush):
+        return
+
+    for model, entity in _ENTITY_BY_MODEL.items():
+        event.listen(model, 'after_insert', _after_insert)
+        event.listen(model, 'after_update', _after_update)
+        event.listen(model, 'after_delete', _after_delete)
+        for column in COUNTED_ENTITIES[entity][2].values():
+            event.listen(getattr(model, column), 'set', _track_old_value,
+                         active_history=True, retval=True)
+
+    event.listen(Session, 'after_flush', _after_flush)
+    event.listen(Session, 'do_orm_execute', _after_bulk_change)
+    event.listen(Session, 'before_commit', _rebuild_bulk_changed)
+    event.listen(Session, 'after_rollback', _discard_bulk_changed)
+
+
+def _expected_counts_sql(entity: str) -> str:
+    """SELECT entity, dimension, key, count computed from the source table"""
+    _model, table, dimensions = COUNTED_ENTITIES[entity]
+    parts = [f"SELECT '{entity}', 'total', '', count(*) FROM {table}"]
+    for dimension, column in dimensions.items():
+        parts.append(
+            f"SELECT '{entity}', '{dimension}', coalesce({column}, ''), count(*) "
+            f"FROM {table} GROUP BY coalesce({column}, '')"
+        )
+    return " UNION ALL ".join(parts)
+
+
+def _rebuild(connection, entities: Iterable[str]) -> None:
+    for entity in entities:
+        connection.execute(text("DELETE FROM stats_counters WHERE entity = :entity"), {'entity': entity})
+        connection.execute(text(
+            f"INSERT INTO stats_counters (entity, dimension, key, count) {_expected_counts_sql(entity)}"
+        ))
+
+
+def rebuild_stats_counters(engine, entities: Optional[Iterable[str]] = None) -> None:
+    """
+    Recompute every counter from the source tables
+
+    Args:
+        engine: SQLAlchemy engine
+        entities: Limit to these COUNTED_ENTITIES keys (default: all)
+    """
+    entities = list(entities or COUNTED_ENTITIES)
+    with engine.begin() as conn:
+        _rebuild(conn, entities)
+    logger.info(f"Stats counters rebuilt for {', '.join(entities)}")
+
+
+def verify_stats_counters(engine) -> list:
+    """
+    Compare stored counters with counts from the source tables
+
+    Args:
+        engine: SQLAlchemy engine
+
+    Returns:
+        List of (entity, dimension, key, stored, expected) for every mismatch
+    """
+    drift = []
+    with engine.connect() as conn:
+        for entity in COUNTED_ENTITIES:
+            expected = {
+                (dimension, key): count
+                for _entity, dimension, key, count in conn.execute(text(_expected_counts_sql(entity)))
+            }
+            stored = {
+                (dimension, key): count
+                for dimension, key, count in conn.execute(text(
+                    "SELECT dimension, key, count FROM stats_counters WHERE entity = :entity"
+                ), {'entity': entity})
+            }
+            for dimension_key in sorted(set(expected) | set(stored)):
+                stored_count = stored.get(dimension_key, 0)
+                expected_count = expected.get(dimension_key, 0)
+                if stored_count != expected_count:
+                    drift.append((entity, *dimension_key, stored_count, expected_count))
+    return drift
+
+
+def ensure_stats_counters(engine) -> None:
+    """Register the listeners and fill the counters on first start"""
+    register_listeners()
+    with engine.connect() as conn:
+        has_counters = conn.execute(text("SELECT 1 FROM stats_counters LIMIT 1")).first()
+    if not has_counters:
+        rebuild_stats_counters(engine)
+
+
+def read_counters(entity: str, dimensions: Iterable[str], day_from: Optional[date] = None) -> dict:
+    """
+    Read counters for one entity in a single query
+
+    Args:
+        entity: Key of COUNTED_ENTITIES
+        dimensions: Dimensions to read ('total', 'status', 'day', 'company')
+        day_from: Only read 'day' counters on or after this date
+
+    Returns:
+        {dimension: {key: count}} with zero counts left out
+    """
+    from db.session import get_session
+
+    dimensions = list(dimensions)
+    result = {dimension: {} for dimension in dimensions}
+    params = {'entity': entity, 'day_from': day_from.isoformat() if day_from else ''}
+    params.update({f'd{i}': dimension for i, dimension in enumerate(dimensions)})
+    names = ', '.join(f':d{i}' for i in range(len(dimensions)))
+
+    session = get_session()
+    try:
+        rows = session.execute(text(
+            "SELECT dimension, key, count FROM stats_counters "
+            f"WHERE entity = :entity AND dimension IN ({names}) "
+            "AND (dimension != 'day' OR key >= :day_from) AND count != 0"
+        ), params)
+        for dimension, key, count in rows:
+            result[dimension][key] = count
+    finally:
+        session.close()
+    return result
+
+
+def top_counters(entity: str, dimension: str, limit: int = 10) -> list:
+    """
+    Largest counters of one dimension, e.g. top companies
+
+    Returns:
+        List of (key, count), largest first
+    """
+    from db.session import get_session
+
+    session = get_session()
+    try:
+        return [tuple(row) for row in session.execute(text(
+            "SELECT key, count FROM stats_counters "
+            "WHERE entity = :entity AND dimension = :dimension AND count > 0 "
+            "ORDER BY count DESC LIMIT :limit"
+        ), {'entity': entity, 'dimension': dimension, 'limit': limit})]
+    finally:
+        session.close()
+
+
+def main(argv=None) -> int:
+    """Command line: python -m db.stats_counters [--rebuild]"""
+    parser = argparse.ArgumentParser(description="Verify (and optionally rebuild) the stats counters")
+    parser.add_argument('--rebuild', action='store_true', help="Rebuild the counters if they drifted")
+    args = parser.parse_args(argv)
+
+    from db.session import init_database, get_engine
+    init_database()
+    engine = get_engine()
+
+    drift = verify_stats_counters(engine)
+    for entity, dimension, key, stored, expected in drift:
+        print(f"{entity}.{dimension}[{key!r}]: stored {stored}, expected {expected}")
+    if not drift:
+        print("Stats counters are consistent")
+        return 0
+    if args.rebuild:
+        rebuild_stats_counters(engine)
+        print(f"Rebuilt after {len(drift)} mismatches")
+        return 0
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,13 +2,21 @@
 GTI Tracker - GET-THAT-INTERNSHIP Tracker
 Main application entry point
 """
+import time
+_STARTUP_BEGAN = time.perf_counter()  # before the imports, for --profile-startup
+
 import sys
+import argparse
 import logging
 from pathlib import Path
 from PySide6.QtWidgets import QApplication, QMessageBox
-from PySide6.QtCore import Qt
-from db.session import init_database
+from PySide6.QtCore import Qt, QSettings, QObject, QEvent, QTimer
+from db.session import init_database, get_app_data_dir, start_scheduled_backups
 from ui.main_window import MainWindow
+from utils import startup_profiler
+from utils.lookup_index import lookup_index
+
+_IMPORTS_DONE = time.perf_counter()
 
 
 # Setup logging
@@ -18,6 +26,12 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Delay between showing the window and starting the scheduled backups
+SCHEDULED_BACKUP_DELAY_MS = 3000
+
+# Delay before the company/contact completer index is built in the background
+LOOKUP_INDEX_DELAY_MS = 1000
+
 
 def load_stylesheet(app: QApplication) -> None:
     """Load and apply the application stylesheet"""
@@ -46,8 +60,53 @@ def load_stylesheet(app: QApplication) -> None:
         logger.error(f"Failed to load stylesheet: {e}")
 
 
+def parse_arguments(argv):
+    """Parse our command line options; anything else is left for Qt"""
+    parser = argparse.ArgumentParser(description="GTI Tracker")
+    parser.add_argument(
+        '--profile-startup', nargs='?', const='', metavar='REPORT.json',
+        help="Record per-phase startup time to a JSON report "
+             "(default: startup_profile.json in the app data folder)"
+    )
+    parser.add_argument(
+        '--exit-after-startup', action='store_true',
+        help="Quit once the first window has painted (with --profile-startup)"
+    )
+    return parser.parse_known_args(argv)
+
+
+class _FirstPaintWatcher(QObject):
+    """Ends the startup profile at the window's first paint"""
+
+    def __init__(self, window, report_path: Path, exit_after: bool):
+        super().__init__(window)
+        self.report_path = report_path
+        self.exit_after = exit_after
+        window.installEventFilter(self)
+
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Paint:
+            watched.removeEventFilter(self)
+            # Let the paint finish before stopping the clock
+            QTimer.singleShot(0, self.finish)
+        return False
+
+    def finish(self):
+        profiler = startup_profiler.get_profiler()
+        profiler.mark('first_paint')
+        profiler.write(self.report_path)
+        if self.exit_after:
+            QApplication.quit()
+
+
 def main():
     """Main application entry point"""
+    args, qt_argv = parse_arguments(sys.argv[1:])
+    profiler = None
+    if args.profile_startup is not None:
+        profiler = startup_profiler.enable(_STARTUP_BEGAN)
+        profiler.add_phase('imports', _STARTUP_BEGAN, _IMPORTS_DONE)
+
     try:
         # Enable high DPI scaling BEFORE creating QApplication
         # High DPI policy for Qt6
@@ -56,23 +115,35 @@ def main():
         )
 
         # Create application
-        app = QApplication(sys.argv)
+        with startup_profiler.phase('qapplication'):
+            app = QApplication(sys.argv[:1] + qt_argv)
         app.setApplicationName("GTI Tracker")
         app.setOrganizationName("GTI_Tracker")
 
         logger.info("Starting GTI Tracker application")
 
-        # Initialize database
+        # Initialize database with the engine profile chosen in Settings
         logger.info("Initializing database...")
-        init_database()
+        app_settings = QSettings("GTI_Tracker", "GTI_Tracker")
+        init_database(engine_profile=app_settings.value("db_profile", None))
         logger.info("Database initialized successfully")
 
         # Load stylesheet
-        load_stylesheet(app)
+        with startup_profiler.phase('stylesheet'):
+            load_stylesheet(app)
 
         # Create and show main window
-        window = MainWindow()
-        window.show()
+        with startup_profiler.phase('main_window'):
+            window = MainWindow()
+            window.show()
+
+        # Scheduled backups run on a worker thread once the window has painted
+        QTimer.singleShot(SCHEDULED_BACKUP_DELAY_MS, start_scheduled_backups)
+        QTimer.singleShot(LOOKUP_INDEX_DELAY_MS, lookup_index.warm_in_background)
+
+        if profiler is not None:
+            report_path = Path(args.profile_startup or get_app_data_dir() / 'startup_profile.json')
+            _FirstPaintWatcher(window, report_path, args.exit_after_startup)
 
         logger.info("Application started successfully")
 
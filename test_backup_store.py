@@ -0,0 +1,82 @@
+"""
+Chunk store backups: restore every backup byte for byte, gc keeps referenced chunks
+"""
+import sqlite3
+import sys
+import tempfile
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from utils.backup_store import BackupStore, snapshot_database
+
+
+def write_rows(db_path: Path, start: int, count: int) -> None:
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute("CREATE TABLE IF NOT EXISTS contacts (id INTEGER PRIMARY KEY, name TEXT, notes TEXT)")
+        conn.executemany(
+            "INSERT INTO contacts (id, name, notes) VALUES (?, ?, ?)",
+            [(i, f"Contact {i}", "x" * 200) for i in range(start, start + count)]
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def test_backup_restore_gc():
+    """Back up, mutate, back up again; both restore exactly and gc frees only unreferenced chunks"""
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        db_path = tmp / 'gti.db'
+        store = BackupStore(tmp / 'store')
+
+        write_rows(db_path, 0, 3000)
+        first_snapshot = tmp / 'first.db'
+        snapshot_database(db_path, first_snapshot)
+        first = store.add(first_snapshot, ('daily',))
+
+        # Change a few pages and append new ones
+        write_rows(db_path, 3000, 500)
+        conn = sqlite3.connect(db_path)
+        conn.execute("UPDATE contacts SET notes = 'changed' WHERE id % 500 = 0")
+        conn.commit()
+        conn.close()
+        second_snapshot = tmp / 'second.db'
+        snapshot_database(db_path, second_snapshot)
+        second = store.add(second_snapshot, ('daily', 'weekly'))
+
+        assert second.reused_chunks > 0, "Unchanged chunks were stored again"
+        assert second.new_chunks > 0, "Changed chunks were not stored"
+
+        for result, snapshot in ((first, first_snapshot), (second, second_snapshot)):
+            for backup_id in result.backup_ids:
+                restored = tmp / f"{backup_id}.db"
+                store.restore(backup_id, restored)
+                assert restored.read_bytes() == snapshot.read_bytes(), f"{backup_id} restored different bytes"
+        print("✓ Every backup restores byte for byte")
+
+        # Dropping the first backup frees the chunks only it used, nothing else
+        only_first = (set(store.read_manifest(first.backup_ids[0])['chunks'])
+                      - set(store.read_manifest(second.backup_ids[0])['chunks']))
+        assert only_first
+        store.delete(first.backup_ids[0])
+        (store.chunks_dir / 'ab').mkdir(exist_ok=True)
+        (store.chunks_dir / 'ab' / '.abc.partial').write_bytes(b'interrupted write')
+        freed = store.gc()
+        assert freed['chunks_deleted'] == len(only_first) + 1
+
+        stored = {path.name for path in store.chunks_dir.glob('*/*')}
+        assert not only_first & stored
+        for backup_id in second.backup_ids:
+            assert set(store.read_manifest(backup_id)['chunks']) <= stored
+        assert not any(name.startswith('.') for name in stored)
+        assert store.verify().ok
+
+        restored = tmp / 'after_gc.db'
+        store.restore(second.backup_ids[1], restored)
+        assert restored.read_bytes() == second_snapshot.read_bytes()
+        print("✓ gc keeps every chunk still referenced")
+
+
+if __name__ == "__main__":
+    test_backup_restore_gc()
@@ -0,0 +1,96 @@
+"""
+Duplicate detection: banded edit distance and the blocked DuplicateIndex
+"""
+import random
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from utils.enterprise_validators import InputValidator
+from utils.dedup import DuplicateIndex
+
+
+def levenshtein(str1: str, str2: str) -> int:
+    """Reference edit distance: the full dynamic-programming table"""
+    previous = list(range(len(str2) + 1))
+    for i, char1 in enumerate(str1, 1):
+        current = [i]
+        for j, char2 in enumerate(str2, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char1 != char2)))
+        previous = current
+    return previous[-1]
+
+
+def test_edit_distance_within():
+    """Same distance as plain Levenshtein under and at max_distance, None over it"""
+    pairs = [
+        ("", ""), ("", "abc"), ("abc", ""), ("kitten", "sitting"), ("flaw", "lawn"),
+        ("jane doe", "jane do"), ("jon smith", "john smith"), ("abc", "cba"), ("same", "same"),
+    ]
+    rng = random.Random(7)
+    for _ in range(300):
+        word = ''.join(rng.choice('abcde ') for _ in range(rng.randint(0, 10)))
+        other = list(word)
+        for _ in range(rng.randint(0, 4)):
+            position = rng.randint(0, len(other))
+            edit = rng.choice(('insert', 'delete', 'replace'))
+            if edit == 'insert':
+                other.insert(position, rng.choice('abcde '))
+            elif other and position < len(other):
+                if edit == 'delete':
+                    del other[position]
+                else:
+                    other[position] = rng.choice('abcde ')
+        pairs.append((word, ''.join(other)))
+
+    for str1, str2 in pairs:
+        distance = levenshtein(str1, str2)
+        for max_distance in (distance - 1, distance, distance + 1, distance + 3):
+            if max_distance < 0:
+                continue
+            expected = distance if distance <= max_distance else None
+            result = InputValidator.edit_distance_within(str1, str2, max_distance)
+            assert result == expected, (
+                f"edit_distance_within({str1!r}, {str2!r}, {max_distance}) = {result}, expected {expected}"
+            )
+    print(f"✓ edit_distance_within agrees with Levenshtein on {len(pairs)} pairs")
+
+
+def test_string_similarity():
+    """Empty strings score 0, equal strings (ignoring case) 1, others 1 - distance / length"""
+    assert InputValidator.calculate_string_similarity("", "") == 0.0
+    assert InputValidator.calculate_string_similarity("", "abc") == 0.0
+    assert InputValidator.calculate_string_similarity("abc", "") == 0.0
+    assert InputValidator.calculate_string_similarity("Jane Doe", "jane doe") == 1.0
+    assert InputValidator.calculate_string_similarity("kitten", "sitting") == 1.0 - 3 / 7
+    print("✓ calculate_string_similarity handles empty and equal strings")
+
+
+def test_duplicate_index():
+    """In-file and legal-suffix duplicates are found; other companies never match"""
+    index = DuplicateIndex()
+    assert index.check_and_add(('row', 1), "Jane Doe", "Acme Inc") is None
+
+    # The same person again in the same file, company without its legal form
+    match = index.check_and_add(('row', 2), "Jane Doe", "Acme")
+    assert match is not None and match.existing_ref == ('row', 1) and match.score == 1.0
+
+    # A near spelling is scored rather than matched exactly
+    match = index.check_and_add(('row', 3), "Jane Doee", "ACME, Inc.")
+    assert match is not None and match.existing_ref in (('row', 1), ('row', 2))
+    assert 0.85 <= match.score < 1.0
+
+    # Same name at another company: no comparison at all
+    comparisons = index.comparisons
+    assert index.check_and_add(('row', 4), "Jane Doe", "Globex") is None
+    assert index.comparisons == comparisons
+
+    # Dissimilar names at the same company are not duplicates
+    assert index.check_and_add(('row', 5), "Bob Stone", "Acme") is None
+    print("✓ DuplicateIndex finds in-file and 'Acme Inc'/'Acme' duplicates, never across companies")
+
+
+if __name__ == "__main__":
+    test_edit_distance_within()
+    test_string_similarity()
+    test_duplicate_index()
@@ -0,0 +1,63 @@
+"""
+Startup import-time budget for main.py
+Importing main must stay cheap: views, charts and dialogs are loaded on demand
+"""
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent
+
+# Wall time allowed for `import main` in a fresh interpreter (override with GTI_IMPORT_BUDGET_MS)
+IMPORT_BUDGET_MS = float(os.getenv('GTI_IMPORT_BUDGET_MS', '2500'))
+
+# Modules that must not be imported before the first window is shown
+DEFERRED_MODULES = [
+    'PySide6.QtCharts',
+    'ui.networking_dashboard', 'ui.networking_list', 'ui.networking_stats', 'ui.networking_dialogs',
+    'ui.internship_dashboard', 'ui.internship_list', 'ui.internship_stats', 'ui.internship_dialogs',
+    'ui.settings_dialog', 'ui.global_search',
+    'utils.backup_manager', 'db.migrations',
+]
+
+_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import main
+elapsed = (time.perf_counter() - start) * 1000
+print(json.dumps({'ms': elapsed, 'modules': sorted(sys.modules)}))
+"""
+
+
+def measure_import(runs: int = 3) -> tuple:
+    """Best-of-runs import time of main in a fresh interpreter, and the modules it loaded"""
+    best, modules = None, []
+    for _ in range(runs):
+        proc = subprocess.run(
+            [sys.executable, '-c', _PROBE], cwd=str(PROJECT_ROOT),
+            capture_output=True, text=True, check=True
+        )
+        result = json.loads(proc.stdout.strip().splitlines()[-1])
+        if best is None or result['ms'] < best:
+            best, modules = result['ms'], result['modules']
+    return best, modules
+
+
+def test_import_budget():
+    """import main stays within IMPORT_BUDGET_MS and defers the heavy modules"""
+    print("Measuring `import main`...")
+    elapsed_ms, modules = measure_import()
+    print(f"  import main: {elapsed_ms:.0f} ms (budget {IMPORT_BUDGET_MS:.0f} ms)")
+
+    loaded_early = [name for name in DEFERRED_MODULES if name in modules]
+    assert not loaded_early, f"Imported before the first window: {', '.join(loaded_early)}"
+    assert elapsed_ms <= IMPORT_BUDGET_MS, (
+        f"import main took {elapsed_ms:.0f} ms, budget is {IMPORT_BUDGET_MS:.0f} ms"
+    )
+    print("✓ Import budget respected")
+
+
+if __name__ == "__main__":
+    test_import_budget()
@@ -0,0 +1,399 @@
+"""
+Model/view backed contact table
+Rows are plain tuples painted by a delegate instead of per-row widgets
+"""
+from PySide6.QtWidgets import (
+    QStyledItemDelegate, QStyleOptionViewItem, QStyle, QComboBox
+)
+from PySide6.QtCore import (
+    Qt, Signal, QAbstractTableModel, QModelIndex, QRect, QEvent, QTimer
+)
+from PySide6.QtGui import QColor, QFont, QPen
+from db.models import NetworkingStatus
+from db.queries import ContactRow
+from utils.date_helpers import format_date
+
+
+class ContactTableModel(QAbstractTableModel):
+    """
+    Table model over ContactRow tuples with incremental fetching
+
+    Rows come either from an in-memory list (set_rows) or from a page source
+    (set_page_source) that is asked for the next page when the view scrolls.
+    """
+
+    COLUMNS = [
+        "Name", "Job Title", "Company", "Phone", "LinkedIn",
+        "Contact Date", "Status", "Actions"
+    ]
+
+    NAME_COLUMN = 0
+    PHONE_COLUMN = 3
+    LINKEDIN_COLUMN = 4
+    DATE_COLUMN = 5
+    STATUS_COLUMN = 6
+    ACTIONS_COLUMN = 7
+
+    # Full ContactRow for a given index
+    RowRole = Qt.UserRole + 1
+
+    # Rows handed to the view per fetchMore() call
+    FETCH_BATCH_SIZE = 200
+
+    status_change_requested = Signal(int, object)  # contact_id, NetworkingStatus
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+        self._loaded = 0
+        self._total = 0
+        self._fetch_page = None
+        self._bold_font = None
+
+    def set_rows(self, rows):
+        """Replace the model contents with an in-memory list"""
+        self.beginResetModel()
+        self._fetch_page = None
+        self._rows = list(rows)
+        self._total = len(self._rows)
+        self._loaded = min(self._total, self.FETCH_BATCH_SIZE)
+        self.endResetModel()
+
+    def set_page_source(self, total: int, fetch_page, first_page=None):
+        """
+        Replace the model contents with a paged source
+
+        Args:
+            total: Number of rows the source can produce
+            fetch_page: Callable (offset, limit) -> list of ContactRow
+            first_page: Rows at offset 0 if already loaded (e.g. by a background loader)
+        """
+        if first_page is None:
+            first_page = fetch_page(0, self.FETCH_BATCH_SIZE) if total else []
+
+        self.beginResetModel()
+        self._fetch_page = fetch_page
+        self._total = total
+        self._rows = list(first_page)
+        self._loaded = len(self._rows)
+        if self._loaded < self.FETCH_BATCH_SIZE:
+            self._total = self._loaded
+        self.endResetModel()
+
+    def total_count(self) -> int:
+        """Number of rows available, including ones not fetched yet"""
+        return self._total
+
+    def row_at(self, row: int) -> ContactRow:
+        """Get the ContactRow at a model row"""
+        return self._rows[row]
+
+    def contact_id_at(self, row: int) -> int:
+        """Get the contact id at a model row"""
+        return self._rows[row].id
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self._loaded
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self.COLUMNS)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return False
+        return self._loaded < self._total
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        if self._fetch_page is not None and len(self._rows) < self._total:
+            page = self._fetch_page(len(self._rows), self.FETCH_BATCH_SIZE)
+            self._rows.extend(page)
+            if len(page) < self.FETCH_BATCH_SIZE:
+                # Source ran out early (rows deleted since it was counted)
+                self._total = len(self._rows)
+        count = min(self.FETCH_BATCH_SIZE, len(self._rows) - self._loaded)
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.COLUMNS[section]
+        return None
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if index.isValid() and index.column() == self.STATUS_COLUMN:
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= self._loaded:
+            return None
+
+        row = self._rows[index.row()]
+        column = index.column()
+
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return row.name
+            if column == 1:
+                return row.job_title
+            if column == 2:
+                return row.company
+            if column == self.PHONE_COLUMN:
+                return row.phone or "-"
+            if column == self.DATE_COLUMN:
+                return format_date(row.contact_date)
+            if column == self.STATUS_COLUMN:
+                return row.status.value
+            return None
+
+        if role == Qt.EditRole and column == self.STATUS_COLUMN:
+            return row.status
+
+        if role == Qt.UserRole:
+            return row.id
+
+        if role == self.RowRole:
+            return row
+
+        if role == Qt.ForegroundRole:
+            return QColor("#FFFFFF")
+
+        if role == Qt.FontRole and column == self.NAME_COLUMN:
+            if self._bold_font is None:
+                self._bold_font = QFont()
+                self._bold_font.setBold(True)
+            return self._bold_font
+
+        if role == Qt.ToolTipRole:
+            if column == self.PHONE_COLUMN and row.phone:
+                return "Click to copy"
+            if column == self.LINKEDIN_COLUMN and row.linkedin_url:
+                return row.linkedin_url
+
+        return None
+
+    def setData(self, index, value, role=Qt.EditRole):
+        """Status edits are forwarded to the owner; the database stays the source of truth"""
+        if not index.isValid() or role != Qt.EditRole or index.column() != self.STATUS_COLUMN:
+            return False
+
+        row = self._rows[index.row()]
+        if value is not None and value != row.status:
+            self.status_change_requested.emit(row.id, value)
+        return True
+
+
+class ContactItemDelegate(QStyledItemDelegate):
+    """Paints phone, LinkedIn, status and action cells and handles clicks on them"""
+
+    phone_clicked = Signal(str)
+    linkedin_clicked = Signal(str)
+    edit_clicked = Signal(int)
+    delete_clicked = Signal(int)
+
+    BUTTON_WIDTH = 40
+    BUTTON_HEIGHT = 30
+    BUTTON_SPACING = 4
+
+    def __init__(self, view):
+        super().__init__(view)
+        self.view = view
+
+    def paint(self, painter, option, index):
+        column = index.column()
+
+        if column == ContactTableModel.PHONE_COLUMN:
+            self._paint_background(painter, option, index)
+            self._paint_phone(painter, option, index.data(ContactTableModel.RowRole))
+        elif column == ContactTableModel.LINKEDIN_COLUMN:
+            self._paint_background(painter, option, index)
+            self._paint_linkedin(painter, option, index.data(ContactTableModel.RowRole))
+        elif column == ContactTableModel.STATUS_COLUMN:
+            self._paint_background(painter, option, index)
+            self._paint_status(painter, option, index.data(Qt.DisplayRole))
+        elif column == ContactTableModel.ACTIONS_COLUMN:
+            self._paint_background(painter, option, index)
+            self._paint_actions(painter, option)
+        else:
+            super().paint(painter, option, index)
+
+    def _paint_background(self, painter, option, index):
+        """Let the style draw selection/alternate background without text"""
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.text = ""
+        style = opt.widget.style() if opt.widget else None
+        if style:
+            style.drawControl(QStyle.CE_ItemViewItem, opt, painter, opt.widget)
+
+    def _paint_phone(self, painter, option, row):
+        painter.save()
+        text_rect = option.rect.adjusted(12, 0, -4, 0)
+        if row and row.phone:
+            painter.setPen(QColor("#4A9EFF"))
+            painter.drawText(text_rect, Qt.AlignVCenter | Qt.AlignLeft, row.phone)
+        else:
+            painter.setPen(QColor("#6B7280"))
+            painter.drawText(text_rect, Qt.AlignVCenter | Qt.AlignLeft, "-")
+        painter.restore()
+
+    def _paint_linkedin(self, painter, option, row):
+        painter.save()
+        painter.setRenderHint(painter.RenderHint.Antialiasing)
+        if row and row.linkedin_url:
+            rect = self._pill_rect(option.rect, 80, 26)
+            painter.setPen(QPen(QColor("#0077B5"), 1))
+            painter.drawRoundedRect(rect, 4, 4)
+            font = QFont(option.font)
+            font.setPointSize(9)
+            font.setBold(True)
+            painter.setFont(font)
+            painter.drawText(rect, Qt.AlignCenter, "🔗 Open")
+        else:
+            painter.setPen(QColor("#6B7280"))
+            painter.drawText(option.rect.adjusted(12, 0, 0, 0), Qt.AlignVCenter | Qt.AlignLeft, "-")
+        painter.restore()
+
+    def _paint_status(self, painter, option, status_text):
+        painter.save()
+        painter.setRenderHint(painter.RenderHint.Antialiasing)
+        rect = self._pill_rect(option.rect, 140, 28)
+        painter.setBrush(QColor("#1E2330"))
+        painter.setPen(QPen(QColor(255, 255, 255, 51), 1))
+        painter.drawRoundedRect(rect, 4, 4)
+
+        font = QFont(option.font)
+        font.setPointSize(9)
+        font.setBold(True)
+        painter.setFont(font)
+        painter.setPen(QColor("#FFFFFF"))
+        painter.drawText(rect.adjusted(12, 0, -20, 0), Qt.AlignVCenter | Qt.AlignLeft, status_text or "")
+        painter.drawText(rect.adjusted(0, 0, -8, 0), Qt.AlignVCenter | Qt.AlignRight, "▾")
+        painter.restore()
+
+    def _paint_actions(self, painter, option):
+        edit_rect, delete_rect = self._action_rects(option.rect)
+        painter.save()
+        painter.setRenderHint(painter.RenderHint.Antialiasing)
+        painter.setPen(Qt.NoPen)
+
+        painter.setBrush(QColor("#FF8B3D"))
+        painter.drawRoundedRect(edit_rect, 3, 3)
+        painter.setBrush(QColor("#e74c3c"))
+        painter.drawRoundedRect(delete_rect, 3, 3)
+
+        font = QFont(option.font)
+        font.setPointSize(12)
+        font.setBold(True)
+        painter.setFont(font)
+        painter.setPen(QColor("#FFFFFF"))
+        painter.drawText(edit_rect, Qt.AlignCenter, "✏")
+        painter.drawText(delete_rect, Qt.AlignCenter, "×")
+        painter.restore()
+
+    def _pill_rect(self, cell: QRect, width: int, height: int) -> QRect:
+        """Left-aligned, vertically centered rect inside a cell"""
+        width = min(width, cell.width() - 8)
+        top = cell.top() + (cell.height() - height) // 2
+        return QRect(cell.left() + 4, top, width, height)
+
+    def _action_rects(self, cell: QRect) -> tuple:
+        """Rects of the edit and delete buttons inside an actions cell"""
+        top = cell.top() + (cell.height() - self.BUTTON_HEIGHT) // 2
+        edit_rect = QRect(cell.left(), top, self.BUTTON_WIDTH, self.BUTTON_HEIGHT)
+        delete_rect = QRect(
+            edit_rect.right() + 1 + self.BUTTON_SPACING, top,
+            self.BUTTON_WIDTH, self.BUTTON_HEIGHT
+        )
+        return edit_rect, delete_rect
+
+    def editorEvent(self, event, model, option, index):
+        """Handle clicks on painted controls"""
+        if event.type() != QEvent.MouseButtonRelease or event.button() != Qt.LeftButton:
+            return super().editorEvent(event, model, option, index)
+
+        column = index.column()
+        row = index.data(ContactTableModel.RowRole)
+        pos = event.position().toPoint()
+
+        if column == ContactTableModel.PHONE_COLUMN and row.phone:
+            self.phone_clicked.emit(row.phone)
+            return True
+
+        if column == ContactTableModel.LINKEDIN_COLUMN and row.linkedin_url:
+            if self._pill_rect(option.rect, 80, 26).contains(pos):
+                self.linkedin_clicked.emit(row.linkedin_url)
+                return True
+
+        if column == ContactTableModel.STATUS_COLUMN:
+            self.view.edit(index)
+            return True
+
+        if column == ContactTableModel.ACTIONS_COLUMN:
+            edit_rect, delete_rect = self._action_rects(option.rect)
+            if edit_rect.contains(pos):
+                self.edit_clicked.emit(row.id)
+                return True
+            if delete_rect.contains(pos):
+                self.delete_clicked.emit(row.id)
+                return True
+
+        return super().editorEvent(event, model, option, index)
+
+    def createEditor(self, parent, option, index):
+        if index.column() != ContactTableModel.STATUS_COLUMN:
+            return super().createEditor(parent, option, index)
+
+        combo = QComboBox(parent)
+        combo.setStyleSheet("""
+            QComboBox {
+                background-color: #1E2330;
+                color: #FFFFFF;
+                border: 1px solid #FF8B3D;
+                border-radius: 4px;
+                padding: 4px 12px;
+                font-size: 11px;
+                font-weight: 600;
+            }
+        """)
+        for status in NetworkingStatus:
+            combo.addItem(status.value, status)
+
+        # Commit as soon as the user picks a value
+        combo.activated.connect(lambda _: self._commit_and_close(combo))
+        return combo
+
+    def _commit_and_close(self, editor):
+        self.commitData.emit(editor)
+        self.closeEditor.emit(editor)
+
+    def setEditorData(self, editor, index):
+        if index.column() != ContactTableModel.STATUS_COLUMN:
+            return super().setEditorData(editor, index)
+
+        current = index.data(Qt.EditRole)
+        position = editor.findData(current)
+        if position >= 0:
+            editor.setCurrentIndex(position)
+        QTimer.singleShot(0, editor.showPopup)
+
+    def setModelData(self, editor, model, index):
+        if index.column() != ContactTableModel.STATUS_COLUMN:
+            return super().setModelData(editor, model, index)
+        model.setData(index, editor.currentData(), Qt.EditRole)
+
+    def updateEditorGeometry(self, editor, option, index):
+        if index.column() == ContactTableModel.STATUS_COLUMN:
+            editor.setGeometry(self._pill_rect(option.rect, 140, 28))
+        else:
+            super().updateEditorGeometry(editor, option, index)
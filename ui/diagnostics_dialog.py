@@ -0,0 +1,118 @@
+"""
+Performance diagnostics dialog
+Slowest queries, per-statement totals, span percentiles and N+1 suspects from utils.performance.perf_monitor
+"""
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTabWidget,
+    QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView
+)
+from PySide6.QtCore import Qt
+from utils.performance import perf_monitor, N_PLUS_ONE_THRESHOLD, SLOWEST_QUERIES_KEPT
+from utils.lookup_index import lookup_index
+
+
+class DiagnosticsDialog(QDialog):
+    """Read-only view of the metrics collected since startup (or the last reset)"""
+
+    def __init__(self, parent=None, monitor=None):
+        super().__init__(parent)
+        self.monitor = monitor or perf_monitor
+        self.setWindowTitle("Performance Diagnostics")
+        self.resize(960, 560)
+        self.setup_ui()
+        self.refresh()
+
+    def setup_ui(self):
+        """Setup the UI components"""
+        layout = QVBoxLayout(self)
+
+        self.summary_label = QLabel()
+        self.summary_label.setStyleSheet("color: #888888;")
+        layout.addWidget(self.summary_label)
+
+        self.tabs = QTabWidget()
+        self.slowest_table = self.create_table(["ms", "Rows", "Span", "Call site", "Statement"])
+        self.tabs.addTab(self.slowest_table, "Slowest Queries")
+        self.statements_table = self.create_table(
+            ["Count", "Total ms", "Mean ms", "p95 ms", "Max ms", "Rows", "Call site", "Statement"]
+        )
+        self.tabs.addTab(self.statements_table, "Statements")
+        self.spans_table = self.create_table(["Span", "Count", "p50 ms", "p95 ms", "p99 ms", "Max ms"])
+        self.tabs.addTab(self.spans_table, "Spans")
+        self.n_plus_one_table = self.create_table(["Repeats", "Span", "Call site", "Statement"])
+        self.tabs.addTab(self.n_plus_one_table, "N+1 Suspects")
+        layout.addWidget(self.tabs)
+
+        buttons = QHBoxLayout()
+        reset_btn = QPushButton("Reset")
+        reset_btn.clicked.connect(self.reset)
+        buttons.addWidget(reset_btn)
+        buttons.addStretch()
+        refresh_btn = QPushButton("Refresh")
+        refresh_btn.clicked.connect(self.refresh)
+        buttons.addWidget(refresh_btn)
+        close_btn = QPushButton("Close")
+        close_btn.setDefault(True)
+        close_btn.clicked.connect(self.accept)
+        buttons.addWidget(close_btn)
+        layout.addLayout(buttons)
+
+    def create_table(self, headers) -> QTableWidget:
+        table = QTableWidget(0, len(headers))
+        table.setHorizontalHeaderLabels(headers)
+        table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        table.verticalHeader().setVisible(False)
+        table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+        table.horizontalHeader().setStretchLastSection(True)
+        return table
+
+    @staticmethod
+    def fill_table(table: QTableWidget, rows) -> None:
+        table.setRowCount(len(rows))
+        for row, values in enumerate(rows):
+            for column, value in enumerate(values):
+                item = QTableWidgetItem('' if value is None else str(value))
+                if isinstance(value, (int, float)):
+                    item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
+                if isinstance(value, str) and len(value) > 80:
+                    item.setToolTip(value)
+                table.setItem(row, column, item)
+
+    def refresh(self):
+        """Reload every table from the monitor"""
+        stats = self.monitor.get_stats()
+
+        self.fill_table(self.slowest_table, [
+            (q['duration_ms'], q['rows'], q['span'], q['call_site'], q['statement'])
+            for q in stats['slowest_queries']
+        ])
+        self.fill_table(self.statements_table, [
+            (s['count'], s['total_ms'], s['mean_ms'], s['p95_ms'], s['max_ms'], s['rows'],
+             s['call_site'], s['statement'])
+            for s in stats['statements']
+        ])
+        self.fill_table(self.spans_table, [
+            (s['name'], s['count'], s['p50_ms'], s['p95_ms'], s['p99_ms'], s['max_ms'])
+            for s in stats['spans']
+        ])
+        self.fill_table(self.n_plus_one_table, [
+            (s['count'], s['span'], s['call_site'], s['statement'])
+            for s in stats['n_plus_one']
+        ])
+        self.tabs.setTabText(3, f"N+1 Suspects ({len(stats['n_plus_one'])})")
+
+        index_stats = lookup_index.get_stats()
+        self.summary_label.setText(
+            f"{stats['db_queries']:,} queries, {len(stats['statements']):,} distinct statements, "
+            f"{len(stats['slow_operations']):,} slow operations; cache {stats['cache_stats']['size']:,} entries, "
+            f"{stats['cache_stats']['hit_rate']:.0f}% hits; lookup index {index_stats['contacts']:,} contacts, "
+            f"{index_stats['companies']:,} companies, {index_stats['builds']} builds. "
+            f"Slowest {SLOWEST_QUERIES_KEPT} executions are kept; a SELECT repeated "
+            f"{N_PLUS_ONE_THRESHOLD}+ times in one span is flagged as N+1."
+        )
+
+    def reset(self):
+        """Forget everything collected so far"""
+        self.monitor.reset()
+        self.refresh()
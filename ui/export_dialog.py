@@ -0,0 +1,184 @@
+"""
+Export dialogs
+Column selection and progress for streaming exports (utils.export_engine)
+"""
+import logging
+import threading
+from pathlib import Path
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QCheckBox, QPushButton,
+    QProgressDialog, QFileDialog, QMessageBox
+)
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Qt, Signal, Slot
+from utils.export_engine import FORMATS, ExportCancelled, file_filter, format_for_path
+
+logger = logging.getLogger('GTI_Tracker.ExportDialog')
+
+
+class ExportColumnsDialog(QDialog):
+    """Check boxes for the columns to export"""
+
+    def __init__(self, columns, title: str, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle(title)
+        self.setModal(True)
+        self.columns = columns
+
+        layout = QVBoxLayout(self)
+        layout.addWidget(QLabel("Columns to export:"))
+
+        self.checkboxes = []
+        for column in columns:
+            checkbox = QCheckBox(column.header)
+            checkbox.setChecked(column.default)
+            checkbox.toggled.connect(self.update_ok_button)
+            layout.addWidget(checkbox)
+            self.checkboxes.append(checkbox)
+
+        buttons = QHBoxLayout()
+        buttons.addStretch()
+        cancel_btn = QPushButton("Cancel")
+        cancel_btn.clicked.connect(self.reject)
+        buttons.addWidget(cancel_btn)
+        self.ok_btn = QPushButton("Export...")
+        self.ok_btn.setDefault(True)
+        self.ok_btn.clicked.connect(self.accept)
+        buttons.addWidget(self.ok_btn)
+        layout.addLayout(buttons)
+
+    def update_ok_button(self):
+        self.ok_btn.setEnabled(any(checkbox.isChecked() for checkbox in self.checkboxes))
+
+    def selected_keys(self) -> list:
+        return [column.key for column, checkbox in zip(self.columns, self.checkboxes) if checkbox.isChecked()]
+
+
+class _ExportSignals(QObject):
+    progress = Signal(int, int)  # rows written, percent
+    finished = Signal(object)    # ExportResult
+    failed = Signal(str)
+    cancelled = Signal()
+
+
+class ExportTask(QRunnable):
+    """Calls export_func(path, column_keys, fmt=..., progress=..., is_cancelled=...) on a pool thread"""
+
+    def __init__(self, export_func, path: str, column_keys, fmt: str):
+        super().__init__()
+        self.export_func = export_func
+        self.path = path
+        self.column_keys = column_keys
+        self.fmt = fmt
+        self.signals = _ExportSignals()
+        self.cancel_requested = threading.Event()
+        self.setAutoDelete(False)
+
+    def run(self):
+        try:
+            result = self.export_func(
+                self.path, self.column_keys, fmt=self.fmt,
+                progress=self.signals.progress.emit,
+                is_cancelled=self.cancel_requested.is_set
+            )
+        except ExportCancelled:
+            self.signals.cancelled.emit()
+        except Exception as e:
+            logger.exception(f"Export to {self.path} failed")
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
+
+
+class ExportProgressDialog(QProgressDialog):
+    """Modal progress for one export; after exec(), result or error is set, or cancelled is True"""
+
+    def __init__(self, task: ExportTask, title: str, parent=None):
+        super().__init__("Exporting...", "Cancel", 0, 100, parent)
+        self.setWindowTitle(title)
+        self.setWindowModality(Qt.WindowModal)
+        self.setAutoClose(False)
+        self.setAutoReset(False)
+        self.setMinimumDuration(300)
+
+        self.result = None
+        self.error = None
+        self.cancelled = False
+        self.task = task
+        task.signals.progress.connect(self.on_progress)
+        task.signals.finished.connect(self.on_finished)
+        task.signals.failed.connect(self.on_failed)
+        task.signals.cancelled.connect(self.on_cancelled)
+        self.canceled.disconnect()
+        self.canceled.connect(self.request_cancel)
+
+    def exec(self):
+        QThreadPool.globalInstance().start(self.task)
+        return super().exec()
+
+    @Slot()
+    def request_cancel(self):
+        self.task.cancel_requested.set()
+        self.setLabelText("Cancelling...")
+
+    @Slot(int, int)
+    def on_progress(self, rows: int, percent: int):
+        self.setValue(percent)
+        self.setLabelText(f"Exported {rows:,} rows")
+
+    @Slot(object)
+    def on_finished(self, result):
+        self.result = result
+        self.accept()
+
+    @Slot(str)
+    def on_failed(self, message: str):
+        self.error = message
+        self.reject()
+
+    @Slot()
+    def on_cancelled(self):
+        self.cancelled = True
+        self.reject()
+
+
+def run_export(parent, columns, export_func, default_name: str, title: str) -> None:
+    """
+    Ask for columns and a target file, then export with progress
+
+    Args:
+        parent: Parent widget
+        columns: ExportColumn list offered (utils.export_engine.*_COLUMNS)
+        export_func: export_contacts / export_internships style function
+        default_name: Suggested file name without extension
+        title: Dialog title
+    """
+    columns_dialog = ExportColumnsDialog(columns, title, parent)
+    if columns_dialog.exec() != QDialog.Accepted:
+        return
+
+    file_path, selected_filter = QFileDialog.getSaveFileName(
+        parent, title, str(Path.home() / f"{default_name}.csv"), file_filter()
+    )
+    if not file_path:
+        return
+
+    # A typed extension wins; otherwise use the filter that was picked
+    fmt = format_for_path(file_path)
+    if not Path(file_path).suffix:
+        for name, (description, extension) in FORMATS.items():
+            if selected_filter.startswith(description):
+                fmt = name
+                file_path += extension
+
+    progress = ExportProgressDialog(
+        ExportTask(export_func, file_path, columns_dialog.selected_keys(), fmt), title, parent
+    )
+    progress.exec()
+
+    if progress.result is not None:
+        QMessageBox.information(
+            parent, "Success",
+            f"Exported {progress.result.rows:,} rows to {progress.result.path}"
+        )
+    elif not progress.cancelled:
+        QMessageBox.critical(parent, "Error", f"Failed to export: {progress.error}")
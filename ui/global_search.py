@@ -0,0 +1,169 @@
+"""
+Global search dialog (Ctrl+F outside the list views)
+"""
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QLineEdit, QListWidget, QListWidgetItem, QLabel
+)
+from PySide6.QtCore import Qt, Signal, QTimer
+from db import search_index
+from utils.async_loader import AsyncLoader
+
+
+ENTITY_ICONS = {
+    'contact': "👤",
+    'application': "💼",
+    'interview': "🎤",
+    'document': "📄",
+    'company': "🏢",
+    'task': "✅",
+}
+
+
+class GlobalSearchDialog(QDialog):
+    """Search contacts, applications, interviews, research notes and tasks at once"""
+
+    # Emitted with (entity, entity_id) when a result is opened
+    result_activated = Signal(str, int)
+
+    # Delay after the last keystroke before querying
+    SEARCH_DELAY_MS = 120
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Search")
+        self.resize(640, 520)
+
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(self.SEARCH_DELAY_MS)
+        self.search_timer.timeout.connect(self.run_search)
+
+        # Queries run on a pool thread; only the newest request's results are shown
+        self.search_loader = AsyncLoader(self, name='search.global')
+        self.search_loader.loaded.connect(self.show_results)
+        self.search_loader.failed.connect(self.on_search_failed)
+        # Enter was pressed before the results for the current text arrived
+        self.open_when_loaded = False
+
+        self.setup_ui()
+
+    def setup_ui(self):
+        """Setup the UI components"""
+        layout = QVBoxLayout(self)
+        layout.setSpacing(12)
+        layout.setContentsMargins(16, 16, 16, 16)
+
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("🔍 Search contacts, applications, notes...")
+        self.search_input.textChanged.connect(self.search_timer.start)
+        self.search_input.returnPressed.connect(self.open_current)
+        layout.addWidget(self.search_input)
+
+        self.results_list = QListWidget()
+        self.results_list.setStyleSheet("""
+            QListWidget {
+                background-color: #0A0A0A;
+                border: 1px solid #1E2330;
+                border-radius: 8px;
+            }
+            QListWidget::item {
+                border-bottom: 1px solid #1E2330;
+            }
+            QListWidget::item:selected {
+                background-color: rgba(255, 139, 61, 0.15);
+            }
+        """)
+        self.results_list.itemActivated.connect(self.open_item)
+        layout.addWidget(self.results_list)
+
+        self.status_label = QLabel("Type to search")
+        self.status_label.setStyleSheet("color: #888888; font-size: 11px;")
+        layout.addWidget(self.status_label)
+
+        if not search_index.is_available():
+            self.search_input.setEnabled(False)
+            self.status_label.setText("Full-text search is not available in this SQLite build")
+
+    def run_search(self):
+        """Start querying the search index in the background"""
+        self.open_when_loaded = False
+        query = self.search_input.text().strip()
+        if not query:
+            self.search_loader.cancel()
+            self.results_list.clear()
+            self.status_label.setText("Type to search")
+            return
+
+        self.status_label.setText("Searching...")
+        self.search_loader.load(search_index.search_results, query)
+
+    def on_search_failed(self, message: str):
+        self.open_when_loaded = False
+        self.results_list.clear()
+        self.status_label.setText(f"Search failed: {message}")
+
+    def show_results(self, results: search_index.SearchResults):
+        """Show the results of the newest query"""
+        self.results_list.clear()
+        hits = results.hits
+        for hit in hits:
+            self.add_result(hit)
+
+        if hits:
+            self.results_list.setCurrentRow(0)
+            if results.truncated:
+                self.status_label.setText(
+                    f"{len(hits)} of {results.matched:,} matches, best of the newest "
+                    f"{search_index.MAX_RANKED_CANDIDATES:,} - type more to narrow down"
+                )
+            elif results.matched > len(hits):
+                self.status_label.setText(f"{len(hits)} of {results.matched:,} matches")
+            else:
+                self.status_label.setText(f"{len(hits)} result(s)")
+        else:
+            self.status_label.setText("No matches")
+
+        if self.open_when_loaded:
+            self.open_when_loaded = False
+            item = self.results_list.currentItem()
+            if item:
+                self.open_item(item)
+
+    def add_result(self, hit: search_index.SearchHit):
+        """Add one result row with highlighted title and snippet"""
+        icon = ENTITY_ICONS.get(hit.entity, "•")
+        lines = [f"<span style='font-size: 13px;'>{icon} <b>{hit.title}</b></span>"]
+        if hit.subtitle:
+            lines.append(f"<span style='color: #AAAAAA;'>{hit.subtitle}</span>")
+        if hit.snippet:
+            lines.append(f"<span style='color: #888888; font-size: 11px;'>{hit.snippet}</span>")
+
+        label = QLabel("<br>".join(lines))
+        label.setTextFormat(Qt.RichText)
+        label.setStyleSheet("color: #FFFFFF; padding: 6px; background: transparent;")
+        label.setAttribute(Qt.WA_TransparentForMouseEvents)
+
+        item = QListWidgetItem()
+        item.setData(Qt.UserRole, (hit.entity, hit.entity_id))
+        item.setSizeHint(label.sizeHint())
+        self.results_list.addItem(item)
+        self.results_list.setItemWidget(item, label)
+
+    def open_current(self):
+        """Open the selected result (Enter in the search field)"""
+        if self.search_timer.isActive():
+            self.search_timer.stop()
+            self.run_search()
+        if self.search_loader.is_busy():
+            # Open the first result once the search for the current text is done
+            self.open_when_loaded = True
+            return
+        item = self.results_list.currentItem()
+        if item:
+            self.open_item(item)
+
+    def open_item(self, item: QListWidgetItem):
+        """Emit the chosen result and close"""
+        entity, entity_id = item.data(Qt.UserRole)
+        self.accept()
+        self.result_activated.emit(entity, entity_id)
@@ -0,0 +1,120 @@
+"""
+CSV import progress dialog
+Runs a bulk import (utils.bulk_import) on the thread pool and shows its progress
+"""
+import logging
+import threading
+from PySide6.QtWidgets import QProgressDialog
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Qt, Signal, Slot
+
+logger = logging.getLogger('GTI_Tracker.ImportDialog')
+
+# Skipped-row messages shown in the summary; the rest are counted
+MAX_ERRORS_SHOWN = 20
+
+
+class _ImportSignals(QObject):
+    progress = Signal(int, int, object)  # rows imported, percent read, [(line, message)] of the batch
+    finished = Signal(object)            # ImportResult
+    failed = Signal(str)                 # file error or cancel
+
+
+class ImportTask(QRunnable):
+    """Calls import_func(path, progress=..., is_cancelled=...) on a pool thread"""
+
+    def __init__(self, import_func, path: str):
+        super().__init__()
+        self.import_func = import_func
+        self.path = path
+        self.signals = _ImportSignals()
+        self.cancel_requested = threading.Event()
+        self.setAutoDelete(False)
+
+    def run(self):
+        from utils.bulk_import import ImportCancelled
+        try:
+            result = self.import_func(
+                self.path,
+                progress=lambda rows, percent, errors: self.signals.progress.emit(rows, percent, list(errors)),
+                is_cancelled=self.cancel_requested.is_set
+            )
+        except ImportCancelled:
+            self.signals.failed.emit("Import cancelled; nothing was imported.")
+        except Exception as e:
+            logger.exception(f"Import of {self.path} failed")
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
+
+
+class ImportProgressDialog(QProgressDialog):
+    """
+    Modal progress for one import; exec() returns once the import ended
+
+    After exec(), result holds the ImportResult (None if the import failed or
+    was cancelled) and error the failure message.
+    """
+
+    def __init__(self, import_func, path: str, title: str, parent=None):
+        super().__init__("Importing...", "Cancel", 0, 100, parent)
+        self.setWindowTitle(title)
+        self.setWindowModality(Qt.WindowModal)
+        self.setAutoClose(False)
+        self.setAutoReset(False)
+        self.setMinimumDuration(0)
+
+        self.result = None
+        self.error = None
+        self.skipped = 0
+
+        self.task = ImportTask(import_func, path)
+        self.task.signals.progress.connect(self.on_progress)
+        self.task.signals.finished.connect(self.on_finished)
+        self.task.signals.failed.connect(self.on_failed)
+        self.canceled.disconnect()  # keep the dialog open until the rollback finished
+        self.canceled.connect(self.request_cancel)
+
+    def exec(self):
+        QThreadPool.globalInstance().start(self.task)
+        return super().exec()
+
+    @Slot()
+    def request_cancel(self):
+        self.task.cancel_requested.set()
+        self.setLabelText("Cancelling...")
+
+    @Slot(int, int, object)
+    def on_progress(self, rows: int, percent: int, errors):
+        self.skipped += len(errors)
+        self.setValue(percent)
+        label = f"Imported {rows:,} rows"
+        if self.skipped:
+            label += f" ({self.skipped:,} skipped)"
+        self.setLabelText(label)
+
+    @Slot(object)
+    def on_finished(self, result):
+        self.result = result
+        self.accept()
+
+    @Slot(str)
+    def on_failed(self, message: str):
+        self.error = message
+        self.reject()
+
+    def summary(self, noun: str) -> str:
+        """Message for the user after exec()"""
+        if self.result is None:
+            return f"Failed to import: {self.error}"
+        message = f"Imported {self.result.imported:,} {noun} in {self.result.elapsed_s:.1f}s."
+        if self.result.errors:
+            lines = self.result.error_messages()
+            message += f"\n\nSkipped {len(lines):,} rows:\n" + "\n".join(lines[:MAX_ERRORS_SHOWN])
+            if len(lines) > MAX_ERRORS_SHOWN:
+                message += f"\n... and {len(lines) - MAX_ERRORS_SHOWN:,} more"
+        if self.result.duplicates:
+            lines = self.result.duplicate_messages()
+            message += f"\n\n{len(lines):,} likely duplicates:\n" + "\n".join(lines[:MAX_ERRORS_SHOWN])
+            if len(lines) > MAX_ERRORS_SHOWN:
+                message += f"\n... and {len(lines) - MAX_ERRORS_SHOWN:,} more"
+        return message
@@ -8,8 +8,10 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtCharts import QChartView, QPieSeries, QChart
 from PySide6.QtGui import QPainter, QColor
-from db.models import InternshipApplication, InternshipStatus
-from db.session import get_session
+from db.models import InternshipStatus
+from utils.dashboard_snapshot import DashboardSnapshot, InternshipSnapshot
+from utils.async_loader import AsyncLoader
+from ui.professional_components import create_loading_overlay
 
 
 class InternshipDashboard(QWidget):
@@ -21,8 +23,11 @@ class InternshipDashboard(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.snapshot_loader = AsyncLoader(self, name='dashboard.internships')
+        self.snapshot_loader.loaded.connect(self.load_data)
         self.setup_ui()
-        self.load_data()
+        create_loading_overlay(self, self.snapshot_loader, "Loading dashboard...")
+        self.refresh()
 
     def setup_ui(self):
         """Setup the UI components with scroll support"""
@@ -237,39 +242,25 @@ class InternshipDashboard(QWidget):
 
         return frame
 
-    def load_data(self):
+    def load_data(self, snapshot: InternshipSnapshot = None):
         """Load data from database and update UI"""
-        session = get_session()
-        try:
-            # Force SQLAlchemy to fetch fresh data
-            session.expire_all()
-
-            # Total applications
-            total = session.query(InternshipApplication).count()
-            self.total_count_label.setText(str(total))
-
-            # Active applications (non-final statuses)
-            active = session.query(InternshipApplication).filter(
-                InternshipApplication.status.notin_([
-                    InternshipStatus.OFFER,
-                    InternshipStatus.REJECTED
-                ])
-            ).count()
-            self.active_count_label.setText(str(active))
-
-            # Status distribution
-            status_counts = {}
-            for status in InternshipStatus:
-                count = session.query(InternshipApplication).filter_by(
-                    status=status
-                ).count()
-                if count > 0:
-                    status_counts[status.value] = count
-
-            self.update_chart(status_counts)
-
-        finally:
-            session.close()
+        if snapshot is None:
+            snapshot = DashboardSnapshot.internships()
+
+        # Total applications
+        self.total_count_label.setText(str(snapshot.total))
+
+        # Active applications (non-final statuses)
+        self.active_count_label.setText(str(snapshot.active_count))
+
+        # Status distribution
+        status_counts = {}
+        for status in InternshipStatus:
+            count = snapshot.status_counts.get(status, 0)
+            if count > 0:
+                status_counts[status.value] = count
+
+        self.update_chart(status_counts)
 
     def update_chart(self, data: dict):
         """Update the pie chart with data"""
@@ -304,6 +295,6 @@ class InternshipDashboard(QWidget):
         self.chart_view.setChart(chart)
 
     def refresh(self):
-        """Refresh the dashboard data"""
-        self.load_data()
+        """Refresh the dashboard data (queried off the GUI thread)"""
+        self.snapshot_loader.load(DashboardSnapshot.internships)
 
@@ -6,13 +6,14 @@ from typing import Optional
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QFormLayout,
     QLineEdit, QTextEdit, QComboBox, QDateEdit, QPushButton,
-    QLabel, QMessageBox, QCompleter, QWidget, QGroupBox,
+    QLabel, QMessageBox, QWidget, QGroupBox,
     QTextBrowser
 )
 from PySide6.QtCore import Qt, QDate, Signal, QUrl
 from PySide6.QtGui import QDesktopServices
 from db.models import InternshipApplication, InternshipStatus, NetworkingContact
 from db.session import get_session
+from ui.lookup_completer import attach_company_completer, setup_contact_choice
 from utils.validators import validate_required_field, is_valid_url
 from utils.date_helpers import format_date
 from ui.toast import show_success, show_error
@@ -150,44 +151,12 @@ class AddEditInternshipDialog(QDialog):
         layout.addLayout(button_layout)
 
     def setup_company_completer(self):
-        """Setup autocomplete for company field"""
-        session = get_session()
-        try:
-            # Get distinct companies from both internships and contacts
-            internship_companies = session.query(InternshipApplication.company).distinct().all()
-            contact_companies = session.query(NetworkingContact.company).distinct().all()
-
-            company_set = set()
-            for c in internship_companies:
-                if c[0]:
-                    company_set.add(c[0])
-            for c in contact_companies:
-                if c[0]:
-                    company_set.add(c[0])
-
-            company_list = sorted(list(company_set))
-
-            completer = QCompleter(company_list)
-            completer.setCaseSensitivity(Qt.CaseInsensitive)
-            self.company_input.setCompleter(completer)
-        finally:
-            session.close()
+        """Setup autocomplete for company field (companies of internships and contacts)"""
+        attach_company_completer(self.company_input, include_applications=True)
 
     def setup_contact_combo(self):
-        """Setup contact combobox"""
-        session = get_session()
-        try:
-            self.contact_combo.addItem("No linked contact", None)
-
-            contacts = session.query(NetworkingContact).order_by(
-                NetworkingContact.name
-            ).all()
-
-            for contact in contacts:
-                display = f"{contact.name} – {contact.job_title} @ {contact.company}"
-                self.contact_combo.addItem(display, contact.id)
-        finally:
-            session.close()
+        """Setup contact combobox (from the shared lookup index)"""
+        self.contact_model = setup_contact_choice(self.contact_combo)
 
     def populate_fields(self):
         """Populate fields with existing internship data"""
@@ -209,10 +178,7 @@ class AddEditInternshipDialog(QDialog):
 
         # Set linked contact
         if self.internship.contact_id:
-            for i in range(self.contact_combo.count()):
-                if self.contact_combo.itemData(i) == self.internship.contact_id:
-                    self.contact_combo.setCurrentIndex(i)
-                    break
+            self.contact_combo.setCurrentIndex(self.contact_model.row_for_id(self.internship.contact_id))
 
         # Set status
         for i in range(self.status_input.count()):
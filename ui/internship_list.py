@@ -8,9 +8,24 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt, Signal, QUrl
 from PySide6.QtGui import QDesktopServices
-from db.models import InternshipApplication, InternshipStatus, NetworkingContact
+from db.models import InternshipApplication, InternshipStatus
 from db.session import get_session
+from db.queries import InternshipFilter, InternshipRow, count_internships, fetch_internship_rows
 from utils.date_helpers import format_date
+from utils.async_loader import AsyncLoader
+from ui.professional_components import create_loading_overlay
+
+
+def query_internships(internship_filter: InternshipFilter, limit: int) -> tuple:
+    """
+    Query run by the internship loader on a pool thread
+
+    Returns:
+        (internship_filter, total, first page of InternshipRow tuples)
+    """
+    total = count_internships(internship_filter)
+    internships = fetch_internship_rows(internship_filter, 0, limit) if total else []
+    return internship_filter, total, internships
 
 
 class InternshipListView(QWidget):
@@ -18,8 +33,16 @@ class InternshipListView(QWidget):
 
     go_back = Signal()
 
+    # Rows fetched per page as the table is scrolled
+    PAGE_SIZE = 100
+
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.internship_filter = InternshipFilter()
+        self.total_internships = 0
+        self.internship_loader = AsyncLoader(self, name='view.internships')
+        self.internship_loader.loaded.connect(self.on_internships_loaded)
+        self.internship_loader.failed.connect(self.on_load_failed)
         self.setup_ui()
         self.load_internships()
 
@@ -37,7 +60,7 @@ class InternshipListView(QWidget):
         top_bar.addWidget(back_btn)
 
         self.search_input = QLineEdit()
-        self.search_input.setPlaceholderText("🔍 Search by role or company")
+        self.search_input.setPlaceholderText("🔍 Search by role, company or notes")
         self.search_input.textChanged.connect(self.filter_internships)
         self.search_input.setMinimumWidth(350)
         top_bar.addWidget(self.search_input)
@@ -97,6 +120,7 @@ class InternshipListView(QWidget):
         self.table.verticalHeader().setVisible(False)
         self.table.setAlternatingRowColors(True)
         self.table.cellDoubleClicked.connect(self.on_row_double_clicked)
+        self.table.verticalScrollBar().valueChanged.connect(self.on_scroll)
 
         # Empty state
         self.empty_state = QWidget()
@@ -113,70 +137,67 @@ class InternshipListView(QWidget):
         layout.addWidget(self.table)
         layout.addWidget(self.empty_state)
 
+        create_loading_overlay(self.table, self.internship_loader, "Loading applications...")
+
     def load_internships(self):
         """Load internships from database"""
-        session = get_session()
-        try:
-            self.all_internships = session.query(InternshipApplication).all()
-
-            # Load contacts for display
-            self.contacts_map = {}
-            for internship in self.all_internships:
-                if internship.contact_id:
-                    contact = session.query(NetworkingContact).filter_by(
-                        id=internship.contact_id
-                    ).first()
-                    if contact:
-                        self.contacts_map[internship.contact_id] = contact
-
-            self.filter_internships()
-        finally:
-            session.close()
+        self.filter_internships()
+
+    def current_filter(self) -> InternshipFilter:
+        """Build the query filter from the current search/filter/sort controls"""
+        return InternshipFilter(
+            search_text=self.search_input.text(),
+            status=self.status_filter.currentData(),
+            sort_key=self.sort_combo.currentData()
+        )
 
     def filter_internships(self):
-        """Filter and sort internships"""
-        filtered = self.all_internships.copy()
-
-        # Search filter
-        search_text = self.search_input.text().lower()
-        if search_text:
-            filtered = [
-                i for i in filtered
-                if (search_text in i.role_name.lower() or
-                    search_text in i.company.lower())
-            ]
-
-        # Status filter
-        status_filter = self.status_filter.currentData()
-        if status_filter:
-            filtered = [i for i in filtered if i.status == status_filter]
-
-        # Sorting
-        sort_by = self.sort_combo.currentData()
-        if sort_by == "date_desc":
-            filtered.sort(key=lambda i: i.application_date, reverse=True)
-        elif sort_by == "date_asc":
-            filtered.sort(key=lambda i: i.application_date)
-        elif sort_by == "company_asc":
-            filtered.sort(key=lambda i: i.company.lower())
-        elif sort_by == "role_asc":
-            filtered.sort(key=lambda i: i.role_name.lower())
-
-        self.display_internships(filtered)
-
-    def display_internships(self, internships):
-        """Display internships in the table"""
-        if not internships:
+        """Filter and sort internships (evaluated in SQL off the GUI thread, first page only)"""
+        self.internship_loader.load(query_internships, self.current_filter(), self.PAGE_SIZE)
+
+    def on_internships_loaded(self, result):
+        """Show the result of the newest filter_internships() request"""
+        self.internship_filter, self.total_internships, internships = result
+        self.table.setRowCount(0)
+
+        if not self.total_internships:
             self.table.hide()
             self.empty_state.show()
             return
 
         self.table.show()
         self.empty_state.hide()
+        if len(internships) < self.PAGE_SIZE:
+            self.total_internships = len(internships)
+        self.display_internships(internships)
+
+    def on_load_failed(self, message: str):
+        """Report a failed background load"""
+        from ui.toast import show_error
+        show_error(self, f"Error loading applications: {message}")
+
+    def load_next_page(self):
+        """Append the next page of internships to the table"""
+        offset = self.table.rowCount()
+        if offset >= self.total_internships:
+            return
+
+        internships = fetch_internship_rows(self.internship_filter, offset, self.PAGE_SIZE)
+        if len(internships) < self.PAGE_SIZE:
+            self.total_internships = offset + len(internships)
+        self.display_internships(internships, offset)
+
+    def on_scroll(self, value: int):
+        """Fetch more rows when the user scrolls near the bottom"""
+        scrollbar = self.table.verticalScrollBar()
+        if value >= scrollbar.maximum() - 2:
+            self.load_next_page()
 
-        self.table.setRowCount(len(internships))
+    def display_internships(self, internships, start_row: int = 0):
+        """Display internships in the table starting at start_row"""
+        self.table.setRowCount(start_row + len(internships))
 
-        for row, internship in enumerate(internships):
+        for row, internship in enumerate(internships, start=start_row):
             # Role Name
             role_item = QTableWidgetItem(internship.role_name)
             role_item.setData(Qt.UserRole, internship.id)
@@ -238,18 +259,18 @@ class InternshipListView(QWidget):
         layout.addWidget(badge)
         return widget
 
-    def create_contact_widget(self, internship: InternshipApplication) -> QWidget:
+    def create_contact_widget(self, internship: InternshipRow) -> QWidget:
         """Create linked contact widget"""
         widget = QWidget()
         layout = QHBoxLayout(widget)
         layout.setContentsMargins(4, 4, 4, 4)
 
-        if internship.contact_id and internship.contact_id in self.contacts_map:
-            contact = self.contacts_map[internship.contact_id]
-            text = f"{contact.name} – {contact.job_title} @ {contact.company}"
+        if internship.contact_id and internship.contact_name is not None:
+            text = (f"{internship.contact_name} – {internship.contact_job_title} "
+                    f"@ {internship.contact_company}")
             label = QLabel(text)
             label.setStyleSheet("font-size: 11px; color: #3498db; cursor: pointer;")
-            label.mousePressEvent = lambda e: self.view_contact(contact.id)
+            label.mousePressEvent = lambda e: self.view_contact(internship.contact_id)
             layout.addWidget(label)
         else:
             label = QLabel("—")
@@ -258,7 +279,7 @@ class InternshipListView(QWidget):
 
         return widget
 
-    def create_link_widget(self, internship: InternshipApplication) -> QWidget:
+    def create_link_widget(self, internship: InternshipRow) -> QWidget:
         """Create job link widget"""
         widget = QWidget()
         layout = QHBoxLayout(widget)
@@ -1,12 +1,11 @@
 """
 Internship statistics window
 """
-import csv
-from pathlib import Path
+from datetime import date
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QGridLayout,
-    QPushButton, QLabel, QScrollArea, QWidget, QFileDialog,
-    QMessageBox, QGroupBox
+    QPushButton, QLabel, QScrollArea, QWidget,
+    QGroupBox
 )
 from PySide6.QtCore import Qt
 from PySide6.QtCharts import (
@@ -16,11 +15,49 @@ from PySide6.QtCharts import (
 from PySide6.QtGui import QPainter, QColor
 from db.models import InternshipApplication, InternshipStatus
 from db.session import get_session
-from sqlalchemy import func
+from db.stats_counters import read_counters, top_counters
 from utils.date_helpers import get_last_n_weeks
+from utils.async_loader import AsyncLoader
+from utils.performance import cached
+from ui.professional_components import create_loading_overlay
 from collections import defaultdict
 
 
+@cached(ttl=300, tags=('applications',), key_func=lambda: date.today())
+def collect_internship_statistics() -> dict:
+    """
+    Query run by the statistics loader on a pool thread
+
+    Returns:
+        Dict with total, status_counts, day_counts, with_contact and top_companies
+    """
+    session = get_session()
+    try:
+        # Overall metrics, status and per-day counts from the stats counters
+        weeks = get_last_n_weeks(12)
+        counters = read_counters('application', ('total', 'status', 'day'), day_from=weeks[0][0])
+
+        # Status counts
+        status_counts = {}
+        for status in InternshipStatus:
+            status_counts[status.value] = counters['status'].get(status.name, 0)
+
+        # Applications made through a contact
+        with_contact = session.query(InternshipApplication).filter(
+            InternshipApplication.contact_id.isnot(None)
+        ).count()
+
+        return {
+            'total': counters['total'].get('', 0),
+            'status_counts': status_counts,
+            'day_counts': counters['day'],
+            'with_contact': with_contact,
+            'top_companies': top_counters('application', 'company', limit=10),
+        }
+    finally:
+        session.close()
+
+
 class InternshipStatsDialog(QDialog):
     """Statistics window for internships"""
 
@@ -29,6 +66,8 @@ class InternshipStatsDialog(QDialog):
         self.setWindowTitle("Internship Statistics")
         self.resize(950, 750)
 
+        self.stats_loader = AsyncLoader(self, name='stats.internships')
+        self.stats_loader.loaded.connect(self.show_statistics)
         self.setup_ui()
         self.load_statistics()
 
@@ -52,6 +91,7 @@ class InternshipStatsDialog(QDialog):
 
         scroll.setWidget(content_widget)
         main_layout.addWidget(scroll)
+        create_loading_overlay(scroll, self.stats_loader, "Loading statistics...")
 
         # Bottom buttons
         button_layout = QHBoxLayout()
@@ -69,71 +109,36 @@ class InternshipStatsDialog(QDialog):
         main_layout.addLayout(button_layout)
 
     def load_statistics(self):
-        """Load and display statistics"""
-        session = get_session()
-        try:
-            # Overall metrics
-            total = session.query(InternshipApplication).count()
-
-            # Active applications
-            active = session.query(InternshipApplication).filter(
-                InternshipApplication.status.notin_([
-                    InternshipStatus.OFFER,
-                    InternshipStatus.REJECTED
-                ])
-            ).count()
-
-            # Offers
-            offers = session.query(InternshipApplication).filter_by(
-                status=InternshipStatus.OFFER
-            ).count()
-
-            # Rejected
-            rejected = session.query(InternshipApplication).filter_by(
-                status=InternshipStatus.REJECTED
-            ).count()
-
-            # Rejection rate
-            rejection_rate = (rejected / total * 100) if total > 0 else 0
-
-            # Status counts
-            status_counts = {}
-            for status in InternshipStatus:
-                count = session.query(InternshipApplication).filter_by(
-                    status=status
-                ).count()
-                status_counts[status.value] = count
-
-            # Create sections
-            self.create_metrics_section(total, active, offers, rejection_rate)
-            self.create_status_chart_section(status_counts)
-
-            # Timeline chart (last 12 weeks)
-            all_applications = session.query(InternshipApplication).all()
-            self.create_timeline_chart_section(all_applications)
-
-            self.create_funnel_section(status_counts, total)
-
-            # Networking impact
-            with_contact = session.query(InternshipApplication).filter(
-                InternshipApplication.contact_id.isnot(None)
-            ).count()
-            without_contact = total - with_contact
-
-            self.create_networking_impact_section(with_contact, without_contact, total)
-
-            # Top companies
-            top_companies = session.query(
-                InternshipApplication.company,
-                func.count(InternshipApplication.id).label('count')
-            ).group_by(InternshipApplication.company).order_by(
-                func.count(InternshipApplication.id).desc()
-            ).limit(10).all()
-
-            self.create_top_companies_section(top_companies)
-
-        finally:
-            session.close()
+        """Load statistics off the GUI thread; show_statistics() builds the sections"""
+        self.stats_loader.load(collect_internship_statistics)
+
+    def show_statistics(self, stats: dict):
+        """Build the report sections from collect_internship_statistics()"""
+        total = stats['total']
+        offers = stats['status_counts'][InternshipStatus.OFFER.value]
+        rejected = stats['status_counts'][InternshipStatus.REJECTED.value]
+
+        # Active applications
+        active = total - offers - rejected
+
+        # Rejection rate
+        rejection_rate = (rejected / total * 100) if total > 0 else 0
+
+        # Create sections
+        self.create_metrics_section(total, active, offers, rejection_rate)
+        self.create_status_chart_section(stats['status_counts'])
+
+        # Timeline chart (last 12 weeks)
+        self.create_timeline_chart_section(stats['day_counts'])
+
+        self.create_funnel_section(stats['status_counts'], total)
+
+        # Networking impact
+        with_contact = stats['with_contact']
+        self.create_networking_impact_section(with_contact, total - with_contact, total)
+
+        # Top companies
+        self.create_top_companies_section(stats['top_companies'])
 
     def create_metrics_section(self, total, active, offers, rejection_rate):
         """Create overall metrics section"""
@@ -210,8 +215,8 @@ class InternshipStatsDialog(QDialog):
         group.setLayout(layout)
         self.content_layout.addWidget(group)
 
-    def create_timeline_chart_section(self, applications):
-        """Create applications over time bar chart"""
+    def create_timeline_chart_section(self, day_counts: dict):
+        """Create applications over time bar chart from {ISO date: count}"""
         group = QGroupBox("Applications Over Last 12 Weeks")
         layout = QVBoxLayout()
 
@@ -220,12 +225,12 @@ class InternshipStatsDialog(QDialog):
 
         # Count applications per week
         week_counts = defaultdict(int)
-        for app in applications:
-            app_date = app.application_date
+        for day, count in day_counts.items():
+            app_date = date.fromisoformat(day)
             for week_start, week_end in weeks:
                 if week_start <= app_date <= week_end:
                     week_key = f"{week_start.month}/{week_start.day}"
-                    week_counts[week_key] += 1
+                    week_counts[week_key] += count
                     break
 
         # Create bar chart
@@ -376,52 +381,15 @@ class InternshipStatsDialog(QDialog):
         self.content_layout.addWidget(group)
 
     def export_csv(self):
-        """Export statistics to CSV"""
-        file_path, _ = QFileDialog.getSaveFileName(
-            self,
-            "Export Statistics",
-            str(Path.home() / "internship_statistics.csv"),
-            "CSV Files (*.csv)"
-        )
-
-        if not file_path:
-            return
-
-        try:
-            session = get_session()
-            internships = session.query(InternshipApplication).all()
-
-            with open(file_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    'Role Name', 'Company', 'Application Date',
-                    'Status', 'Job Link', 'Contact ID', 'Notes', 'Last Updated'
-                ])
-
-                for internship in internships:
-                    writer.writerow([
-                        internship.role_name,
-                        internship.company,
-                        internship.application_date.isoformat(),
-                        internship.status.value,
-                        internship.job_link or '',
-                        internship.contact_id or '',
-                        internship.notes or '',
-                        internship.last_updated.isoformat()
-                    ])
-
-            session.close()
-
-            QMessageBox.information(
-                self,
-                "Success",
-                f"Statistics exported to {file_path}"
-            )
-
-        except Exception as e:
-            QMessageBox.critical(
-                self,
-                "Error",
-                f"Failed to export statistics: {str(e)}"
-            )
+        """Export the applications behind the statistics (CSV, TSV or JSON Lines)"""
+        from dataclasses import replace
+        from utils.export_engine import INTERNSHIP_COLUMNS, export_internships
+        from ui.export_dialog import run_export
+
+        # The statistics export has always included the contact link and last update
+        columns = [
+            replace(column, default=column.default or column.key in ('contact_id', 'updated_at'))
+            for column in INTERNSHIP_COLUMNS
+        ]
+        run_export(self, columns, export_internships, "internship_statistics", "Export Statistics")
 
@@ -0,0 +1,159 @@
+"""
+Completers backed by utils.lookup_index
+Suggestion models recomputed per keystroke (prefix, then word, substring and fuzzy matches)
+"""
+from typing import Callable, List, Optional
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex
+from PySide6.QtWidgets import QComboBox, QCompleter, QLineEdit
+from utils.lookup_index import lookup_index
+
+# Rows visible in a completer popup before it scrolls
+VISIBLE_SUGGESTIONS = 12
+
+
+class SuggestionModel(QAbstractListModel):
+    """The current suggestions: display text, and an id in Qt.UserRole"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []  # (text, id)
+
+    def set_suggestions(self, rows: List[tuple]) -> None:
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return self._rows[index.row()][0]
+        if role == Qt.UserRole:
+            return self._rows[index.row()][1]
+        return None
+
+
+class LookupCompleter(QCompleter):
+    """
+    QCompleter whose rows come from a suggest(text) function
+
+    The completer does no filtering of its own (UnfilteredPopupCompletion):
+    every edit of the widget's text replaces the model with suggest(text),
+    so only the best MAX_SUGGESTIONS matches ever reach Qt.
+    """
+
+    def __init__(self, suggest: Callable[[str], List[tuple]], parent=None):
+        super().__init__(parent)
+        self.suggest = suggest
+        self.setModel(SuggestionModel(self))
+        self.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        self.setCaseSensitivity(Qt.CaseInsensitive)
+        self.setMaxVisibleItems(VISIBLE_SUGGESTIONS)
+
+    def update_suggestions(self, text: str) -> None:
+        self.model().set_suggestions(self.suggest(text) if text.strip() else [])
+
+
+def attach_company_completer(line_edit: QLineEdit, include_applications: bool = False) -> LookupCompleter:
+    """
+    Suggest company names from lookup_index while typing in line_edit
+
+    Args:
+        line_edit: Company field
+        include_applications: Also suggest companies of internship applications
+    """
+    completer = LookupCompleter(
+        lambda text: [(company, None) for company in
+                      lookup_index.suggest_companies(text, include_applications)],
+        line_edit
+    )
+    # textEdited is emitted before the line edit asks the completer for its popup
+    line_edit.textEdited.connect(completer.update_suggestions)
+    line_edit.setCompleter(completer)
+    return completer
+
+
+class ContactChoiceModel(QAbstractListModel):
+    """
+    "No linked contact" followed by every contact, for an editable QComboBox
+
+    Holds the sorted tuple from lookup_index.contacts(); rows are looked up
+    by id or label in dictionaries built on first use instead of by scanning.
+    """
+
+    NO_CONTACT_LABEL = "No linked contact"
+
+    def __init__(self, contacts: tuple, parent=None):
+        super().__init__(parent)
+        self._contacts = contacts
+        self._rows_by_id = None
+        self._rows_by_label = None
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._contacts) + 1
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            return self._contacts[row - 1].label if row else self.NO_CONTACT_LABEL
+        if role == Qt.UserRole:
+            return self._contacts[row - 1].id if row else None
+        return None
+
+    def row_for_id(self, contact_id: Optional[int]) -> int:
+        """Row of a contact, 0 ("No linked contact") for None or an unknown id"""
+        if self._rows_by_id is None:
+            self._rows_by_id = {entry.id: row for row, entry in enumerate(self._contacts, 1)}
+        return self._rows_by_id.get(contact_id, 0)
+
+    def row_for_label(self, label: str, case_sensitive: bool = False) -> int:
+        """First row whose label equals label, -1 if there is none"""
+        if self._rows_by_label is None:
+            self._rows_by_label = {self.NO_CONTACT_LABEL.casefold(): 0}
+            for row, entry in enumerate(self._contacts, 1):
+                self._rows_by_label.setdefault(entry.label.casefold(), row)
+        row = self._rows_by_label.get(label.casefold(), -1)
+        if row >= 0 and case_sensitive and self.data(self.index(row)) != label:
+            return -1
+        return row
+
+    def match(self, start, role, value, hits=1, flags=Qt.MatchExactly | Qt.MatchWrap):
+        # QComboBox.findText() after an edit: answer whole-label lookups without visiting every row
+        whole_label = (flags & ~(Qt.MatchCaseSensitive | Qt.MatchWrap)) in (Qt.MatchExactly, Qt.MatchFixedString)
+        if whole_label and role in (Qt.DisplayRole, Qt.EditRole) and isinstance(value, str):
+            row = self.row_for_label(value, bool(flags & Qt.MatchCaseSensitive))
+            return [self.index(row)] if row >= 0 else []
+        return super().match(start, role, value, hits, flags)
+
+
+def setup_contact_choice(combo: QComboBox) -> ContactChoiceModel:
+    """
+    Fill an editable combobox with every contact from lookup_index
+
+    Typing suggests contacts by name, job title or company; the current
+    item's Qt.UserRole data is the contact id (None for no contact).
+    """
+    model = ContactChoiceModel(lookup_index.contacts(), combo)
+    combo.setModel(model)
+    combo.setInsertPolicy(QComboBox.NoInsert)
+    # Don't measure every row to size the box or the popup
+    combo.setSizeAdjustPolicy(QComboBox.AdjustToMinimumContentsLengthWithIcon)
+    combo.setMinimumContentsLength(30)
+    combo.view().setUniformItemSizes(True)
+
+    def suggest(text: str) -> List[tuple]:
+        return [(entry.label, entry.id) for entry in lookup_index.suggest_contacts(text)]
+
+    completer = LookupCompleter(suggest, combo)
+    combo.lineEdit().textEdited.connect(completer.update_suggestions)
+    combo.setCompleter(completer)
+    # After QComboBox's own handler, which picks the first row with the same label
+    completer.activated[QModelIndex].connect(
+        lambda index: combo.setCurrentIndex(model.row_for_id(index.data(Qt.UserRole)))
+    )
+    return model
@@ -7,20 +7,22 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt, QSettings
 from PySide6.QtGui import QIcon, QKeySequence, QAction
-from ui.networking_dashboard import NetworkingDashboard
-from ui.networking_list import NetworkingListView
-from ui.networking_stats import NetworkingStatsDialog
-from ui.networking_dialogs import AddEditContactDialog
-from ui.internship_dashboard import InternshipDashboard
-from ui.internship_list import InternshipListView
-from ui.internship_stats import InternshipStatsDialog
-from ui.internship_dialogs import AddEditInternshipDialog
-from ui.settings_dialog import SettingsDialog
+from utils.performance import perf_monitor
+from utils.settings_store import settings_store
+
+# Views and dialogs are imported when first used: the chart and dialog
+# modules are not needed to paint the first window.
 
 
 class MainWindow(QMainWindow):
     """Main application window with sidebar navigation"""
 
+    # Views of each sidebar tab; the tab's dashboard is shown when switching tabs
+    TAB_VIEWS = {
+        "networking": ("networking_dashboard", "networking_list"),
+        "internships": ("internship_dashboard", "internship_list"),
+    }
+
     def __init__(self):
         super().__init__()
 
@@ -37,6 +39,9 @@ class MainWindow(QMainWindow):
         # QSettings for persistence
         self.app_settings = QSettings("GTI_Tracker", "GTI_Tracker")
 
+        # Settings saved anywhere are broadcast by the store
+        settings_store.changed.connect(self.on_settings_saved)
+
         self.setup_ui()
         self.setup_shortcuts()
         self.restore_window_state()
@@ -80,40 +85,25 @@ class MainWindow(QMainWindow):
 
         content_layout.addWidget(settings_bar)
 
-        # Stacked widget for different views
+        # Stacked widget for different views; each view is built (and loads
+        # its data) the first time it is shown
         self.stacked_widget = QStackedWidget()
         self.stacked_widget.setStyleSheet("QStackedWidget { background-color: #000000; }")
 
-        # Networking views
-        self.networking_dashboard = NetworkingDashboard()
-        self.networking_dashboard.show_add_contact.connect(self.add_networking_contact)
-        self.networking_dashboard.show_contact_list.connect(self.show_networking_list)
-        self.networking_dashboard.show_statistics.connect(self.show_networking_stats)
-
-        self.networking_list = NetworkingListView()
-        self.networking_list.go_back.connect(lambda: self.show_view("networking_dashboard"))
-
-        # Internship views
-        self.internship_dashboard = InternshipDashboard()
-        self.internship_dashboard.show_add_internship.connect(self.add_internship)
-        self.internship_dashboard.show_internship_list.connect(self.show_internship_list)
-        self.internship_dashboard.show_statistics.connect(self.show_internship_stats)
-
-        self.internship_list = InternshipListView()
-        self.internship_list.go_back.connect(lambda: self.show_view("internship_dashboard"))
-
-        # Add views to stacked widget
+        self.view_factories = {
+            "networking_dashboard": self.create_networking_dashboard,
+            "networking_list": self.create_networking_list,
+            "internship_dashboard": self.create_internship_dashboard,
+            "internship_list": self.create_internship_list,
+        }
+        self.views = {}
         self.view_indices = {}
-        self.view_indices["networking_dashboard"] = self.stacked_widget.addWidget(self.networking_dashboard)
-        self.view_indices["networking_list"] = self.stacked_widget.addWidget(self.networking_list)
-        self.view_indices["internship_dashboard"] = self.stacked_widget.addWidget(self.internship_dashboard)
-        self.view_indices["internship_list"] = self.stacked_widget.addWidget(self.internship_list)
 
         content_layout.addWidget(self.stacked_widget)
 
         main_layout.addWidget(content_widget, 1)  # stretch factor 1
 
-        # Show networking dashboard by default
+        # Only the last-used tab's dashboard is built at startup
         last_tab = self.app_settings.value("last_tab", "networking")
         if last_tab == "internships":
             self.show_view("internship_dashboard")
@@ -122,6 +112,75 @@ class MainWindow(QMainWindow):
             self.show_view("networking_dashboard")
             self.networking_btn.setChecked(True)
 
+    def create_networking_dashboard(self) -> QWidget:
+        """Build the networking dashboard view"""
+        from ui.networking_dashboard import NetworkingDashboard
+
+        view = NetworkingDashboard()
+        view.show_add_contact.connect(self.add_networking_contact)
+        view.show_contact_list.connect(self.show_networking_list)
+        view.show_statistics.connect(self.show_networking_stats)
+        return view
+
+    def create_networking_list(self) -> QWidget:
+        """Build the networking contact list view"""
+        from ui.networking_list import NetworkingListView
+
+        view = NetworkingListView()
+        view.go_back.connect(lambda: self.show_view("networking_dashboard"))
+        return view
+
+    def create_internship_dashboard(self) -> QWidget:
+        """Build the internship dashboard view"""
+        from ui.internship_dashboard import InternshipDashboard
+
+        view = InternshipDashboard()
+        view.show_add_internship.connect(self.add_internship)
+        view.show_internship_list.connect(self.show_internship_list)
+        view.show_statistics.connect(self.show_internship_stats)
+        return view
+
+    def create_internship_list(self) -> QWidget:
+        """Build the internship list view"""
+        from ui.internship_list import InternshipListView
+
+        view = InternshipListView()
+        view.go_back.connect(lambda: self.show_view("internship_dashboard"))
+        return view
+
+    def get_view(self, view_name: str) -> QWidget:
+        """Return a view, building it and adding it to the stack on first use"""
+        view = self.views.get(view_name)
+        if view is None:
+            view = self.view_factories[view_name]()
+            self.views[view_name] = view
+            self.view_indices[view_name] = self.stacked_widget.addWidget(view)
+        return view
+
+    def current_view_name(self):
+        """Name of the view currently shown, or None"""
+        current = self.stacked_widget.currentWidget()
+        for view_name, view in self.views.items():
+            if view is current:
+                return view_name
+        return None
+
+    @property
+    def networking_dashboard(self):
+        return self.get_view("networking_dashboard")
+
+    @property
+    def networking_list(self):
+        return self.get_view("networking_list")
+
+    @property
+    def internship_dashboard(self):
+        return self.get_view("internship_dashboard")
+
+    @property
+    def internship_list(self):
+        return self.get_view("internship_list")
+
     def create_sidebar(self) -> QWidget:
         """Create the sidebar with navigation buttons"""
         sidebar = QWidget()
@@ -214,29 +273,62 @@ class MainWindow(QMainWindow):
 
     def shortcut_new_item(self):
         """Handle Ctrl+N shortcut - add new item based on current tab"""
-        current_index = self.stacked_widget.currentIndex()
+        current_view = self.current_view_name()
 
         # Check if we're in networking views
-        if current_index in [self.view_indices["networking_dashboard"],
-                             self.view_indices["networking_list"]]:
+        if current_view in self.TAB_VIEWS["networking"]:
             self.add_networking_contact()
         # Check if we're in internship views
-        elif current_index in [self.view_indices["internship_dashboard"],
-                               self.view_indices["internship_list"]]:
+        elif current_view in self.TAB_VIEWS["internships"]:
             self.add_internship()
 
     def shortcut_focus_search(self):
-        """Handle Ctrl+F shortcut - focus search field in list views"""
-        current_index = self.stacked_widget.currentIndex()
+        """Handle Ctrl+F shortcut - focus search field in list views, global search elsewhere"""
+        current_view = self.current_view_name()
 
         # Focus search in networking list
-        if current_index == self.view_indices["networking_list"]:
+        if current_view == "networking_list":
             self.networking_list.search_input.setFocus()
             self.networking_list.search_input.selectAll()
         # Focus search in internship list
-        elif current_index == self.view_indices["internship_list"]:
+        elif current_view == "internship_list":
             self.internship_list.search_input.setFocus()
             self.internship_list.search_input.selectAll()
+        else:
+            self.open_global_search()
+
+    def open_global_search(self):
+        """Open the search dialog over all indexed records"""
+        with perf_monitor.span('dialog.global_search'):
+            from ui.global_search import GlobalSearchDialog
+
+            dialog = GlobalSearchDialog(self)
+        dialog.result_activated.connect(self.open_search_result)
+        dialog.exec()
+
+    def open_search_result(self, entity: str, entity_id: int):
+        """Show the record picked in the global search dialog"""
+        if entity == "interview":
+            from db.session import get_session
+            from db.enhanced_models import Interview
+
+            session = get_session()
+            try:
+                interview = session.get(Interview, entity_id)
+                if not interview:
+                    return
+                entity, entity_id = "application", interview.application_id
+            finally:
+                session.close()
+
+        if entity == "contact":
+            self.switch_tab("networking")
+            self.show_networking_list()
+            self.networking_list.show_contact_detail(entity_id)
+        elif entity == "application":
+            self.switch_tab("internships")
+            self.show_internship_list()
+            self.internship_list.show_internship_detail(entity_id)
 
     def switch_tab(self, tab: str):
         """Switch between main tabs (networking/internships)"""
@@ -252,19 +344,25 @@ class MainWindow(QMainWindow):
             self.app_settings.setValue("last_tab", "internships")
 
     def show_view(self, view_name: str):
-        """Show a specific view in the stacked widget"""
-        if view_name in self.view_indices:
-            self.stacked_widget.setCurrentIndex(self.view_indices[view_name])
+        """Show a specific view in the stacked widget, building it on first use"""
+        if view_name not in self.view_factories:
+            return
 
-            # Refresh dashboards when showing them
-            if view_name == "networking_dashboard":
-                self.networking_dashboard.refresh()
-            elif view_name == "internship_dashboard":
-                self.internship_dashboard.refresh()
+        # A freshly built view has just started loading its data
+        already_built = view_name in self.views
+        view = self.get_view(view_name)
+        self.stacked_widget.setCurrentWidget(view)
+
+        # Refresh dashboards when showing them
+        if already_built and view_name in ("networking_dashboard", "internship_dashboard"):
+            view.refresh()
 
     def add_networking_contact(self):
         """Open dialog to add a networking contact"""
-        dialog = AddEditContactDialog(self)
+        with perf_monitor.span('dialog.add_contact'):
+            from ui.networking_dialogs import AddEditContactDialog
+
+            dialog = AddEditContactDialog(self)
         dialog.contact_saved.connect(self.on_data_changed)
         dialog.exec()
 
@@ -276,12 +374,18 @@ class MainWindow(QMainWindow):
 
     def show_networking_stats(self):
         """Show networking statistics dialog"""
-        dialog = NetworkingStatsDialog(self)
+        with perf_monitor.span('dialog.networking_stats'):
+            from ui.networking_stats import NetworkingStatsDialog
+
+            dialog = NetworkingStatsDialog(self)
         dialog.exec()
 
     def add_internship(self):
         """Open dialog to add an internship"""
-        dialog = AddEditInternshipDialog(self)
+        with perf_monitor.span('dialog.add_internship'):
+            from ui.internship_dialogs import AddEditInternshipDialog
+
+            dialog = AddEditInternshipDialog(self)
         dialog.internship_saved.connect(self.on_data_changed)
         dialog.exec()
 
@@ -292,43 +396,45 @@ class MainWindow(QMainWindow):
 
     def show_internship_stats(self):
         """Show internship statistics dialog"""
-        dialog = InternshipStatsDialog(self)
+        with perf_monitor.span('dialog.internship_stats'):
+            from ui.internship_stats import InternshipStatsDialog
+
+            dialog = InternshipStatsDialog(self)
         dialog.exec()
 
     def open_settings(self):
         """Open settings dialog"""
-        dialog = SettingsDialog(self)
-        dialog.settings_saved.connect(self.on_settings_saved)
+        with perf_monitor.span('dialog.settings'):
+            from ui.settings_dialog import SettingsDialog
+
+            dialog = SettingsDialog(self)
         dialog.exec()
 
     def on_data_changed(self):
-        """Refresh views when data changes"""
-        from PySide6.QtWidgets import QApplication
-
-        # Refresh networking dashboard
-        self.networking_dashboard.refresh()
-
-        # Refresh internship dashboard
-        self.internship_dashboard.refresh()
-
-        # Force immediate UI update
-        QApplication.processEvents()
+        """Refresh views when data changes (views not built yet load fresh data when first shown)"""
+        self.refresh_dashboards()
 
         # If on list views, refresh them too
-        current_view = self.stacked_widget.currentWidget()
-        if current_view == self.networking_list:
+        current_view = self.current_view_name()
+        if current_view == "networking_list":
             self.networking_list.load_contacts()
-        elif current_view == self.internship_list:
+        elif current_view == "internship_list":
             self.internship_list.load_internships()
-        self.internship_dashboard.refresh()
 
-    def on_settings_saved(self):
-        """Handle settings saved"""
+    def on_settings_saved(self, snapshot=None):
+        """Handle settings saved (settings_store.changed)"""
         # Refresh dashboards to update goal widget
-        if hasattr(self, 'networking_dashboard'):
-            self.networking_dashboard.refresh()
-        if hasattr(self, 'internship_dashboard'):
-            self.internship_dashboard.refresh()
+        self.refresh_dashboards()
+
+        # The follow-up filter depends on follow_up_days (the Cold message threshold)
+        if self.current_view_name() == "networking_list":
+            self.networking_list.load_contacts()
+
+    def refresh_dashboards(self):
+        """Refresh the dashboards that have been built"""
+        for view_name in ("networking_dashboard", "internship_dashboard"):
+            if view_name in self.views:
+                self.views[view_name].refresh()
     
     def init_notification_service(self):
         """Initialize the follow-up notification service"""
@@ -342,8 +448,8 @@ class MainWindow(QMainWindow):
     def update_followup_count(self, count: int):
         """Update follow-up counter badge on dashboard"""
         # This will be called by the notification service
-        if hasattr(self, 'networking_dashboard'):
-            self.networking_dashboard.update_followup_count(count)
+        if "networking_dashboard" in self.views:
+            self.views["networking_dashboard"].update_followup_count(count)
 
     def restore_window_state(self):
         """Restore window size and position"""
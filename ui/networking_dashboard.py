@@ -9,11 +9,24 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt, Signal, QMargins
 from PySide6.QtCharts import QChart, QChartView, QBarSet, QBarSeries, QBarCategoryAxis, QValueAxis
 from PySide6.QtGui import QPainter, QColor
-from db.models import NetworkingContact, NetworkingStatus
-from utils.smart_followup import SmartFollowUpService
-from db.session import get_session
-from utils.date_helpers import days_since, get_last_n_days, format_date_short
-from sqlalchemy import func
+from utils.dashboard_snapshot import DashboardSnapshot, NetworkingSnapshot
+from utils.date_helpers import format_date_short
+from utils.async_loader import AsyncLoader
+from ui.professional_components import create_loading_overlay
+
+
+
+def load_networking_snapshot() -> tuple:
+    """
+    Query run by the dashboard loader on a pool thread
+
+    Returns:
+        (NetworkingSnapshot, GoalStatus)
+    """
+    from utils.goal_service import GoalTrackingService
+
+    snapshot = DashboardSnapshot.networking(days=7)
+    return snapshot, GoalTrackingService.get_goal_status(snapshot)
 
 
 class NetworkingDashboard(QWidget):
@@ -25,8 +38,11 @@ class NetworkingDashboard(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.snapshot_loader = AsyncLoader(self, name='dashboard.networking')
+        self.snapshot_loader.loaded.connect(self.on_snapshot_loaded)
         self.setup_ui()
-        self.load_data()
+        create_loading_overlay(self, self.snapshot_loader, "Loading dashboard...")
+        self.refresh()
 
     def setup_ui(self):
         """Setup the UI components with scroll support"""
@@ -251,8 +267,6 @@ class NetworkingDashboard(QWidget):
     
     def create_goal_widget(self) -> QFrame:
         """Create daily goal tracking widget with progress bar"""
-        from utils.goal_service import GoalTrackingService
-        
         frame = QFrame()
         frame.setStyleSheet("""
             QFrame {
@@ -271,15 +285,8 @@ class NetworkingDashboard(QWidget):
         # Goal info
         info_layout = QVBoxLayout()
         
-        remaining = GoalTrackingService.get_remaining_today()
-        today_count = GoalTrackingService.get_today_count()
-        goal = GoalTrackingService.get_daily_goal()
-        
-        if remaining > 0:
-            self.goal_label = QLabel(f"🎯 Only {remaining} contact{'s' if remaining != 1 else ''} left today to reach your goal!")
-        else:
-            self.goal_label = QLabel(f"🎉 Goal achieved! ({today_count}/{goal} contacts today)")
-        
+        # Text and progress are filled in by refresh_goal_widget()
+        self.goal_label = QLabel()
         self.goal_label.setStyleSheet("font-size: 14px; font-weight: 600; color: #FF8B3D;")
         info_layout.addWidget(self.goal_label)
         
@@ -287,7 +294,6 @@ class NetworkingDashboard(QWidget):
         from PySide6.QtWidgets import QProgressBar
         self.goal_progress = QProgressBar()
         self.goal_progress.setMaximum(100)
-        self.goal_progress.setValue(int(GoalTrackingService.get_progress_percentage()))
         self.goal_progress.setTextVisible(False)
         self.goal_progress.setFixedHeight(8)
         self.goal_progress.setStyleSheet("""
@@ -332,71 +338,64 @@ class NetworkingDashboard(QWidget):
 
         return frame
 
-    def load_data(self):
+    def load_data(self, snapshot: NetworkingSnapshot = None):
         """Load data from database and update UI"""
-        session = get_session()
-        try:
-            # Force SQLAlchemy to fetch fresh data (not cached objects)
-            session.expire_all()
-
-            from db.models import Settings
-
-            # Total contacts
-            total = session.query(NetworkingContact).count()
-            self.total_count_label.setText(str(total))
-
-            # Last 7 days data
-            last_7_days = get_last_n_days(7)
-            daily_counts = {}
-
-            for day in last_7_days:
-                count = session.query(NetworkingContact).filter(
-                    func.date(NetworkingContact.contact_date) == day
-                ).count()
-                daily_counts[format_date_short(day)] = count
-
-            self.update_chart(daily_counts)
-
-            # Follow-up count using smart logic
-            followup_count = SmartFollowUpService.get_followup_count()
-
-            self.followup_count_label.setText(str(followup_count))
-            self.followup_btn.setText(f"Needs Follow-Up ({followup_count})")
-
-            # Update follow-up card styling based on count
-            if followup_count > 0:
-                self.followup_count_label.setStyleSheet("""
-                    font-size: 54px;
-                    font-weight: 700;
-                    color: #e67e22;
-                """)
-            else:
-                self.followup_count_label.setStyleSheet("""
-                    font-size: 54px;
-                    font-weight: 700;
-                    color: #95a5a6;
-                """)
-
-        finally:
-            session.close()
+        if snapshot is None:
+            snapshot = DashboardSnapshot.networking(days=7)
+
+        # Total contacts
+        self.total_count_label.setText(str(snapshot.total))
+
+        # Last 7 days data
+        daily_counts = {
+            format_date_short(day): count for day, count in snapshot.daily_counts.items()
+        }
+        self.update_chart(daily_counts)
+
+        # Follow-up count using smart logic
+        followup_count = snapshot.followup_count
+
+        self.followup_count_label.setText(str(followup_count))
+        self.followup_btn.setText(f"Needs Follow-Up ({followup_count})")
+
+        # Update follow-up card styling based on count
+        if followup_count > 0:
+            self.followup_count_label.setStyleSheet("""
+                font-size: 54px;
+                font-weight: 700;
+                color: #e67e22;
+            """)
+        else:
+            self.followup_count_label.setStyleSheet("""
+                font-size: 54px;
+                font-weight: 700;
+                color: #95a5a6;
+            """)
 
     def update_chart(self, data: dict):
         """Update the modern bar chart"""
         self.chart_view.set_data(data)
 
     def refresh(self):
-        """Refresh the dashboard data"""
-        self.load_data()
+        """Refresh the dashboard data (queried off the GUI thread)"""
+        self.snapshot_loader.load(load_networking_snapshot)
+
+    def on_snapshot_loaded(self, result):
+        """Show the snapshot and goal status loaded by refresh()"""
+        snapshot, goal_status = result
+        self.load_data(snapshot)
         if hasattr(self, 'goal_widget'):
-            self.refresh_goal_widget()
+            self.show_goal_status(goal_status)
 
-    def refresh_goal_widget(self):
+    def refresh_goal_widget(self, snapshot: NetworkingSnapshot = None):
         """Refresh goal widget with latest data"""
         from utils.goal_service import GoalTrackingService
-        
-        remaining = GoalTrackingService.get_remaining_today()
-        today_count = GoalTrackingService.get_today_count()
-        goal = GoalTrackingService.get_daily_goal()
+
+        self.show_goal_status(GoalTrackingService.get_goal_status(snapshot))
+
+    def show_goal_status(self, goal_status):
+        """Fill the goal widget from a GoalStatus"""
+        goal, today_count, remaining, percentage = goal_status
         
         # Update label
         if remaining > 0:
@@ -405,7 +404,7 @@ class NetworkingDashboard(QWidget):
             self.goal_label.setText(f"🎉 Goal achieved! ({today_count}/{goal} contacts today)")
         
         # Update progress bar
-        self.goal_progress.setValue(int(GoalTrackingService.get_progress_percentage()))
+        self.goal_progress.setValue(int(percentage))
 
     
     def update_followup_count(self, count: int):
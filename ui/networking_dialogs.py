@@ -6,13 +6,14 @@ from typing import Optional
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QFormLayout,
     QLineEdit, QTextEdit, QComboBox, QDateEdit, QPushButton,
-    QLabel, QMessageBox, QCompleter, QWidget, QTextBrowser,
+    QLabel, QMessageBox, QWidget, QTextBrowser,
     QGroupBox, QScrollArea
 )
 from PySide6.QtCore import Qt, QDate, Signal
 from PySide6.QtGui import QClipboard
 from db.models import NetworkingContact, NetworkingStatus
 from db.session import get_session
+from ui.lookup_completer import attach_company_completer
 from utils.validators import validate_required_field
 from utils.enterprise_validators import InputValidator, FormValidator
 from utils.message_generator import generate_networking_message
@@ -202,17 +203,7 @@ class AddEditContactDialog(QDialog):
 
     def setup_company_completer(self):
         """Setup autocomplete for company field"""
-        session = get_session()
-        try:
-            # Get distinct companies from contacts
-            companies = session.query(NetworkingContact.company).distinct().all()
-            company_list = [c[0] for c in companies if c[0]]
-
-            completer = QCompleter(company_list)
-            completer.setCaseSensitivity(Qt.CaseInsensitive)
-            self.company_input.setCompleter(completer)
-        finally:
-            session.close()
+        attach_company_completer(self.company_input)
 
     def populate_fields(self):
         """Populate fields with existing contact data"""
@@ -354,6 +345,7 @@ class AddEditContactDialog(QDialog):
             activity_logger.log_action(
                 action="ADDED_CONTACT" if not self.is_edit_mode else "UPDATED_CONTACT",
                 entity_type="NetworkingContact",
+                entity_id=self.contact.id if self.is_edit_mode else new_contact.id,
                 details={"name": self.name_input.text().strip()}
             )
 
@@ -389,15 +381,16 @@ class ContactDetailDialog(QDialog):
 
     def load_data(self):
         """Load contact and settings from database"""
+        from utils.settings_store import settings_store
+
         session = get_session()
         try:
-            from db.models import Settings
             self.contact = session.query(NetworkingContact).filter_by(
                 id=self.contact_id
             ).first()
-            self.settings = session.query(Settings).filter_by(id=1).first()
         finally:
             session.close()
+        self.settings = settings_store.get()
 
     def setup_ui(self):
         """Setup the UI components with scroll area"""
@@ -658,19 +651,18 @@ class ContactDetailDialog(QDialog):
 
     def create_follow_up_section(self) -> Optional[QWidget]:
         """Create follow-up alert section if needed"""
-        if not self.settings:
-            return None
+        from utils.smart_followup import SmartFollowUpService
 
         days = days_since(self.contact.contact_date)
 
-        if (self.contact.status == NetworkingStatus.COLD_MESSAGE and
-            days >= self.settings.follow_up_days):
+        # Same rule as the follow-up badge and list filter
+        if SmartFollowUpService.needs_followup(self.contact):
 
             widget = QWidget()
             widget.setStyleSheet("background-color: #fff3cd; border: 1px solid #ffc107; border-radius: 4px; padding: 12px;")
             layout = QHBoxLayout(widget)
 
-            alert_label = QLabel(f"⏰ Follow-up needed – it has been {days} days with no response.")
+            alert_label = QLabel(f"⏰ Follow-up needed – it has been {days} days since you reached out.")
             alert_label.setStyleSheet("color: #856404; font-weight: 500;")
             layout.addWidget(alert_label)
 
@@ -1,21 +1,58 @@
 """
 Networking contact list view
 """
-from datetime import date, timedelta
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLineEdit,
-    QPushButton, QComboBox, QTableWidget, QTableWidgetItem,
+    QPushButton, QComboBox, QTableView,
     QHeaderView, QLabel, QMessageBox, QAbstractItemView,
-    QScrollArea, QGridLayout, QFrame, QButtonGroup
+    QScrollArea, QGridLayout, QFrame, QButtonGroup, QMenu, QApplication
 )
 from PySide6.QtCore import Qt, Signal, QSize
-from PySide6.QtGui import QIcon, QFont, QCursor, QColor
+from PySide6.QtGui import QIcon, QFont, QCursor
+from sqlalchemy import bindparam
 from db.models import NetworkingContact, NetworkingStatus
 from db.session import get_session
-from utils.date_helpers import format_date, days_since
-from sqlalchemy import or_
+from db.queries import (
+    ContactFilter, contact_filter_clauses, count_contacts, fetch_contact_rows, fetch_contacts
+)
+from utils.date_helpers import days_since
 from ui.empty_state import EmptyState
 from ui.toast import show_success, show_error
+from ui.contact_table_model import ContactTableModel, ContactItemDelegate
+from ui.professional_components import create_loading_overlay
+from utils.async_loader import AsyncLoader
+
+# Cards built per page of the card view; "Show more" appends the next page
+CARDS_PAGE_SIZE = 60
+
+
+def query_contacts(contact_filter: ContactFilter, view_mode: str) -> tuple:
+    """
+    Query run by the contact loader on a pool thread
+
+    Returns:
+        (contact_filter, view_mode, total, contacts): the first page of
+        ContactRow tuples for the table, or of NetworkingContact objects for the cards
+    """
+    total = count_contacts(contact_filter)
+    if not total:
+        contacts = []
+    elif view_mode == "table":
+        contacts = fetch_contact_rows(contact_filter, 0, ContactTableModel.FETCH_BATCH_SIZE)
+    else:
+        contacts = fetch_contacts(contact_filter, 0, CARDS_PAGE_SIZE)
+    return contact_filter, view_mode, total, contacts
+
+
+def render_messages(where, order_by, description: str) -> tuple:
+    """
+    Render outreach messages on a pool thread for "Copy to Clipboard"
+
+    Returns:
+        (description, text): text is empty when no contact is in scope
+    """
+    from utils.message_generator import messages_text
+    return description, messages_text(where, order_by)
 
 
 class NetworkingListView(QWidget):
@@ -27,6 +64,18 @@ class NetworkingListView(QWidget):
         super().__init__(parent)
         self.filter_followup = False
         self.view_mode = "table"  # "table" or "cards"
+        # Card view paging: filter, matching total, cards built so far, "showing N of M" row
+        self.card_filter = None
+        self.card_total = 0
+        self.cards_shown = 0
+        self.cards_footer = None
+        self.contact_loader = AsyncLoader(self, name='view.contacts')
+        self.contact_loader.loaded.connect(self.on_contacts_loaded)
+        self.contact_loader.failed.connect(self.on_load_failed)
+        self.message_loader = AsyncLoader(self, name='view.copy_messages')
+        self.message_loader.loaded.connect(self.on_messages_rendered)
+        self.message_loader.failed.connect(self.on_messages_failed)
+        self.message_loader.busy_changed.connect(self.on_messages_busy)
         self.setup_ui()
         self.load_contacts()
 
@@ -45,7 +94,7 @@ class NetworkingListView(QWidget):
         top_bar.addWidget(back_btn)
 
         self.search_input = QLineEdit()
-        self.search_input.setPlaceholderText("🔍 Search contacts by name, company, or title")
+        self.search_input.setPlaceholderText("🔍 Search contacts by name, company, title or notes")
         self.search_input.setStyleSheet("""
             QLineEdit {
                 background-color: #1E2330;
@@ -86,6 +135,15 @@ class NetworkingListView(QWidget):
         self.card_view_btn.clicked.connect(lambda: self.set_view_mode("cards"))
         top_bar.addWidget(self.card_view_btn)
 
+        messages_btn = QPushButton("✉️ Messages")
+        messages_btn.setProperty("class", "compact")
+        messages_btn.setToolTip("Outreach messages for the selected contacts (or all contacts shown)")
+        messages_menu = QMenu(messages_btn)
+        messages_menu.addAction("Copy to Clipboard", self.copy_messages)
+        messages_menu.addAction("Save to File...", self.save_messages)
+        messages_btn.setMenu(messages_menu)
+        top_bar.addWidget(messages_btn)
+
         add_btn = QPushButton("+ Add Activity")
         add_btn.clicked.connect(self.add_contact)
         top_bar.addWidget(add_btn)
@@ -118,28 +176,23 @@ class NetworkingListView(QWidget):
 
         layout.addLayout(filter_bar)
 
-        # Table or empty state
-        self.table = QTableWidget()
+        # Table or empty state (model/view: rows are painted, not built from widgets)
+        self.table = QTableView()
         self.table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: #0A0A0A;
                 color: #FFFFFF;
                 gridline-color: rgba(255, 255, 255, 0.05);
                 border: none;
             }
-            QTableWidget::item {
-            }
-            QTableWidget::item:hover {
+            QTableView::item:hover {
                 background-color: rgba(255, 139, 61, 0.15);
             }
-            QTableWidget::item:selected {
-                background-color: rgba(255, 139, 61, 0.25);
-            }
-            QTableWidget::item {
+            QTableView::item {
                 color: #FFFFFF;
                 padding: 8px;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #272D3D;
                 color: #FFFFFF;
             }
@@ -151,10 +204,17 @@ class NetworkingListView(QWidget):
                 font-weight: 600;
             }
         """)
-        self.table.setColumnCount(8)
-        self.table.setHorizontalHeaderLabels([
-            "Name", "Job Title", "Company", "Phone", "LinkedIn", "Contact Date", "Status", "Actions"
-        ])
+        self.table_model = ContactTableModel(self)
+        self.table_model.status_change_requested.connect(self.update_contact_status)
+        self.table.setModel(self.table_model)
+
+        self.table_delegate = ContactItemDelegate(self.table)
+        self.table_delegate.phone_clicked.connect(self.copy_phone_to_clipboard)
+        self.table_delegate.linkedin_clicked.connect(self.open_linkedin_url)
+        self.table_delegate.edit_clicked.connect(self.edit_contact)
+        self.table_delegate.delete_clicked.connect(self.delete_contact)
+        self.table.setItemDelegate(self.table_delegate)
+
         self.table.horizontalHeader().setStretchLastSection(False)
         
         # Use Interactive mode for flexible, spacious columns
@@ -177,7 +237,7 @@ class NetworkingListView(QWidget):
         self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.table.verticalHeader().setVisible(False)
         self.table.setAlternatingRowColors(True)
-        self.table.cellDoubleClicked.connect(self.on_row_double_clicked)
+        self.table.doubleClicked.connect(self.on_row_double_clicked)
         
         # Set very generous row height for full visibility
         self.table.verticalHeader().setDefaultSectionSize(80)  # 80px row height
@@ -223,6 +283,10 @@ class NetworkingListView(QWidget):
         layout.addWidget(self.cards_scroll)
         layout.addWidget(self.empty_state)
 
+        # Spinner over whichever view is showing while a query runs
+        for view in (self.table, self.cards_scroll):
+            create_loading_overlay(view, self.contact_loader, "Loading contacts...")
+
     def set_view_mode(self, mode):
         """Switch between table and card view modes"""
         self.view_mode = mode
@@ -235,67 +299,26 @@ class NetworkingListView(QWidget):
 
     def load_contacts(self):
         """Load contacts from database"""
-        session = get_session()
-        try:
-            query = session.query(NetworkingContact)
+        self.filter_contacts()
 
-            # Apply follow-up filter if set
-            if self.filter_followup:
-                from db.models import Settings
-                settings = session.query(Settings).filter_by(id=1).first()
-                follow_up_days = settings.follow_up_days if settings else 3
-                cutoff_date = date.today() - timedelta(days=follow_up_days)
+    def current_filter(self) -> ContactFilter:
+        """Build the query filter from the current search/filter/sort controls"""
+        return ContactFilter(
+            search_text=self.search_input.text(),
+            status=self.status_filter.currentData(),
+            sort_key=self.sort_combo.currentData(),
+            needs_followup=self.filter_followup
+        )
 
-                query = query.filter(
-                    NetworkingContact.status == NetworkingStatus.COLD_MESSAGE,
-                    NetworkingContact.contact_date <= cutoff_date
-                )
+    def filter_contacts(self):
+        """Filter and sort contacts based on current filters (evaluated in SQL, off the GUI thread)"""
+        self.contact_loader.load(query_contacts, self.current_filter(), self.view_mode)
 
-            self.all_contacts = query.all()
-            self.filter_contacts()
+    def on_contacts_loaded(self, result):
+        """Show the result of the newest filter_contacts() request"""
+        contact_filter, view_mode, total, contacts = result
 
-        finally:
-            session.close()
-
-    def filter_contacts(self):
-        """Filter and sort contacts based on current filters"""
-        filtered = self.all_contacts.copy()
-
-        # Apply search filter
-        search_text = self.search_input.text().lower()
-        if search_text:
-            filtered = [
-                c for c in filtered
-                if (search_text in c.name.lower() or
-                    search_text in c.company.lower() or
-                    search_text in c.job_title.lower())
-            ]
-
-        # Apply status filter
-        status_filter = self.status_filter.currentData()
-        if status_filter:
-            filtered = [c for c in filtered if c.status == status_filter]
-
-        # Apply sorting
-        sort_by = self.sort_combo.currentData()
-        if sort_by == "date_desc":
-            filtered.sort(key=lambda c: c.contact_date, reverse=True)
-        elif sort_by == "date_asc":
-            filtered.sort(key=lambda c: c.contact_date)
-        elif sort_by == "name_asc":
-            filtered.sort(key=lambda c: c.name.lower())
-        elif sort_by == "name_desc":
-            filtered.sort(key=lambda c: c.name.lower(), reverse=True)
-        elif sort_by == "company_asc":
-            filtered.sort(key=lambda c: c.company.lower())
-        elif sort_by == "company_desc":
-            filtered.sort(key=lambda c: c.company.lower(), reverse=True)
-
-        self.display_contacts(filtered)
-
-    def display_contacts(self, contacts):
-        """Display contacts in either table or card view"""
-        if not contacts:
+        if not total:
             self.table.hide()
             self.cards_scroll.hide()
             self.empty_state.show()
@@ -303,62 +326,28 @@ class NetworkingListView(QWidget):
 
         self.empty_state.hide()
 
-        if self.view_mode == "table":
-            self.display_table_view(contacts)
+        if view_mode == "table":
+            self.display_table_view(contact_filter, total, contacts)
         else:
-            self.display_card_view(contacts)
+            self.display_card_view(contact_filter, total, contacts)
+
+    def on_load_failed(self, message: str):
+        """Report a failed background load"""
+        show_error(self, f"Error loading contacts: {message}")
 
-    def display_table_view(self, contacts):
-        """Display contacts in table format"""
+    def display_table_view(self, contact_filter: ContactFilter, total: int, first_page=None):
+        """Display contacts in table format, fetching pages as the user scrolls"""
         self.table.show()
         self.cards_scroll.hide()
 
-        self.table.setRowCount(len(contacts))
-
-        for row, contact in enumerate(contacts):
-            # Name
-            name_item = QTableWidgetItem(contact.name)
-            name_item.setData(Qt.UserRole, contact.id)
-            name_item.setForeground(QColor("#FFFFFF"))  # White text
-            font = name_item.font()
-            font.setBold(True)
-            name_item.setFont(font)
-            self.table.setItem(row, 0, name_item)
-
-            # Job Title
-            title_item = QTableWidgetItem(contact.job_title)
-            title_item.setForeground(QColor("#FFFFFF"))  # White text
-            self.table.setItem(row, 1, title_item)
-
-            # Company
-            company_item = QTableWidgetItem(contact.company)
-            company_item.setForeground(QColor("#FFFFFF"))  # White text
-            self.table.setItem(row, 2, company_item)
-
-            # Phone - clickable button to copy
-            phone_widget = self.create_phone_widget(contact.phone)
-            self.table.setCellWidget(row, 3, phone_widget)
-
-            # LinkedIn - clickable button to open
-            linkedin_widget = self.create_linkedin_widget(contact.linkedin_url)
-            self.table.setCellWidget(row, 4, linkedin_widget)
-
-            # Contact Date
-            date_str = format_date(contact.contact_date)
-            date_item = QTableWidgetItem(date_str)
-            date_item.setForeground(QColor("#FFFFFF"))  # White text
-            self.table.setItem(row, 5, date_item)
-
-            # Status - inline dropdown for editing
-            status_widget = self.create_status_dropdown(contact.id, contact.status)
-            self.table.setCellWidget(row, 6, status_widget)
-
-            # Actions
-            actions_widget = self.create_actions_widget(contact.id)
-            self.table.setCellWidget(row, 7, actions_widget)
-
-    def display_card_view(self, contacts):
-        """Display contacts as cards in grid layout"""
+        self.table_model.set_page_source(
+            total,
+            lambda offset, limit: fetch_contact_rows(contact_filter, offset, limit),
+            first_page
+        )
+
+    def display_card_view(self, contact_filter: ContactFilter, total: int, first_page):
+        """Display the first page of contacts as cards in grid layout"""
         self.table.hide()
         self.cards_scroll.show()
 
@@ -368,15 +357,53 @@ class NetworkingListView(QWidget):
             if item.widget():
                 item.widget().deleteLater()
 
-        # Display contacts as cards (3 per row)
-        for idx, contact in enumerate(contacts):
-            card = self.create_contact_card(contact)
-            row = idx // 3
-            col = idx % 3
-            self.cards_layout.addWidget(card, row, col)
+        self.card_filter = contact_filter
+        self.card_total = total
+        self.cards_shown = 0
+        self.cards_footer = None
+        self.append_cards(first_page)
+
+    def append_cards(self, contacts):
+        """Add cards after the ones shown (3 per row), followed by the "showing N of M" row"""
+        if self.cards_footer is not None:
+            self.cards_layout.removeWidget(self.cards_footer)
+            self.cards_footer.deleteLater()
 
-        # Add stretch to push cards to top
-        self.cards_layout.setRowStretch(self.cards_layout.rowCount(), 1)
+        for contact in contacts:
+            card = self.create_contact_card(contact)
+            self.cards_layout.addWidget(card, self.cards_shown // 3, self.cards_shown % 3)
+            self.cards_shown += 1
+
+        footer_row = (self.cards_shown + 2) // 3
+        self.cards_footer = self.create_cards_footer()
+        self.cards_layout.addWidget(self.cards_footer, footer_row, 0, 1, 3)
+
+        # Add stretch below the footer to push cards to top
+        for row in range(self.cards_layout.rowCount()):
+            self.cards_layout.setRowStretch(row, 0)
+        self.cards_layout.setRowStretch(footer_row + 1, 1)
+
+    def create_cards_footer(self) -> QWidget:
+        """Row under the cards: how many are shown, and a button for the next page"""
+        footer = QWidget()
+        footer_layout = QHBoxLayout(footer)
+        footer_layout.setContentsMargins(0, 0, 0, 0)
+
+        shown_label = QLabel(f"Showing {self.cards_shown:,} of {self.card_total:,} contacts")
+        shown_label.setProperty("class", "secondary-text")
+        footer_layout.addWidget(shown_label)
+        footer_layout.addStretch()
+
+        if self.cards_shown < self.card_total:
+            more_btn = QPushButton(f"Show {min(CARDS_PAGE_SIZE, self.card_total - self.cards_shown)} more")
+            more_btn.setProperty("class", "compact")
+            more_btn.clicked.connect(self.show_more_cards)
+            footer_layout.addWidget(more_btn)
+        return footer
+
+    def show_more_cards(self):
+        """Append the next page of cards"""
+        self.append_cards(fetch_contacts(self.card_filter, self.cards_shown, CARDS_PAGE_SIZE))
 
     def create_contact_card(self, contact: NetworkingContact) -> QFrame:
         """Create a professional contact card widget"""
@@ -591,141 +618,73 @@ class NetworkingListView(QWidget):
         layout.addWidget(badge)
         return widget
 
-    def create_actions_widget(self, contact_id: int) -> QWidget:
-        """Create simple actions widget"""
-        widget = QWidget()
-        layout = QHBoxLayout(widget)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(4)
-
-        # Simple icon buttons
-        edit_btn = QPushButton("✏")
-        edit_btn.setFixedSize(40, 30)
-        edit_btn.setStyleSheet("QPushButton { background: #FF8B3D; color: white; border: none; border-radius: 3px; font-size: 16px; } QPushButton:hover { background: #FF9E54; }")
-        edit_btn.clicked.connect(lambda: self.edit_contact(contact_id))
-        layout.addWidget(edit_btn)
-
-        delete_btn = QPushButton("×")
-        delete_btn.setFixedSize(40, 30)
-        delete_btn.setStyleSheet("QPushButton { background: #e74c3c; color: white; border: none; border-radius: 3px; font-size: 20px; font-weight: bold; } QPushButton:hover { background: #ff5757; }")
-        delete_btn.clicked.connect(lambda: self.delete_contact(contact_id))
-        layout.addWidget(delete_btn)
-
-        return widget
-
-        return widget
-
-    def create_phone_widget(self, phone: str):
-        """Create clickable phone widget that copies to clipboard"""
-        widget = QWidget()
-        layout = QHBoxLayout(widget)
-        layout.setContentsMargins(4, 4, 4, 4)
-        
-        if phone:
-            phone_btn = QPushButton(phone)
-            phone_btn.setStyleSheet("""
-                QPushButton {
-                     background-color: transparent;
-                    color: #4A9EFF;
-                    border: none;
-                    text-align: left;
-                    padding: 4px 8px;
-                    font-size: 12px;
-                }
-                QPushButton:hover {
-                    background-color: rgba(74, 158, 255, 0.1);
-                    border-radius: 4px;
-                }
-            """)
-            phone_btn.setCursor(Qt.PointingHandCursor)
-            phone_btn.clicked.connect(lambda: self.copy_phone_to_clipboard(phone))
-            layout.addWidget(phone_btn)
+    def message_scope(self) -> tuple:
+        """
+        Contacts the message actions apply to
+
+        Returns:
+            (where, order_by, description): the selected table rows, or every
+            contact matching the current filter when no row or every row is selected
+        """
+        where, order_by = contact_filter_clauses(self.current_filter())
+        if self.table.isVisible():
+            selected = self.table.selectionModel().selectedRows()
+            if selected and len(selected) < self.table_model.total_count():
+                ids = [self.table_model.contact_id_at(index.row()) for index in selected]
+                # Inlined as literals: one bound parameter per row could pass SQLite's variable limit
+                selected_ids = bindparam('selected_ids', ids, expanding=True, literal_execute=True)
+                return NetworkingContact.id.in_(selected_ids), order_by, f"{len(ids)} selected contacts"
+        return where, order_by, "all contacts shown"
+
+    def copy_messages(self):
+        """Render the outreach message of every contact in scope in the background"""
+        self.message_loader.load(render_messages, *self.message_scope())
+
+    def on_messages_busy(self, busy: bool):
+        """Wait cursor while messages are being rendered"""
+        if busy:
+            QApplication.setOverrideCursor(Qt.WaitCursor)
         else:
-            label = QLabel("-")
-            label.setStyleSheet("color: #6B7280; padding: 4px 8px;")
-            layout.addWidget(label)
-        
-        return widget
+            QApplication.restoreOverrideCursor()
 
-    def create_linkedin_widget(self, linkedin_url: str):
-        """Create clickable LinkedIn widget that opens URL in browser"""
-        widget = QWidget()
-        layout = QHBoxLayout(widget)
-        layout.setContentsMargins(4, 4, 4, 4)
-        
-        if linkedin_url:
-            linkedin_btn = QPushButton("🔗 Open")
-            linkedin_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: transparent;
-                    color: #0077B5;
-                    border: 1px solid #0077B5;
-                    border-radius: 4px;
-                    padding: 4px 12px;
-                    font-size: 11px;
-                    font-weight: 600;
-                }
-                QPushButton:hover {
-                    background-color: rgba(0, 119, 181, 0.1);
-                }
-            """)
-            linkedin_btn.setCursor(Qt.PointingHandCursor)
-            linkedin_btn.clicked.connect(lambda: self.open_linkedin_url(linkedin_url))
-            layout.addWidget(linkedin_btn)
-        else:
-            label = QLabel("-")
-            label.setStyleSheet("color: #6B7280; padding: 4px 8px;")
-            layout.addWidget(label)
-        
-        return widget
+    def on_messages_failed(self, message: str):
+        show_error(self, f"Failed to generate messages: {message}")
 
-    def create_status_dropdown(self, contact_id: int, current_status):
-        """Create status dropdown for inline editing"""
-        widget = QWidget()
-        layout = QHBoxLayout(widget)
-        layout.setContentsMargins(4, 4, 4, 4)
-        
-        status_combo = QComboBox()
-        status_combo.setStyleSheet("""
-            QComboBox {
-                background-color: #1E2330;
-                color: #FFFFFF;
-                border: 1px solid rgba(255, 255, 255, 0.2);
-                border-radius: 4px;
-                padding: 4px 12px;
-                font-size: 11px;
-                font-weight: 600;
-                min-width: 130px;
-            }
-            QComboBox:hover {
-                border: 1px solid #FF8B3D;
-            }
-            QComboBox::drop-down {
-                border: none;
-            }
-            QComboBox::down-arrow {
-                image: none;
-                border-left: 4px solid transparent;
-                border-right: 4px solid transparent;
-                border-top: 4px solid #FFFFFF;
-                margin-right: 6px;
-            }
-        """)
-        
-        # Add all status options
-        from db.models import NetworkingStatus
-        for status in NetworkingStatus:
-            status_combo.addItem(status.value, status)
-            if status == current_status:
-                status_combo.setCurrentText(status.value)
-        
-        # Connect to update handler
-        status_combo.currentIndexChanged.connect(
-            lambda index: self.update_contact_status(contact_id, status_combo.itemData(index))
+    def on_messages_rendered(self, result):
+        """Copy the rendered messages to the clipboard"""
+        description, text = result
+        if not text:
+            show_error(self, "No contacts to write to")
+            return
+        QApplication.clipboard().setText(text)
+        show_success(self, f"📋 Copied messages for {description}")
+
+    def save_messages(self):
+        """Stream the outreach messages of every contact in scope to a CSV/TSV/JSON Lines file"""
+        from functools import partial
+        from pathlib import Path
+        from PySide6.QtWidgets import QFileDialog
+        from ui.export_dialog import ExportProgressDialog, ExportTask
+        from utils.export_engine import file_filter, format_for_path
+        from utils.message_generator import export_messages
+
+        where, order_by, _ = self.message_scope()
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "Save Messages", str(Path.home() / "outreach_messages.csv"), file_filter()
         )
-        
-        layout.addWidget(status_combo)
-        return widget
+        if not file_path:
+            return
+
+        export_func = partial(export_messages, where=where, order_by=order_by)
+        progress = ExportProgressDialog(
+            ExportTask(export_func, file_path, None, format_for_path(file_path)), "Save Messages", self
+        )
+        progress.exec()
+
+        if progress.result is not None:
+            show_success(self, f"Saved {progress.result.rows:,} messages to {progress.result.path.name}")
+        elif not progress.cancelled:
+            show_error(self, f"Failed to save messages: {progress.error}")
 
     def copy_phone_to_clipboard(self, phone: str):
         """Copy phone number to clipboard and show notification"""
@@ -781,12 +740,12 @@ class NetworkingListView(QWidget):
         finally:
             session.close()
 
-    def on_row_double_clicked(self, row, column):
+    def on_row_double_clicked(self, index):
         """Handle row double click"""
-        if column == 7:  # Don't open detail if clicking actions
+        if index.column() == ContactTableModel.ACTIONS_COLUMN:  # Don't open detail if clicking actions
             return
 
-        contact_id = self.table.item(row, 0).data(Qt.UserRole)
+        contact_id = self.table_model.contact_id_at(index.row())
         self.show_contact_detail(contact_id)
 
     def add_contact(self):
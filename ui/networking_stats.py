@@ -2,7 +2,7 @@
 Networking statistics window
 """
 import csv
-from datetime import date, timedelta
+from datetime import date
 from pathlib import Path
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QGridLayout,
@@ -17,11 +17,50 @@ from PySide6.QtCharts import (
 from PySide6.QtGui import QPainter, QColor
 from db.models import NetworkingContact, NetworkingStatus
 from db.session import get_session
+from db.stats_counters import read_counters, top_counters
 from utils.date_helpers import get_last_n_weeks
-from sqlalchemy import func
+from utils.async_loader import AsyncLoader
+from utils.performance import cached
+from ui.professional_components import create_loading_overlay
 from collections import defaultdict
 
 
+@cached(ttl=300, tags=('contacts', 'settings'), key_func=lambda: date.today())
+def collect_networking_statistics() -> dict:
+    """
+    Query run by the statistics loader on a pool thread
+
+    Returns:
+        Dict with total, status_counts, followup_count, day_counts and top_companies
+    """
+    session = get_session()
+    try:
+        # Overall metrics, status and per-day counts from the stats counters
+        weeks = get_last_n_weeks(12)
+        counters = read_counters('contact', ('total', 'status', 'day'), day_from=weeks[0][0])
+
+        # Status counts
+        status_counts = {}
+        for status in NetworkingStatus:
+            status_counts[status.value] = counters['status'].get(status.name, 0)
+
+        # Follow-up needed (same predicate as the badge and the list filter)
+        from utils.smart_followup import SmartFollowUpService
+        followup_count = session.query(NetworkingContact).filter(
+            SmartFollowUpService.followup_condition(date.today())
+        ).count()
+
+        return {
+            'total': counters['total'].get('', 0),
+            'status_counts': status_counts,
+            'followup_count': followup_count,
+            'day_counts': counters['day'],
+            'top_companies': top_counters('contact', 'company', limit=10),
+        }
+    finally:
+        session.close()
+
+
 class NetworkingStatsDialog(QDialog):
     """Statistics window for networking"""
 
@@ -30,6 +69,8 @@ class NetworkingStatsDialog(QDialog):
         self.setWindowTitle("Networking Statistics")
         self.resize(950, 750)
 
+        self.stats_loader = AsyncLoader(self, name='stats.networking')
+        self.stats_loader.loaded.connect(self.show_statistics)
         self.setup_ui()
         self.load_statistics()
 
@@ -53,6 +94,7 @@ class NetworkingStatsDialog(QDialog):
 
         scroll.setWidget(content_widget)
         main_layout.addWidget(scroll)
+        create_loading_overlay(scroll, self.stats_loader, "Loading statistics...")
 
         # Bottom buttons
         button_layout = QHBoxLayout()
@@ -70,56 +112,27 @@ class NetworkingStatsDialog(QDialog):
         main_layout.addLayout(button_layout)
 
     def load_statistics(self):
-        """Load and display statistics"""
-        session = get_session()
-        try:
-            # Overall metrics
-            total_contacts = session.query(NetworkingContact).count()
-
-            # Status counts
-            status_counts = {}
-            for status in NetworkingStatus:
-                count = session.query(NetworkingContact).filter_by(status=status).count()
-                status_counts[status.value] = count
-
-            # Follow-up needed
-            from db.models import Settings
-            settings = session.query(Settings).filter_by(id=1).first()
-            follow_up_days = settings.follow_up_days if settings else 3
-            cutoff_date = date.today() - timedelta(days=follow_up_days)
-
-            followup_count = session.query(NetworkingContact).filter(
-                NetworkingContact.status == NetworkingStatus.COLD_MESSAGE,
-                NetworkingContact.contact_date <= cutoff_date
-            ).count()
-
-            # Create metrics section
-            self.create_metrics_section(
-                total_contacts, status_counts, followup_count
-            )
-
-            # Status distribution pie chart
-            self.create_status_chart_section(status_counts)
-
-            # Weekly chart (last 12 weeks)
-            all_contacts = session.query(NetworkingContact).all()
-            self.create_weekly_chart_section(all_contacts)
+        """Load statistics off the GUI thread; show_statistics() builds the sections"""
+        self.stats_loader.load(collect_networking_statistics)
+
+    def show_statistics(self, stats: dict):
+        """Build the report sections from collect_networking_statistics()"""
+        # Create metrics section
+        self.create_metrics_section(
+            stats['total'], stats['status_counts'], stats['followup_count']
+        )
 
-            # Conversion funnel
-            self.create_funnel_section(status_counts, total_contacts)
+        # Status distribution pie chart
+        self.create_status_chart_section(stats['status_counts'])
 
-            # Top companies
-            top_companies = session.query(
-                NetworkingContact.company,
-                func.count(NetworkingContact.id).label('count')
-            ).group_by(NetworkingContact.company).order_by(
-                func.count(NetworkingContact.id).desc()
-            ).limit(10).all()
+        # Weekly chart (last 12 weeks)
+        self.create_weekly_chart_section(stats['day_counts'])
 
-            self.create_top_companies_section(top_companies)
+        # Conversion funnel
+        self.create_funnel_section(stats['status_counts'], stats['total'])
 
-        finally:
-            session.close()
+        # Top companies
+        self.create_top_companies_section(stats['top_companies'])
 
     def create_metrics_section(self, total, status_counts, followup_count):
         """Create overall metrics section"""
@@ -208,8 +221,8 @@ class NetworkingStatsDialog(QDialog):
         group.setLayout(layout)
         self.content_layout.addWidget(group)
 
-    def create_weekly_chart_section(self, contacts):
-        """Create contacts per week bar chart"""
+    def create_weekly_chart_section(self, day_counts: dict):
+        """Create contacts per week bar chart from {ISO date: count}"""
         group = QGroupBox("Contacts Over Last 12 Weeks")
         layout = QVBoxLayout()
 
@@ -218,12 +231,12 @@ class NetworkingStatsDialog(QDialog):
 
         # Count contacts per week
         week_counts = defaultdict(int)
-        for contact in contacts:
-            contact_date = contact.contact_date
+        for day, count in day_counts.items():
+            contact_date = date.fromisoformat(day)
             for week_start, week_end in weeks:
                 if week_start <= contact_date <= week_end:
                     week_key = f"{week_start.month}/{week_start.day}"
-                    week_counts[week_key] += 1
+                    week_counts[week_key] += count
                     break
 
         # Create bar chart
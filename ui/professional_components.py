@@ -6,7 +6,7 @@ from PySide6.QtWidgets import (
     QWidget, QLabel, QVBoxLayout, QHBoxLayout,
     QProgressBar, QPushButton, QFrame
 )
-from PySide6.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, Property
+from PySide6.QtCore import Qt, QTimer, QEvent, QPropertyAnimation, QEasingCurve, Property
 from PySide6.QtGui import QPainter, QColor, QPen
 import math
 
@@ -56,10 +56,11 @@ class LoadingSpinner(QWidget):
 class LoadingOverlay(QWidget):
     """Full-screen loading overlay with spinner and message"""
 
-    def __init__(self, message: str = "Loading...", parent=None):
+    def __init__(self, message: str = "Loading...", parent=None, embedded: bool = False):
         super().__init__(parent)
-        self.setWindowFlags(Qt.FramelessWindowHint | Qt.Tool)
-        self.setAttribute(Qt.WA_TranslucentBackground)
+        if not embedded:
+            self.setWindowFlags(Qt.FramelessWindowHint | Qt.Tool)
+            self.setAttribute(Qt.WA_TranslucentBackground)
         self.setAttribute(Qt.WA_StyledBackground)
 
         # Semi-transparent dark background
@@ -97,8 +98,62 @@ class LoadingOverlay(QWidget):
         """Center on parent when shown"""
         if self.parent():
             self.setGeometry(self.parent().rect())
+            self.raise_()
+        self.spinner.start()
         super().showEvent(event)
 
+    def hideEvent(self, event):
+        """Stop animating while hidden"""
+        self.spinner.stop()
+        super().hideEvent(event)
+
+    def eventFilter(self, watched, event):
+        """Follow the parent's size while covering it"""
+        if watched is self.parent() and event.type() == QEvent.Resize:
+            self.setGeometry(self.parent().rect())
+        return super().eventFilter(watched, event)
+
+    def track(self, loader, delay_ms: int = 150):
+        """
+        Show while an AsyncLoader has work in flight
+
+        Args:
+            loader: utils.async_loader.AsyncLoader
+            delay_ms: Loads finishing sooner than this never show the overlay
+        """
+        show_timer = QTimer(self)
+        show_timer.setSingleShot(True)
+        show_timer.timeout.connect(self.show)
+
+        def on_busy_changed(busy: bool):
+            if busy:
+                show_timer.start(delay_ms)
+            else:
+                show_timer.stop()
+                self.hide()
+
+        loader.busy_changed.connect(on_busy_changed)
+        if self.parent():
+            self.parent().installEventFilter(self)
+
+
+def create_loading_overlay(widget: QWidget, loader, message: str = "Loading...") -> LoadingOverlay:
+    """
+    Cover widget with a LoadingOverlay while loader is busy
+
+    Args:
+        widget: Widget to cover
+        loader: utils.async_loader.AsyncLoader feeding the widget
+        message: Text under the spinner
+
+    Returns:
+        The (hidden) overlay
+    """
+    overlay = LoadingOverlay(message, widget, embedded=True)
+    overlay.hide()
+    overlay.track(loader)
+    return overlay
+
 
 class SuccessToast(QWidget):
     """Toast notification for success messages"""
@@ -1,19 +1,27 @@
 """
 Settings dialog
 """
-import csv
 import shutil
 from pathlib import Path
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QFormLayout,
     QPushButton, QLabel, QTabWidget, QWidget,
     QLineEdit, QTextEdit, QSpinBox, QMessageBox,
-    QFileDialog, QGroupBox
+    QFileDialog, QGroupBox, QComboBox
 )
-from PySide6.QtCore import Qt, Signal
-from db.models import Settings, NetworkingContact, InternshipApplication
-from db.session import get_session, get_database_path
-from utils.message_generator import get_template_placeholders
+from PySide6.QtCore import Qt, Signal, QSettings
+from db.models import NetworkingContact, InternshipApplication
+from db.enhanced_models import Interview, Task
+from db.session import (
+    get_session, get_database_path, get_active_engine_profile, checkpoint_database
+)
+from db.engine_profile import ENGINE_PROFILES, DEFAULT_PROFILE
+from utils.message_generator import get_template_placeholders, compile_template, validate_template
+from utils.settings_store import settings_store
+from utils.bulk_import import import_contacts_csv, import_internships_csv
+from utils.export_engine import CONTACT_COLUMNS, INTERNSHIP_COLUMNS, export_contacts, export_internships
+from ui.import_dialog import ImportProgressDialog
+from ui.export_dialog import run_export
 
 
 class SettingsDialog(QDialog):
@@ -28,16 +36,13 @@ class SettingsDialog(QDialog):
         self.setModal(True)
 
         self.settings = None
+        self.app_settings = QSettings("GTI_Tracker", "GTI_Tracker")
         self.load_settings()
         self.setup_ui()
 
     def load_settings(self):
-        """Load settings from database"""
-        session = get_session()
-        try:
-            self.settings = session.query(Settings).filter_by(id=1).first()
-        finally:
-            session.close()
+        """Load settings (a SettingsSnapshot, None if the row is missing)"""
+        self.settings = settings_store.get()
 
     def setup_ui(self):
         """Setup the UI components"""
@@ -224,11 +229,11 @@ class SettingsDialog(QDialog):
         export_group = QGroupBox("Export Data")
         export_layout = QVBoxLayout()
 
-        export_contacts_btn = QPushButton("Export Contacts to CSV")
+        export_contacts_btn = QPushButton("Export Contacts...")
         export_contacts_btn.clicked.connect(self.export_contacts)
         export_layout.addWidget(export_contacts_btn)
 
-        export_internships_btn = QPushButton("Export Internships to CSV")
+        export_internships_btn = QPushButton("Export Internships...")
         export_internships_btn.clicked.connect(self.export_internships)
         export_layout.addWidget(export_internships_btn)
 
@@ -254,6 +259,35 @@ class SettingsDialog(QDialog):
         import_group.setLayout(import_layout)
         layout.addWidget(import_group)
 
+        # Database engine profile (read at startup by main.py)
+        performance_group = QGroupBox("Database Performance")
+        performance_layout = QVBoxLayout()
+
+        self.db_profile_combo = QComboBox()
+        for profile in ENGINE_PROFILES.values():
+            self.db_profile_combo.addItem(profile.label, profile.name)
+        active_profile = get_active_engine_profile()
+        saved_profile = self.app_settings.value(
+            "db_profile", active_profile.name if active_profile else DEFAULT_PROFILE
+        )
+        index = self.db_profile_combo.findData(saved_profile)
+        self.db_profile_combo.setCurrentIndex(max(index, 0))
+        self.db_profile_combo.currentIndexChanged.connect(self.update_db_profile_description)
+        performance_layout.addWidget(self.db_profile_combo)
+
+        self.db_profile_description = QLabel()
+        self.db_profile_description.setStyleSheet("color: #888888; font-size: 11px;")
+        self.db_profile_description.setWordWrap(True)
+        performance_layout.addWidget(self.db_profile_description)
+        self.update_db_profile_description()
+
+        diagnostics_btn = QPushButton("Show Diagnostics...")
+        diagnostics_btn.clicked.connect(self.show_diagnostics)
+        performance_layout.addWidget(diagnostics_btn)
+
+        performance_group.setLayout(performance_layout)
+        layout.addWidget(performance_group)
+
         # Danger zone
         danger_group = QGroupBox("⚠️ Danger Zone")
         danger_group.setStyleSheet("QGroupBox { color: #e74c3c; font-weight: bold; }")
@@ -277,6 +311,21 @@ class SettingsDialog(QDialog):
 
         return widget
 
+    def update_db_profile_description(self):
+        """Show what the selected engine profile does"""
+        profile = ENGINE_PROFILES[self.db_profile_combo.currentData()]
+        text = profile.description
+        active_profile = get_active_engine_profile()
+        if active_profile and active_profile.name != profile.name:
+            text += "\nTakes effect the next time GTI Tracker starts."
+        self.db_profile_description.setText(text)
+
+    def show_diagnostics(self):
+        """Open the query and span diagnostics panel"""
+        from ui.diagnostics_dialog import DiagnosticsDialog
+
+        DiagnosticsDialog(self).exec()
+
     def reset_template(self):
         """Reset message template to default"""
         default_template = """Hi {name},
@@ -299,99 +348,35 @@ Best regards,
     def preview_template(self):
         """Preview the message template"""
         # Create a sample preview
-        template = self.template_input.toPlainText()
-
-        preview = template.replace('{name}', 'John Smith')
-        preview = preview.replace('{job_title}', 'Senior Software Engineer')
-        preview = preview.replace('{company}', 'Tech Corp')
-        preview = preview.replace('{user_name}', self.user_name_input.text() or 'Your Name')
-        preview = preview.replace('{user_school}', self.user_school_input.text() or 'Your University')
-        preview = preview.replace('{user_ambitions}', self.user_ambitions_input.toPlainText() or 'Your ambitions...')
-        preview = preview.replace('{relevant_info}', 'We both studied at MIT and share an interest in AI.')
+        compiled = compile_template(self.template_input.toPlainText())
+        preview = compiled.render({
+            'name': 'John Smith',
+            'job_title': 'Senior Software Engineer',
+            'company': 'Tech Corp',
+            'user_name': self.user_name_input.text() or 'Your Name',
+            'user_school': self.user_school_input.text() or 'Your University',
+            'user_ambitions': self.user_ambitions_input.toPlainText() or 'Your ambitions...',
+            'relevant_info': 'We both studied at MIT and share an interest in AI.',
+        })
 
         msg = QMessageBox(self)
         msg.setWindowTitle("Message Preview")
-        msg.setText("Preview with sample data:")
+        text = "Preview with sample data:"
+        unknown = validate_template(compiled.source)
+        if unknown:
+            text += f"\n\nUnknown placeholders are sent as typed: {', '.join(unknown)}"
+        msg.setText(text)
         msg.setDetailedText(preview)
         msg.exec()
 
     def export_contacts(self):
-        """Export contacts to CSV"""
-        file_path, _ = QFileDialog.getSaveFileName(
-            self,
-            "Export Contacts",
-            str(Path.home() / "networking_contacts.csv"),
-            "CSV Files (*.csv)"
-        )
-
-        if not file_path:
-            return
-
-        try:
-            session = get_session()
-            contacts = session.query(NetworkingContact).all()
-
-            with open(file_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    'Name', 'Job Title', 'Company', 'Contact Date',
-                    'Status', 'Relevant Info'
-                ])
-
-                for contact in contacts:
-                    writer.writerow([
-                        contact.name,
-                        contact.job_title,
-                        contact.company,
-                        contact.contact_date.isoformat(),
-                        contact.status.value,
-                        contact.relevant_info or ''
-                    ])
-
-            session.close()
-            QMessageBox.information(self, "Success", f"Contacts exported to {file_path}")
-
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to export: {str(e)}")
+        """Export contacts (CSV, TSV or JSON Lines)"""
+        run_export(self, CONTACT_COLUMNS, export_contacts, "networking_contacts", "Export Contacts")
 
     def export_internships(self):
-        """Export internships to CSV"""
-        file_path, _ = QFileDialog.getSaveFileName(
-            self,
-            "Export Internships",
-            str(Path.home() / "internship_applications.csv"),
-            "CSV Files (*.csv)"
-        )
-
-        if not file_path:
-            return
-
-        try:
-            session = get_session()
-            internships = session.query(InternshipApplication).all()
-
-            with open(file_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    'Role Name', 'Company', 'Application Date',
-                    'Status', 'Job Link', 'Notes'
-                ])
-
-                for internship in internships:
-                    writer.writerow([
-                        internship.role_name,
-                        internship.company,
-                        internship.application_date.isoformat(),
-                        internship.status.value,
-                        internship.job_link or '',
-                        internship.notes or ''
-                    ])
-
-            session.close()
-            QMessageBox.information(self, "Success", f"Internships exported to {file_path}")
-
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to export: {str(e)}")
+        """Export internships (CSV, TSV or JSON Lines)"""
+        run_export(self, INTERNSHIP_COLUMNS, export_internships, "internship_applications",
+                   "Export Internships")
 
     def export_database(self):
         """Export the entire database file"""
@@ -407,6 +392,7 @@ Best regards,
 
         try:
             db_path = get_database_path()
+            checkpoint_database()
             shutil.copy2(db_path, file_path)
             QMessageBox.information(self, "Success", f"Database exported to {file_path}")
 
@@ -431,58 +417,7 @@ Best regards,
         if not file_path:
             return
 
-        try:
-            from datetime import datetime
-            from db.models import NetworkingStatus
-
-            session = get_session()
-            imported = 0
-
-            with open(file_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-
-                for row in reader:
-                    try:
-                        # Parse status
-                        status_str = row.get('Status', 'Cold message')
-                        status = NetworkingStatus.COLD_MESSAGE
-                        for s in NetworkingStatus:
-                            if s.value == status_str:
-                                status = s
-                                break
-
-                        # Parse date
-                        contact_date = datetime.fromisoformat(row['Contact Date']).date()
-
-                        contact = NetworkingContact(
-                            name=row['Name'],
-                            job_title=row['Job Title'],
-                            company=row['Company'],
-                            contact_date=contact_date,
-                            status=status,
-                            relevant_info=row.get('Relevant Info', ''),
-                            created_at=datetime.now(),
-                            last_updated=datetime.now()
-                        )
-
-                        session.add(contact)
-                        imported += 1
-
-                    except Exception as e:
-                        print(f"Skipping row due to error: {e}")
-                        continue
-
-            session.commit()
-            session.close()
-
-            QMessageBox.information(
-                self,
-                "Success",
-                f"Imported {imported} contacts successfully!"
-            )
-
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to import: {str(e)}")
+        self.run_import(import_contacts_csv, file_path, "Import Contacts", "contacts")
 
     def import_internships(self):
         """Import internships from CSV"""
@@ -502,56 +437,19 @@ Best regards,
         if not file_path:
             return
 
-        try:
-            from datetime import datetime
+        self.run_import(import_internships_csv, file_path, "Import Internships", "internships")
 
-            session = get_session()
-            imported = 0
-
-            with open(file_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-
-                for row in reader:
-                    try:
-                        # Parse status
-                        status_str = row.get('Status', 'Applied')
-                        status = InternshipStatus.APPLIED
-                        for s in InternshipStatus:
-                            if s.value == status_str:
-                                status = s
-                                break
-
-                        # Parse date
-                        application_date = datetime.fromisoformat(row['Application Date']).date()
-
-                        internship = InternshipApplication(
-                            role_name=row['Role Name'],
-                            company=row['Company'],
-                            application_date=application_date,
-                            status=status,
-                            job_link=row.get('Job Link', ''),
-                            notes=row.get('Notes', ''),
-                            last_updated=datetime.now()
-                        )
-
-                        session.add(internship)
-                        imported += 1
-
-                    except Exception as e:
-                        print(f"Skipping row due to error: {e}")
-                        continue
-
-            session.commit()
-            session.close()
+    def run_import(self, import_func, file_path: str, title: str, noun: str):
+        """Run a bulk import with a progress dialog and report the outcome"""
+        dialog = ImportProgressDialog(import_func, file_path, title, self)
+        dialog.exec()
 
-            QMessageBox.information(
-                self,
-                "Success",
-                f"Imported {imported} internships successfully!"
-            )
-
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to import: {str(e)}")
+        if dialog.result is None:
+            QMessageBox.critical(self, "Error", dialog.summary(noun))
+        elif dialog.result.errors or dialog.result.duplicates:
+            QMessageBox.warning(self, "Import Finished", dialog.summary(noun))
+        else:
+            QMessageBox.information(self, "Success", dialog.summary(noun))
 
     def reset_all_data(self):
         """Reset all data (with confirmation)"""
@@ -583,8 +481,14 @@ Best regards,
         # Perform reset
         try:
             session = get_session()
-            session.query(NetworkingContact).delete()
+            # Children first: foreign keys are enforced by the engine profile
+            session.query(Interview).delete()
+            session.query(Task).update({
+                Task.related_contact_id: None,
+                Task.related_application_id: None
+            })
             session.query(InternshipApplication).delete()
+            session.query(NetworkingContact).delete()
             session.commit()
             session.close()
 
@@ -603,33 +507,40 @@ Best regards,
             QMessageBox.critical(self, "Error", "Settings not found in database")
             return
 
-        session = get_session()
-        try:
-            settings = session.query(Settings).filter_by(id=1).first()
-
-            if settings:
-                settings.user_name = self.user_name_input.text().strip()
-                settings.user_school = self.user_school_input.text().strip()
-                settings.user_ambitions = self.user_ambitions_input.toPlainText().strip()
-                settings.message_template = self.template_input.toPlainText().strip()
-                settings.follow_up_days = self.follow_up_days_input.value()
-                settings.daily_goal = self.daily_goal_input.value()
-
-                session.commit()
-                self.settings_saved.emit()
-
-                QMessageBox.information(
-                    self,
-                    "Success",
-                    "Settings saved successfully!"
-                )
-
-                self.accept()
+        unknown = validate_template(self.template_input.toPlainText().strip())
+        if unknown:
+            reply = QMessageBox.question(
+                self, "Unknown Placeholders",
+                f"The message template uses unknown placeholders: {', '.join(unknown)}\n\n"
+                f"They will appear in messages as typed. Available placeholders: "
+                f"{', '.join(get_template_placeholders())}\n\nSave anyway?",
+                QMessageBox.Yes | QMessageBox.No, QMessageBox.No
+            )
+            if reply != QMessageBox.Yes:
+                return
 
+        try:
+            # Commits and broadcasts settings_store.changed
+            settings_store.update(
+                user_name=self.user_name_input.text().strip(),
+                user_school=self.user_school_input.text().strip(),
+                user_ambitions=self.user_ambitions_input.toPlainText().strip(),
+                message_template=self.template_input.toPlainText().strip(),
+                follow_up_days=self.follow_up_days_input.value(),
+                daily_goal=self.daily_goal_input.value(),
+            )
         except Exception as e:
-            session.rollback()
             QMessageBox.critical(self, "Error", f"Failed to save settings: {str(e)}")
+            return
 
-        finally:
-            session.close()
+        self.app_settings.setValue("db_profile", self.db_profile_combo.currentData())
+        self.settings_saved.emit()
+
+        QMessageBox.information(
+            self,
+            "Success",
+            "Settings saved successfully!"
+        )
+
+        self.accept()
 
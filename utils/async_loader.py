@@ -0,0 +1,153 @@
+"""
+Background data loading
+Runs database reads on the Qt thread pool and delivers only the newest result to the GUI thread
+"""
+import logging
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Slot
+from utils.performance import perf_monitor
+
+logger = logging.getLogger('GTI_Tracker.AsyncLoader')
+
+
+class _TaskSignals(QObject):
+    """Signals of one task; a separate object so a finished task never outlives its receiver"""
+    finished = Signal(int, object)  # request_id, (result,)
+    failed = Signal(int, str)       # request_id, error message
+
+
+class _LoadTask(QRunnable):
+    """Calls func(*args, **kwargs) on a pool thread, timed as span span_name, and reports the result"""
+
+    def __init__(self, request_id: int, span_name: str, func, args, kwargs):
+        super().__init__()
+        self.request_id = request_id
+        self.span_name = span_name
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = _TaskSignals()
+        # The loader keeps the task alive until it reports back
+        self.setAutoDelete(False)
+
+    def run(self):
+        try:
+            with perf_monitor.span(self.span_name):
+                result = self.func(*self.args, **self.kwargs)
+        except Exception as e:
+            logger.exception(f"Background load failed: {getattr(self.func, '__name__', self.func)}")
+            self.signals.failed.emit(self.request_id, str(e))
+        else:
+            # Wrapped: a bare None crossing threads as 'object' breaks its refcount
+            self.signals.finished.emit(self.request_id, (result,))
+
+
+class AsyncLoader(QObject):
+    """
+    Loads data for one view off the GUI thread
+
+    Every load() supersedes the previous one: a request still waiting in the
+    pool is taken back, and the result of one already running is dropped, so
+    typing in a search box never shows stale rows. Loader functions must only
+    return plain data (row tuples, dataclasses, detached objects), never open
+    sessions or widgets.
+
+    Each load is timed in utils.performance.perf_monitor as a span named
+    after the loader (e.g. 'dashboard.networking') or, without a name, after
+    the loader function.
+    """
+
+    loaded = Signal(object)      # result of the newest request
+    failed = Signal(str)         # error message of the newest request
+    busy_changed = Signal(bool)  # True while the newest request is in flight
+
+    def __init__(self, parent=None, pool: QThreadPool = None, name: str = None):
+        super().__init__(parent)
+        self.pool = pool or QThreadPool.globalInstance()
+        self.name = name
+        self._request_id = 0
+        self._tasks = {}  # request_id -> task started and not yet reported back
+        self._busy = False
+
+    def load(self, func, *args, **kwargs) -> int:
+        """
+        Run func(*args, **kwargs) on the thread pool, cancelling any earlier request
+
+        Returns:
+            Request id of the new request
+        """
+        self._drop_current()
+
+        span_name = self.name or f"load:{getattr(func, '__qualname__', func)}"
+        task = _LoadTask(self._request_id, span_name, func, args, kwargs)
+        task.signals.finished.connect(self._on_finished)
+        task.signals.failed.connect(self._on_failed)
+        self._tasks[self._request_id] = task
+        self._set_busy(True)
+        self.pool.start(task)
+        return self._request_id
+
+    def cancel(self) -> None:
+        """Drop the current request; its result will not be delivered"""
+        self._drop_current()
+        self._set_busy(False)
+
+    def _drop_current(self) -> None:
+        task = self._tasks.get(self._request_id)
+        # Still queued: take it back so it never touches the database
+        if task is not None and self.pool.tryTake(task):
+            del self._tasks[self._request_id]
+        self._request_id += 1
+
+    def is_busy(self) -> bool:
+        return self._busy
+
+    def _set_busy(self, busy: bool) -> None:
+        if busy != self._busy:
+            self._busy = busy
+            self.busy_changed.emit(busy)
+
+    @Slot(int, object)
+    def _on_finished(self, request_id: int, wrapped):
+        self._tasks.pop(request_id, None)
+        if request_id != self._request_id:
+            return
+        self._set_busy(False)
+        self.loaded.emit(wrapped[0])
+
+    @Slot(int, str)
+    def _on_failed(self, request_id: int, message: str):
+        self._tasks.pop(request_id, None)
+        if request_id != self._request_id:
+            return
+        self._set_busy(False)
+        self.failed.emit(message)
+
+
+def wait_for_loaders(*loaders, timeout_ms: int = 5000) -> bool:
+    """
+    Run a local event loop until the given loaders are idle (scripts and smoke tests)
+
+    Returns:
+        True if every loader finished within the timeout
+    """
+    from PySide6.QtCore import QEventLoop, QTimer
+
+    loop = QEventLoop()
+    timer = QTimer()
+    timer.setSingleShot(True)
+    timer.timeout.connect(loop.quit)
+
+    def quit_when_idle(_busy=None):
+        if not any(loader.is_busy() for loader in loaders):
+            loop.quit()
+
+    for loader in loaders:
+        loader.busy_changed.connect(quit_when_idle)
+    try:
+        if any(loader.is_busy() for loader in loaders):
+            timer.start(timeout_ms)
+            loop.exec()
+    finally:
+        for loader in loaders:
+            loader.busy_changed.disconnect(quit_when_idle)
+    return not any(loader.is_busy() for loader in loaders)
@@ -0,0 +1,166 @@
+"""
+Backup catalog
+SQLite index of the backups on disk, by type and time, kept in step with rotation
+"""
+import json
+import logging
+import sqlite3
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Optional
+
+logger = logging.getLogger('GTI_Tracker.BackupCatalog')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS backups (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    type TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    size_bytes INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS ix_backups_type_timestamp ON backups (type, timestamp);
+CREATE INDEX IF NOT EXISTS ix_backups_timestamp ON backups (timestamp);
+"""
+
+
+class BackupCatalog:
+    """
+    One row per backup file or store manifest
+
+    Timestamps are ISO strings, so the (type, timestamp) index answers "last
+    backup of this type" with a single index seek. Every change runs in one
+    transaction; rotation deletes its rows in the transaction that decides
+    which backups to drop.
+    """
+
+    def __init__(self, path: Path, legacy_metadata_file: Optional[Path] = None):
+        """
+        Args:
+            path: Catalog database file
+            legacy_metadata_file: backup_metadata.json to import once, if it exists
+        """
+        self.path = Path(path)
+        conn = sqlite3.connect(str(self.path), timeout=30)
+        try:
+            conn.executescript(_SCHEMA)
+        finally:
+            conn.close()
+        if legacy_metadata_file is not None and Path(legacy_metadata_file).exists():
+            self.import_legacy_metadata(Path(legacy_metadata_file))
+
+    @contextmanager
+    def transaction(self):
+        """Connection inside BEGIN IMMEDIATE ... COMMIT (rolled back on error)"""
+        conn = sqlite3.connect(str(self.path), timeout=30, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+    def _query(self, sql: str, params=()) -> list:
+        conn = sqlite3.connect(str(self.path), timeout=30)
+        conn.row_factory = sqlite3.Row
+        try:
+            return conn.execute(sql, params).fetchall()
+        finally:
+            conn.close()
+
+    def add(self, path: Path, backup_type: str, size_bytes: int,
+            timestamp: Optional[datetime] = None) -> None:
+        """Record a backup (replaces an existing row for the same path)"""
+        timestamp = (timestamp or datetime.now()).isoformat()
+        with self.transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO backups (path, type, timestamp, size_bytes) VALUES (?, ?, ?, ?)",
+                (str(path), backup_type, timestamp, size_bytes)
+            )
+
+    def remove(self, paths: Iterable[Path], conn=None) -> int:
+        """Forget backups by path; uses conn's transaction when given"""
+        rows = [(str(path),) for path in paths]
+        if conn is not None:
+            return conn.executemany("DELETE FROM backups WHERE path = ?", rows).rowcount
+        with self.transaction() as conn:
+            return conn.executemany("DELETE FROM backups WHERE path = ?", rows).rowcount
+
+    def last_backup_time(self, backup_type: Optional[str] = None) -> Optional[datetime]:
+        """Time of the newest backup (of backup_type if given), None if there is none"""
+        if backup_type is None:
+            rows = self._query("SELECT MAX(timestamp) FROM backups")
+        else:
+            rows = self._query("SELECT MAX(timestamp) FROM backups WHERE type = ?", (backup_type,))
+        value = rows[0][0]
+        return datetime.fromisoformat(value) if value else None
+
+    def list_backups(self, backup_type: Optional[str] = None, limit: Optional[int] = None) -> list:
+        """Backups as dicts (path, type, timestamp, size_bytes), newest first"""
+        sql = "SELECT path, type, timestamp, size_bytes FROM backups"
+        params = []
+        if backup_type:
+            sql += " WHERE type = ?"
+            params.append(backup_type)
+        sql += " ORDER BY timestamp DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        return [dict(row) for row in self._query(sql, params)]
+
+    def summary(self) -> dict:
+        """Count and total size per type, plus the newest timestamp overall"""
+        rows = self._query(
+            "SELECT type, COUNT(*) AS count, SUM(size_bytes) AS size_bytes, MAX(timestamp) AS last "
+            "FROM backups GROUP BY type"
+        )
+        return {
+            'counts': {row['type']: row['count'] for row in rows},
+            'size_bytes': sum(row['size_bytes'] or 0 for row in rows),
+            'last_backup': max((row['last'] for row in rows), default=None),
+        }
+
+    def reconcile(self) -> int:
+        """
+        Drop rows whose file no longer exists (deleted by hand or by an older version)
+
+        Returns:
+            Number of rows removed
+        """
+        with self.transaction() as conn:
+            missing = [row['path'] for row in conn.execute("SELECT path FROM backups")
+                       if not Path(row['path']).exists()]
+            self.remove(missing, conn)
+        if missing:
+            logger.info(f"Removed {len(missing)} catalog entries for missing backups")
+        return len(missing)
+
+    def import_legacy_metadata(self, metadata_file: Path) -> int:
+        """
+        Import backup_metadata.json (earlier versions) and rename it to *.imported
+
+        Entries whose file is gone are skipped, so the catalog starts bounded.
+        """
+        try:
+            with open(metadata_file, 'r') as f:
+                backups = json.load(f).get('backups', [])
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read legacy backup metadata: {e}")
+            return 0
+
+        rows = [(b['path'], b['type'], b['timestamp'], b.get('size_bytes', 0))
+                for b in backups if Path(b['path']).exists()]
+        with self.transaction() as conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO backups (path, type, timestamp, size_bytes) VALUES (?, ?, ?, ?)",
+                rows
+            )
+        metadata_file.replace(metadata_file.with_name(metadata_file.name + '.imported'))
+        logger.info(f"Imported {len(rows)} of {len(backups)} entries from {metadata_file.name}")
+        return len(rows)
@@ -2,27 +2,275 @@
 Enterprise-grade automatic backup system
 Multi-location backups with scheduled rotation
 """
+import os
 import shutil
-import json
+import threading
+from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 import gzip
 import logging
+import lzma
+import sqlite3
+import struct
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from utils.backup_catalog import BackupCatalog
+from utils.backup_store import BackupStore, snapshot_database
+from utils.performance import CACHE_TAGS_BY_TABLE, invalidate_tables, measure_time
+
+
+# Scheduled backup types and how many of each rotation keeps
+SCHEDULED_BACKUP_TYPES = ('daily', 'weekly', 'monthly')
+KEEP_COUNTS = {'daily': 7, 'weekly': 4, 'monthly': 12}
+
+
+# Bytes moved per read/write when streaming a file through a codec
+STREAM_BUFFER_SIZE = 1024 * 1024
+
+
+class Codec(ABC):
+    """Compresses and decompresses whole backup files, streaming"""
+
+    name = ''
+    extension = ''
+
+    @abstractmethod
+    def compress_file(self, source: Path, target: Path) -> None:
+        """Write source compressed to target"""
+
+    @abstractmethod
+    def decompress_file(self, source: Path, target: Path) -> None:
+        """Write the original contents of compressed source to target"""
+
+
+class StreamCodec(Codec):
+    """Single-threaded codec over a file-like compressor (gzip, lzma)"""
+
+    def __init__(self, name: str, extension: str, opener, **options):
+        """
+        Args:
+            name: Registry name, e.g. 'gzip-6'
+            extension: File suffix identifying the format, e.g. '.gz'
+            opener: gzip.open / lzma.open style function
+            options: Compression options passed to opener when writing
+        """
+        self.name = name
+        self.extension = extension
+        self.opener = opener
+        self.options = options
+
+    def compress_file(self, source: Path, target: Path) -> None:
+        with open(source, 'rb') as f_in:
+            with self.opener(target, 'wb', **self.options) as f_out:
+                shutil.copyfileobj(f_in, f_out, STREAM_BUFFER_SIZE)
+
+    def decompress_file(self, source: Path, target: Path) -> None:
+        with self.opener(source, 'rb') as f_in:
+            with open(target, 'wb') as f_out:
+                shutil.copyfileobj(f_in, f_out, STREAM_BUFFER_SIZE)
+
+
+class ZlibCodec(Codec):
+    """Raw zlib stream (no gzip header/CRC), single-threaded"""
+
+    def __init__(self, name: str, level: int):
+        self.name = name
+        self.extension = '.zz'
+        self.level = level
+
+    def compress_file(self, source: Path, target: Path) -> None:
+        compressor = zlib.compressobj(self.level)
+        with open(source, 'rb') as f_in, open(target, 'wb') as f_out:
+            for block in iter(lambda: f_in.read(STREAM_BUFFER_SIZE), b''):
+                f_out.write(compressor.compress(block))
+            f_out.write(compressor.flush())
+
+    def decompress_file(self, source: Path, target: Path) -> None:
+        decompressor = zlib.decompressobj()
+        with open(source, 'rb') as f_in, open(target, 'wb') as f_out:
+            for block in iter(lambda: f_in.read(STREAM_BUFFER_SIZE), b''):
+                f_out.write(decompressor.decompress(block))
+            f_out.write(decompressor.flush())
+
+
+class ParallelCodec(Codec):
+    """
+    Multi-threaded block codec with a seekable frame index
+
+    The input is cut into fixed-size blocks that are compressed independently
+    on a thread pool (zlib and lzma release the GIL), then written in order.
+    File layout:
+
+        MAGIC | block codec (1 byte) | block size (4 bytes)
+        frame 0 | frame 1 | ...                         compressed blocks
+        index: (offset, compressed size, raw size) per frame
+        footer: index offset (8 bytes) | frame count (4 bytes) | MAGIC
+
+    read_range() decompresses only the frames overlapping the requested bytes.
+    """
+
+    MAGIC = b'GTIPZ\x00\x01\x00'
+    HEADER = struct.Struct('<BI')
+    INDEX_ENTRY = struct.Struct('<QII')
+    FOOTER = struct.Struct('<QI')
+    BLOCK_CODECS = {
+        0: (lambda data, level: zlib.compress(data, level), zlib.decompress),
+        1: (lambda data, level: lzma.compress(data, preset=level), lzma.decompress),
+    }
+
+    def __init__(self, name: str, block_codec: int, level: int,
+                 block_size: int = 4 * 1024 * 1024, workers: Optional[int] = None):
+        """
+        Args:
+            name: Registry name
+            block_codec: 0 = zlib, 1 = lzma
+            level: zlib level / lzma preset
+            block_size: Uncompressed bytes per frame
+            workers: Compression threads (default: CPU count)
+        """
+        self.name = name
+        self.extension = '.pz'
+        self.block_codec = block_codec
+        self.level = level
+        self.block_size = block_size
+        self.workers = workers or os.cpu_count() or 2
+
+    def compress_file(self, source: Path, target: Path) -> None:
+        compress = self.BLOCK_CODECS[self.block_codec][0]
+        index = []
+        with open(source, 'rb') as f_in, open(target, 'wb') as f_out, \
+                ThreadPoolExecutor(max_workers=self.workers) as pool:
+            f_out.write(self.MAGIC + self.HEADER.pack(self.block_codec, self.block_size))
+            offset = f_out.tell()
+            pending = deque()
+
+            def write_oldest():
+                raw_size, future = pending.popleft()
+                frame = future.result()
+                f_out.write(frame)
+                index.append((offset, len(frame), raw_size))
+                return offset + len(frame)
+
+            # Keep a bounded number of blocks in flight so memory stays flat
+            for block in iter(lambda: f_in.read(self.block_size), b''):
+                pending.append((len(block), pool.submit(compress, block, self.level)))
+                if len(pending) >= self.workers * 2:
+                    offset = write_oldest()
+            while pending:
+                offset = write_oldest()
+
+            index_offset = f_out.tell()
+            for entry in index:
+                f_out.write(self.INDEX_ENTRY.pack(*entry))
+            f_out.write(self.FOOTER.pack(index_offset, len(index)) + self.MAGIC)
+
+    def read_index(self, f) -> tuple:
+        """(block codec, block size, [(offset, compressed size, raw size), ...]) of an open file"""
+        header = f.read(len(self.MAGIC) + self.HEADER.size)
+        if header[:len(self.MAGIC)] != self.MAGIC:
+            raise ValueError("Not a parallel-compressed backup")
+        block_codec, block_size = self.HEADER.unpack(header[len(self.MAGIC):])
+
+        f.seek(-(self.FOOTER.size + len(self.MAGIC)), os.SEEK_END)
+        footer = f.read(self.FOOTER.size + len(self.MAGIC))
+        if footer[self.FOOTER.size:] != self.MAGIC:
+            raise ValueError("Parallel-compressed backup is truncated")
+        index_offset, count = self.FOOTER.unpack(footer[:self.FOOTER.size])
+
+        f.seek(index_offset)
+        raw_index = f.read(count * self.INDEX_ENTRY.size)
+        index = [self.INDEX_ENTRY.unpack_from(raw_index, i * self.INDEX_ENTRY.size) for i in range(count)]
+        return block_codec, block_size, index
+
+    def _read_frame(self, f, entry, decompress) -> bytes:
+        offset, compressed_size, _raw_size = entry
+        f.seek(offset)
+        return decompress(f.read(compressed_size))
+
+    def decompress_file(self, source: Path, target: Path) -> None:
+        with open(source, 'rb') as f_in:
+            block_codec, _block_size, index = self.read_index(f_in)
+            decompress = self.BLOCK_CODECS[block_codec][1]
+            with open(target, 'wb') as f_out, ThreadPoolExecutor(max_workers=self.workers) as pool:
+                # Frames are read here and decompressed on the pool, in order
+                for start in range(0, len(index), self.workers * 2):
+                    frames = []
+                    for entry in index[start:start + self.workers * 2]:
+                        f_in.seek(entry[0])
+                        frames.append(f_in.read(entry[1]))
+                    for data in pool.map(decompress, frames):
+                        f_out.write(data)
+
+    def read_range(self, source: Path, offset: int, size: int) -> bytes:
+        """Uncompressed bytes [offset, offset + size) without decompressing the whole file"""
+        with open(source, 'rb') as f:
+            block_codec, block_size, index = self.read_index(f)
+            decompress = self.BLOCK_CODECS[block_codec][1]
+            first = offset // block_size
+            last = min((offset + size - 1) // block_size, len(index) - 1)
+            data = b''.join(self._read_frame(f, index[i], decompress) for i in range(first, last + 1))
+        start = offset - first * block_size
+        return data[start:start + size]
+
+
+CODECS = {codec.name: codec for codec in [
+    StreamCodec('gzip-1', '.gz', gzip.open, compresslevel=1),
+    StreamCodec('gzip-6', '.gz', gzip.open, compresslevel=6),
+    StreamCodec('gzip-9', '.gz', gzip.open, compresslevel=9),
+    ZlibCodec('zlib-6', 6),
+    StreamCodec('lzma-1', '.xz', lzma.open, preset=1),
+    StreamCodec('lzma-6', '.xz', lzma.open, preset=6),
+    ParallelCodec('parallel-zlib-6', 0, 6),
+    ParallelCodec('parallel-lzma-1', 1, 1),
+]}
+
+# gzip.open's default level, what backups always used
+DEFAULT_CODEC = 'gzip-9'
+
+# Codec used to read a backup, by file suffix (levels don't matter for reading)
+_CODECS_BY_EXTENSION = {'.gz': CODECS['gzip-9'], '.xz': CODECS['lzma-6'],
+                        '.zz': CODECS['zlib-6'], '.pz': CODECS['parallel-zlib-6']}
+
+
+def get_codec(name: Optional[str] = None) -> Codec:
+    """
+    Look up a codec by name
+
+    Raises:
+        ValueError: unknown codec name
+    """
+    name = name or DEFAULT_CODEC
+    if name not in CODECS:
+        raise ValueError(f"Unknown backup codec '{name}' (choose from {', '.join(CODECS)})")
+    return CODECS[name]
+
+
+def codec_for_path(path: Path) -> Optional[Codec]:
+    """Codec that reads a backup file, None for an uncompressed .db"""
+    return _CODECS_BY_EXTENSION.get(Path(path).suffix)
 
 
 class BackupManager:
     """Automatic backup system with rotation and multiple locations"""
 
-    def __init__(self, database_path: Path, backup_dir: Path = None):
+    # Pages copied per backup step when writers would otherwise be blocked
+    # (rollback journal); in WAL mode the whole copy runs in one read transaction
+    SNAPSHOT_PAGES_PER_STEP = 1024
+
+    def __init__(self, database_path: Path, backup_dir: Path = None, codec: Optional[str] = None):
         """
         Initialize backup manager
 
         Args:
             database_path: Path to the SQLite database
             backup_dir: Directory for backups (default: ~/.gti_tracker/backups)
+            codec: Name in CODECS used for compressed backups (default: DEFAULT_CODEC)
         """
         self.database_path = Path(database_path)
+        self.codec = get_codec(codec)
 
         if backup_dir is None:
             backup_dir = Path.home() / '.gti_tracker' / 'backups'
@@ -40,16 +288,27 @@ class BackupManager:
 
         self.logger = logging.getLogger('GTI_Tracker.Backup')
 
-        # Backup metadata file
-        self.metadata_file = self.backup_dir / 'backup_metadata.json'
+        # Index of the backups on disk (replaces backup_metadata.json, imported once)
+        self.catalog = BackupCatalog(self.backup_dir / 'backup_catalog.db',
+                                     legacy_metadata_file=self.backup_dir / 'backup_metadata.json')
+
+        # Deduplicated store for the scheduled backups (see utils.backup_store)
+        self.store = BackupStore(self.backup_dir / 'store')
 
-    def create_backup(self, backup_type: str = 'manual', compress: bool = True) -> Optional[Path]:
+        # One backup or restore at a time (scheduled backups run on a worker thread)
+        self._lock = threading.RLock()
+        self._scheduled_thread = None
+
+    @measure_time
+    def create_backup(self, backup_type: str = 'manual', compress: bool = True,
+                      codec: Optional[str] = None) -> Optional[Path]:
         """
         Create a backup of the database
 
         Args:
             backup_type: Type of backup (manual, daily, weekly, monthly)
             compress: Whether to compress the backup
+            codec: Name in CODECS (default: the manager's codec)
 
         Returns:
             Path to the created backup file, or None if failed
@@ -59,35 +318,13 @@ class BackupManager:
                 self.logger.error(f"Database file not found: {self.database_path}")
                 return None
 
-            # Determine backup location based on type
-            if backup_type == 'daily':
-                backup_dir = self.daily_dir
-            elif backup_type == 'weekly':
-                backup_dir = self.weekly_dir
-            elif backup_type == 'monthly':
-                backup_dir = self.monthly_dir
-            else:
-                backup_dir = self.backup_dir
-
-            # Create backup filename with timestamp
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            backup_name = f"gti_tracker_{backup_type}_{timestamp}.db"
+            codec = (get_codec(codec) if codec else self.codec) if compress else None
+            with self._lock:
+                backup_path = self._backup_path(backup_type, codec)
+                self._write_snapshot(backup_path, codec)
 
-            if compress:
-                backup_name += '.gz'
-
-            backup_path = backup_dir / backup_name
-
-            # Perform backup
-            if compress:
-                with open(self.database_path, 'rb') as f_in:
-                    with gzip.open(backup_path, 'wb') as f_out:
-                        shutil.copyfileobj(f_in, f_out)
-            else:
-                shutil.copy2(self.database_path, backup_path)
-
-            # Update metadata
-            self._update_metadata(backup_path, backup_type)
+                # Update metadata
+                self._update_metadata(backup_path, backup_type)
 
             self.logger.info(f"Backup created successfully: {backup_path}")
             return backup_path
@@ -96,34 +333,73 @@ class BackupManager:
             self.logger.error(f"Backup failed: {e}")
             return None
 
-    def _update_metadata(self, backup_path: Path, backup_type: str):
-        """Update backup metadata file"""
+    def _backup_path(self, backup_type: str, codec: Optional[Codec]) -> Path:
+        """Timestamped file name in the directory of the backup type"""
+        # Determine backup location based on type
+        if backup_type == 'daily':
+            backup_dir = self.daily_dir
+        elif backup_type == 'weekly':
+            backup_dir = self.weekly_dir
+        elif backup_type == 'monthly':
+            backup_dir = self.monthly_dir
+        else:
+            backup_dir = self.backup_dir
+
+        # Create backup filename with timestamp
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        backup_name = f"gti_tracker_{backup_type}_{timestamp}.db"
+
+        if codec is not None:
+            backup_name += codec.extension
+
+        return backup_dir / backup_name
+
+    def _snapshot(self, target_path: Path) -> None:
+        """Copy the live database to target_path with the SQLite online backup API"""
+        snapshot_database(self.database_path, target_path, self.SNAPSHOT_PAGES_PER_STEP)
+
+    def _write_snapshot(self, backup_path: Path, codec: Optional[Codec]) -> None:
+        """Snapshot the database into backup_path, compressed with codec unless it is None"""
+        # Work on temporary names so an interrupted backup never looks complete
+        snapshot_path = backup_path.with_name(f".{backup_path.name}.snapshot")
+        partial_path = backup_path.with_name(f".{backup_path.name}.partial")
         try:
-            # Read existing metadata
-            if self.metadata_file.exists():
-                with open(self.metadata_file, 'r') as f:
-                    metadata = json.load(f)
+            self._snapshot(snapshot_path)
+            if codec is not None:
+                codec.compress_file(snapshot_path, partial_path)
+                os.replace(partial_path, backup_path)
             else:
-                metadata = {'backups': []}
-
-            # Add new backup info
-            backup_info = {
-                'path': str(backup_path),
-                'type': backup_type,
-                'timestamp': datetime.now().isoformat(),
-                'size_bytes': backup_path.stat().st_size
-            }
-
-            metadata['backups'].append(backup_info)
-            metadata['last_backup'] = datetime.now().isoformat()
-
-            # Write updated metadata
-            with open(self.metadata_file, 'w') as f:
-                json.dump(metadata, f, indent=2)
-
+                os.replace(snapshot_path, backup_path)
+        finally:
+            for path in (snapshot_path, partial_path):
+                if path.exists():
+                    path.unlink()
+
+    def _checkpoint_wal(self):
+        """Copy WAL-journaled pages into the database file and truncate the WAL"""
+        wal_path = self.database_path.with_name(self.database_path.name + '-wal')
+        if not wal_path.exists():
+            return
+        try:
+            conn = sqlite3.connect(str(self.database_path))
+            try:
+                conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            self.logger.warning(f"WAL checkpoint failed: {e}")
+
+    def _update_metadata(self, backup_path: Path, backup_type: str, size_bytes: Optional[int] = None):
+        """Record a backup in the catalog (size_bytes defaults to the size of backup_path)"""
+        try:
+            self.catalog.add(
+                backup_path, backup_type,
+                backup_path.stat().st_size if size_bytes is None else size_bytes
+            )
         except Exception as e:
             self.logger.error(f"Failed to update metadata: {e}")
 
+    @measure_time
     def restore_backup(self, backup_path: Path) -> bool:
         """
         Restore database from a backup
@@ -139,21 +415,28 @@ class BackupManager:
                 self.logger.error(f"Backup file not found: {backup_path}")
                 return False
 
-            # Create a backup of current database before restoring
-            current_backup = self.backup_dir / f"pre_restore_{datetime.now().strftime('%Y%m%d_%H%M%S')}.db"
-            if self.database_path.exists():
-                shutil.copy2(self.database_path, current_backup)
-                self.logger.info(f"Created safety backup before restore: {current_backup}")
-
-            # Restore from backup
-            if backup_path.suffix == '.gz':
-                # Decompress first
-                with gzip.open(backup_path, 'rb') as f_in:
-                    with open(self.database_path, 'wb') as f_out:
-                        shutil.copyfileobj(f_in, f_out)
-            else:
-                shutil.copy2(backup_path, self.database_path)
-
+            with self._lock:
+                # Create a backup of current database before restoring
+                current_backup = self.backup_dir / f"pre_restore_{datetime.now().strftime('%Y%m%d_%H%M%S')}.db"
+                if self.database_path.exists():
+                    self._snapshot(current_backup)
+                    self.logger.info(f"Created safety backup before restore: {current_backup}")
+
+                # Empty the WAL so none of its pages are replayed over the restored file
+                self._checkpoint_wal()
+
+                # Restore from backup
+                if backup_path.suffix == '.json' and backup_path.parent == self.store.manifests_dir:
+                    # Rebuild from the chunk store
+                    self.store.restore(backup_path.stem, self.database_path)
+                elif codec_for_path(backup_path) is not None:
+                    # Decompress first
+                    codec_for_path(backup_path).decompress_file(backup_path, self.database_path)
+                else:
+                    shutil.copy2(backup_path, self.database_path)
+
+            # Every table changed under the ORM: drop cached queries and the lookup index
+            invalidate_tables(*CACHE_TAGS_BY_TABLE)
             self.logger.info(f"Database restored from: {backup_path}")
             return True
 
@@ -167,23 +450,40 @@ class BackupManager:
         - Keep last 7 daily backups
         - Keep last 4 weekly backups
         - Keep last 12 monthly backups
+        Chunks only referenced by pruned store backups are deleted. Catalog
+        entries of deleted backups are removed in the same catalog transaction,
+        and entries whose file has disappeared are dropped.
         """
         try:
-            self._rotate_directory(self.daily_dir, keep_count=7)
-            self._rotate_directory(self.weekly_dir, keep_count=4)
-            self._rotate_directory(self.monthly_dir, keep_count=12)
+            with self.catalog.transaction() as conn:
+                deleted = []
+                deleted += self._rotate_directory(self.daily_dir, keep_count=KEEP_COUNTS['daily'])
+                deleted += self._rotate_directory(self.weekly_dir, keep_count=KEEP_COUNTS['weekly'])
+                deleted += self._rotate_directory(self.monthly_dir, keep_count=KEEP_COUNTS['monthly'])
+
+                pruned = []
+                for backup_type in SCHEDULED_BACKUP_TYPES:
+                    pruned.extend(self.store.prune(backup_type, KEEP_COUNTS[backup_type]))
+                deleted += [self.store.manifest_path(backup_id) for backup_id in pruned]
+
+                self.catalog.remove(deleted, conn)
+
+            if pruned:
+                self.store.gc()
+            self.catalog.reconcile()
 
             self.logger.info("Backup rotation completed")
 
         except Exception as e:
             self.logger.error(f"Backup rotation failed: {e}")
 
-    def _rotate_directory(self, directory: Path, keep_count: int):
-        """Rotate backups in a directory, keeping only the most recent"""
+    def _rotate_directory(self, directory: Path, keep_count: int) -> list:
+        """Rotate backups in a directory, keeping only the most recent; returns the deleted paths"""
+        deleted = []
         try:
             # Get all backup files sorted by modification time
             backups = sorted(
-                directory.glob('*.db*'),
+                (p for p in directory.glob('*.db*') if not p.name.startswith('.')),
                 key=lambda p: p.stat().st_mtime,
                 reverse=True
             )
@@ -191,10 +491,12 @@ class BackupManager:
             # Delete old backups beyond keep_count
             for backup in backups[keep_count:]:
                 backup.unlink()
+                deleted.append(backup)
                 self.logger.info(f"Deleted old backup: {backup}")
 
         except Exception as e:
             self.logger.error(f"Failed to rotate backups in {directory}: {e}")
+        return deleted
 
     def should_create_backup(self, backup_type: str) -> bool:
         """
@@ -207,21 +509,12 @@ class BackupManager:
             True if backup should be created
         """
         try:
-            if not self.metadata_file.exists():
-                return True
+            # Last backup of this type (one index seek)
+            last_backup_time = self.catalog.last_backup_time(backup_type)
 
-            with open(self.metadata_file, 'r') as f:
-                metadata = json.load(f)
-
-            # Find last backup of this type
-            backups = [b for b in metadata.get('backups', []) if b['type'] == backup_type]
-
-            if not backups:
+            if last_backup_time is None:
                 return True
 
-            last_backup = max(backups, key=lambda b: b['timestamp'])
-            last_backup_time = datetime.fromisoformat(last_backup['timestamp'])
-
             # Check if enough time has passed
             now = datetime.now()
 
@@ -238,24 +531,64 @@ class BackupManager:
             self.logger.error(f"Failed to check backup schedule: {e}")
             return True  # If unsure, create backup
 
-    def perform_scheduled_backups(self):
+    def due_backup_types(self) -> list:
+        """Scheduled backup types (daily, weekly, monthly) that are due now"""
+        return [backup_type for backup_type in SCHEDULED_BACKUP_TYPES
+                if self.should_create_backup(backup_type)]
+
+    @measure_time
+    def perform_scheduled_backups(self) -> list:
         """
         Perform all scheduled backups that are due
-        """
-        # Daily backup
-        if self.should_create_backup('daily'):
-            self.create_backup('daily')
 
-        # Weekly backup
-        if self.should_create_backup('weekly'):
-            self.create_backup('weekly')
+        Backups go to the deduplicated store: only chunks that changed since
+        any earlier backup are written. Backups due at the same time share one
+        snapshot and differ only in their manifest.
+
+        Returns:
+            Manifest paths of the backups created
+        """
+        created = []
+        with self._lock:
+            due = self.due_backup_types()
+
+            if due and self.database_path.exists():
+                try:
+                    result = self.store.backup_database(self.database_path, due)
+                    for index, (backup_id, backup_type) in enumerate(zip(result.backup_ids, due)):
+                        manifest_path = self.store.manifest_path(backup_id)
+                        # Only the first manifest wrote new chunks
+                        self._update_metadata(manifest_path, backup_type,
+                                              result.bytes_written if index == 0 else 0)
+                        created.append(manifest_path)
+
+                    self.logger.info(
+                        f"Scheduled backups created ({', '.join(due)}): "
+                        f"{result.new_chunks}/{result.chunks} chunks changed"
+                    )
+                except Exception as e:
+                    self.logger.error(f"Scheduled backup failed: {e}")
+
+            # Rotate old backups
+            self.rotate_backups()
+        return created
+
+    def perform_scheduled_backups_in_background(self) -> threading.Thread:
+        """
+        Run perform_scheduled_backups() on a worker thread
 
-        # Monthly backup
-        if self.should_create_backup('monthly'):
-            self.create_backup('monthly')
+        Returns:
+            The worker thread (the running one if a run is already in progress)
+        """
+        if self._scheduled_thread is not None and self._scheduled_thread.is_alive():
+            return self._scheduled_thread
 
-        # Rotate old backups
-        self.rotate_backups()
+        # Not a daemon: a backup in progress is finished before the process exits
+        self._scheduled_thread = threading.Thread(
+            target=self.perform_scheduled_backups, name='GTI_Tracker.ScheduledBackups'
+        )
+        self._scheduled_thread.start()
+        return self._scheduled_thread
 
     def get_backup_info(self) -> dict:
         """
@@ -265,26 +598,16 @@ class BackupManager:
             Dictionary with backup statistics
         """
         try:
-            if not self.metadata_file.exists():
-                return {
-                    'total_backups': 0,
-                    'last_backup': None,
-                    'total_size_mb': 0
-                }
-
-            with open(self.metadata_file, 'r') as f:
-                metadata = json.load(f)
-
-            backups = metadata.get('backups', [])
-            total_size = sum(b.get('size_bytes', 0) for b in backups)
+            summary = self.catalog.summary()
+            counts = summary['counts']
 
             return {
-                'total_backups': len(backups),
-                'last_backup': metadata.get('last_backup'),
-                'total_size_mb': total_size / (1024 * 1024),
-                'daily_backups': len([b for b in backups if b['type'] == 'daily']),
-                'weekly_backups': len([b for b in backups if b['type'] == 'weekly']),
-                'monthly_backups': len([b for b in backups if b['type'] == 'monthly'])
+                'total_backups': sum(counts.values()),
+                'last_backup': summary['last_backup'],
+                'total_size_mb': summary['size_bytes'] / (1024 * 1024),
+                'daily_backups': counts.get('daily', 0),
+                'weekly_backups': counts.get('weekly', 0),
+                'monthly_backups': counts.get('monthly', 0)
             }
 
         except Exception as e:
@@ -306,21 +629,8 @@ class BackupManager:
             List of backup information dictionaries
         """
         try:
-            if not self.metadata_file.exists():
-                return []
-
-            with open(self.metadata_file, 'r') as f:
-                metadata = json.load(f)
-
-            backups = metadata.get('backups', [])
-
-            if backup_type:
-                backups = [b for b in backups if b['type'] == backup_type]
-
-            # Sort by timestamp, newest first
-            backups.sort(key=lambda b: b['timestamp'], reverse=True)
-
-            return backups
+            # Newest first
+            return self.catalog.list_backups(backup_type)
 
         except Exception as e:
             self.logger.error(f"Failed to list backups: {e}")
@@ -0,0 +1,423 @@
+"""
+Content-addressed backup store
+Database snapshots split into page-aligned chunks; each chunk is stored once and
+every backup is a manifest listing its chunks, so a backup only writes what changed
+"""
+import argparse
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import sys
+import zlib
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+logger = logging.getLogger('GTI_Tracker.BackupStore')
+
+# SQLite pages per chunk: small enough that a few changed rows touch few
+# chunks, large enough to keep the chunk count (and file count) reasonable
+PAGES_PER_CHUNK = 8
+
+# Chunk size for files that are not SQLite databases
+DEFAULT_CHUNK_SIZE = 32 * 1024
+
+MANIFEST_VERSION = 1
+
+
+def snapshot_database(source_path: Path, target_path: Path, pages_per_step: int = 1024) -> None:
+    """
+    Copy a live SQLite database with the online backup API
+
+    The copy is a consistent snapshot even while other connections write,
+    and includes pages still in the WAL.
+
+    Args:
+        source_path: Database to copy
+        target_path: Destination file (overwritten)
+        pages_per_step: Pages per step when the source uses a rollback journal;
+            in WAL mode the copy runs in one read transaction, which never blocks writers
+    """
+    source = sqlite3.connect(str(source_path))
+    try:
+        target = sqlite3.connect(str(target_path))
+        try:
+            journal_mode = source.execute("PRAGMA journal_mode").fetchone()[0]
+            if journal_mode.lower() == 'wal':
+                source.backup(target)
+            else:
+                source.backup(target, pages=pages_per_step, sleep=0.01)
+        finally:
+            target.close()
+    finally:
+        source.close()
+
+
+def sqlite_page_size(path: Path) -> Optional[int]:
+    """Page size from the SQLite file header, None if path is not a SQLite database"""
+    with open(path, 'rb') as f:
+        header = f.read(100)
+    if len(header) < 100 or not header.startswith(b'SQLite format 3\x00'):
+        return None
+    page_size = int.from_bytes(header[16:18], 'big')
+    return 65536 if page_size == 1 else page_size
+
+
+def chunk_hash(data: bytes) -> str:
+    """Content address of a chunk"""
+    return hashlib.blake2b(data, digest_size=20).hexdigest()
+
+
+@dataclass
+class BackupResult:
+    """Outcome of BackupStore.add()"""
+    backup_ids: List[str]
+    size: int                 # bytes in the snapshot
+    chunks: int               # chunks in the snapshot
+    new_chunks: int           # chunks that were not stored yet
+    bytes_written: int        # compressed bytes of the new chunks
+
+    @property
+    def reused_chunks(self) -> int:
+        return self.chunks - self.new_chunks
+
+
+@dataclass
+class VerifyReport:
+    """Outcome of BackupStore.verify()"""
+    manifests: int = 0
+    chunks_checked: int = 0
+    missing: List[str] = field(default_factory=list)   # "backup_id: chunk"
+    corrupt: List[str] = field(default_factory=list)   # chunk hashes
+
+    @property
+    def ok(self) -> bool:
+        return not self.missing and not self.corrupt
+
+
+class BackupStore:
+    """
+    Chunk store plus one JSON manifest per backup
+
+    Layout:
+        root/chunks/ab/abcdef...   zlib-compressed chunk, named by its hash
+        root/manifests/<id>.json   size, chunk size, whole-file hash and chunk list
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.chunks_dir = self.root / 'chunks'
+        self.manifests_dir = self.root / 'manifests'
+        self.chunks_dir.mkdir(parents=True, exist_ok=True)
+        self.manifests_dir.mkdir(parents=True, exist_ok=True)
+
+    # -- chunks --------------------------------------------------------------
+
+    def _chunk_path(self, digest: str) -> Path:
+        return self.chunks_dir / digest[:2] / digest
+
+    def has_chunk(self, digest: str) -> bool:
+        return self._chunk_path(digest).exists()
+
+    def _write_chunk(self, digest: str, data: bytes) -> int:
+        """Store a chunk unless present; returns compressed bytes written"""
+        path = self._chunk_path(digest)
+        if path.exists():
+            return 0
+        path.parent.mkdir(exist_ok=True)
+        payload = zlib.compress(data, 6)
+        partial = path.with_name(f".{digest}.partial")
+        partial.write_bytes(payload)
+        os.replace(partial, path)
+        return len(payload)
+
+    def read_chunk(self, digest: str) -> bytes:
+        """Chunk contents; raises ValueError if the stored bytes don't match the hash"""
+        try:
+            data = zlib.decompress(self._chunk_path(digest).read_bytes())
+        except zlib.error:
+            raise ValueError(f"Chunk {digest} is corrupt")
+        if chunk_hash(data) != digest:
+            raise ValueError(f"Chunk {digest} is corrupt")
+        return data
+
+    # -- manifests -----------------------------------------------------------
+
+    def _manifest_path(self, backup_id: str) -> Path:
+        return self.manifests_dir / f"{backup_id}.json"
+
+    def manifest_path(self, backup_id: str) -> Path:
+        """Path of a backup's manifest (what BackupManager records in its metadata)"""
+        return self._manifest_path(backup_id)
+
+    def read_manifest(self, backup_id: str) -> dict:
+        with open(self._manifest_path(backup_id), 'r') as f:
+            return json.load(f)
+
+    def list_backups(self, backup_type: Optional[str] = None) -> list:
+        """
+        Manifests without their chunk lists, newest first
+
+        Args:
+            backup_type: Only backups of this type
+        """
+        backups = []
+        for path in self.manifests_dir.glob('*.json'):
+            try:
+                with open(path, 'r') as f:
+                    manifest = json.load(f)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Unreadable manifest {path.name}: {e}")
+                continue
+            if backup_type and manifest['type'] != backup_type:
+                continue
+            manifest.pop('chunks', None)
+            backups.append(manifest)
+        backups.sort(key=lambda m: m['created'], reverse=True)
+        return backups
+
+    # -- backup / restore ----------------------------------------------------
+
+    def add(self, snapshot_path: Path, backup_types: Iterable[str] = ('manual',)) -> BackupResult:
+        """
+        Store a snapshot file, writing only chunks not already in the store
+
+        Args:
+            snapshot_path: A database snapshot (see snapshot_database); must not change while read
+            backup_types: One manifest is written per type, all sharing the same chunks
+
+        Returns:
+            BackupResult
+        """
+        snapshot_path = Path(snapshot_path)
+        page_size = sqlite_page_size(snapshot_path)
+        chunk_size = page_size * PAGES_PER_CHUNK if page_size else DEFAULT_CHUNK_SIZE
+
+        digests = []
+        new_chunks = 0
+        bytes_written = 0
+        file_hash = hashlib.sha256()
+        size = 0
+
+        with open(snapshot_path, 'rb') as f:
+            while True:
+                data = f.read(chunk_size)
+                if not data:
+                    break
+                size += len(data)
+                file_hash.update(data)
+                digest = chunk_hash(data)
+                written = self._write_chunk(digest, data)
+                if written:
+                    new_chunks += 1
+                    bytes_written += written
+                digests.append(digest)
+
+        created = datetime.now()
+        backup_ids = []
+        for backup_type in backup_types:
+            backup_id = f"{backup_type}_{created.strftime('%Y%m%d_%H%M%S_%f')}"
+            manifest = {
+                'version': MANIFEST_VERSION,
+                'id': backup_id,
+                'type': backup_type,
+                'created': created.isoformat(),
+                'size': size,
+                'chunk_size': chunk_size,
+                'page_size': page_size,
+                'sha256': file_hash.hexdigest(),
+                'new_chunks': new_chunks,
+                'bytes_written': bytes_written,
+                'chunks': digests,
+            }
+            path = self._manifest_path(backup_id)
+            partial = path.with_name(f".{path.name}.partial")
+            partial.write_text(json.dumps(manifest))
+            os.replace(partial, path)
+            backup_ids.append(backup_id)
+
+        logger.info(
+            f"Stored {', '.join(backup_ids)}: {len(digests)} chunks, "
+            f"{new_chunks} new ({bytes_written / 1024:.0f} KB written)"
+        )
+        return BackupResult(backup_ids, size, len(digests), new_chunks, bytes_written)
+
+    def backup_database(self, database_path: Path, backup_types: Iterable[str] = ('manual',)) -> BackupResult:
+        """Snapshot a live database and add it to the store"""
+        database_path = Path(database_path)
+        snapshot_path = self.root / f".snapshot_{os.getpid()}.db"
+        try:
+            snapshot_database(database_path, snapshot_path)
+            return self.add(snapshot_path, backup_types)
+        finally:
+            if snapshot_path.exists():
+                snapshot_path.unlink()
+
+    def restore(self, backup_id: str, target_path: Path) -> None:
+        """
+        Rebuild a backup into target_path
+
+        The file is assembled next to the target and checked against the
+        manifest's hash before it replaces the target.
+
+        Raises:
+            ValueError: a chunk or the rebuilt file doesn't match its hash
+        """
+        manifest = self.read_manifest(backup_id)
+        target_path = Path(target_path)
+        partial = target_path.with_name(f".{target_path.name}.restore")
+
+        file_hash = hashlib.sha256()
+        try:
+            with open(partial, 'wb') as f:
+                for digest in manifest['chunks']:
+                    data = self.read_chunk(digest)
+                    file_hash.update(data)
+                    f.write(data)
+            if file_hash.hexdigest() != manifest['sha256']:
+                raise ValueError(f"Rebuilt {backup_id} does not match its manifest")
+            os.replace(partial, target_path)
+        finally:
+            if partial.exists():
+                partial.unlink()
+        logger.info(f"Restored {backup_id} to {target_path}")
+
+    # -- maintenance ---------------------------------------------------------
+
+    def delete(self, backup_id: str) -> None:
+        """Remove a manifest (its chunks are freed by gc())"""
+        path = self._manifest_path(backup_id)
+        if path.exists():
+            path.unlink()
+
+    def prune(self, backup_type: str, keep: int) -> list:
+        """Delete all but the newest keep backups of a type; returns deleted ids"""
+        deleted = [m['id'] for m in self.list_backups(backup_type)[keep:]]
+        for backup_id in deleted:
+            self.delete(backup_id)
+        return deleted
+
+    def _referenced_chunks(self) -> set:
+        referenced = set()
+        for path in self.manifests_dir.glob('*.json'):
+            with open(path, 'r') as f:
+                referenced.update(json.load(f)['chunks'])
+        return referenced
+
+    def _stored_chunks(self):
+        for path in self.chunks_dir.glob('*/*'):
+            if not path.name.startswith('.'):
+                yield path
+
+    def gc(self) -> dict:
+        """
+        Delete chunks no manifest refers to (and leftovers of interrupted writes)
+
+        Returns:
+            {'chunks_deleted': int, 'bytes_freed': int}
+        """
+        referenced = self._referenced_chunks()
+        deleted = 0
+        freed = 0
+        for path in list(self.chunks_dir.glob('*/*')):
+            if path.name.startswith('.') or path.name not in referenced:
+                freed += path.stat().st_size
+                path.unlink()
+                deleted += 1
+        logger.info(f"Backup store gc: {deleted} chunks deleted, {freed / 1024:.0f} KB freed")
+        return {'chunks_deleted': deleted, 'bytes_freed': freed}
+
+    def verify(self, backup_ids: Optional[Iterable[str]] = None) -> VerifyReport:
+        """
+        Check that every chunk of the given backups (default: all) exists and matches its hash
+
+        Returns:
+            VerifyReport
+        """
+        if backup_ids is None:
+            backup_ids = [path.stem for path in self.manifests_dir.glob('*.json')]
+
+        report = VerifyReport()
+        checked = {}
+        for backup_id in backup_ids:
+            manifest = self.read_manifest(backup_id)
+            report.manifests += 1
+            for digest in manifest['chunks']:
+                if digest not in checked:
+                    if not self.has_chunk(digest):
+                        checked[digest] = 'missing'
+                    else:
+                        try:
+                            self.read_chunk(digest)
+                            checked[digest] = 'ok'
+                        except ValueError:
+                            checked[digest] = 'corrupt'
+                            report.corrupt.append(digest)
+                if checked[digest] == 'missing':
+                    report.missing.append(f"{backup_id}: {digest}")
+        report.chunks_checked = len(checked)
+        return report
+
+    def stats(self) -> dict:
+        """Manifest count, chunk count and bytes on disk"""
+        chunk_paths = list(self._stored_chunks())
+        return {
+            'backups': len(list(self.manifests_dir.glob('*.json'))),
+            'chunks': len(chunk_paths),
+            'stored_bytes': sum(path.stat().st_size for path in chunk_paths),
+        }
+
+
+def main(argv=None) -> int:
+    """Command line: python -m utils.backup_store {list,backup,restore,verify,gc}"""
+    parser = argparse.ArgumentParser(description="Content-addressed backup store")
+    parser.add_argument('--store', type=Path, help="Store directory (default: the app's backup store)")
+    commands = parser.add_subparsers(dest='command', required=True)
+    commands.add_parser('list', help="List backups, newest first")
+    backup = commands.add_parser('backup', help="Back up the app database")
+    backup.add_argument('--type', default='manual')
+    restore = commands.add_parser('restore', help="Rebuild a backup into a file")
+    restore.add_argument('backup_id')
+    restore.add_argument('target', type=Path)
+    verify = commands.add_parser('verify', help="Check chunks of all (or some) backups")
+    verify.add_argument('backup_ids', nargs='*')
+    commands.add_parser('gc', help="Delete unreferenced chunks")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+
+    from db.session import get_database_path
+    from utils.backup_manager import BackupManager
+    manager = BackupManager(get_database_path())
+    store = BackupStore(args.store) if args.store else manager.store
+
+    if args.command == 'list':
+        for manifest in store.list_backups():
+            print(f"{manifest['id']:<40} {manifest['size'] / 1024:>10.0f} KB  "
+                  f"{manifest['new_chunks']:>6} new chunks")
+        print(store.stats())
+    elif args.command == 'backup':
+        result = store.backup_database(get_database_path(), [args.type])
+        print(f"{result.backup_ids[0]}: {result.new_chunks}/{result.chunks} chunks new, "
+              f"{result.bytes_written / 1024:.0f} KB written")
+    elif args.command == 'restore':
+        store.restore(args.backup_id, args.target)
+    elif args.command == 'verify':
+        report = store.verify(args.backup_ids or None)
+        for problem in report.missing:
+            print(f"missing {problem}")
+        for digest in report.corrupt:
+            print(f"corrupt {digest}")
+        print(f"{report.manifests} backups, {report.chunks_checked} chunks checked: "
+              f"{'OK' if report.ok else 'FAILED'}")
+        return 0 if report.ok else 1
+    elif args.command == 'gc':
+        print(store.gc())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,274 @@
+"""
+Bulk CSV import engine
+Streams a CSV file in chunks and inserts each chunk with one Core executemany, all in one transaction
+"""
+import csv
+import io
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Callable, Dict, List, Optional, Tuple
+from sqlalchemy import insert
+from db.models import NetworkingContact, NetworkingStatus, InternshipApplication, InternshipStatus
+
+logger = logging.getLogger('GTI_Tracker.BulkImport')
+
+# Rows parsed and inserted per executemany
+DEFAULT_BATCH_SIZE = 5000
+
+
+class ImportCancelled(Exception):
+    """Raised inside the import transaction when the caller cancels; nothing is committed"""
+
+
+@dataclass(frozen=True)
+class ImportSpec:
+    """How the columns of one CSV layout map onto a table"""
+    entity: str                    # stats_counters entity ('contact', 'application')
+    model: type
+    columns: Dict[str, str]        # normalized CSV header -> model column
+    required: Tuple[str, ...]      # model columns that must not be empty
+    date_columns: Tuple[str, ...]
+    status_enum: type
+    default_status: object
+    dedup_columns: Optional[Tuple[str, str]] = None  # (name, company) columns checked for duplicates
+
+
+CONTACT_SPEC = ImportSpec(
+    entity='contact',
+    model=NetworkingContact,
+    columns={
+        'name': 'name', 'job_title': 'job_title', 'company': 'company',
+        'contact_date': 'contact_date', 'status': 'status', 'email': 'email',
+        'linkedin_url': 'linkedin_url', 'phone': 'phone', 'relevant_info': 'relevant_info',
+    },
+    required=('name', 'contact_date'),
+    date_columns=('contact_date',),
+    status_enum=NetworkingStatus,
+    default_status=NetworkingStatus.COLD_MESSAGE,
+    dedup_columns=('name', 'company'),
+)
+
+INTERNSHIP_SPEC = ImportSpec(
+    entity='application',
+    model=InternshipApplication,
+    columns={
+        'role_name': 'role_name', 'company': 'company', 'application_date': 'application_date',
+        'status': 'status', 'job_link': 'job_link', 'notes': 'notes',
+        'deadline': 'deadline', 'location': 'location',
+    },
+    required=('role_name', 'company', 'application_date'),
+    date_columns=('application_date', 'deadline'),
+    status_enum=InternshipStatus,
+    default_status=InternshipStatus.APPLIED,
+)
+
+
+@dataclass
+class ImportResult:
+    imported: int = 0
+    errors: List[Tuple[int, str]] = field(default_factory=list)  # (CSV line number, message)
+    duplicates: list = field(default_factory=list)  # utils.dedup.DuplicateMatch
+    skipped_duplicates: int = 0
+    elapsed_s: float = 0.0
+
+    def error_messages(self) -> List[str]:
+        return [f"Row {row_num}: {message}" for row_num, message in self.errors]
+
+    def duplicate_messages(self) -> List[str]:
+        messages = []
+        for match in self.duplicates:
+            kind, ref = match.existing_ref
+            other = f"existing contact #{ref}" if kind == 'contact' else f"row {ref}"
+            messages.append(
+                f"Row {match.new_ref[1]}: '{match.name}' ({match.company}) looks like "
+                f"{other} '{match.existing_name}' ({match.score:.0%})"
+            )
+        return messages
+
+
+def normalize_header(header: str) -> str:
+    """'Contact Date' / 'contact_date' / ' Contact-Date ' -> 'contact_date'"""
+    return header.strip().lower().replace(' ', '_').replace('-', '_')
+
+
+def status_lookup(status_enum) -> dict:
+    """Lower-cased enum value and name -> member, built once per import"""
+    lookup = {}
+    for member in status_enum:
+        lookup[member.name.lower()] = member
+        lookup[member.value.lower()] = member
+    return lookup
+
+
+class BulkImporter:
+    """
+    Imports one CSV file according to an ImportSpec
+
+    Rows are parsed a batch at a time and inserted with a single executemany
+    per batch inside one transaction, so an import either lands completely
+    or (on a file error or cancel) not at all. Rows that fail to parse are
+    skipped and reported with their line number. Statistics counters are
+    updated in the same transaction; full-text search rows come from the
+    database triggers.
+    """
+
+    def __init__(self, spec: ImportSpec, batch_size: int = DEFAULT_BATCH_SIZE):
+        self.spec = spec
+        self.batch_size = batch_size
+        self._statuses = status_lookup(spec.status_enum)
+        self._dates = {}  # text -> date; dates repeat a lot in real exports
+
+    def _parse_date(self, text: str) -> date:
+        parsed = self._dates.get(text)
+        if parsed is None:
+            try:
+                parsed = date.fromisoformat(text)
+            except ValueError:
+                parsed = datetime.fromisoformat(text).date()
+            self._dates[text] = parsed
+        return parsed
+
+    def parse_row(self, row: dict, now: datetime) -> dict:
+        """
+        Column values for one CSV row (keys already normalized)
+
+        Raises:
+            ValueError: missing required value or unparsable date
+        """
+        values = {}
+        for header, column in self.spec.columns.items():
+            raw = row.get(header)
+            values[column] = raw.strip() if raw else None
+
+        for column in self.spec.required:
+            if not values.get(column):
+                raise ValueError(f"missing {column}")
+        for column in self.spec.date_columns:
+            if values.get(column):
+                try:
+                    values[column] = self._parse_date(values[column])
+                except ValueError:
+                    raise ValueError(f"invalid date in {column}: {values[column]!r}")
+
+        status = values.get('status')
+        values['status'] = self._statuses.get(status.lower(), self.spec.default_status) if status \
+            else self.spec.default_status
+
+        for column in ('job_title', 'company'):
+            if column in values and values[column] is None:
+                values[column] = ''
+        # Audit columns (AuditMixin); set once here instead of a default call per row
+        values['created_at'] = values['updated_at'] = now
+        return values
+
+    def run(self, csv_path, engine=None,
+            progress: Optional[Callable[[int, int, list], None]] = None,
+            is_cancelled: Optional[Callable[[], bool]] = None,
+            duplicates: str = 'report') -> ImportResult:
+        """
+        Import csv_path
+
+        Args:
+            csv_path: UTF-8 CSV file with a header row
+            engine: SQLAlchemy engine (default: db.session.get_engine())
+            progress: Called after every batch with (rows imported, percent of the file read,
+                errors of this batch as (line, message))
+            is_cancelled: Polled between batches; True rolls the import back
+            duplicates: For specs with dedup_columns: 'report' likely duplicates (of stored
+                records or earlier rows) in ImportResult.duplicates, 'skip' them as well,
+                or 'ignore' to not check
+
+        Returns:
+            ImportResult (errors only lists skipped rows; file errors raise)
+
+        Raises:
+            ImportCancelled: is_cancelled() returned True
+            OSError, csv.Error: the file could not be read
+        """
+        from db.stats_counters import record_bulk_insert
+        from utils.performance import invalidate_tables
+        if engine is None:
+            from db.session import get_engine
+            engine = get_engine()
+
+        started = time.perf_counter()
+        result = ImportResult()
+        table = self.spec.model.__table__
+        statement = insert(table)
+        total_bytes = os.path.getsize(csv_path) or 1
+        now = datetime.now()
+
+        with open(csv_path, 'rb') as raw, engine.begin() as connection:
+            reader = csv.reader(io.TextIOWrapper(raw, encoding='utf-8-sig', newline=''))
+            headers = [normalize_header(h) for h in next(reader, [])]
+
+            dedup_index = None
+            if self.spec.dedup_columns and duplicates != 'ignore':
+                from utils.dedup import load_contact_index
+                dedup_index = load_contact_index(connection)
+                name_column, company_column = self.spec.dedup_columns
+
+            batch, batch_errors = [], []
+            for row_num, fields in enumerate(reader, start=2):
+                if not any(fields):
+                    continue
+                try:
+                    values = self.parse_row(dict(zip(headers, fields)), now)
+                except ValueError as e:
+                    batch_errors.append((row_num, str(e)))
+                else:
+                    match = None
+                    if dedup_index is not None:
+                        match = dedup_index.check_and_add(
+                            ('row', row_num), values[name_column], values[company_column]
+                        )
+                    if match is not None:
+                        result.duplicates.append(match)
+                    if match is not None and duplicates == 'skip':
+                        result.skipped_duplicates += 1
+                    else:
+                        batch.append(values)
+
+                if len(batch) + len(batch_errors) >= self.batch_size:
+                    self._flush(connection, statement, batch, batch_errors, result,
+                                raw.tell() * 100 // total_bytes, progress, is_cancelled,
+                                record_bulk_insert)
+                    batch, batch_errors = [], []
+
+            self._flush(connection, statement, batch, batch_errors, result, 100,
+                        progress, is_cancelled, record_bulk_insert)
+
+        # Core inserts skip the ORM commit events that invalidate cached reads
+        invalidate_tables(table.name)
+
+        result.elapsed_s = time.perf_counter() - started
+        logger.info(
+            f"Imported {result.imported} {self.spec.entity} rows from {csv_path} "
+            f"in {result.elapsed_s:.2f}s ({len(result.errors)} skipped)"
+        )
+        return result
+
+    def _flush(self, connection, statement, batch, batch_errors, result, percent,
+               progress, is_cancelled, record_bulk_insert) -> None:
+        if is_cancelled is not None and is_cancelled():
+            raise ImportCancelled()
+        if batch:
+            connection.execute(statement, batch)
+            record_bulk_insert(connection, self.spec.entity, batch)
+            result.imported += len(batch)
+        result.errors.extend(batch_errors)
+        if progress is not None:
+            progress(result.imported, min(percent, 100), batch_errors)
+
+
+def import_contacts_csv(csv_path, **kwargs) -> ImportResult:
+    """Import networking contacts (see BulkImporter.run for kwargs)"""
+    return BulkImporter(CONTACT_SPEC).run(csv_path, **kwargs)
+
+
+def import_internships_csv(csv_path, **kwargs) -> ImportResult:
+    """Import internship applications (see BulkImporter.run for kwargs)"""
+    return BulkImporter(INTERNSHIP_SPEC).run(csv_path, **kwargs)
@@ -0,0 +1,110 @@
+"""
+Dashboard snapshot service
+Totals, per-status counts, daily histogram and follow-up counts in two queries
+"""
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, Optional
+from sqlalchemy import select, func
+from db.session import get_session
+from db.models import NetworkingContact, NetworkingStatus, InternshipStatus
+from db.stats_counters import read_counters
+from utils.smart_followup import SmartFollowUpService
+from utils.date_helpers import get_last_n_days
+from utils.performance import cached
+
+# Snapshots are dropped from the cache as soon as a contact/application is committed
+SNAPSHOT_TTL = 300
+
+
+# Statuses that close an application
+FINAL_INTERNSHIP_STATUSES = (InternshipStatus.OFFER, InternshipStatus.REJECTED)
+
+
+@dataclass
+class NetworkingSnapshot:
+    """Counts shown on the networking dashboard"""
+    total: int = 0
+    status_counts: Dict[NetworkingStatus, int] = field(default_factory=dict)
+    # Contacts per day over the histogram window, oldest day first
+    daily_counts: Dict[date, int] = field(default_factory=dict)
+    followup_by_status: Dict[NetworkingStatus, int] = field(default_factory=dict)
+    today_count: int = 0
+
+    @property
+    def followup_count(self) -> int:
+        return sum(self.followup_by_status.values())
+
+
+@dataclass
+class InternshipSnapshot:
+    """Counts shown on the internship dashboard"""
+    total: int = 0
+    status_counts: Dict[InternshipStatus, int] = field(default_factory=dict)
+
+    @property
+    def active_count(self) -> int:
+        return self.total - sum(self.status_counts.get(s, 0) for s in FINAL_INTERNSHIP_STATUSES)
+
+
+def _enum_counts(enum_class, counts: Dict[str, int]) -> dict:
+    """Map stored enum names back to members, skipping unknown names"""
+    return {enum_class[name]: count for name, count in counts.items() if name in enum_class.__members__}
+
+
+class DashboardSnapshot:
+    """Loads dashboard numbers in a fixed number of round trips"""
+
+    @staticmethod
+    @cached(ttl=SNAPSHOT_TTL, tags=('contacts', 'settings'),
+            key_func=lambda days=7, today=None: (days, today or date.today()))
+    def networking(days: int = 7, today: Optional[date] = None) -> NetworkingSnapshot:
+        """
+        Networking counts: totals, statuses and days from the stats counters,
+        follow-ups from one indexed query grouped by status
+
+        Args:
+            days: Length of the daily histogram
+            today: Reference date (default: today)
+
+        Returns:
+            NetworkingSnapshot
+        """
+        today = today or date.today()
+        window = get_last_n_days(days, today)
+
+        counters = read_counters('contact', ('total', 'status', 'day'), day_from=window[0])
+        snapshot = NetworkingSnapshot(
+            total=counters['total'].get('', 0),
+            status_counts=_enum_counts(NetworkingStatus, counters['status']),
+            daily_counts={day: counters['day'].get(day.isoformat(), 0) for day in window},
+        )
+        snapshot.today_count = snapshot.daily_counts.get(today, 0)
+
+        session = get_session()
+        try:
+            by_status = session.execute(
+                select(NetworkingContact.status, func.count())
+                .where(SmartFollowUpService.followup_condition(today))
+                .group_by(NetworkingContact.status)
+            )
+            snapshot.followup_by_status = {status: count for status, count in by_status}
+        finally:
+            session.close()
+
+        return snapshot
+
+    @staticmethod
+    @cached(ttl=SNAPSHOT_TTL, tags=('applications',))
+    def internships() -> InternshipSnapshot:
+        """
+        Internship counts from the stats counters
+
+        Returns:
+            InternshipSnapshot
+        """
+        counters = read_counters('application', ('total', 'status'))
+        return InternshipSnapshot(
+            total=counters['total'].get('', 0),
+            status_counts=_enum_counts(InternshipStatus, counters['status']),
+        )
@@ -0,0 +1,141 @@
+"""
+Duplicate contact detection
+Blocks records by normalized company and name trigrams, then scores only the pairs inside a block
+"""
+import re
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Hashable, List, Optional
+from utils.enterprise_validators import InputValidator
+
+# Name similarity (1 - edit distance / length) at which two contacts are reported
+DEFAULT_THRESHOLD = 0.85
+
+_NON_ALNUM = re.compile(r'[^a-z0-9]+')
+
+# Legal-form words dropped from the end of company keys ("Acme Inc" blocks with "Acme")
+_LEGAL_SUFFIXES = {'inc', 'corp', 'co', 'llc', 'ltd', 'plc', 'gmbh', 'sa', 'ag'}
+
+
+def company_key(company: Optional[str]) -> str:
+    """Blocking key: normalized company name without legal suffix, case, spaces or punctuation"""
+    words = _NON_ALNUM.sub(' ', InputValidator.normalize_company_name(company or '').lower()).split()
+    while len(words) > 1 and words[-1] in _LEGAL_SUFFIXES:
+        words.pop()
+    return ''.join(words)
+
+
+def name_key(name: Optional[str]) -> str:
+    """Compared form of a name: lower case, single spaces, no punctuation"""
+    return _NON_ALNUM.sub(' ', (name or '').lower()).strip()
+
+
+def trigrams(text: str) -> set:
+    """Character trigrams of text padded with boundary markers, so short names get some too"""
+    padded = f"##{text}#"
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+@dataclass(frozen=True)
+class DuplicateMatch:
+    """A likely duplicate: the new record and the one it matches"""
+    new_ref: Hashable       # e.g. ('row', CSV line number)
+    existing_ref: Hashable  # e.g. ('contact', id), or ('row', line) of an earlier row of the same file
+    name: str
+    existing_name: str
+    company: str
+    score: float
+
+
+class DuplicateIndex:
+    """
+    Names grouped by company, with a trigram index per company
+
+    A new record is only compared with records of the same company key that
+    share at least one name trigram and whose length is within the allowed
+    edit distance; each of those pairs is scored with a banded edit distance
+    that gives up as soon as the threshold cannot be met. Nothing is ever
+    compared across companies.
+    """
+
+    def __init__(self, threshold: float = DEFAULT_THRESHOLD):
+        self.threshold = threshold
+        self._records = []  # (ref, name, name_key)
+        self._blocks = defaultdict(lambda: defaultdict(list))  # company key -> trigram -> record indexes
+        self._exact = {}  # (company key, name key) -> first record index
+        self.comparisons = 0
+
+    def __len__(self):
+        return len(self._records)
+
+    def add(self, ref: Hashable, name: str, company: str) -> None:
+        key = name_key(name)
+        if not key:
+            return
+        index = len(self._records)
+        self._records.append((ref, name, key))
+        self._exact.setdefault((company_key(company), key), index)
+        block = self._blocks[company_key(company)]
+        for gram in trigrams(key):
+            block[gram].append(index)
+
+    def find(self, name: str, company: str) -> List[tuple]:
+        """
+        Records similar to (name, company), best first; an exact match is returned alone
+
+        Returns:
+            List of (ref, existing name, score)
+        """
+        key = name_key(name)
+        company = company_key(company)
+        block = self._blocks.get(company)
+        if not key or not block:
+            return []
+
+        exact = self._exact.get((company, key))
+        if exact is not None:
+            ref, existing_name, _ = self._records[exact]
+            return [(ref, existing_name, 1.0)]
+
+        shared = Counter()
+        for gram in trigrams(key):
+            for index in block.get(gram, ()):
+                shared[index] += 1
+
+        matches = []
+        for index in shared:
+            ref, existing_name, existing_key = self._records[index]
+            longest = max(len(key), len(existing_key))
+            max_distance = int((1.0 - self.threshold) * longest + 1e-9)
+            if abs(len(key) - len(existing_key)) > max_distance:
+                continue
+            self.comparisons += 1
+            distance = InputValidator.edit_distance_within(key, existing_key, max_distance)
+            if distance is not None:
+                matches.append((ref, existing_name, 1.0 - distance / longest))
+        matches.sort(key=lambda match: -match[2])
+        return matches
+
+    def check_and_add(self, ref: Hashable, name: str, company: str) -> Optional[DuplicateMatch]:
+        """Best match of a new record (or None), then index it for the records after it"""
+        matches = self.find(name, company)
+        self.add(ref, name, company)
+        if not matches:
+            return None
+        existing_ref, existing_name, score = matches[0]
+        return DuplicateMatch(ref, existing_ref, name, existing_name, company, round(score, 3))
+
+
+def load_contact_index(connection, threshold: float = DEFAULT_THRESHOLD) -> DuplicateIndex:
+    """Index of the stored (not deleted) contacts, refs are ('contact', id)"""
+    from sqlalchemy import select
+    from db.models import NetworkingContact
+
+    index = DuplicateIndex(threshold)
+    rows = connection.execute(
+        select(NetworkingContact.id, NetworkingContact.name, NetworkingContact.company)
+        .where(NetworkingContact.is_deleted.is_(False))
+    )
+    for contact_id, name, company in rows:
+        index.add(('contact', contact_id), name, company)
+    return index
@@ -252,33 +252,53 @@ class InputValidator:
         if str1 == str2:
             return 1.0
 
-        # Simple implementation of Levenshtein distance
-        len1, len2 = len(str1), len(str2)
-        if len1 == 0:
-            return len2
-        if len2 == 0:
-            return len1
+        max_len = max(len(str1), len(str2))
+        distance = InputValidator.edit_distance_within(str1, str2, max_len)
 
-        matrix = [[0] * (len2 + 1) for _ in range(len1 + 1)]
+        return 1.0 - (distance / max_len)
 
-        for i in range(len1 + 1):
-            matrix[i][0] = i
-        for j in range(len2 + 1):
-            matrix[0][j] = j
+    @staticmethod
+    def edit_distance_within(str1: str, str2: str, max_distance: int) -> Optional[int]:
+        """
+        Levenshtein distance if it is at most max_distance, else None
 
-        for i in range(1, len1 + 1):
-            for j in range(1, len2 + 1):
-                cost = 0 if str1[i-1] == str2[j-1] else 1
-                matrix[i][j] = min(
-                    matrix[i-1][j] + 1,      # deletion
-                    matrix[i][j-1] + 1,      # insertion
-                    matrix[i-1][j-1] + cost  # substitution
-                )
+        Only the diagonal band of width 2 * max_distance + 1 is computed, and
+        the scan stops as soon as a whole row exceeds max_distance, so
+        rejecting a dissimilar pair costs O(len * max_distance) or less.
+        """
+        if str1 == str2:
+            return 0
+        if abs(len(str1) - len(str2)) > max_distance:
+            return None
+        if len(str1) > len(str2):
+            str1, str2 = str2, str1
 
-        distance = matrix[len1][len2]
-        max_len = max(len1, len2)
+        len1, len2 = len(str1), len(str2)
+        too_far = max_distance + 1
+        previous = [j if j <= max_distance else too_far for j in range(len2 + 1)]
 
-        return 1.0 - (distance / max_len)
+        for i in range(1, len1 + 1):
+            low, high = max(1, i - max_distance), min(len2, i + max_distance)
+            current = [too_far] * (len2 + 1)
+            current[0] = i if i <= max_distance else too_far
+            row_min = current[0]
+            char1 = str1[i - 1]
+
+            for j in range(low, high + 1):
+                value = previous[j - 1] + (char1 != str2[j - 1])  # substitution
+                if previous[j] + 1 < value:
+                    value = previous[j] + 1                        # deletion
+                if current[j - 1] + 1 < value:
+                    value = current[j - 1] + 1                     # insertion
+                current[j] = value
+                if value < row_min:
+                    row_min = value
+
+            if row_min > max_distance:
+                return None
+            previous = current
+
+        return previous[len2] if previous[len2] <= max_distance else None
 
     @staticmethod
     def validate_salary_range(min_salary: Optional[int], max_salary: Optional[int]) -> ValidationResult:
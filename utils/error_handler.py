@@ -10,7 +10,7 @@ from pathlib import Path
 from typing import Optional, Callable, Any
 from functools import wraps
 from dataclasses import dataclass
-import json
+from utils.log_store import JsonLinesLog
 
 
 @dataclass
@@ -48,7 +48,9 @@ class ErrorHandler:
         )
 
         self.logger = logging.getLogger('GTI_Tracker')
-        self.error_log_file = log_dir / 'errors.json'
+        # Append-only, replaces errors.json (imported on first start)
+        self.error_log = JsonLinesLog(log_dir, 'errors', max_segments=4,
+                                      legacy_file=log_dir / 'errors.json')
 
     def generate_error_id(self) -> str:
         """Generate unique error ID"""
@@ -86,17 +88,9 @@ class ErrorHandler:
         return error_id
 
     def _append_to_error_log(self, error_context: ErrorContext):
-        """Append error to JSON log file"""
+        """Append error to the JSON Lines error log (written in the background)"""
         try:
-            # Read existing errors
-            if self.error_log_file.exists():
-                with open(self.error_log_file, 'r') as f:
-                    errors = json.load(f)
-            else:
-                errors = []
-
-            # Append new error
-            errors.append({
+            self.error_log.append({
                 'error_id': error_context.error_id,
                 'timestamp': error_context.timestamp.isoformat(),
                 'type': error_context.error_type,
@@ -104,14 +98,6 @@ class ErrorHandler:
                 'action': error_context.user_action,
                 'state': error_context.system_state
             })
-
-            # Keep only last 1000 errors
-            errors = errors[-1000:]
-
-            # Write back
-            with open(self.error_log_file, 'w') as f:
-                json.dump(errors, f, indent=2)
-
         except Exception as e:
             self.logger.error(f"Failed to write to error log: {e}")
 
@@ -260,60 +246,43 @@ def retry_on_failure(max_retries: int = 3, delay: float = 1.0,
 
 
 class OperationLogger:
-    """Log user operations for audit trail"""
-
-    def __init__(self, log_dir: Path = None):
-        if log_dir is None:
-            log_dir = Path.home() / '.gti_tracker' / 'logs'
-
-        log_dir.mkdir(parents=True, exist_ok=True)
-        self.activity_log = log_dir / 'user_activity.json'
+    """Log user operations for audit trail (activity_log table, see db.activity_log)"""
 
     def log_action(self, action: str, entity_type: str, entity_id: int = None,
                    details: dict = None):
-        """Log a user action"""
-        try:
-            # Read existing log
-            if self.activity_log.exists():
-                with open(self.activity_log, 'r') as f:
-                    activities = json.load(f)
-            else:
-                activities = []
-
-            # Add new activity
-            activity = {
-                'timestamp': datetime.now().isoformat(),
-                'action': action,
-                'entity_type': entity_type,
-                'entity_id': entity_id,
-                'details': details or {}
-            }
-
-            activities.append(activity)
-
-            # Keep only last 10000 activities
-            activities = activities[-10000:]
-
-            # Write back
-            with open(self.activity_log, 'w') as f:
-                json.dump(activities, f, indent=2)
+        """
+        Log a user action (buffered; inserted in batches in the background)
 
+        Args:
+            action: ActivityType name, e.g. 'ADDED_CONTACT'
+            entity_type: EntityType name or model class name, e.g. 'NetworkingContact'
+            entity_id: Primary key of the entity
+            details: Extra context stored as JSON
+        """
+        try:
+            from db.activity_log import activity_writer
+            activity_writer.record(action, entity_type, entity_id, details)
         except Exception as e:
             error_handler.logger.error(f"Failed to log activity: {e}")
 
     def get_recent_activities(self, limit: int = 50) -> list:
-        """Get recent user activities"""
+        """Get recent user activities, oldest first"""
         try:
-            if not self.activity_log.exists():
-                return []
+            from db.activity_log import get_recent_activities
+            return list(reversed(get_recent_activities(limit)))
 
-            with open(self.activity_log, 'r') as f:
-                activities = json.load(f)
+        except Exception as e:
+            error_handler.logger.error(f"Failed to read activities: {e}")
+            return []
 
-            return activities[-limit:]
+    def get_timeline(self, entity_type: str, entity_id: int, limit: int = 100) -> list:
+        """Get the activities of one entity, newest first"""
+        try:
+            from db.activity_log import get_entity_timeline
+            return get_entity_timeline(entity_type, entity_id, limit)
 
         except Exception as e:
-            error_handler.logger.error(f"Failed to read activities: {e}")
+            error_handler.logger.error(f"Failed to read timeline: {e}")
             return []
 
 
@@ -0,0 +1,243 @@
+"""
+Streaming export engine
+Writes selected columns of contacts or applications as CSV, TSV or JSON Lines without loading all rows
+"""
+import csv
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass
+from datetime import date, datetime
+from enum import Enum
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional, Sequence
+from sqlalchemy import func, select
+from db.models import NetworkingContact, InternshipApplication
+
+logger = logging.getLogger('GTI_Tracker.Export')
+
+# Rows fetched from the cursor per batch (yield_per)
+DEFAULT_BATCH_SIZE = 1000
+
+# Format name -> (description, default extension)
+FORMATS = {
+    'csv': ("CSV Files", '.csv'),
+    'tsv': ("Tab-separated Files", '.tsv'),
+    'jsonl': ("JSON Lines Files", '.jsonl'),
+}
+
+_FORMAT_BY_EXTENSION = {'.csv': 'csv', '.tsv': 'tsv', '.txt': 'tsv', '.jsonl': 'jsonl', '.json': 'jsonl'}
+
+
+class ExportCancelled(Exception):
+    """Raised when the caller cancels; the target file is left untouched"""
+
+
+@dataclass(frozen=True)
+class ExportColumn:
+    key: str             # JSON Lines field name
+    header: str          # CSV/TSV header (matches the import layout)
+    column: object       # ORM attribute selected
+    default: bool = True  # selected unless the user unticks it
+
+
+CONTACT_COLUMNS = [
+    ExportColumn('name', 'Name', NetworkingContact.name),
+    ExportColumn('job_title', 'Job Title', NetworkingContact.job_title),
+    ExportColumn('company', 'Company', NetworkingContact.company),
+    ExportColumn('contact_date', 'Contact Date', NetworkingContact.contact_date),
+    ExportColumn('status', 'Status', NetworkingContact.status),
+    ExportColumn('relevant_info', 'Relevant Info', NetworkingContact.relevant_info),
+    ExportColumn('email', 'Email', NetworkingContact.email, default=False),
+    ExportColumn('linkedin_url', 'LinkedIn URL', NetworkingContact.linkedin_url, default=False),
+    ExportColumn('phone', 'Phone', NetworkingContact.phone, default=False),
+    ExportColumn('id', 'ID', NetworkingContact.id, default=False),
+    ExportColumn('updated_at', 'Last Updated', NetworkingContact.updated_at, default=False),
+]
+
+INTERNSHIP_COLUMNS = [
+    ExportColumn('role_name', 'Role Name', InternshipApplication.role_name),
+    ExportColumn('company', 'Company', InternshipApplication.company),
+    ExportColumn('application_date', 'Application Date', InternshipApplication.application_date),
+    ExportColumn('status', 'Status', InternshipApplication.status),
+    ExportColumn('job_link', 'Job Link', InternshipApplication.job_link),
+    ExportColumn('notes', 'Notes', InternshipApplication.notes),
+    ExportColumn('contact_id', 'Contact ID', InternshipApplication.contact_id, default=False),
+    ExportColumn('deadline', 'Deadline', InternshipApplication.deadline, default=False),
+    ExportColumn('location', 'Location', InternshipApplication.location, default=False),
+    ExportColumn('id', 'ID', InternshipApplication.id, default=False),
+    ExportColumn('updated_at', 'Last Updated', InternshipApplication.updated_at, default=False),
+]
+
+
+@dataclass
+class ExportResult:
+    rows: int
+    path: Path
+    elapsed_s: float
+
+
+def format_for_path(path) -> str:
+    """Export format implied by the file extension (CSV if unknown)"""
+    return _FORMAT_BY_EXTENSION.get(Path(path).suffix.lower(), 'csv')
+
+
+def file_filter() -> str:
+    """QFileDialog filter string listing every format"""
+    return ";;".join(f"{description} (*{extension})" for description, extension in FORMATS.values())
+
+
+def select_columns(available: Sequence[ExportColumn], keys: Optional[Sequence[str]] = None) -> List[ExportColumn]:
+    """
+    Columns to export, in the order of keys (default: the default columns)
+
+    Raises:
+        ValueError: unknown column key
+    """
+    if keys is None:
+        return [column for column in available if column.default]
+    by_key = {column.key: column for column in available}
+    unknown = [key for key in keys if key not in by_key]
+    if unknown:
+        raise ValueError(f"Unknown export columns: {', '.join(unknown)}")
+    return [by_key[key] for key in keys]
+
+
+def _plain(value):
+    """JSON-friendly form of a column value"""
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+class _DelimitedWriter:
+    def __init__(self, f, columns, dialect):
+        self.writer = csv.writer(f, dialect=dialect)
+        self.writer.writerow([column.header for column in columns])
+
+    def write(self, rows):
+        self.writer.writerows(
+            ['' if value is None else _plain(value) for value in row] for row in rows
+        )
+
+
+class _JsonLinesWriter:
+    def __init__(self, f, columns):
+        self.f = f
+        self.keys = [column.key for column in columns]
+
+    def write(self, rows):
+        self.f.write(''.join(
+            json.dumps(dict(zip(self.keys, map(_plain, row))), ensure_ascii=False) + '\n' for row in rows
+        ))
+
+
+def write_batches(columns: Sequence[ExportColumn], path, fmt: str, batches: Iterable[Sequence[tuple]],
+                  total: int = 0, progress: Optional[Callable[[int, int], None]] = None,
+                  is_cancelled: Optional[Callable[[], bool]] = None) -> int:
+    """
+    Write batches of row tuples (values in column order) to path in fmt
+
+    The file is written under a temporary name and moved into place at the
+    end, so a failed or cancelled export leaves the target untouched.
+
+    Args:
+        total: Expected row count, for progress percentages
+
+    Returns:
+        Rows written
+
+    Raises:
+        ExportCancelled: is_cancelled() returned True
+    """
+    path = Path(path)
+    partial_path = path.with_name(f".{path.name}.partial")
+    written = 0
+    try:
+        with open(partial_path, 'w', newline='', encoding='utf-8') as f:
+            if fmt == 'jsonl':
+                writer = _JsonLinesWriter(f, columns)
+            else:
+                writer = _DelimitedWriter(f, columns, 'excel-tab' if fmt == 'tsv' else 'excel')
+
+            for rows in batches:
+                if is_cancelled is not None and is_cancelled():
+                    raise ExportCancelled()
+                writer.write(rows)
+                written += len(rows)
+                if progress is not None:
+                    progress(written, written * 100 // total if total else 100)
+
+        os.replace(partial_path, path)
+    finally:
+        if partial_path.exists():
+            partial_path.unlink()
+    return written
+
+
+def export_rows(columns: Sequence[ExportColumn], path, fmt: Optional[str] = None,
+                where=None, order_by=None, engine=None,
+                progress: Optional[Callable[[int, int], None]] = None,
+                is_cancelled: Optional[Callable[[], bool]] = None,
+                batch_size: int = DEFAULT_BATCH_SIZE) -> ExportResult:
+    """
+    Stream the selected columns of one table to path
+
+    Rows come from a server-side cursor (yield_per) and are written batch by
+    batch, so memory does not grow with the table. The file is written under a
+    temporary name and moved into place at the end.
+
+    Args:
+        columns: Columns to write (all from the same table)
+        path: Target file
+        fmt: 'csv', 'tsv' or 'jsonl' (default: from the extension)
+        where: Optional SQLAlchemy filter
+        order_by: Optional ordering (default: primary key)
+        engine: SQLAlchemy engine (default: db.session.get_engine())
+        progress: Called after every batch with (rows written, percent)
+        is_cancelled: Polled between batches; True abandons the export
+
+    Raises:
+        ExportCancelled: is_cancelled() returned True
+        ValueError: unknown format or no columns
+    """
+    if engine is None:
+        from db.session import get_engine
+        engine = get_engine()
+    if not columns:
+        raise ValueError("No columns selected")
+    fmt = fmt or format_for_path(path)
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown export format '{fmt}'")
+
+    started = time.perf_counter()
+    path = Path(path)
+    table = columns[0].column.class_.__table__
+    query = select(*[column.column for column in columns])
+    count_query = select(func.count()).select_from(table)
+    if where is not None:
+        query = query.where(where)
+        count_query = count_query.where(where)
+    query = query.order_by(*(order_by if order_by is not None else table.primary_key.columns))
+
+    with engine.connect() as connection:
+        total = connection.execute(count_query).scalar() or 0
+        result = connection.execution_options(yield_per=batch_size).execute(query)
+        written = write_batches(columns, path, fmt, result.partitions(), total, progress, is_cancelled)
+
+    elapsed = time.perf_counter() - started
+    logger.info(f"Exported {written} rows of {table.name} to {path} ({fmt}) in {elapsed:.2f}s")
+    return ExportResult(written, path, elapsed)
+
+
+def export_contacts(path, column_keys: Optional[Sequence[str]] = None, **kwargs) -> ExportResult:
+    """Export networking contacts (see export_rows for kwargs)"""
+    return export_rows(select_columns(CONTACT_COLUMNS, column_keys), path, **kwargs)
+
+
+def export_internships(path, column_keys: Optional[Sequence[str]] = None, **kwargs) -> ExportResult:
+    """Export internship applications (see export_rows for kwargs)"""
+    return export_rows(select_columns(INTERNSHIP_COLUMNS, column_keys), path, **kwargs)
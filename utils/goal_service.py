@@ -1,46 +1,39 @@
 """
 Goal Tracking Service for daily contact goals
 """
-from datetime import date
-from db.session import get_session
-from db.models import NetworkingContact, Settings
-from sqlalchemy import func
+from collections import namedtuple
+from typing import Optional
+from utils.settings_store import settings_store
+from utils.dashboard_snapshot import DashboardSnapshot, NetworkingSnapshot
+
+
+GoalStatus = namedtuple('GoalStatus', ['goal', 'today_count', 'remaining', 'percentage'])
 
 
 class GoalTrackingService:
-    
+
     @staticmethod
     def get_daily_goal() -> int:
-        session = get_session()
-        try:
-            settings = session.query(Settings).filter_by(id=1).first()
-            return settings.daily_goal if (settings and hasattr(settings, 'daily_goal')) else 3
-        finally:
-            session.close()
-    
+        return settings_store.daily_goal()
+
     @staticmethod
-    def get_today_count() -> int:
-        session = get_session()
-        try:
-            today = date.today()
-            count = session.query(NetworkingContact).filter(
-                func.date(NetworkingContact.contact_date) == today
-            ).count()
-            return count
-        finally:
-            session.close()
-    
+    def get_today_count(snapshot: Optional[NetworkingSnapshot] = None) -> int:
+        if snapshot is None:
+            snapshot = DashboardSnapshot.networking(days=1)
+        return snapshot.today_count
+
     @staticmethod
-    def get_remaining_today() -> int:
+    def get_goal_status(snapshot: Optional[NetworkingSnapshot] = None) -> GoalStatus:
+        """Goal, today's count, remaining and progress from one settings read"""
         goal = GoalTrackingService.get_daily_goal()
-        today_count = GoalTrackingService.get_today_count()
-        remaining = goal - today_count
-        return max(0, remaining)
-    
+        today_count = GoalTrackingService.get_today_count(snapshot)
+        percentage = 100.0 if goal == 0 else min(100.0, (today_count / goal) * 100)
+        return GoalStatus(goal, today_count, max(0, goal - today_count), percentage)
+
     @staticmethod
-    def get_progress_percentage() -> float:
-        goal = GoalTrackingService.get_daily_goal()
-        if goal == 0:
-            return 100.0
-        today_count = GoalTrackingService.get_today_count()
-        return min(100.0, (today_count / goal) * 100)
+    def get_remaining_today(snapshot: Optional[NetworkingSnapshot] = None) -> int:
+        return GoalTrackingService.get_goal_status(snapshot).remaining
+
+    @staticmethod
+    def get_progress_percentage(snapshot: Optional[NetworkingSnapshot] = None) -> float:
+        return GoalTrackingService.get_goal_status(snapshot).percentage
@@ -0,0 +1,189 @@
+"""
+Append-only JSON Lines log
+Records are queued in O(1) and written in batches by a background thread into size-rotated segments
+"""
+import atexit
+import json
+import logging
+import os
+import queue
+import threading
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger('GTI_Tracker.LogStore')
+
+# Bytes read per step when scanning a segment backwards for its last lines
+_TAIL_BLOCK_SIZE = 64 * 1024
+
+# Most records written per batch
+_MAX_BATCH = 1000
+
+
+class JsonLinesLog:
+    """
+    One record per line in <name>.jsonl, rotated to <name>.<n>.jsonl by size
+
+    append() only puts the record on a queue; a daemon thread drains the queue
+    and writes everything waiting in one write and flush, so callers on the
+    GUI thread never touch the disk. A crash loses at most the records still
+    queued, never earlier lines; a torn last line is skipped when reading.
+    """
+
+    def __init__(self, directory: Path, name: str, max_segment_bytes: int = 1024 * 1024,
+                 max_segments: int = 8, legacy_file: Optional[Path] = None):
+        """
+        Args:
+            directory: Directory holding the segments
+            name: Segment file prefix, e.g. 'user_activity'
+            max_segment_bytes: Size at which the current segment is rotated
+            max_segments: Segments kept, including the current one
+            legacy_file: JSON array written by earlier versions, imported once
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.name = name
+        self.max_segment_bytes = max_segment_bytes
+        self.max_segments = max_segments
+        self.current_path = self.directory / f"{name}.jsonl"
+
+        self._queue = queue.Queue()
+        self._file_lock = threading.Lock()
+        self._start_lock = threading.Lock()
+        self._thread = None
+
+        if legacy_file is not None and Path(legacy_file).exists():
+            self._import_legacy(Path(legacy_file))
+
+    def append(self, record: dict) -> None:
+        """Queue a record for writing (O(1), never blocks on I/O)"""
+        if self._thread is None:
+            self._start()
+        self._queue.put(record)
+
+    def flush(self) -> None:
+        """Block until every record appended so far is on disk"""
+        if self._thread is not None:
+            self._queue.join()
+
+    def close(self) -> None:
+        """Write the remaining records and stop the writer thread"""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+
+    def _start(self) -> None:
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name=f'GTI_Tracker.LogStore.{self.name}', daemon=True
+                )
+                self._thread.start()
+                atexit.register(self.close)
+
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            # What is already waiting goes into the same write (bounded, so
+            # segments still rotate close to max_segment_bytes)
+            while len(batch) < _MAX_BATCH:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            stop = None in batch
+            records = [record for record in batch if record is not None]
+            try:
+                if records:
+                    self._write(records)
+            except Exception as e:
+                logger.error(f"Failed to write {len(records)} records to {self.current_path}: {e}")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if stop:
+                return
+
+    def _write(self, records: list) -> None:
+        data = ''.join(json.dumps(record, default=str) + '\n' for record in records).encode('utf-8')
+        with self._file_lock:
+            with open(self.current_path, 'ab') as f:
+                f.write(data)
+                size = f.tell()
+            if size >= self.max_segment_bytes:
+                self._rotate()
+
+    def _segments(self) -> list:
+        """Rotated segments as (number, path), oldest first"""
+        segments = []
+        for path in self.directory.glob(f"{self.name}.*.jsonl"):
+            number = path.name[len(self.name) + 1:-len('.jsonl')]
+            if number.isdigit():
+                segments.append((int(number), path))
+        return sorted(segments)
+
+    def _rotate(self) -> None:
+        segments = self._segments()
+        next_number = segments[-1][0] + 1 if segments else 1
+        os.replace(self.current_path, self.directory / f"{self.name}.{next_number}.jsonl")
+        segments.append((next_number, None))
+
+        # The current segment counts towards max_segments
+        for _, path in segments[:max(0, len(segments) - (self.max_segments - 1))]:
+            path.unlink(missing_ok=True)
+
+    def tail(self, limit: int = 50) -> list:
+        """
+        The last limit records, oldest first
+
+        Reads the newest segments backwards block by block, so the cost depends
+        on limit, not on the size of the log. Queued records are flushed first.
+        """
+        self.flush()
+        with self._file_lock:
+            paths = [self.current_path] + [path for _, path in reversed(self._segments())]
+            lines = []
+            for path in paths:
+                if len(lines) >= limit:
+                    break
+                if path.exists():
+                    lines = _read_last_lines(path, limit - len(lines)) + lines
+
+        records = []
+        for line in lines:
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                continue  # torn write from a crash
+        return records[-limit:]
+
+    def _import_legacy(self, legacy_file: Path) -> None:
+        try:
+            with open(legacy_file, 'r') as f:
+                records = json.load(f)
+            self._write(records)
+            legacy_file.replace(legacy_file.with_name(legacy_file.name + '.imported'))
+            logger.info(f"Imported {len(records)} records from {legacy_file.name}")
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not import {legacy_file}: {e}")
+
+
+def _read_last_lines(path: Path, count: int) -> list:
+    """Last count non-empty lines of a file, decoded, oldest first"""
+    if count <= 0:
+        return []
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        buffer = b''
+        while position > 0 and buffer.count(b'\n') <= count:
+            step = min(_TAIL_BLOCK_SIZE, position)
+            position -= step
+            f.seek(position)
+            buffer = f.read(step) + buffer
+    lines = [line for line in buffer.split(b'\n') if line.strip()]
+    if position > 0:
+        lines = lines[1:]  # first line may be cut off
+    return [line.decode('utf-8', errors='replace') for line in lines[-count:]]
@@ -0,0 +1,407 @@
+"""
+Company and contact lookup index
+Company names and contact labels held in memory for the dialog completers, kept current by ORM events
+"""
+import bisect
+import logging
+import re
+import threading
+from collections import namedtuple
+from typing import Callable, List, Optional
+
+logger = logging.getLogger('GTI_Tracker.LookupIndex')
+
+# Suggestions returned per keystroke
+MAX_SUGGESTIONS = 50
+
+# global_cache tags of the indexed tables; a version change not applied by
+# this module (Core import, bulk delete, data reset) forces a rebuild
+INDEX_TAGS = ('contacts', 'applications')
+
+# session.info keys of the changes collected during a transaction
+_PENDING_KEY = 'lookup_index_changes'
+_VERSION_KEY = 'lookup_index_version'
+
+# A linked-contact choice: label is "name – job title @ company"
+ContactEntry = namedtuple('ContactEntry', ['id', 'name', 'job_title', 'company', 'label'])
+
+
+def contact_label(name: Optional[str], job_title: Optional[str], company: Optional[str]) -> str:
+    return f"{name} – {job_title} @ {company}"
+
+
+def _key(text: str) -> str:
+    # Newlines separate the keys in SortedKeys' joined text
+    return text.casefold().replace('\n', ' ')
+
+
+class SortedKeys:
+    """
+    (casefolded text, payload) pairs kept sorted, with ranked lookup
+
+    Prefix matches come first (found by bisection), then keys with a word
+    starting with the query, then keys containing it, then keys containing
+    its characters in order ("gogl" finds "google"). The last three are
+    regular expression scans over all keys joined into one text, built with
+    the keys and again on the first lookup after a change.
+    """
+
+    def __init__(self, pairs=()):
+        self.items = sorted((_key(text), payload) for text, payload in pairs)
+        self._text = None
+        self._starts = None
+        self._joined()
+
+    def __len__(self):
+        return len(self.items)
+
+    def add(self, text: str, payload) -> None:
+        bisect.insort(self.items, (_key(text), payload))
+        self._text = None
+
+    def remove(self, text: str, payload) -> None:
+        item = (_key(text), payload)
+        position = bisect.bisect_left(self.items, item)
+        if position < len(self.items) and self.items[position] == item:
+            del self.items[position]
+            self._text = None
+
+    def payloads(self) -> list:
+        return [payload for _, payload in self.items]
+
+    def _joined(self) -> tuple:
+        """All keys joined by newlines, and the offset where each one starts"""
+        if self._text is None:
+            starts, offset = [], 0
+            for key, _ in self.items:
+                starts.append(offset)
+                offset += len(key) + 1
+            self._text = '\n'.join(key for key, _ in self.items)
+            self._starts = starts
+        return self._text, self._starts
+
+    def match(self, query: str, limit: int = MAX_SUGGESTIONS, accept: Optional[Callable] = None) -> list:
+        """
+        Payloads of the keys matching query, best matches first
+
+        Args:
+            query: Text typed so far
+            limit: Maximum number of payloads returned
+            accept: Optional filter on payloads
+        """
+        query = _key(query.strip())
+        items = self.items
+        results = []
+        if not query:
+            for _, payload in items:
+                if accept is None or accept(payload):
+                    results.append(payload)
+                    if len(results) >= limit:
+                        break
+            return results
+
+        seen = set()
+        position = bisect.bisect_left(items, (query,))
+        while position < len(items) and items[position][0].startswith(query):
+            seen.add(position)
+            payload = items[position][1]
+            if accept is None or accept(payload):
+                results.append(payload)
+                if len(results) >= limit:
+                    return results
+            position += 1
+
+        text, starts = self._joined()
+        escaped = re.escape(query)
+        subsequence = '[^\n]*?'.join(re.escape(char) for char in query if not char.isspace())
+        for pattern in (' ' + escaped, escaped, subsequence):
+            for found in re.finditer(pattern, text):
+                line = bisect.bisect_right(starts, found.start()) - 1
+                if line in seen:
+                    continue
+                seen.add(line)
+                payload = items[line][1]
+                if accept is None or accept(payload):
+                    results.append(payload)
+                    if len(results) >= limit:
+                        return results
+        return results
+
+
+class LookupIndex:
+    """
+    Distinct companies (with row counts per table) and all contacts, sorted
+
+    Built from the database on first use; afterwards inserts, updates and
+    deletes made through the ORM are applied when their session commits, so
+    opening a dialog never scans the tables again. Writes that bypass the
+    mapper events (Core inserts, query.delete(), restores) show up as a
+    changed version of INDEX_TAGS in utils.performance.global_cache, and the
+    next read rebuilds. Safe to call from loader threads.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._version = None
+        # company -> [contacts, applications] rows naming it
+        self._company_counts = {}
+        self._companies = SortedKeys()      # payload: company name
+        self._contacts = {}                 # id -> ContactEntry
+        self._contact_keys = SortedKeys()   # payload: contact id, by label
+        self._application_companies = {}    # id -> company
+        self.builds = 0
+
+    # Building
+
+    def _current_version(self) -> tuple:
+        from utils.performance import global_cache
+        return global_cache.tag_version(INDEX_TAGS)
+
+    def _ensure_current(self) -> None:
+        version = self._current_version()
+        with self._lock:
+            if self._version != version:
+                self._build(version)
+
+    def _build(self, version: tuple) -> None:
+        from sqlalchemy import select
+        from db.models import NetworkingContact, InternshipApplication
+        from db.session import get_engine
+        from utils.performance import perf_monitor
+
+        with perf_monitor.span('lookup_index.build'), get_engine().connect() as connection:
+            contacts = connection.execute(select(
+                NetworkingContact.id, NetworkingContact.name,
+                NetworkingContact.job_title, NetworkingContact.company
+            )).all()
+            applications = connection.execute(select(
+                InternshipApplication.id, InternshipApplication.company
+            )).all()
+
+        self._company_counts = {}
+        self._contacts = {}
+        for contact_id, name, job_title, company in contacts:
+            self._contacts[contact_id] = ContactEntry(
+                contact_id, name, job_title, company, contact_label(name, job_title, company)
+            )
+            if company:
+                self._company_counts.setdefault(company, [0, 0])[0] += 1
+        self._application_companies = dict(applications)
+        for company in self._application_companies.values():
+            if company:
+                self._company_counts.setdefault(company, [0, 0])[1] += 1
+
+        self._companies = SortedKeys((company, company) for company in self._company_counts)
+        self._contact_keys = SortedKeys((entry.label, entry.id) for entry in self._contacts.values())
+        self._version = version
+        self.builds += 1
+        logger.info(f"Lookup index built: {len(self._contacts):,} contacts, "
+                    f"{len(self._companies):,} companies")
+
+    def invalidate(self) -> None:
+        """Rebuild on the next read"""
+        with self._lock:
+            self._version = None
+
+    def warm_in_background(self) -> threading.Thread:
+        """Build the index on a daemon thread so the first dialog opens without waiting"""
+        thread = threading.Thread(target=self._warm, name='GTI_Tracker.LookupIndex', daemon=True)
+        thread.start()
+        return thread
+
+    def _warm(self) -> None:
+        try:
+            self._ensure_current()
+        except Exception:
+            logger.exception("Building the lookup index failed")
+
+    # Incremental updates
+
+    def _add_company(self, company: Optional[str], column: int) -> None:
+        if not company:
+            return
+        counts = self._company_counts.get(company)
+        if counts is None:
+            counts = self._company_counts[company] = [0, 0]
+            self._companies.add(company, company)
+        counts[column] += 1
+
+    def _remove_company(self, company: Optional[str], column: int) -> None:
+        counts = self._company_counts.get(company) if company else None
+        if counts is None:
+            return
+        counts[column] -= 1
+        if counts[0] <= 0 and counts[1] <= 0:
+            del self._company_counts[company]
+            self._companies.remove(company, company)
+
+    def _remove_contact(self, contact_id: int) -> None:
+        entry = self._contacts.pop(contact_id, None)
+        if entry is None:
+            return
+        self._remove_company(entry.company, 0)
+        self._contact_keys.remove(entry.label, contact_id)
+
+    def _set_contact(self, contact_id: int, values: Optional[tuple]) -> None:
+        self._remove_contact(contact_id)
+        if values is None:
+            return
+        name, job_title, company = values
+        entry = ContactEntry(contact_id, name, job_title, company, contact_label(name, job_title, company))
+        self._contacts[contact_id] = entry
+        self._add_company(company, 0)
+        self._contact_keys.add(entry.label, contact_id)
+
+    def _set_application(self, application_id: int, values: Optional[tuple]) -> None:
+        if application_id in self._application_companies:
+            self._remove_company(self._application_companies.pop(application_id), 1)
+        if values is None:
+            return
+        company, = values
+        self._application_companies[application_id] = company
+        self._add_company(company, 1)
+
+    def apply(self, changes: list, since_version: tuple) -> bool:
+        """
+        Apply committed row changes
+
+        Args:
+            changes: ('contact', id, (name, job_title, company)) and
+                ('application', id, (company,)) in commit order; None for deleted rows
+            since_version: INDEX_TAGS version before the transaction
+
+        Returns:
+            False if the index was not built from since_version (it rebuilds
+            on the next read instead)
+        """
+        with self._lock:
+            if self._version is None or self._version != since_version:
+                return False
+            for entity, row_id, values in changes:
+                if entity == 'contact':
+                    self._set_contact(row_id, values)
+                else:
+                    self._set_application(row_id, values)
+            self._version = self._current_version()
+            return True
+
+    # Reads
+
+    def companies(self, include_applications: bool = False) -> List[str]:
+        """Distinct company names of contacts (and applications), sorted case-insensitively"""
+        self._ensure_current()
+        with self._lock:
+            return [company for company in self._companies.payloads()
+                    if include_applications or self._company_counts[company][0]]
+
+    def suggest_companies(self, text: str, include_applications: bool = False,
+                          limit: int = MAX_SUGGESTIONS) -> List[str]:
+        """Company names matching text (see SortedKeys.match)"""
+        self._ensure_current()
+        with self._lock:
+            counts = self._company_counts
+            accept = None if include_applications else (lambda company: counts[company][0] > 0)
+            return self._companies.match(text, limit, accept)
+
+    def contacts(self) -> tuple:
+        """Every contact as a ContactEntry, sorted by label"""
+        self._ensure_current()
+        with self._lock:
+            return tuple(self._contacts[contact_id] for contact_id in self._contact_keys.payloads())
+
+    def suggest_contacts(self, text: str, limit: int = MAX_SUGGESTIONS) -> List[ContactEntry]:
+        """Contacts whose label (name, job title, company) matches text (see SortedKeys.match)"""
+        self._ensure_current()
+        with self._lock:
+            return [self._contacts[contact_id]
+                    for contact_id in self._contact_keys.match(text, limit)]
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            return {
+                'built': self._version is not None,
+                'builds': self.builds,
+                'contacts': len(self._contacts),
+                'companies': len(self._companies),
+            }
+
+
+# Global lookup index
+lookup_index = LookupIndex()
+
+
+def _record(target, change: tuple) -> None:
+    """Queue a row change on the owning session; applied when it commits"""
+    from sqlalchemy.orm import Session
+
+    session = Session.object_session(target)
+    if session is None:
+        return
+    if _VERSION_KEY not in session.info:
+        session.info[_VERSION_KEY] = lookup_index._current_version()
+    session.info.setdefault(_PENDING_KEY, []).append(change)
+
+
+def _after_contact_write(mapper, connection, target):
+    _record(target, ('contact', target.id, (target.name, target.job_title, target.company)))
+
+
+def _after_contact_delete(mapper, connection, target):
+    _record(target, ('contact', target.id, None))
+
+
+def _after_application_write(mapper, connection, target):
+    _record(target, ('application', target.id, (target.company,)))
+
+
+def _after_application_delete(mapper, connection, target):
+    _record(target, ('application', target.id, None))
+
+
+def _after_bulk_change(orm_execute_state):
+    """
+    session.execute(update/delete(Model)) and query.update()/delete() skip
+    the mapper events: rebuild after the commit instead
+    """
+    from db.models import NetworkingContact, InternshipApplication
+
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None and mapper.class_ in (NetworkingContact, InternshipApplication):
+        orm_execute_state.session.info[_VERSION_KEY] = None
+
+
+def _apply_committed(session):
+    changes = session.info.pop(_PENDING_KEY, None)
+    since_version = session.info.pop(_VERSION_KEY, None)
+    if changes:
+        lookup_index.apply(changes, since_version)
+
+
+def _discard_changes(session, previous_transaction=None):
+    session.info.pop(_PENDING_KEY, None)
+    session.info.pop(_VERSION_KEY, None)
+
+
+def register_lookup_index() -> None:
+    """
+    Keep lookup_index current on ORM commits (idempotent)
+
+    Register after utils.performance.register_cache_invalidation(): the
+    index adopts the tag version the cache sets on the same commit.
+    """
+    from sqlalchemy import event
+    from sqlalchemy.orm import Session
+    from db.models import NetworkingContact, InternshipApplication
+
+    if event.contains(Session, 'after_commit', _apply_committed):
+        return
+    for event_name in ('after_insert', 'after_update'):
+        event.listen(NetworkingContact, event_name, _after_contact_write)
+        event.listen(InternshipApplication, event_name, _after_application_write)
+    event.listen(NetworkingContact, 'after_delete', _after_contact_delete)
+    event.listen(InternshipApplication, 'after_delete', _after_application_delete)
+    event.listen(Session, 'do_orm_execute', _after_bulk_change)
+    event.listen(Session, 'after_commit', _apply_committed)
+    event.listen(Session, 'after_rollback', _discard_changes)
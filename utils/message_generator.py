@@ -1,55 +1,244 @@
 """
 Message generation utilities
+Templates are compiled once into literal/placeholder segments; batches stream from the database
 """
-from typing import Optional
-from db.models import NetworkingContact, Settings
-from db.session import get_session
+import re
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple
+from db.models import NetworkingContact
+from utils.settings_store import settings_store, SettingsSnapshot
+
+# {name}-style placeholders; anything else in braces is left as typed
+_PLACEHOLDER_RE = re.compile(r'\{(\w+)\}')
+
+# Contacts rendered per database round trip in the batch API
+MESSAGE_BATCH_SIZE = 1000
+
+# Between messages copied to the clipboard
+MESSAGE_SEPARATOR = "\n\n" + "-" * 40 + "\n\n"
+
+
+@dataclass(frozen=True)
+class CompiledTemplate:
+    """
+    A message template split into literal text and placeholder names
+
+    segments alternates literal, placeholder, literal, ...: even positions
+    are text, odd positions are keys of the values passed to render().
+    """
+    source: str
+    segments: Tuple[str, ...]
+    unknown_placeholders: Tuple[str, ...]
+
+    def render(self, values: dict) -> str:
+        parts = list(self.segments)
+        for i in range(1, len(parts), 2):
+            parts[i] = values.get(parts[i], '')
+        return ''.join(parts)
+
+
+@lru_cache(maxsize=16)
+def compile_template(template: str) -> CompiledTemplate:
+    """
+    Parse a message template once (cached by template text)
+
+    Placeholders not in get_template_placeholders() stay in the output as
+    typed and are listed in unknown_placeholders.
+    """
+    known = {placeholder.strip('{}') for placeholder in get_template_placeholders()}
+    segments, unknown = [], []
+    position = 0
+    literal = ''
+    for match in _PLACEHOLDER_RE.finditer(template):
+        literal += template[position:match.start()]
+        position = match.end()
+        key = match.group(1)
+        if key in known:
+            segments.extend((literal, key))
+            literal = ''
+        else:
+            literal += match.group(0)
+            if key not in unknown:
+                unknown.append(key)
+    segments.append(literal + template[position:])
+    return CompiledTemplate(template, tuple(segments), tuple(unknown))
+
+
+def validate_template(template: str) -> List[str]:
+    """
+    Placeholders of a template that are not in get_template_placeholders()
+
+    Returns:
+        Placeholders as typed (e.g. ['{firstname}']), empty if the template is valid
+    """
+    return [f"{{{key}}}" for key in compile_template(template).unknown_placeholders]
+
+
+def _user_values(settings) -> dict:
+    return {
+        'user_name': settings.user_name or 'Your Name',
+        'user_school': settings.user_school or 'Your University',
+        'user_ambitions': settings.user_ambitions or '',
+    }
 
 
 def generate_networking_message(
     contact: NetworkingContact,
-    settings: Optional[Settings] = None
+    settings: Optional[SettingsSnapshot] = None
 ) -> str:
     """
     Generate a networking message from template and contact/user data
 
     Args:
         contact: NetworkingContact object
-        settings: Settings object (if None, will fetch from DB)
+        settings: Settings row or SettingsSnapshot (default: settings_store)
 
     Returns:
         Generated message string
     """
     if settings is None:
-        session = get_session()
-        try:
-            settings = session.query(Settings).filter_by(id=1).first()
-        finally:
-            session.close()
+        settings = settings_store.get()
 
     if not settings:
         return "Error: Settings not found"
 
-    template = settings.message_template
-
-    # Prepare replacement values
-    replacements = {
+    values = _user_values(settings)
+    values.update({
         'name': contact.name or '',
         'job_title': contact.job_title or '',
         'company': contact.company or '',
-        'user_name': settings.user_name or 'Your Name',
-        'user_school': settings.user_school or 'Your University',
-        'user_ambitions': settings.user_ambitions or '',
         'relevant_info': contact.relevant_info or ''
-    }
+    })
+    return compile_template(settings.message_template).render(values)
 
-    # Replace placeholders
-    message = template
-    for key, value in replacements.items():
-        placeholder = '{' + key + '}'
-        message = message.replace(placeholder, value)
 
-    return message
+def _message_columns():
+    from utils.export_engine import ExportColumn
+    return [
+        ExportColumn('id', 'ID', NetworkingContact.id),
+        ExportColumn('name', 'Name', NetworkingContact.name),
+        ExportColumn('email', 'Email', NetworkingContact.email),
+        ExportColumn('company', 'Company', NetworkingContact.company),
+        ExportColumn('message', 'Message', None),
+    ]
+
+
+def iter_messages(where=None, order_by=None, settings=None, engine=None,
+                  batch_size: int = MESSAGE_BATCH_SIZE) -> Iterator[list]:
+    """
+    Render messages for many contacts, one batch of rows at a time
+
+    Only the columns the template needs are read, from a server-side cursor,
+    and the template is compiled once for the whole run.
+
+    Args:
+        where: Optional SQLAlchemy filter on NetworkingContact (default: all contacts)
+        order_by: Optional ordering (default: name)
+        settings: Settings row or SettingsSnapshot (default: settings_store)
+        engine: SQLAlchemy engine (default: db.session.get_engine())
+
+    Yields:
+        Lists of (id, name, email, company, message) tuples
+
+    Raises:
+        LookupError: the settings row does not exist
+    """
+    from sqlalchemy import select
+
+    if engine is None:
+        from db.session import get_engine
+        engine = get_engine()
+    settings = settings or settings_store.get()
+    if not settings:
+        raise LookupError("Settings not found in database")
+
+    render = compile_template(settings.message_template).render
+    values = _user_values(settings)
+    query = select(
+        NetworkingContact.id, NetworkingContact.name, NetworkingContact.email,
+        NetworkingContact.company, NetworkingContact.job_title, NetworkingContact.relevant_info
+    )
+    if where is not None:
+        query = query.where(where)
+    query = query.order_by(*(order_by if order_by is not None
+                             else (NetworkingContact.name, NetworkingContact.id)))
+
+    with engine.connect() as connection:
+        result = connection.execution_options(yield_per=batch_size).execute(query)
+        for rows in result.partitions():
+            batch = []
+            for contact_id, name, email, company, job_title, relevant_info in rows:
+                values['name'] = name or ''
+                values['job_title'] = job_title or ''
+                values['company'] = company or ''
+                values['relevant_info'] = relevant_info or ''
+                batch.append((contact_id, name, email, company, render(values)))
+            yield batch
+
+
+def count_message_recipients(where=None, engine=None) -> int:
+    """Contacts iter_messages() would render for where"""
+    from sqlalchemy import func, select
+
+    if engine is None:
+        from db.session import get_engine
+        engine = get_engine()
+    query = select(func.count(NetworkingContact.id))
+    if where is not None:
+        query = query.where(where)
+    with engine.connect() as connection:
+        return connection.execute(query).scalar() or 0
+
+
+def messages_text(where=None, order_by=None, settings=None, engine=None) -> str:
+    """All messages as one text for the clipboard, each headed by 'To: name <email>'"""
+    parts = []
+    for batch in iter_messages(where, order_by, settings, engine):
+        for _, name, email, _, message in batch:
+            header = f"To: {name} <{email}>" if email else f"To: {name}"
+            parts.append(f"{header}\n\n{message}")
+    return MESSAGE_SEPARATOR.join(parts)
+
+
+def export_messages(path, column_keys: Optional[Sequence[str]] = None, fmt: Optional[str] = None,
+                    where=None, order_by=None, settings=None, engine=None,
+                    progress: Optional[Callable[[int, int], None]] = None,
+                    is_cancelled: Optional[Callable[[], bool]] = None):
+    """
+    Stream rendered messages to a CSV, TSV or JSON Lines file (see utils.export_engine)
+
+    Args:
+        path: Target file
+        column_keys: Subset of id, name, email, company, message (default: all)
+        fmt: 'csv', 'tsv' or 'jsonl' (default: from the extension)
+        where, order_by, settings, engine: As for iter_messages
+        progress: Called after every batch with (rows written, percent)
+        is_cancelled: Polled between batches; True abandons the export
+
+    Returns:
+        utils.export_engine.ExportResult
+    """
+    from utils.export_engine import ExportResult, FORMATS, format_for_path, select_columns, write_batches
+
+    started = time.perf_counter()
+    all_columns = _message_columns()
+    columns = select_columns(all_columns, column_keys)
+    fmt = fmt or format_for_path(path)
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown export format '{fmt}'")
+
+    index = {column.key: i for i, column in enumerate(all_columns)}
+    positions = [index[column.key] for column in columns]
+    batches = (
+        [tuple(row[i] for i in positions) for row in batch]
+        for batch in iter_messages(where, order_by, settings, engine)
+    )
+    total = count_message_recipients(where, engine)
+    written = write_batches(columns, path, fmt, batches, total, progress, is_cancelled)
+    return ExportResult(written, Path(path), time.perf_counter() - started)
 
 
 def get_template_placeholders() -> list[str]:
@@ -68,4 +257,3 @@ def get_template_placeholders() -> list[str]:
         '{user_ambitions}',
         '{relevant_info}'
     ]
-
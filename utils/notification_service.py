@@ -2,12 +2,9 @@
 Follow-up Notification Service
 Monitors contacts and sends reminders for those needing follow-up
 """
-from datetime import date, timedelta
 from PySide6.QtCore import QObject, QTimer
 from PySide6.QtWidgets import QSystemTrayIcon, QMenu
 from PySide6.QtGui import QIcon, QAction
-from db.session import get_session
-from db.models import NetworkingContact, NetworkingStatus, Settings
 from utils.smart_followup import SmartFollowUpService
 
 
@@ -71,32 +68,15 @@ class FollowUpNotificationService(QObject):
     
     def check_followups(self):
         """Check for contacts needing follow-up"""
-        session = get_session()
-        try:
-            # Get follow-up days setting
-            settings = session.query(Settings).filter_by(id=1).first()
-            follow_up_days = settings.follow_up_days if settings else 3
-            
-            # Calculate cutoff date
-            cutoff_date = date.today() - timedelta(days=follow_up_days)
-            
-            # Find contacts needing follow-up
-            contacts_needing_followup = session.query(NetworkingContact).filter(
-                NetworkingContact.status == NetworkingStatus.COLD_MESSAGE,
-                NetworkingContact.contact_date <= cutoff_date
-            ).all()
-            
-            count = len(contacts_needing_followup)
-            
-            if count > 0:
-                self.show_notification(count, contacts_needing_followup[:3])  # Show first 3
-            
-            # Update parent window badge/counter if available
-            if hasattr(self.parent_window, 'update_followup_count'):
-                self.parent_window.update_followup_count(count)
-            
-        finally:
-            session.close()
+        # Counted on the status/date index; only the names shown are loaded
+        count = SmartFollowUpService.get_followup_count()
+
+        if count > 0:
+            self.show_notification(count, SmartFollowUpService.get_followup_contacts(limit=3))
+
+        # Update parent window badge/counter if available
+        if hasattr(self.parent_window, 'update_followup_count'):
+            self.parent_window.update_followup_count(count)
     
     def show_notification(self, count, contacts):
         """Show desktop notification"""
@@ -121,17 +101,4 @@ class FollowUpNotificationService(QObject):
     
     def get_followup_count(self):
         """Get current number of contacts needing follow-up"""
-        session = get_session()
-        try:
-            settings = session.query(Settings).filter_by(id=1).first()
-            follow_up_days = settings.follow_up_days if settings else 3
-            cutoff_date = date.today() - timedelta(days=follow_up_days)
-            
-            count = session.query(NetworkingContact).filter(
-                NetworkingContact.status == NetworkingStatus.COLD_MESSAGE,
-                NetworkingContact.contact_date <= cutoff_date
-            ).count()
-            
-            return count
-        finally:
-            session.close()
+        return SmartFollowUpService.get_followup_count()
@@ -2,120 +2,306 @@
 Performance optimization utilities
 Lazy loading, caching, and query optimization
 """
-from typing import Any, Callable, Dict, Optional
-from datetime import datetime, timedelta
-from functools import wraps
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional
+from collections import Counter, OrderedDict, deque
+from contextlib import contextmanager
+from datetime import datetime
+from functools import lru_cache, wraps
+import heapq
+import itertools
+import os
+import re
+import sys
+import threading
 import time
 import logging
 
 logger = logging.getLogger('GTI_Tracker.Performance')
 
+# Source files under this directory are "ours" when looking for a query's call site
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) + os.sep
+
+
+# Returned by Cache.get(key, MISSING) when the key is absent or expired
+MISSING = object()
+
+
+class _CacheEntry:
+    __slots__ = ('value', 'expiry', 'cost', 'tags')
+
+    def __init__(self, value, expiry: float, cost: int, tags: tuple):
+        self.value = value
+        self.expiry = expiry
+        self.cost = cost
+        self.tags = tags
+
+
+def _default_cost(value) -> int:
+    """Cost of a cached value: its length for containers and strings, else 1"""
+    try:
+        return max(1, len(value))
+    except TypeError:
+        return 1
+
 
 class Cache:
-    """Simple in-memory cache with TTL"""
+    """
+    Bounded in-memory cache with TTL, LRU eviction and invalidation tags
+
+    Entries leave the cache when they expire (swept on every write), when the
+    least recently used entries are evicted to stay within max_entries and
+    max_cost, or when one of their tags is invalidated (see
+    register_cache_invalidation). Thread-safe: loaders fill it from the
+    thread pool.
+    """
 
-    def __init__(self, default_ttl: int = 30):
+    def __init__(self, default_ttl: int = 30, max_entries: int = 512, max_cost: Optional[int] = None):
         """
         Initialize cache
 
         Args:
             default_ttl: Default time-to-live in seconds
+            max_entries: Entries kept before the least recently used are evicted
+            max_cost: Total cost kept (see set()); None for no limit
         """
-        self._cache: Dict[str, tuple[Any, datetime]] = {}
+        self._cache: 'OrderedDict[Hashable, _CacheEntry]' = OrderedDict()
+        self._expiries: List[tuple] = []  # min-heap of (expiry, sequence, key)
+        self._sequence = itertools.count()
+        self._tags: Dict[str, set] = {}
+        self._tag_versions: Dict[str, int] = {}
+        self._lock = threading.RLock()
         self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self.max_cost = max_cost
+        self.total_cost = 0
         self.hits = 0
         self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
 
-    def get(self, key: str) -> Optional[Any]:
-        """Get value from cache"""
-        if key not in self._cache:
-            self.misses += 1
-            return None
-
-        value, expiry = self._cache[key]
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get value from cache
 
-        if datetime.now() > expiry:
-            # Expired, remove and return None
-            del self._cache[key]
-            self.misses += 1
-            return None
+        Returns:
+            The cached value, or default if the key is absent or expired (pass
+            MISSING to tell a cached None apart from a miss)
+        """
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+
+            if time.monotonic() >= entry.expiry:
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return default
+
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return entry.value
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            entry = self._cache.get(key)
+            return entry is not None and time.monotonic() < entry.expiry
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[int] = None, tags: Iterable[str] = (),
+            cost: Optional[int] = None, version: Optional[tuple] = None) -> bool:
+        """
+        Set value in cache
 
-        self.hits += 1
-        return value
+        Args:
+            key: Any hashable key
+            value: Value to cache (shared with every reader: do not mutate it)
+            ttl: Time-to-live in seconds (default: default_ttl)
+            tags: Invalidation tags, e.g. ('contacts', 'settings')
+            cost: Accounting weight against max_cost (default: len(value) or 1)
+            version: tag_version(tags) taken before the value was computed; if a
+                tag was invalidated since, the value may be stale and is not stored
 
-    def set(self, key: str, value: Any, ttl: Optional[int] = None):
-        """Set value in cache"""
+        Returns:
+            True if the value was stored
+        """
         if ttl is None:
             ttl = self.default_ttl
+        tags = tuple(tags)
+        if cost is None:
+            cost = _default_cost(value)
+
+        with self._lock:
+            if version is not None and version != self.tag_version(tags):
+                return False
+            if key in self._cache:
+                self._remove(key)
+
+            expiry = time.monotonic() + ttl
+            self._cache[key] = _CacheEntry(value, expiry, cost, tags)
+            self.total_cost += cost
+            heapq.heappush(self._expiries, (expiry, next(self._sequence), key))
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+
+            self._sweep_expired()
+            while self._cache and (len(self._cache) > self.max_entries or
+                                   (self.max_cost is not None and self.total_cost > self.max_cost)):
+                oldest = next(iter(self._cache))
+                self._remove(oldest)
+                self.evictions += 1
+            return key in self._cache
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._cache.pop(key)
+        self.total_cost -= entry.cost
+        for tag in entry.tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    def _sweep_expired(self) -> None:
+        """Drop expired entries (the heap may hold stale items for replaced keys)"""
+        now = time.monotonic()
+        while self._expiries and self._expiries[0][0] <= now:
+            expiry, _, key = heapq.heappop(self._expiries)
+            entry = self._cache.get(key)
+            if entry is not None and entry.expiry == expiry:
+                self._remove(key)
+                self.expirations += 1
+        # Replaced keys leave stale heap items behind; rebuild once they dominate
+        if len(self._expiries) > 2 * len(self._cache) + 64:
+            self._expiries = [(entry.expiry, next(self._sequence), key) for key, entry in self._cache.items()]
+            heapq.heapify(self._expiries)
+
+    def tag_version(self, tags: Iterable[str]) -> tuple:
+        """Invalidation counters of tags; compare before/after computing a value"""
+        with self._lock:
+            return tuple(self._tag_versions.get(tag, 0) for tag in tags)
+
+    def invalidate(self, key: Hashable):
+        """Remove key from cache"""
+        with self._lock:
+            if key in self._cache:
+                self._remove(key)
+                self.invalidations += 1
 
-        expiry = datetime.now() + timedelta(seconds=ttl)
-        self._cache[key] = (value, expiry)
+    def invalidate_tags(self, *tags: str) -> int:
+        """
+        Remove every entry carrying any of tags
 
-    def invalidate(self, key: str):
-        """Remove key from cache"""
-        if key in self._cache:
-            del self._cache[key]
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        with self._lock:
+            for tag in tags:
+                self._tag_versions[tag] = self._tag_versions.get(tag, 0) + 1
+                for key in list(self._tags.get(tag, ())):
+                    self._remove(key)
+                    removed += 1
+            self.invalidations += removed
+        if removed:
+            logger.debug(f"Invalidated {removed} cache entries tagged {', '.join(tags)}")
+        return removed
 
     def clear(self):
         """Clear entire cache"""
-        self._cache.clear()
-        self.hits = 0
-        self.misses = 0
+        with self._lock:
+            self._cache.clear()
+            self._expiries.clear()
+            self._tags.clear()
+            self.total_cost = 0
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+            self.expirations = 0
+            self.invalidations = 0
 
     def get_stats(self) -> dict:
         """Get cache statistics"""
-        total = self.hits + self.misses
-        hit_rate = (self.hits / total * 100) if total > 0 else 0
-
-        return {
-            'hits': self.hits,
-            'misses': self.misses,
-            'hit_rate': hit_rate,
-            'size': len(self._cache)
-        }
+        with self._lock:
+            total = self.hits + self.misses
+            hit_rate = (self.hits / total * 100) if total > 0 else 0
+
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': hit_rate,
+                'size': len(self._cache),
+                'cost': self.total_cost,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'invalidations': self.invalidations,
+            }
 
 
 # Global cache instance
-global_cache = Cache(default_ttl=30)
+global_cache = Cache(default_ttl=30, max_entries=512, max_cost=200_000)
 
 
-def cached(ttl: int = 30, key_func: Optional[Callable] = None):
+def cached(ttl: int = 30, key_func: Optional[Callable] = None, tags: Iterable[str] = (),
+           cost: Optional[Callable[[Any], int]] = None, cache: Optional[Cache] = None):
     """
     Decorator for caching function results
 
+    The key is the function plus its arguments (which must be hashable; calls
+    with unhashable arguments are not cached). None and other falsy results
+    are cached like any other value.
+
     Args:
         ttl: Time-to-live in seconds
         key_func: Optional function to generate cache key from args
+        tags: Invalidation tags; committing changes to the matching tables
+            drops the entry (see CACHE_TAGS_BY_TABLE)
+        cost: Optional function giving the cost of a result (default: its length)
+        cache: Cache to use (default: global_cache)
 
     Usage:
-        @cached(ttl=60)
+        @cached(ttl=60, tags=('contacts',))
         def expensive_query():
             return session.query(...).all()
     """
+    tags = tuple(tags)
+
     def decorator(func: Callable) -> Callable:
+        name = f"{func.__module__}.{func.__qualname__}"
+
         @wraps(func)
         def wrapper(*args, **kwargs) -> Any:
+            target = cache or global_cache
+
             # Generate cache key
             if key_func:
-                cache_key = key_func(*args, **kwargs)
+                cache_key = (name, key_func(*args, **kwargs))
             else:
-                cache_key = f"{func.__name__}:{str(args)}:{str(kwargs)}"
+                cache_key = (name, args, tuple(sorted(kwargs.items())))
+            try:
+                hash(cache_key)
+            except TypeError:
+                return func(*args, **kwargs)
 
             # Check cache
-            cached_value = global_cache.get(cache_key)
-            if cached_value is not None:
+            cached_value = target.get(cache_key, MISSING)
+            if cached_value is not MISSING:
                 logger.debug(f"Cache hit for {func.__name__}")
                 return cached_value
 
-            # Execute function
+            # Execute function; a commit while it runs makes the result stale
             logger.debug(f"Cache miss for {func.__name__}, executing...")
+            version = target.tag_version(tags)
             result = func(*args, **kwargs)
 
             # Store in cache
-            global_cache.set(cache_key, result, ttl)
+            target.set(cache_key, result, ttl, tags=tags,
+                       cost=cost(result) if cost else None, version=version)
 
             return result
 
+        wrapper.cache_tags = tags
         return wrapper
     return decorator
 
@@ -124,6 +310,9 @@ def measure_time(func: Callable) -> Callable:
     """
     Decorator to measure function execution time
 
+    The duration is also recorded as a span of perf_monitor under the
+    function's qualified name.
+
     Usage:
         @measure_time
         def slow_operation():
@@ -132,17 +321,96 @@ def measure_time(func: Callable) -> Callable:
     @wraps(func)
     def wrapper(*args, **kwargs) -> Any:
         start = time.perf_counter()
-        result = func(*args, **kwargs)
-        elapsed = time.perf_counter() - start
+        try:
+            with perf_monitor.span(func.__qualname__):
+                return func(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            if elapsed > 0.1:  # Log if > 100ms
+                logger.warning(f"{func.__name__} took {elapsed*1000:.2f}ms")
+            else:
+                logger.debug(f"{func.__name__} took {elapsed*1000:.2f}ms")
 
-        if elapsed > 0.1:  # Log if > 100ms
-            logger.warning(f"{func.__name__} took {elapsed*1000:.2f}ms")
-        else:
-            logger.debug(f"{func.__name__} took {elapsed*1000:.2f}ms")
+    return wrapper
 
-        return result
 
-    return wrapper
+# Cache tag dropped when rows of a table are committed (other tables: the table name)
+CACHE_TAGS_BY_TABLE = {
+    'networking_contacts': 'contacts',
+    'internship_applications': 'applications',
+    'settings': 'settings',
+    'interviews': 'interviews',
+    'tasks': 'tasks',
+    'activity_log': 'activities',
+}
+
+_CACHE_TAGS_KEY = 'cache_invalidation_tags'
+
+
+def cache_tag_for_table(table_name: str) -> str:
+    return CACHE_TAGS_BY_TABLE.get(table_name, table_name)
+
+
+def invalidate_tables(*table_names: str) -> int:
+    """
+    Drop global_cache entries of tables written without the ORM (Core inserts)
+
+    Call after the writing transaction committed.
+
+    Returns:
+        Number of entries removed
+    """
+    return global_cache.invalidate_tags(*{cache_tag_for_table(name) for name in table_names})
+
+
+def _pending_cache_tags(session) -> set:
+    return session.info.setdefault(_CACHE_TAGS_KEY, set())
+
+
+def _collect_flushed_tags(session, flush_context):
+    tags = _pending_cache_tags(session)
+    for instance in (*session.new, *session.dirty, *session.deleted):
+        table = getattr(type(instance), '__tablename__', None)
+        if table is not None:
+            tags.add(cache_tag_for_table(table))
+
+
+def _collect_bulk_tags(orm_execute_state):
+    # session.execute(update/delete(Model)) and query.update()/delete() skip the flush
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    table = getattr(orm_execute_state.bind_mapper, 'local_table', None)
+    if table is not None:
+        _pending_cache_tags(orm_execute_state.session).add(cache_tag_for_table(table.name))
+
+
+def _invalidate_committed_tags(session):
+    tags = session.info.pop(_CACHE_TAGS_KEY, None)
+    if tags:
+        global_cache.invalidate_tags(*tags)
+
+
+def _discard_cache_tags(session, previous_transaction=None):
+    session.info.pop(_CACHE_TAGS_KEY, None)
+
+
+def register_cache_invalidation() -> None:
+    """
+    Invalidate global_cache tags when ORM sessions commit changes (idempotent)
+
+    Tables flushed or changed by ORM UPDATE/DELETE statements in a transaction are collected per session
+    and their tags (CACHE_TAGS_BY_TABLE) invalidated after the commit; a
+    rollback discards them.
+    """
+    from sqlalchemy import event
+    from sqlalchemy.orm import Session
+
+    if event.contains(Session, 'after_commit', _invalidate_committed_tags):
+        return
+    event.listen(Session, 'after_flush', _collect_flushed_tags)
+    event.listen(Session, 'do_orm_execute', _collect_bulk_tags)
+    event.listen(Session, 'after_commit', _invalidate_committed_tags)
+    event.listen(Session, 'after_rollback', _discard_cache_tags)
 
 
 class LazyLoader:
@@ -206,12 +474,22 @@ class QueryOptimizer:
             "CREATE INDEX IF NOT EXISTS idx_networking_status ON networking_contacts(status)",
             "CREATE INDEX IF NOT EXISTS idx_networking_date ON networking_contacts(contact_date)",
             "CREATE INDEX IF NOT EXISTS idx_networking_company ON networking_contacts(company)",
+            # Case-insensitive sorts and the "needs follow-up" filter in db.queries
+            "CREATE INDEX IF NOT EXISTS idx_networking_name_nocase ON networking_contacts(name COLLATE NOCASE)",
+            "CREATE INDEX IF NOT EXISTS idx_networking_company_nocase ON networking_contacts(company COLLATE NOCASE)",
+            "CREATE INDEX IF NOT EXISTS idx_networking_status_date ON networking_contacts(status, contact_date)",
 
             # Internship applications
             "CREATE INDEX IF NOT EXISTS idx_internship_status ON internship_applications(status)",
             "CREATE INDEX IF NOT EXISTS idx_internship_date ON internship_applications(application_date)",
             "CREATE INDEX IF NOT EXISTS idx_internship_company ON internship_applications(company)",
             "CREATE INDEX IF NOT EXISTS idx_internship_contact ON internship_applications(contact_id)",
+            "CREATE INDEX IF NOT EXISTS idx_internship_role_nocase ON internship_applications(role_name COLLATE NOCASE)",
+            "CREATE INDEX IF NOT EXISTS idx_internship_company_nocase ON internship_applications(company COLLATE NOCASE)",
+
+            # Activity log: per-entity timelines and the recent-activity feed (db.activity_log)
+            "CREATE INDEX IF NOT EXISTS idx_activity_entity ON activity_log(entity_type, entity_id, timestamp)",
+            "CREATE INDEX IF NOT EXISTS idx_activity_timestamp ON activity_log(timestamp)",
         ]
 
         with engine.connect() as conn:
@@ -249,42 +527,325 @@ class QueryOptimizer:
             logger.info(str(row))
 
 
+# Queries/spans slower than this (seconds) are listed in slow_operations
+SLOW_THRESHOLD = 0.1
+
+# Slowest statements kept for the diagnostics panel
+SLOWEST_QUERIES_KEPT = 50
+
+# The same SELECT this many times inside one span (or burst) is reported as N+1
+N_PLUS_ONE_THRESHOLD = 10
+
+# Outside spans, statements more than this many seconds apart start a new burst
+N_PLUS_ONE_WINDOW = 0.5
+
+_MAX_SLOW_OPERATIONS = 200
+
+
+class Histogram:
+    """Durations of one operation; percentiles are taken over the most recent samples"""
+
+    def __init__(self, max_samples: int = 1024):
+        self.samples = deque(maxlen=max_samples)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, duration: float):
+        self.samples.append(duration)
+        self.count += 1
+        self.total += duration
+        if duration > self.max:
+            self.max = duration
+
+    @staticmethod
+    def _nearest_rank(ordered: list, p: float) -> float:
+        if not ordered:
+            return 0.0
+        rank = max(1, -(-p * len(ordered) // 100))
+        return ordered[min(int(rank), len(ordered)) - 1]
+
+    def percentile(self, p: float) -> float:
+        """Nearest-rank percentile (0-100) of the kept samples, in seconds"""
+        return self._nearest_rank(sorted(self.samples), p)
+
+    def summary(self) -> dict:
+        """Count, mean, p50/p95/p99 and max in milliseconds"""
+        ordered = sorted(self.samples)
+        return {
+            'count': self.count,
+            'mean_ms': round(self.total / self.count * 1000, 2) if self.count else 0.0,
+            'p50_ms': round(self._nearest_rank(ordered, 50) * 1000, 2),
+            'p95_ms': round(self._nearest_rank(ordered, 95) * 1000, 2),
+            'p99_ms': round(self._nearest_rank(ordered, 99) * 1000, 2),
+            'max_ms': round(self.max * 1000, 2),
+        }
+
+
+@lru_cache(maxsize=2048)
+def normalize_statement(statement: str) -> str:
+    """
+    Statement text with literals and IN lists folded, so repeats of one query group together
+
+    Example:
+        "SELECT ... WHERE id IN (?, ?, ?) LIMIT 20" -> "SELECT ... WHERE id IN (?) LIMIT ?"
+    """
+    text = ' '.join(statement.split())
+    text = re.sub(r"'(?:[^']|'')*'", '?', text)
+    text = re.sub(r'\b\d+(?:\.\d+)?\b', '?', text)
+    text = re.sub(r'\(\s*\?(?:\s*,\s*\?)+\s*\)', '(?)', text)
+    return text
+
+
+def find_call_site() -> Optional[str]:
+    """'path.py:line in function' of the innermost application frame on the stack"""
+    frame = sys._getframe(1)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if (filename.startswith(_PROJECT_ROOT) and filename != __file__
+                and 'site-packages' not in filename):
+            relative = filename[len(_PROJECT_ROOT):]
+            return f"{relative}:{frame.f_lineno} in {frame.f_code.co_name}"
+        frame = frame.f_back
+    return None
+
+
 class PerformanceMonitor:
-    """Monitor application performance metrics"""
+    """
+    Monitor application performance metrics
+
+    Collects per-statement query timings (fed by install_query_hooks), named
+    spans with percentile histograms (span(), measure_time) and statements
+    repeated inside one span, the usual sign of an N+1 query pattern. Safe to
+    use from worker threads.
+    """
 
     def __init__(self):
-        self.metrics = {
-            'db_queries': 0,
-            'cache_hits': 0,
-            'cache_misses': 0,
-            'slow_operations': []
-        }
+        self.enabled = True
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.reset()
+
+    def reset(self):
+        """Reset metrics"""
+        with self._lock:
+            self.metrics = {
+                'db_queries': 0,
+                'cache_hits': 0,
+                'cache_misses': 0,
+                'slow_operations': []
+            }
+            self._statements: Dict[str, dict] = {}
+            self._slowest: List[tuple] = []  # min-heap of (duration, seq, entry)
+            self._seq = 0
+            self._spans: Dict[str, Histogram] = {}
+            self._suspects: Dict[tuple, dict] = {}
+
+    def _thread_state(self):
+        state = self._local
+        if not hasattr(state, 'spans'):
+            state.spans = []
+            state.repeats = Counter()
+            state.last_query = 0.0
+        return state
+
+    def _add_slow_operation(self, entry: dict):
+        slow = self.metrics['slow_operations']
+        slow.append(entry)
+        if len(slow) > _MAX_SLOW_OPERATIONS:
+            del slow[:len(slow) - _MAX_SLOW_OPERATIONS]
+
+    def record_query(self, duration: float, statement: Optional[str] = None,
+                     rows: Optional[int] = None, call_site: Optional[str] = None):
+        """
+        Record database query
 
-    def record_query(self, duration: float):
-        """Record database query"""
-        self.metrics['db_queries'] += 1
+        Args:
+            duration: Execution time in seconds
+            statement: SQL text (grouped by normalize_statement)
+            rows: Rows affected, when the driver reports it (DML; SELECTs report None)
+            call_site: Application code that ran the query (default: found on the stack
+                when the query is slow, among the slowest or first seen)
+        """
+        if statement is None:
+            with self._lock:
+                self.metrics['db_queries'] += 1
+                if duration > SLOW_THRESHOLD:
+                    self._add_slow_operation({'type': 'query', 'duration': duration,
+                                              'timestamp': datetime.now()})
+            return
+
+        key = normalize_statement(statement)
+        state = self._thread_state()
+        span = state.spans[-1] if state.spans else None
+
+        # Repeats of one SELECT inside a span (or a burst of queries outside spans);
+        # schema checks at startup are repeated by design
+        repeat_count = 0
+        if key.startswith('SELECT') and 'sqlite_master' not in key:
+            now = time.perf_counter()
+            if not state.spans and now - state.last_query > N_PLUS_ONE_WINDOW:
+                state.repeats.clear()
+            state.last_query = now
+            state.repeats[key] += 1
+            repeat_count = state.repeats[key]
+
+        with self._lock:
+            self.metrics['db_queries'] += 1
+
+            stats = self._statements.get(key)
+            if stats is None:
+                stats = self._statements[key] = {
+                    'histogram': Histogram(max_samples=256),
+                    'rows': 0,
+                    'call_site': call_site or find_call_site(),
+                }
+            stats['histogram'].add(duration)
+            if rows is not None and rows > 0:
+                stats['rows'] += rows
+
+            is_slowest = len(self._slowest) < SLOWEST_QUERIES_KEPT or duration > self._slowest[0][0]
+            if is_slowest or duration > SLOW_THRESHOLD:
+                entry = {
+                    'statement': key,
+                    'duration': duration,
+                    'rows': rows,
+                    'call_site': call_site or find_call_site(),
+                    'span': span,
+                    'timestamp': datetime.now(),
+                }
+                if is_slowest:
+                    self._seq += 1
+                    if len(self._slowest) < SLOWEST_QUERIES_KEPT:
+                        heapq.heappush(self._slowest, (duration, self._seq, entry))
+                    else:
+                        heapq.heapreplace(self._slowest, (duration, self._seq, entry))
+                if duration > SLOW_THRESHOLD:
+                    self._add_slow_operation(dict(entry, type='query'))
+
+            if repeat_count >= N_PLUS_ONE_THRESHOLD:
+                suspect = self._suspects.get((span, key))
+                if suspect is None:
+                    self._suspects[(span, key)] = {
+                        'span': span,
+                        'statement': key,
+                        'count': repeat_count,
+                        'call_site': call_site or find_call_site(),
+                        'timestamp': datetime.now(),
+                    }
+                elif repeat_count > suspect['count']:
+                    suspect['count'] = repeat_count
+
+    def record_span(self, name: str, duration: float):
+        """Add one duration (seconds) to the histogram of span name"""
+        with self._lock:
+            histogram = self._spans.get(name)
+            if histogram is None:
+                histogram = self._spans[name] = Histogram()
+            histogram.add(duration)
+            if duration > SLOW_THRESHOLD:
+                self._add_slow_operation({'type': 'span', 'name': name, 'duration': duration,
+                                          'timestamp': datetime.now()})
+
+    @contextmanager
+    def span(self, name: str):
+        """
+        Time the body of a with block as span name
 
-        if duration > 0.1:  # Slow query threshold
-            self.metrics['slow_operations'].append({
-                'type': 'query',
-                'duration': duration,
-                'timestamp': datetime.now()
-            })
+        Queries run inside the block are attributed to the innermost span, and
+        repeats are counted per outermost span for N+1 detection.
+
+        Usage:
+            with perf_monitor.span('dialog.settings'):
+                dialog = SettingsDialog(self)
+        """
+        if not self.enabled:
+            yield
+            return
+        state = self._thread_state()
+        state.spans.append(name)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            state.spans.pop()
+            if not state.spans:
+                state.repeats.clear()
+            self.record_span(name, elapsed)
+
+    def slowest_queries(self, limit: int = SLOWEST_QUERIES_KEPT) -> list:
+        """Slowest statement executions, slowest first (duration in ms)"""
+        with self._lock:
+            ordered = sorted(self._slowest, key=lambda item: item[0], reverse=True)[:limit]
+        return [dict(entry, duration_ms=round(duration * 1000, 2)) for duration, _, entry in ordered]
+
+    def statement_summary(self) -> list:
+        """Per normalized statement: timings, rows and call site, by total time"""
+        with self._lock:
+            summary = [
+                dict(stats['histogram'].summary(), statement=key, rows=stats['rows'],
+                     call_site=stats['call_site'],
+                     total_ms=round(stats['histogram'].total * 1000, 2))
+                for key, stats in self._statements.items()
+            ]
+        summary.sort(key=lambda item: item['total_ms'], reverse=True)
+        return summary
+
+    def span_summary(self) -> list:
+        """Per span name: count, mean, p50/p95/p99 and max in ms, by name"""
+        with self._lock:
+            return [dict(histogram.summary(), name=name)
+                    for name, histogram in sorted(self._spans.items())]
+
+    def n_plus_one_suspects(self) -> list:
+        """SELECTs repeated at least N_PLUS_ONE_THRESHOLD times in one span, most repeated first"""
+        with self._lock:
+            suspects = [dict(suspect) for suspect in self._suspects.values()]
+        suspects.sort(key=lambda item: item['count'], reverse=True)
+        return suspects
 
     def get_stats(self) -> dict:
         """Get performance statistics"""
-        stats = self.metrics.copy()
+        with self._lock:
+            stats = self.metrics.copy()
+            stats['slow_operations'] = list(self.metrics['slow_operations'])
         stats['cache_stats'] = global_cache.get_stats()
+        stats['slowest_queries'] = self.slowest_queries()
+        stats['statements'] = self.statement_summary()
+        stats['spans'] = self.span_summary()
+        stats['n_plus_one'] = self.n_plus_one_suspects()
         return stats
 
-    def reset(self):
-        """Reset metrics"""
-        self.metrics = {
-            'db_queries': 0,
-            'cache_hits': 0,
-            'cache_misses': 0,
-            'slow_operations': []
-        }
+
+def install_query_hooks(engine, monitor: Optional['PerformanceMonitor'] = None) -> None:
+    """
+    Time every statement engine runs and feed it to monitor (default: perf_monitor)
+
+    Uses the before_cursor_execute/after_cursor_execute events; statements that
+    raise are not recorded.
+    """
+    from sqlalchemy import event
+
+    monitor = monitor or perf_monitor
+
+    @event.listens_for(engine, 'before_cursor_execute')
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('query_start_time', []).append(time.perf_counter())
+
+    @event.listens_for(engine, 'after_cursor_execute')
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info['query_start_time'].pop()
+        if monitor.enabled:
+            rows = cursor.rowcount
+            monitor.record_query(time.perf_counter() - started, statement,
+                                 rows if rows is not None and rows >= 0 else None)
+
+    @event.listens_for(engine, 'handle_error')
+    def handle_error(exception_context):
+        connection = exception_context.connection
+        if connection is not None and connection.info.get('query_start_time'):
+            connection.info['query_start_time'].pop()
 
 
 # Global performance monitor
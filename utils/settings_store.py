@@ -0,0 +1,145 @@
+"""
+Settings store
+The singleton Settings row, loaded once and shared as an immutable snapshot
+"""
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Optional
+from PySide6.QtCore import QObject, Signal
+
+logger = logging.getLogger('GTI_Tracker.SettingsStore')
+
+# Fallbacks used while the settings row is missing
+DEFAULT_FOLLOW_UP_DAYS = 3
+DEFAULT_DAILY_GOAL = 3
+
+
+@dataclass(frozen=True)
+class SettingsSnapshot:
+    """Read-only copy of the Settings row"""
+    message_template: str
+    follow_up_days: int = DEFAULT_FOLLOW_UP_DAYS
+    user_name: Optional[str] = None
+    user_school: Optional[str] = None
+    user_ambitions: Optional[str] = None
+    daily_goal: int = DEFAULT_DAILY_GOAL
+
+    @classmethod
+    def from_row(cls, settings) -> 'SettingsSnapshot':
+        return cls(
+            message_template=settings.message_template,
+            follow_up_days=settings.follow_up_days,
+            user_name=settings.user_name,
+            user_school=settings.user_school,
+            user_ambitions=settings.user_ambitions,
+            daily_goal=getattr(settings, 'daily_goal', None) or DEFAULT_DAILY_GOAL,
+        )
+
+
+class SettingsStore(QObject):
+    """
+    In-process cache of the Settings row (id=1)
+
+    get() queries the database once and then returns the same snapshot until
+    the settings are written. update() commits through this store and emits
+    changed; commits made elsewhere (e.g. resetting data) invalidate the
+    'settings' cache tag, and the next get() reloads. Safe to call from
+    loader threads.
+    """
+
+    changed = Signal(object)  # SettingsSnapshot
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._lock = threading.Lock()
+        self._snapshot = None
+        self._version = None
+
+    def get(self) -> Optional[SettingsSnapshot]:
+        """
+        Current settings
+
+        Returns:
+            SettingsSnapshot, or None if the settings row does not exist
+        """
+        from utils.performance import global_cache
+
+        version = global_cache.tag_version(('settings',))
+        with self._lock:
+            if self._version == version:
+                return self._snapshot
+        return self.reload()
+
+    def follow_up_days(self) -> int:
+        snapshot = self.get()
+        return snapshot.follow_up_days if snapshot else DEFAULT_FOLLOW_UP_DAYS
+
+    def daily_goal(self) -> int:
+        snapshot = self.get()
+        return snapshot.daily_goal if snapshot else DEFAULT_DAILY_GOAL
+
+    def reload(self) -> Optional[SettingsSnapshot]:
+        """Read the settings row again; emits changed if it differs from the last snapshot"""
+        from db.models import Settings
+        from db.session import get_session
+        from utils.performance import global_cache
+
+        with self._lock:
+            version = global_cache.tag_version(('settings',))
+            session = get_session()
+            try:
+                settings = session.get(Settings, 1)
+                snapshot = SettingsSnapshot.from_row(settings) if settings else None
+            finally:
+                session.close()
+
+            previous, self._snapshot, self._version = self._snapshot, snapshot, version
+
+        if previous is not None and snapshot != previous:
+            self.changed.emit(snapshot)
+        return snapshot
+
+    def update(self, **values) -> SettingsSnapshot:
+        """
+        Write settings columns and commit, then broadcast the new snapshot
+
+        Args:
+            **values: Settings attributes to set, e.g. follow_up_days=5
+
+        Returns:
+            The new SettingsSnapshot
+
+        Raises:
+            LookupError: the settings row does not exist
+        """
+        from db.models import Settings
+        from db.session import get_session
+
+        session = get_session()
+        try:
+            settings = session.get(Settings, 1)
+            if settings is None:
+                raise LookupError("Settings not found in database")
+            for name, value in values.items():
+                setattr(settings, name, value)
+            session.commit()
+            snapshot = SettingsSnapshot.from_row(settings)
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+        from utils.performance import global_cache
+        with self._lock:
+            self._snapshot = snapshot
+            self._version = global_cache.tag_version(('settings',))
+
+        logger.info("Settings saved")
+        self.changed.emit(snapshot)
+        return snapshot
+
+
+# Global settings store
+settings_store = SettingsStore()
@@ -2,7 +2,8 @@
 Smart Follow-Up Service with status-based thresholds
 """
 from datetime import date, timedelta
-from typing import Tuple, List
+from typing import Dict, Tuple, List, Optional
+from sqlalchemy import select, func, and_, or_
 from db.session import get_session
 from db.models import NetworkingContact, NetworkingStatus
 
@@ -10,7 +11,8 @@ from db.models import NetworkingContact, NetworkingStatus
 class SmartFollowUpService:
     """Intelligent follow-up logic based on status and time"""
     
-    # Follow-up thresholds by status (in days)
+    # Follow-up thresholds by status (in days); the Cold message one is
+    # replaced by Settings > Follow-up days, see thresholds()
     THRESHOLDS = {
         NetworkingStatus.COLD_MESSAGE: 3,      # 3 days
         NetworkingStatus.HAS_RESPONDED: 21,   # 3 weeks
@@ -18,10 +20,19 @@ class SmartFollowUpService:
         NetworkingStatus.INTERVIEW: 7          # 1 week
     }
     
+    @staticmethod
+    def thresholds() -> Dict[NetworkingStatus, int]:
+        """THRESHOLDS with the Cold message cutoff taken from the follow_up_days setting"""
+        from utils.settings_store import settings_store
+        return {
+            **SmartFollowUpService.THRESHOLDS,
+            NetworkingStatus.COLD_MESSAGE: settings_store.follow_up_days(),
+        }
+
     @staticmethod
     def needs_followup(contact: NetworkingContact) -> bool:
         """Check if contact needs follow-up based on status and time"""
-        threshold = SmartFollowUpService.THRESHOLDS.get(contact.status)
+        threshold = SmartFollowUpService.thresholds().get(contact.status)
         if not threshold:
             return False
         
@@ -29,20 +40,66 @@ class SmartFollowUpService:
         return days_since >= threshold
     
     @staticmethod
-    def get_followup_contacts() -> List[NetworkingContact]:
-        """Get all contacts needing follow-up"""
+    def followup_condition(today: Optional[date] = None):
+        """
+        SQL predicate equivalent to needs_followup()
+
+        Written as one (status = s AND contact_date <= cutoff_s) range per
+        status rather than a CASE, so SQLite can answer it from
+        idx_networking_status_date instead of scanning every contact.
+
+        Args:
+            today: Reference date (default: today)
+        """
+        today = today or date.today()
+        return or_(*[
+            and_(
+                NetworkingContact.status == status,
+                NetworkingContact.contact_date <= today - timedelta(days=days)
+            )
+            for status, days in SmartFollowUpService.thresholds().items()
+        ])
+
+    @staticmethod
+    def get_followup_contacts(offset: int = 0, limit: Optional[int] = None) -> List[NetworkingContact]:
+        """Get contacts needing follow-up, longest-waiting first (optionally one page)"""
         session = get_session()
         try:
-            all_contacts = session.query(NetworkingContact).all()
-            return [c for c in all_contacts if SmartFollowUpService.needs_followup(c)]
+            query = session.query(NetworkingContact).filter(
+                SmartFollowUpService.followup_condition()
+            ).order_by(NetworkingContact.contact_date.asc(), NetworkingContact.id.asc())
+            if offset:
+                query = query.offset(offset)
+            if limit is not None:
+                query = query.limit(limit)
+            return query.all()
         finally:
             session.close()
-    
+
+    @staticmethod
+    def get_followup_ids() -> List[int]:
+        """Get ids of contacts needing follow-up"""
+        session = get_session()
+        try:
+            rows = session.execute(
+                select(NetworkingContact.id).where(SmartFollowUpService.followup_condition())
+            )
+            return [contact_id for (contact_id,) in rows]
+        finally:
+            session.close()
+
     @staticmethod
     def get_followup_count() -> int:
         """Get count of contacts needing follow-up"""
-        return len(SmartFollowUpService.get_followup_contacts())
-    
+        session = get_session()
+        try:
+            return session.execute(
+                select(func.count()).select_from(NetworkingContact)
+                .where(SmartFollowUpService.followup_condition())
+            ).scalar_one()
+        finally:
+            session.close()
+
     @staticmethod
     def get_suggested_message(contact: NetworkingContact) -> Tuple[str, str]:
         """Get adaptive message suggestion based on status and timing"""
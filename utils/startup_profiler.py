@@ -0,0 +1,98 @@
+"""
+Startup profiler
+Per-phase wall time of application startup (main.py --profile-startup), written as a JSON report
+"""
+import json
+import logging
+import os
+import platform
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger('GTI_Tracker.StartupProfiler')
+
+# Active profiler; phase() is a no-op while this is None
+_profiler = None
+
+
+class StartupProfiler:
+    """Records named phases as offsets from a start time"""
+
+    def __init__(self, start: Optional[float] = None):
+        """
+        Args:
+            start: time.perf_counter() value startup began at (default: now)
+        """
+        self.start = start if start is not None else time.perf_counter()
+        self.phases = []
+        self.marks = {}
+
+    def add_phase(self, name: str, began: float, ended: float) -> None:
+        """Record a phase from two time.perf_counter() values"""
+        self.phases.append({
+            'phase': name,
+            'start_ms': round((began - self.start) * 1000, 2),
+            'duration_ms': round((ended - began) * 1000, 2),
+        })
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time the body of a with block as one phase"""
+        began = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_phase(name, began, time.perf_counter())
+
+    def mark(self, name: str) -> None:
+        """Record a point in time (e.g. first paint)"""
+        self.marks[name] = round((time.perf_counter() - self.start) * 1000, 2)
+
+    def report(self) -> dict:
+        """Phases, marks and environment as a JSON-serialisable dict"""
+        return {
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': sys.platform,
+            'pid': os.getpid(),
+            'total_ms': round((time.perf_counter() - self.start) * 1000, 2),
+            'phases': self.phases,
+            'marks': self.marks,
+        }
+
+    def write(self, path: Path) -> dict:
+        """Write report() to path and log a one-line summary"""
+        report = self.report()
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(report, indent=2))
+
+        summary = ", ".join(f"{p['phase']} {p['duration_ms']:.0f}ms" for p in self.phases)
+        logger.info(f"Startup profile written to {path}: {summary}")
+        return report
+
+
+def enable(start: Optional[float] = None) -> StartupProfiler:
+    """Start collecting phases; returns the active profiler"""
+    global _profiler
+    _profiler = StartupProfiler(start)
+    return _profiler
+
+
+def get_profiler() -> Optional[StartupProfiler]:
+    """The active profiler, or None when profiling is off"""
+    return _profiler
+
+
+@contextmanager
+def phase(name: str):
+    """Time a startup phase if profiling is enabled"""
+    if _profiler is None:
+        yield
+    else:
+        with _profiler.phase(name):
+            yield